@@ -26,3 +26,4 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 from .batch_sim_manager import BatchSimManager, BatchSimSettings, BsmStatesEnum, BatchDoneStatusEnum
 from .batch_sim_manager import MIN_REPLIC_ID, MIN_VARIANT_ID
 from .seed_table import SeedTable
+from .batch_profiling import ReplicProfilerEnum, ReplicProfile, BatchProfile
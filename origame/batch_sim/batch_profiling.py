@@ -0,0 +1,262 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Profiling of batch replications
+
+When profiling is turned on for a batch (see BatchSimManager.set_profiler()), each replication runs under a
+profiler and returns its stats, as a ReplicProfile, with its result. The BatchMonitor merges them in a BatchProfile,
+which holds one pstats.Stats for the whole batch and one per variant, and saves them in the batch folder when
+the batch is done.
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import logging
+import pstats
+from cProfile import Profile
+from enum import IntEnum
+from pathlib import Path
+from time import perf_counter
+from textwrap import dedent
+
+# [2. third-party]
+
+# [3. local]
+from ..core.utils import SamplingProfiler
+from ..core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from ..core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from ..core.typing import AnnotationDeclarations
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'ReplicProfilerEnum',
+    'ReplicProfile',
+    'BatchProfile',
+    'profile_call',
+]
+
+log = logging.getLogger('system')
+
+# Names of the stats files saved in the batch folder (the per-variant file name is formatted with variant ID):
+BATCH_PROFILE_FILE_NAME = 'batch_profile.pstats'
+VARIANT_PROFILE_FILE_NAME = 'batch_profile_v_{}.pstats'
+
+
+class Decl(AnnotationDeclarations):
+    ReplicProfilerEnum = 'ReplicProfilerEnum'
+    ReplicProfile = 'ReplicProfile'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def profile_call(profiler_type: Decl.ReplicProfilerEnum, func: Callable,
+                 *args, **kwargs) -> Tuple[Any, Decl.ReplicProfile]:
+    """
+    Call a function under a profiler.
+    :param profiler_type: the type of profiler to use (must not be ReplicProfilerEnum.none)
+    :param func: the function to call, with args and kwargs
+    :return: a pair (value returned by func, profile of the call); if func raises, no profile is returned
+    """
+    if profiler_type == ReplicProfilerEnum.cprofile:
+        call_cost_sec = _get_cprofile_call_cost_sec()
+        profiler = Profile()
+    else:
+        assert profiler_type == ReplicProfilerEnum.sampling
+        profiler = SamplingProfiler()
+
+    start_sec = perf_counter()
+    profiler.enable()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+    run_time_sec = perf_counter() - start_sec
+
+    profiler.create_stats()
+    if profiler_type == ReplicProfilerEnum.cprofile:
+        num_calls = sum(num_calls for _, num_calls, _, _, _ in profiler.stats.values())
+        overhead_sec = num_calls * call_cost_sec
+    else:
+        overhead_sec = profiler.overhead_sec
+
+    return result, ReplicProfile(profiler_type, profiler.stats, run_time_sec, overhead_sec)
+
+
+def _get_cprofile_call_cost_sec(num_calls: int = 20000) -> float:
+    """Estimate how much time cProfile adds to each function call, by timing calls of an empty function"""
+
+    def empty_func():
+        pass
+
+    def time_calls() -> float:
+        start_sec = perf_counter()
+        for _ in range(num_calls):
+            empty_func()
+        return perf_counter() - start_sec
+
+    unprofiled_sec = time_calls()
+    profiler = Profile()
+    profiler.enable()
+    try:
+        profiled_sec = time_calls()
+    finally:
+        profiler.disable()
+
+    return max(0.0, profiled_sec - unprofiled_sec) / num_calls
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class ReplicProfilerEnum(IntEnum):
+    """
+    Profiler used for each replication of a batch: none (profiling off), cprofile (exact call counts and times,
+    but slows the replication down a lot when the scenario makes many calls), or sampling (see SamplingProfiler:
+    low overhead, but estimated).
+    """
+    none, cprofile, sampling = range(3)
+
+
+class ReplicProfile:
+    """
+    POD structure with the profile of one replication, returned by the replication process to the batch sim manager
+    (hence picklable).
+    """
+
+    def __init__(self, profiler_type: ReplicProfilerEnum, stats: Dict[Tuple, Tuple],
+                 run_time_sec: float, overhead_sec: float):
+        """
+        :param profiler_type: the type of profiler used
+        :param stats: the stats, in the format of cProfile.Profile.stats
+        :param run_time_sec: wall clock time of the profiled replication run
+        :param overhead_sec: estimate of the part of run_time_sec that is due to profiling
+        """
+        self.profiler_type = profiler_type
+        self.stats = stats
+        self.run_time_sec = run_time_sec
+        self.overhead_sec = overhead_sec
+
+    def get_pstats(self) -> pstats.Stats:
+        """Get a new pstats.Stats with this profile's stats (which it does not modify)"""
+        return pstats.Stats(_StatsSource(self.stats))
+
+
+class _StatsSource:
+    """
+    Source of stats for pstats.Stats, which accepts any object that has create_stats() and stats (it takes the
+    stats and resets them to empty). Each instance gives a copy of the stats, so the caller's dict is not modified
+    as the pstats.Stats gets other stats added.
+    """
+
+    def __init__(self, stats: Dict[Tuple, Tuple]):
+        self.stats = dict(stats)
+
+    def create_stats(self):
+        pass
+
+
+class BatchProfile:
+    """
+    Merges the profiles of the replications of a batch as they get done: one pstats.Stats for the whole batch,
+    and one per variant. Also totals the run time of the profiled replications and the estimated cost of
+    profiling them.
+    """
+
+    def __init__(self, profiler_type: ReplicProfilerEnum):
+        self.__profiler_type = profiler_type
+        self.__batch_stats = None
+        self.__variant_stats = {}  # variant ID -> pstats.Stats
+        self.__num_replics = 0
+        self.__run_time_sec = 0.0
+        self.__overhead_sec = 0.0
+
+    def add_replic_profile(self, variant_id: int, replic_profile: ReplicProfile):
+        """Merge the profile of a replication of given variant"""
+        if self.__batch_stats is None:
+            self.__batch_stats = replic_profile.get_pstats()
+        else:
+            self.__batch_stats.add(replic_profile.get_pstats())
+
+        variant_stats = self.__variant_stats.get(variant_id)
+        if variant_stats is None:
+            self.__variant_stats[variant_id] = replic_profile.get_pstats()
+        else:
+            variant_stats.add(replic_profile.get_pstats())
+
+        self.__num_replics += 1
+        self.__run_time_sec += replic_profile.run_time_sec
+        self.__overhead_sec += replic_profile.overhead_sec
+
+    def get_profiler_type(self) -> ReplicProfilerEnum:
+        return self.__profiler_type
+
+    def get_stats(self) -> Optional[pstats.Stats]:
+        """Get the merged stats of all replications profiled so far (None if none)"""
+        return self.__batch_stats
+
+    def get_variant_stats(self, variant_id: int) -> Optional[pstats.Stats]:
+        """Get the merged stats of the replications of given variant profiled so far (None if none)"""
+        return self.__variant_stats.get(variant_id)
+
+    def get_num_replics(self) -> int:
+        """Get the number of replications profiled so far"""
+        return self.__num_replics
+
+    def get_run_time_sec(self) -> float:
+        """Get the total run time of the replications profiled so far"""
+        return self.__run_time_sec
+
+    def get_overhead_sec(self) -> float:
+        """Get the estimated part of the total run time that is due to profiling"""
+        return self.__overhead_sec
+
+    def get_summary(self) -> str:
+        """Get a summary of the profiling, to report with the results of the batch"""
+        overhead_percent = 100 * self.__overhead_sec / self.__run_time_sec if self.__run_time_sec else 0.0
+        return dedent("""\
+            Profiling ({}): {} replications profiled, {:.2f} sec run time
+            Estimated profiling cost: {:.2f} sec ({:.1f}% of run time)
+        """).format(self.__profiler_type.name, self.__num_replics, self.__run_time_sec,
+                    self.__overhead_sec, overhead_percent)
+
+    def save(self, folder: PathType) -> List[Path]:
+        """
+        Save the merged stats to .pstats files in folder: BATCH_PROFILE_FILE_NAME for the whole batch, and
+        VARIANT_PROFILE_FILE_NAME for each variant. Nothing is saved if no replication was profiled.
+        :return: the paths of the files saved
+        """
+        if self.__batch_stats is None:
+            return []
+
+        paths = [Path(folder, BATCH_PROFILE_FILE_NAME)]
+        self.__batch_stats.dump_stats(str(paths[0]))
+        for variant_id, variant_stats in sorted(self.__variant_stats.items()):
+            path = Path(folder, VARIANT_PROFILE_FILE_NAME.format(variant_id))
+            variant_stats.dump_stats(str(path))
+            paths.append(path)
+
+        log.info('Batch profile of {} replications saved to {}', self.__num_replics, paths[0])
+        return paths
+
+    profiler_type = property(get_profiler_type)
+    stats = property(get_stats)
+    num_replics = property(get_num_replics)
+    run_time_sec = property(get_run_time_sec)
+    overhead_sec = property(get_overhead_sec)
@@ -46,10 +46,12 @@ from ..core.typing import Any, Either, Optional, List, Tuple, Sequence, Set, Dic
 from ..core.typing import AnnotationDeclarations
 from ..scenario import ScenarioManager, Scenario, SimSteps
 from ..scenario import create_batch_data_file, get_db_path, BatchDataMgr, DataPathTypesEnum, BATCH_TIMESTAMP_FMT
+from ..scenario import SIM_METRICS_FILE_NAME
 from ..scenario.defn_parts import RunRolesEnum
 
 from .bg_replication import ReplicSimState, BatchSetup, ReplicSimConfig, ReplicStatusEnum, ReplicationError
 from .bg_replication import run_bg_replic, get_replic_path, ReplicExitReasonEnum
+from .batch_profiling import ReplicProfilerEnum, ReplicProfile, BatchProfile
 from .seed_table import SeedTable, MIN_VARIANT_ID, MIN_REPLIC_ID
 
 # -- Meta-data ----------------------------------------------------------------------------------
@@ -277,7 +279,7 @@ class _BsmStateRunning(BaseFsmState, CapturesNextReadyScenPath):
         if sim_steps is None:
             sim_steps = bsm.get_scen_sim_steps()
         batch_setup = BatchSetup(bsm.scen_path, batch_folder, sim_steps, settings.save_scen_on_exit,
-                                 **bsm._app_settings)
+                                 profiler=bsm.profiler, **bsm._app_settings)
 
         # queue a work item for each replication (NxM replications)
         self._worker_pool = mp.Pool(num_cores_actual, maxtasksperchild=1)
@@ -493,6 +495,7 @@ class _BsmStateDone(BaseFsmState, CapturesNextReadyScenPath):
         log.info('Summary:')
         for line in self._batch_mon.get_summary().splitlines():
             log.info('    {}', line)
+        self._batch_mon.save_profile()
 
         if batch_log_file_handler is not None:
             logging.getLogger('system').removeHandler(batch_log_file_handler)
@@ -754,6 +757,12 @@ class BatchSimManager(IFsmOwner):
 
             if hasattr(app_settings, 'loop_log_level') and app_settings.loop_log_level is not None:
                 self._app_settings['loop_log_level'] = app_settings.loop_log_level
+            if getattr(app_settings, 'metrics_out', None) is not None:
+                self._app_settings['save_metrics'] = True
+
+        self.__profiler = ReplicProfilerEnum.none
+        if app_settings and getattr(app_settings, 'batch_profiler', None) is not None:
+            self.__profiler = ReplicProfilerEnum[app_settings.batch_profiler]
 
         self.__scen_sim_step_settings = None
         self.__auto_load_settings = True
@@ -860,6 +869,18 @@ class BatchSimManager(IFsmOwner):
         """Get the seed table. If settings.auto_seed is True, returns None"""
         return self._settings.seed_table
 
+    def set_profiler(self, profiler: ReplicProfilerEnum):
+        """
+        Set the profiler with which each replication of the next batch will run. When not ReplicProfilerEnum.none,
+        the profiles of the replications are merged as they complete (see get_batch_profile()), and saved in the
+        batch folder when the batch is done, with the cost of profiling reported in the batch summary.
+        """
+        self.__profiler = profiler
+
+    def get_profiler(self) -> ReplicProfilerEnum:
+        """Get the profiler with which each replication of the next batch will run"""
+        return self.__profiler
+
     # In the non-ready states, the following methods will work:
 
     def is_running(self) -> bool:
@@ -932,11 +953,43 @@ class BatchSimManager(IFsmOwner):
         """
         return self._state.get_batch_results_scen_path()
 
+    @ret_val_on_attrib_except(None)
+    def get_batch_profile(self) -> Optional[BatchProfile]:
+        """
+        Get the profile of the replications of the last/current batch completed so far. Returns None if the batch
+        was not profiled.
+        """
+        return self._state._batch_mon.get_batch_profile()
+
     @ret_val_on_attrib_except(None)
     def get_replic_path(self, variant_id: int, replic_id: int) -> Path:
         """Get the path for the replication from last/current batch"""
         return self._state._batch_mon.get_replic_path(variant_id, replic_id)
 
+    def save_replic_metrics(self, path: PathType):
+        """
+        Save the simulation metrics of the replications of the last/current batch to a JSON file: a list with one
+        item per replication that saved its metrics (see BatchSetup.save_metrics), each having the variant and
+        replication IDs in addition to the metrics.
+        :param path: path of the JSON file to create
+        """
+        batch_folder = self.get_batch_folder()
+        replics_metrics = []
+        if batch_folder is not None:
+            for variant_id in range(MIN_VARIANT_ID, MIN_VARIANT_ID + self.num_variants):
+                for replic_id in range(MIN_REPLIC_ID, MIN_REPLIC_ID + self.num_replics_per_variant):
+                    metrics_path = get_replic_path(batch_folder, variant_id, replic_id) / SIM_METRICS_FILE_NAME
+                    if not metrics_path.exists():
+                        continue
+                    with metrics_path.open() as metrics_file:
+                        replic_metrics = dict(variant_id=variant_id, replic_id=replic_id)
+                        replic_metrics.update(json.load(metrics_file))
+                        replics_metrics.append(replic_metrics)
+
+        with Path(path).open('w') as metrics_file:
+            json.dump(replics_metrics, metrics_file, indent=4)
+        log.info('Sim metrics of {} replications saved to {}', len(replics_metrics), path)
+
     def wait_till_done(self, max_time_sec=None):
         """
         Wait till the BSM is back in ready state, or at most max_time_sec if given. Returns whether the BSM is
@@ -994,10 +1047,12 @@ class BatchSimManager(IFsmOwner):
     num_replics_per_variant = property(get_num_replics_per_variant)
 
     seed_table = property(get_seed_table)
+    profiler = property(get_profiler, set_profiler)
     scen_path = property(get_scen_path)
     batch_runs_path = property(get_batch_runs_path)
     batch_folder = property(get_batch_folder)
     batch_results_scen_path = property(get_batch_results_scen_path)
+    batch_profile = property(get_batch_profile)
 
     num_cores_actual = property(get_num_cores_actual)
     num_replics_in_progress = property(get_num_replics_in_progress)
@@ -1151,6 +1206,7 @@ class BatchMonitor:
         self.__num_cores_actual = num_cores_start
         self.__replics_in_queue = []
         self.__replic_results = {}  # each replication has a status as result (indicating its completion status)
+        self.__batch_profile = None if bsm.profiler == ReplicProfilerEnum.none else BatchProfile(bsm.profiler)
 
         self.__start_time = datetime.now()
         self.__done_time = None
@@ -1245,6 +1301,20 @@ class BatchMonitor:
         """Get number of variants that have all their replications completed but at least one replication failed."""
         return len(self.get_variants_failed())
 
+    def get_batch_profile(self) -> Optional[BatchProfile]:
+        """Get the merged profile of the replications done so far; None if the batch is not profiled"""
+        return self.__batch_profile
+
+    def save_profile(self):
+        """Save the merged profile to the batch folder, if the batch is profiled"""
+        if self.__batch_profile is None:
+            return
+        with self.__pool_mutex:
+            try:
+                self.__batch_profile.save(self.__batch_folder)
+            except Exception as exc:
+                log.error('Could not save the batch profile: {}', exc)
+
     def get_exec_time(self) -> timedelta:
         """Return the amount of time used to run a batch simulation"""
         if self.__done_time is None:
@@ -1264,7 +1334,7 @@ class BatchMonitor:
         else:
             replics_failed = '(replic IDs: {})'.format(', '.join(str(id) for id in self.get_replics_failed()))
 
-        return dedent("""\
+        summary = dedent("""\
             Queued at start: {} replications ({} variants)
             Variants with failures: {} of {} {}
             Replications failed: {} of {} {}
@@ -1274,19 +1344,26 @@ class BatchMonitor:
                     num_replics_failed, self.get_num_replics_done(), replics_failed,
                     self.get_exec_time(),
                     )
+        if self.__batch_profile is not None:
+            with self.__pool_mutex:
+                summary += self.__batch_profile.get_summary()
+
+        return summary
 
     # --------------------------- instance _PROTECTED and _INTERNAL methods ---------------------
     # --------------------------- instance _PROTECTED and _INTERNAL properties --------
 
     @internal(_BsmStateRunning)
-    def _on_background_replic_done(self, result: Tuple[int, int, ReplicStatusEnum]):
+    def _on_background_replic_done(self, result: Tuple[int, int, ReplicStatusEnum, Optional[ReplicProfile]]):
         """
         Called when a replication has completed (returned) successfully
-        :param result: the tuple returned by self._child_replication
+        :param result: the tuple returned by run_bg_replic()
         """
-        variant_id, replic_id, status = result
+        variant_id, replic_id, status, profile = result
         log.info('Got status "{}" for replication ({},{})', get_enum_val_name(status), variant_id, replic_id)
         with self.__pool_mutex:
+            if profile is not None:
+                self.__batch_profile.add_replic_profile(variant_id, profile)
             self.__update_state(variant_id, replic_id, status)
             # Notify the GUI that replications have been completed.
             total_replics = self.__num_variants * self.__num_replics_per_variant
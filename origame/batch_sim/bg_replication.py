@@ -32,13 +32,15 @@ import sys
 
 # [3. local]
 from ..core import LogManager, log_level_int, log_level_name
-from ..core.utils import ori_profile, ClockTimer
+from ..core.utils import ClockTimer
 from ..core.signaling import setup_bridge_for_console
 from ..core.typing import Any, Either, Optional, List, Tuple, Sequence, Set, Dict, Iterable, Callable, PathType
 from ..core.typing import AnnotationDeclarations
 
 from ..scenario import SimController, SimStatesEnum, SimSteps, SimControllerSettings, RunRolePartsError
-from ..scenario import proto_compat_warn, DataPathTypesEnum
+from ..scenario import proto_compat_warn, DataPathTypesEnum, SIM_METRICS_FILE_NAME
+
+from .batch_profiling import ReplicProfilerEnum, ReplicProfile, profile_call
 
 # -- Meta-data ----------------------------------------------------------------------------------
 
@@ -64,9 +66,6 @@ __all__ = [
 
 log = logging.getLogger('system')
 
-# set this to True if profile data should be generated for each replication (each one gets its own .pstats file)
-PROFILE_BATCH_REPLICATIONS = False
-
 
 class Decl(AnnotationDeclarations):
     BatchSetup = 'BatchSetup'
@@ -101,7 +100,8 @@ def setup_variant(bridged_ui: bool):
 
 def run_bg_replic(batch_setup: Decl.BatchSetup,
                   sim_config: Decl.ReplicSimConfig,
-                  shared_sim_state: Decl.ReplicSimState) -> Tuple[int, int, Decl.ReplicStatusEnum]:
+                  shared_sim_state: Decl.ReplicSimState) -> Tuple[int, int, Decl.ReplicStatusEnum,
+                                                                  Optional[ReplicProfile]]:
     """
     Start a replication. This is called by multiprocessing.Pool *in separate process* to start a replication.
 
@@ -112,7 +112,8 @@ def run_bg_replic(batch_setup: Decl.BatchSetup,
     :param sim_config: ReplicSimConfig instance containing run parameters specific to sim (random seed etc)
     :param shared_sim_state: the shared sim state, instance of ReplicSimState
 
-    :returns: (variant_id, replic_id, status), where status is one of ReplicStatusEnum constants
+    :returns: (variant_id, replic_id, status, profile), where status is one of ReplicStatusEnum constants, and
+        profile is the ReplicProfile of the run if batch_setup.profiler is not ReplicProfilerEnum.none, else None
     :raises ReplicationError: when something went wrong in replication process; this exception got
         pickled in process and carried over to parent process.
     """
@@ -127,7 +128,7 @@ def run_bg_replic(batch_setup: Decl.BatchSetup,
         shared_sim_state.update_exit()
         if shared_sim_state.need_exit():
             log.warning("Replication ({},{}) will NOT be created", variant_id, replic_id)
-            return variant_id, replic_id, ReplicExitReasonEnum.stopped
+            return variant_id, replic_id, ReplicExitReasonEnum.stopped, None
 
         # ok, replication needed, create its folder; user-facing IDs start at 1 instead of 0
         replic_path = get_replic_path(batch_setup.batch_folder, variant_id, replic_id)
@@ -139,11 +140,11 @@ def run_bg_replic(batch_setup: Decl.BatchSetup,
 
         # start and run it:
         replication = Replication(batch_setup, sim_config)
-        if PROFILE_BATCH_REPLICATIONS:
-            replication.run = ori_profile(replication.run, batch_setup.scen_path, v=variant_id, r=replic_id)
-        result = replication.run(shared_sim_state)
+        if batch_setup.profiler == ReplicProfilerEnum.none:
+            return replication.run(shared_sim_state) + (None,)
 
-        return result
+        result, profile = profile_call(batch_setup.profiler, replication.run, shared_sim_state)
+        return result + (profile,)
 
     except Exception as exc:
         log.error('Exception in Replication ({},{}):', variant_id, replic_id)
@@ -351,6 +352,8 @@ class BatchSetup:
                  log_deprecated: bool = False,
                  log_raw_events: bool = False,
                  fix_linking_on_load: bool = True,
+                 save_metrics: bool = False,
+                 profiler: ReplicProfilerEnum = ReplicProfilerEnum.none,
 
                  bridged_ui: bool = False):
         """
@@ -364,6 +367,10 @@ class BatchSetup:
             each replication uses the same file, so this option really only makes sense for 1x1 batch!
         :param fix_linking_on_load: if True, linking will be verified on load and fixed (should only be
             required for prototype scenarios)
+        :param save_metrics: if True, each replication saves the metrics of its simulation (see SimMetrics) to
+            SIM_METRICS_FILE_NAME in its folder
+        :param profiler: the profiler to run each replication with; the profile is returned with the replication
+            result (see run_bg_replic())
 
         :param max_sim_time_days: sim time (days) at which replication should exit
         :param max_wall_clock_sec: real-time (seconds) at which replication should exit
@@ -383,6 +390,8 @@ class BatchSetup:
         self.log_deprecated = log_deprecated
         self.log_raw_events = log_raw_events
         self.fix_linking_on_load = fix_linking_on_load
+        self.save_metrics = save_metrics
+        self.profiler = profiler
 
         self.save_scen_on_exit = save_scen_on_exit
         self.bridged_ui = bridged_ui
@@ -429,6 +438,7 @@ class Replication:
         self.__r_id = replic_id
         self.__replic_folder = sim_config.replic_path
         self.__save_scen_on_exit = batch_config.save_scen_on_exit
+        self.__save_metrics = batch_config.save_metrics
         self.__sim_loop_log_level = batch_config.loop_log_level
 
         self.__replic_status = ReplicStatusEnum.initialized
@@ -530,7 +540,17 @@ class Replication:
             # batch replication data automatically gets saved if there is any. *So* we have to save the batch
             # replication data *first* AND clear it, so it doesn't get saved in the wrong place on scenario shutdown.
             self.__scenario_mgr.scenario.save_batch_replic_data(clear_after=True)
-            # regardless of success, attempt to save scenario in case final state useful for debugging
+            if self.__save_metrics:
+                # the metrics are not essential, they must not prevent the final save of the scenario:
+                try:
+                    self.__sim_controller.metrics.save(Path(self.__replic_folder, SIM_METRICS_FILE_NAME))
+                except Exception as exc:
+                    log.error('Replication ({},{}) could not save its sim metrics: {}',
+                              self.__v_id, self.__r_id, exc)
+            # regardless of success, attempt to save scenario in case final state useful for debugging. This is
+            # synchronous because there is nothing to overlap the write with: the pool runs one replication per
+            # worker process (maxtasksperchild=1), the process exit waits for the threads of save_async(), and
+            # the pool only starts the next replication's process once this one has exited.
             if self.__save_scen_on_exit:
                 self.__scenario_mgr.save(Path(self.__replic_folder, 'final_scenario.ori'))
 
@@ -132,6 +132,15 @@ class RunScenCmdLineArgs(ArgumentParser):
                           type=int, default=0,
                           help="The maximum number of cores to utilize for the configured scenario run. "
                                "Optional. Zero distributes batch replications across all available cores.")
+        self.add_argument("--metrics-out",
+                          type=str, default=None,
+                          help="Pathname of a JSON file in which to save the simulation metrics of each "
+                               "replication (events/sec, queue depth, part execution times, etc). Optional.")
+        self.add_argument("--batch-profiler",
+                          choices=['cprofile', 'sampling'], default=None,
+                          help="Profile each replication with the given profiler, and save the merged profile "
+                               "of the batch (and of each variant) as .pstats files in the batch folder. "
+                               "Optional. The sampling profiler costs less but its numbers are estimates.")
 
 
 class BaseCmdLineArgsParser(ArgumentParser):
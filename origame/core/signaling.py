@@ -125,9 +125,12 @@ class BackendSignal:
     in order to provide for code completion from IDE, stub methods are provided for these.
     """
 
-    def __init__(self, *types: List[type]):
+    def __init__(self, *types: List[type], coalesce: bool = False):
         """
         :param types: array of types accepted as payload when emitted
+        :param coalesce: True if only the latest data emitted is of interest to slots (state signals, like a
+            counter or clock value). This allows the GUI variant to send the data of such signals at a limited
+            rate; in the Console variant, slots are always called at every emit.
         """
         self.__types = types
         self.__bound_signals = {}
@@ -17,9 +17,12 @@ Version History: See SVN log.
 # [1. standard library]
 import logging
 import re
+import sys
 import keyword
+from collections import Counter, defaultdict
 from datetime import timedelta
-from time import time
+from time import time, perf_counter
+from threading import Thread, Event, get_ident
 from cProfile import Profile
 from enum import Enum
 from pathlib import Path
@@ -50,7 +53,9 @@ __all__ = [
     'get_enum_val_name',
     'UniqueIdGenerator',
     'BlockProfiler',
+    'get_profile_path',
     'ori_profile',
+    'SamplingProfiler',
     'ClockTimer',
     'plural_if',
     'bool_to_not',
@@ -279,6 +284,19 @@ def select_object(objects: List[TAny], attr_path: str, val: TAny) -> TAny:
     return None
 
 
+def get_profile_path(scen_path: PathType, suffix: str, **out_info) -> Path:
+    """
+    Get the path of a profiling output file for a scenario: if scen_path is c:\\folder\path.ori and suffix is
+    '.pstats', this is c:\\folder\path.pstats; if out_info is v=1, r=2, it is c:\\folder\path_v_1_r_2.pstats.
+    """
+    scen_path = Path(scen_path)
+    if out_info:
+        extra = ['{}_{}'.format(name[0], val) for name, val in out_info.items()]
+        extra_str = '_'.join(extra)
+        scen_path = scen_path.with_name(scen_path.stem + '_' + extra_str)
+    return scen_path.with_suffix(suffix)
+
+
 class BlockProfiler(Profile):
     """
     This can be used to profile various portions of Origame. Use like this:
@@ -300,12 +318,7 @@ class BlockProfiler(Profile):
     def __init__(self, scen_path: PathType, **out_info):
         """If out_info is not empty, appends their string rep to the stats file path name"""
         Profile.__init__(self)
-        scen_path = Path(scen_path)
-        if out_info:
-            extra = ['{}_{}'.format(name[0], val) for name, val in out_info.items()]
-            extra_str = '_'.join(extra)
-            scen_path = scen_path.with_name(scen_path.stem + '_' + extra_str)
-        self.out_path = scen_path.with_suffix('.pstats')
+        self.out_path = get_profile_path(scen_path, '.pstats', **out_info)
 
     def __enter__(self):
         log.warning("Profiling starting")
@@ -341,6 +354,156 @@ def ori_profile(func: TCallable, scen_path: PathType, **out_info) -> TCallable:
     return wrapper
 
 
+class SamplingProfiler:
+    """
+    Statistical profiler: once enabled, a background thread samples the call stack of the thread that called
+    enable(), every interval_sec, until disable(). This costs much less than cProfile (which traces every call)
+    but only sees Python functions, and its numbers are estimates.
+
+    Like cProfile.Profile, it has create_stats() and a stats attribute, so it can be given to pstats.Stats: the
+    number of calls of a function is the number of samples in which it was on the stack. Each sample stands for the
+    time elapsed since the previous sample, which is longer than the interval (the sampling thread must get the GIL,
+    and taking a sample takes time), so the times of a function are the sums of the times of its samples. If
+    record_stacks is True, the number of samples and the time of each distinct stack are also kept (see
+    get_stacks() and get_stack_times()).
+    """
+
+    DEFAULT_INTERVAL_SEC = 0.005
+
+    def __init__(self, interval_sec: float = DEFAULT_INTERVAL_SEC, record_stacks: bool = False):
+        self.stats = {}
+
+        self.__interval_sec = interval_sec
+        self.__record_stacks = record_stacks
+        self.__thread_id = None
+        self.__sampler = None
+        self.__stop_sampling = Event()
+
+        self.__num_samples = 0
+        self.__overhead_sec = 0.0
+        self.__last_sample_sec = None  # perf_counter() at the previous sample (or at enable())
+        self.__self_sec = Counter()  # function key -> time of the samples in which it was executing
+        self.__stack_samples = Counter()  # function key -> number of samples in which it was on the stack
+        self.__stack_sec = Counter()  # function key -> time of the samples in which it was on the stack
+        self.__caller_samples = defaultdict(Counter)  # function key -> caller function key -> number of samples
+        self.__caller_sec = defaultdict(Counter)  # function key -> caller function key -> time of samples
+        self.__stack_counts = Counter()  # tuple of function keys, outermost first -> number of samples
+        self.__stack_times = Counter()  # tuple of function keys, outermost first -> time of samples
+
+    def enable(self):
+        """Start sampling the stack of the calling thread"""
+        if self.__sampler is not None:
+            return
+        self.__thread_id = get_ident()
+        self.__stop_sampling.clear()
+        self.__last_sample_sec = perf_counter()
+        self.__sampler = Thread(target=self.__sample_till_stopped, name='SamplingProfiler', daemon=True)
+        self.__sampler.start()
+
+    def disable(self):
+        """Stop sampling; returns once the sampling thread has exited"""
+        if self.__sampler is None:
+            return
+        self.__stop_sampling.set()
+        self.__sampler.join()
+        self.__sampler = None
+
+    def create_stats(self):
+        """Stop sampling and put the samples in self.stats, in the same format as cProfile.Profile.stats"""
+        self.disable()
+        self.stats = {}
+        for func_key, num_on_stack in self.__stack_samples.items():
+            caller_sec = self.__caller_sec[func_key]
+            callers = {caller_key: (count, count, 0.0, caller_sec[caller_key])
+                       for caller_key, count in self.__caller_samples[func_key].items()}
+            self.stats[func_key] = (num_on_stack, num_on_stack,
+                                    self.__self_sec[func_key], self.__stack_sec[func_key],
+                                    callers)
+
+    def get_interval_sec(self) -> float:
+        """Get the time between samples"""
+        return self.__interval_sec
+
+    def get_num_samples(self) -> int:
+        """Get the number of stack samples taken so far"""
+        return self.__num_samples
+
+    def get_stacks(self) -> Dict[Tuple[Tuple[str, int, str], ...], int]:
+        """
+        Get the number of samples of each distinct stack sampled, if record_stacks was True at init (else the map
+        is empty). Each stack is a tuple of function keys (same as the keys of self.stats), outermost call first.
+        """
+        return dict(self.__stack_counts)
+
+    def get_stack_times(self) -> Dict[Tuple[Tuple[str, int, str], ...], float]:
+        """
+        Get the time (in seconds) of the samples of each distinct stack sampled, if record_stacks was True at init
+        (else the map is empty). The keys are the same as those of get_stacks().
+        """
+        return dict(self.__stack_times)
+
+    def get_sampled_sec(self) -> float:
+        """Get the total time of the samples taken so far"""
+        return sum(self.__self_sec.values())
+
+    def get_overhead_sec(self) -> float:
+        """
+        Get the time spent by the sampling thread taking samples. Since the thread needs the GIL to take a sample,
+        this is an estimate of the time taken from the profiled thread.
+        """
+        return self.__overhead_sec
+
+    interval_sec = property(get_interval_sec)
+    num_samples = property(get_num_samples)
+    sampled_sec = property(get_sampled_sec)
+    overhead_sec = property(get_overhead_sec)
+
+    def __sample_till_stopped(self):
+        while not self.__stop_sampling.wait(self.__interval_sec):
+            start_sec = perf_counter()
+            # the sample stands for all the time since the previous one, however late this one is:
+            sample_sec = start_sec - self.__last_sample_sec
+            self.__last_sample_sec = start_sec
+            frame = sys._current_frames().get(self.__thread_id)
+            if frame is not None:
+                self.__add_sample(frame, sample_sec)
+            self.__overhead_sec += perf_counter() - start_sec
+
+    def __add_sample(self, frame, sample_sec: float):
+        """Add the stack of given frame (the innermost) to the samples, as lasting sample_sec"""
+        self.__num_samples += 1
+        func_key = self.__get_func_key(frame)
+        self.__self_sec[func_key] += sample_sec
+
+        # a recursive function is counted once per sample, at its innermost call
+        seen = set()
+        stack = [func_key]
+        while frame is not None:
+            caller_frame = frame.f_back
+            caller_key = None if caller_frame is None else self.__get_func_key(caller_frame)
+            if func_key not in seen:
+                seen.add(func_key)
+                self.__stack_samples[func_key] += 1
+                self.__stack_sec[func_key] += sample_sec
+                if caller_key is not None:
+                    self.__caller_samples[func_key][caller_key] += 1
+                    self.__caller_sec[func_key][caller_key] += sample_sec
+            if caller_key is not None:
+                stack.append(caller_key)
+            frame, func_key = caller_frame, caller_key
+
+        if self.__record_stacks:
+            stack = tuple(reversed(stack))
+            self.__stack_counts[stack] += 1
+            self.__stack_times[stack] += sample_sec
+
+    @staticmethod
+    def __get_func_key(frame) -> Tuple[str, int, str]:
+        """Get the key of the function of a frame, same as cProfile"""
+        code = frame.f_code
+        return code.co_filename, code.co_firstlineno, code.co_name
+
+
 class ClockTimer:
     """
     Track wall-clock time. The time stops increasing after pause(), resumes increasing
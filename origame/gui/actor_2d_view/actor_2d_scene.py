@@ -16,7 +16,7 @@ Version History: See SVN log.
 
 # [1. standard library]
 import logging
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, WeakValueDictionary
 from enum import IntEnum, unique
 
 # [2. third-party]
@@ -76,6 +76,14 @@ log = logging.getLogger('system')
 # The intent is to have consistent height for all the title bars.
 DEFAULT_TITLE_BAR_HEIGHT = 20
 
+# The data of child part items (table content, variable values, etc) is only populated once the item is in the
+# visible part of the scene, expanded by this margin (in scene pixels) so that content is ready when scrolling:
+LAZY_POPULATE_VIEW_MARGIN = 200
+# Below this view scale, the content of part items is too small to be read, so its data is not populated:
+LAZY_POPULATE_MIN_VIEW_SCALE = 0.2
+# Maximum number of part items populated per pass of the event loop, so the GUI stays responsive:
+MAX_ITEMS_POPULATED_PER_PASS = 50
+
 
 class Decl(AnnotationDeclarations):
     Actor2dScene = 'Actor2dScene'
@@ -308,6 +316,10 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
 
         self.__detail_level_override = DetailLevelOverrideEnum.none
         self.__view_rect = None
+        self.__view_scale = 1.0
+        # Map ID of each child part to its item, for the items that have not had their data populated yet:
+        self.__unpopulated_items = {}
+        self.__populate_pass_pending = False
         self.selectionChanged.connect(self.__slot_on_selection_changed)
         #  Set by view so view can be restored when re-activate scene:
         self.__view_center = center  # Position object
@@ -315,6 +327,8 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
 
         # first create all the part items:
         self.__link_objs = WeakKeyDictionary()
+        # Map link session ID to PartLink, so link objects can be found without scanning all links:
+        self.__map_link_ids_to_links = WeakValueDictionary()
         self.__create_scenario_items(children)
 
         # We need to maintain this state because it is needed when a new part is created.
@@ -388,8 +402,18 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
 
     @override(QGraphicsScene)
     def drawBackground(self, painter: QPainter, rect: QRectF):
-        """Overwrite this function so we can get and reuse the visible rect without compute manually every time"""
+        """
+        Overwrite this function so we can get and reuse the visible rect without compute manually every time. Since
+        this gets called every time the view scrolls or zooms, it is also used to populate the data of the part items
+        that have become visible. Repaints that don't change the visible rect (e.g. those due to animation) don't
+        trigger a populate pass.
+        """
+        view_scale = painter.worldTransform().m11()
+        view_changed = rect != self.__view_rect or view_scale != self.__view_scale
         self.__view_rect = rect
+        self.__view_scale = view_scale
+        if view_changed and self.__unpopulated_items:
+            self.__schedule_populate_pass()
 
     def on_grobj_item_disposed(self, grobj_item: QGraphicsObject):
         """
@@ -421,6 +445,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
         for part_link, link_item in self.__link_objs.items():
             link_item.on_part_link_removed()
         self.__link_objs = WeakKeyDictionary()
+        self.__map_link_ids_to_links = WeakValueDictionary()
 
         # WARNING: super().clear() deletes the items, which is not good: must let Python GC decide when
         child_part_items = list(self.__map_child_parts_to_items.values())
@@ -430,6 +455,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
                 self.__remove_child_part_item(item.part.SESSION_ID)
 
         self.__map_child_parts_to_items = {}
+        self.__unpopulated_items = {}
         self.__ifx_port_items_tracker.reset()
 
         self.__parent_proxy_item = None
@@ -437,7 +463,9 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
 
     def override_detail_level(self, detail_level_override: DetailLevelOverrideEnum):
         """
-        Override the detail level of each part in the scene.
+        Override the detail level of each part in the scene. When the override is minimal, the content of the
+        part items is not shown so the data of items not yet populated remains unpopulated until the override
+        is changed.
         :param detail_level_override: The detail level override to be applied to each inner item.
         """
         assert detail_level_override in DetailLevelOverrideEnum
@@ -447,6 +475,12 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
             item.inner_item.override_detail_level(detail_level_override)
 
         self.__detail_level_override = detail_level_override
+        if self.__unpopulated_items:
+            self.__schedule_populate_pass()
+
+    def get_num_unpopulated_items(self) -> int:
+        """Get the number of child part items that have not had their data populated yet"""
+        return len(self.__unpopulated_items)
 
     def get_view_center_2d(self) -> Position:
         """
@@ -697,9 +731,9 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
 
             self.sig_part_added.emit(child_part)
 
-        # This single shot allows the Qt to show the item before its content is populated.
-        # Note: this approach does not work if the time consuming content population is GIL-related.
-        QTimer.singleShot(0, item.inner_item.populate_data)
+            # The content is populated on a later pass of the event loop, once the item is visible: this allows
+            # the Qt to show the item before its content is populated.
+            self.__add_unpopulated_item(item)
 
     def on_child_part_removed(self, part_id: int):
         """
@@ -733,16 +767,22 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
         :param link_id: the session ID of the link that was removed.
         :param link_name: the name of the link that was removed.
         """
-        for part_link, link_item in self.__link_objs.items():
-            if part_link.SESSION_ID == link_id:
-                assert link_item.part_link is part_link
-                log.debug("Scene removing link {} (named '{}')", link_id, link_name)
-                self.__link_objs.pop(part_link)
-                link_item.on_part_link_removed()
-                break
+        part_link = self.__map_link_ids_to_links.pop(link_id, None)
+        if part_link is None:
+            return
+
+        link_item = self.__link_objs.pop(part_link, None)
+        if link_item is not None:
+            assert link_item.part_link is part_link
+            log.debug("Scene removing link {} (named '{}')", link_id, link_name)
+            link_item.on_part_link_removed()
 
     def is_item_visible(self, item: IInteractiveItem) -> bool:
         """This function check if this item is visible on 2d view"""
+        if self.__view_rect is None:
+            # not drawn yet
+            return False
+
         rect_item = item.get_highlight_rect()
         scene_item = item.mapRectToScene(rect_item)
 
@@ -822,11 +862,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
         :param part: A part to be associated with a PartBoxItem in the current scene.
         :return: The PartBoxItem associated with the input part, or None.
         """
-        items = self.get_child_part_items()
-        for item in items:
-            if item.part is part:
-                return item
-        return None
+        return self.__map_child_parts_to_items.get(part.SESSION_ID)
 
     # ------------------ O T H E R ------------------------------------------------
 
@@ -898,6 +934,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
 
     is_creating_link = property(get_is_creating_link)
     content_actor = property(get_content_actor)
+    num_unpopulated_items = property(get_num_unpopulated_items)
     view_center_2d = property(get_view_center_2d, set_view_center_2d)
     zoom_factor_2d = property(get_zoom_factor_2d, set_zoom_factor_2d)
 
@@ -907,6 +944,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
         # remove from maps, but do nothing if not in any map:
         try:
             self.__map_child_parts_to_items.pop(item.get_part_id(), None)
+            self.__unpopulated_items.pop(item.get_part_id(), None)
             self.__ifx_port_items_tracker.cleanup_item(item)
         except AttributeError:
             # it is not an item that has a scenario part id, nothing to do
@@ -931,12 +969,57 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
                     self.__create_outgoing_links(child_item)
                     progress.set_progress_value(count + 1)
 
-            def __populate_data():
-                for item in child_items:
-                    item.inner_item.populate_data()
+            # The data is populated only for the items that become visible, after Qt has rendered the items:
+            for child_item in child_items:
+                self.__add_unpopulated_item(child_item)
+
+    def __add_unpopulated_item(self, item: PartBoxItem):
+        """
+        Add an item to the items that need their data populated. The data gets populated by a later populate pass,
+        once the item is in view (see __populate_visible_items()).
+        """
+        self.__unpopulated_items[item.part.SESSION_ID] = item
+        self.__schedule_populate_pass()
+
+    def __schedule_populate_pass(self):
+        """Populate the data of visible items on next pass of the event loop, unless already scheduled"""
+        if not self.__populate_pass_pending:
+            self.__populate_pass_pending = True
+            QTimer.singleShot(0, self.__populate_visible_items)
+
+    def __populate_visible_items(self):
+        """
+        Populate the data of the unpopulated items that are in (or near) the visible part of the scene, provided
+        their content is shown: nothing is populated when the detail level override is minimal or when the view is
+        zoomed out below LAZY_POPULATE_MIN_VIEW_SCALE. At most MAX_ITEMS_POPULATED_PER_PASS items are populated;
+        another pass is scheduled if more visible items remain. The items that are not visible are populated
+        when the view gets scrolled or zoomed to them. The items in view are obtained from the spatial index of
+        the scene, so a pass takes time proportional to the number of items in view, not to the number of items
+        still unpopulated.
+        """
+        self.__populate_pass_pending = False
+        if self.__content_actor is None or self.__view_rect is None:
+            return
+        if self.__detail_level_override == DetailLevelOverrideEnum.minimal:
+            return
+        if self.__view_scale < LAZY_POPULATE_MIN_VIEW_SCALE:
+            return
+
+        margin = LAZY_POPULATE_VIEW_MARGIN
+        populate_rect = self.__view_rect.adjusted(-margin, -margin, margin, margin)
+        visible_ids = [item.part.SESSION_ID for item in self.items(populate_rect, Qt.IntersectsItemBoundingRect)
+                       if isinstance(item, PartBoxItem) and self.__unpopulated_items.get(item.part.SESSION_ID) is item]
+
+        for part_id in visible_ids[:MAX_ITEMS_POPULATED_PER_PASS]:
+            item = self.__unpopulated_items.pop(part_id)
+            if not item.disposed:
+                item.inner_item.populate_data()
 
-            # This single shot is needed to make the Qt render the items as soon as possible.
-            QTimer.singleShot(0, __populate_data)
+        if len(visible_ids) > MAX_ITEMS_POPULATED_PER_PASS:
+            self.__schedule_populate_pass()
+        if visible_ids:
+            log.debug("Scene populated data of {} items ({} remain unpopulated)",
+                      min(len(visible_ids), MAX_ITEMS_POPULATED_PER_PASS), len(self.__unpopulated_items))
 
     def __create_outgoing_links(self, from_item: LinkAnchorItem):
         """
@@ -1040,6 +1123,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
         """
         assert part_id in self.__map_child_parts_to_items
         part_box_item = self.__map_child_parts_to_items.pop(part_id)
+        self.__unpopulated_items.pop(part_id, None)
         child_part = part_box_item.part
         log.debug("Scene removing child part item #{} for part {}", part_box_item.ITEM_ID, child_part)
 
@@ -1074,6 +1158,7 @@ class Actor2dScene(IFsmOwner, QGraphicsScene):
             log.debug("Scene adding {} link item for {}", link_dir, link)
             link_obj = LinkSceneObject(self, link, from_item, target_item)
             self.__link_objs[link] = link_obj
+            self.__map_link_ids_to_links[link.SESSION_ID] = link
         else:
             log.debug("Link {} has a CCA that is not the current content actor; link not rendered.", link)
 
@@ -19,7 +19,7 @@ import logging
 from inspect import signature
 
 # [2. third-party]
-from PyQt5.QtCore import QSize, QObject, pyqtSignal, Qt
+from PyQt5.QtCore import QSize, QObject, pyqtSignal, Qt, QTimer
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtSvg import QSvgWidget
 from PyQt5.QtWidgets import QDialog, QListWidgetItem, QSizePolicy, QHBoxLayout, QStackedLayout
@@ -54,6 +54,7 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 
 __all__ = [
     # public API of module: one line per string
+    'set_max_plot_redraw_rate',
     'DetailLevelChangeButton',
     'InfoTextBrowser',
     'PlotFigureCanvas',
@@ -71,9 +72,23 @@ log = logging.getLogger('system')
 SMALL_ICON_SIZE_WIDTH = 25
 SMALL_ICON_SIZE_HEIGHT = 25
 
+# Maximum number of times per second that a plot canvas redraws its figure in response to figure updates:
+MAX_PLOT_REDRAWS_PER_SEC = 10
+
 
 # -- Function definitions -----------------------------------------------------------------------
 
+def set_max_plot_redraw_rate(max_per_sec: float):
+    """
+    Set the maximum rate at which plot canvases redraw their figure when updated (see PlotFigureCanvas.update_figure()).
+    Applies to the updates requested after this call.
+    """
+    if max_per_sec <= 0:
+        raise ValueError("Plot redraw rate must be > 0 (got {})".format(max_per_sec))
+
+    global MAX_PLOT_REDRAWS_PER_SEC
+    MAX_PLOT_REDRAWS_PER_SEC = max_per_sec
+
 
 # -- Class Definitions --------------------------------------------------------------------------
 
@@ -115,6 +130,32 @@ class PlotFigureCanvas(FigureCanvas):
     def __init__(self, figure):
         super().__init__(figure)
 
+        self.__background = None
+        self.__layout_signature = None
+        self.__last_draw_blitted = False
+        self.__update_pending = False
+        self.__throttle_timer = QTimer(self)
+        self.__throttle_timer.setSingleShot(True)
+        self.__throttle_timer.timeout.connect(self.__slot_on_throttle_timeout)
+
+    def update_figure(self):
+        """
+        Redraw the figure after its data has changed. Redraws are throttled to MAX_PLOT_REDRAWS_PER_SEC: the
+        updates requested while the throttle is active are merged into one redraw at the end of the throttle period.
+
+        When only the data of the plot artists (lines, collections, patches) has changed since the last full draw,
+        i.e. the same artists are in the same axes with the same limits and labels (as when the plot script updates
+        its artists via set_data() etc), only the artists are redrawn over the saved background of the axes
+        (blitting). Otherwise, the whole figure is drawn. Once updates stop (such as when the run is paused or has
+        ended), the whole figure is drawn again, so any change not covered by the blitting gets shown.
+        """
+        if self.__throttle_timer.isActive():
+            self.__update_pending = True
+            return
+
+        self.__redraw()
+        self.__throttle_timer.start(int(1000 / MAX_PLOT_REDRAWS_PER_SEC))
+
     # noinspection PyPep8Naming
     @override(FigureCanvas)
     def mousePressEvent(self, evt):
@@ -123,6 +164,79 @@ class PlotFigureCanvas(FigureCanvas):
         """
         evt.ignore()
 
+    @override(FigureCanvas)
+    def resizeEvent(self, evt):
+        # the saved background no longer matches the canvas
+        self.__layout_signature = None
+        super().resizeEvent(evt)
+
+    def __on_throttle_timeout(self):
+        """Redraw if updates were requested during the throttle period, else make the last draw a full one"""
+        if self.__update_pending:
+            self.__update_pending = False
+            self.__redraw()
+            self.__throttle_timer.start(int(1000 / MAX_PLOT_REDRAWS_PER_SEC))
+
+        elif self.__last_draw_blitted:
+            self.__draw_full()
+
+    def __redraw(self):
+        """Blit the data artists if the layout of the figure has not changed since the last full draw, else draw all"""
+        if self.__background is not None and self.__get_layout_signature() == self.__layout_signature:
+            self.restore_region(self.__background)
+            self.__draw_data_artists()
+            self.blit(self.figure.bbox)
+            self.__last_draw_blitted = True
+        else:
+            self.__draw_full()
+
+    def __draw_full(self):
+        """
+        Draw the whole figure. The figure is first drawn without its data artists so that the background can be
+        saved for blitting.
+        """
+        artists = self.__get_data_artists()
+        for artist in artists:
+            artist.set_animated(True)
+        try:
+            self.draw()
+            self.__background = self.copy_from_bbox(self.figure.bbox)
+        finally:
+            for artist in artists:
+                artist.set_animated(False)
+
+        self.__draw_data_artists()
+        self.blit(self.figure.bbox)
+        self.__layout_signature = self.__get_layout_signature()
+        self.__last_draw_blitted = False
+
+    def __draw_data_artists(self):
+        """Draw the data artists of each axes of the figure over the current canvas content"""
+        for axes in self.figure.get_axes():
+            for artist in self.__get_axes_data_artists(axes):
+                axes.draw_artist(artist)
+
+    def __get_data_artists(self) -> List[Any]:
+        """Get the data artists of all axes of the figure"""
+        return [artist for axes in self.figure.get_axes() for artist in self.__get_axes_data_artists(axes)]
+
+    def __get_axes_data_artists(self, axes) -> List[Any]:
+        """Get the artists that show data in given axes: lines, collections (scatter plots etc) and patches"""
+        return list(axes.lines) + list(axes.collections) + list(axes.patches)
+
+    def __get_layout_signature(self) -> Tuple:
+        """
+        Get a value that changes whenever something other than the data of the data artists changes in the figure:
+        the axes, their position, limits, title, labels and legend, and the set of data artists in each.
+        """
+        return tuple(
+            (id(axes), tuple(axes.get_position().bounds), tuple(axes.viewLim.bounds),
+             axes.get_title(), axes.get_xlabel(), axes.get_ylabel(), id(axes.get_legend()),
+             tuple(id(artist) for artist in self.__get_axes_data_artists(axes)))
+            for axes in self.figure.get_axes())
+
+    __slot_on_throttle_timeout = safe_slot(__on_throttle_timeout)
+
 
 class CallParameters(QLineEdit):
     """
@@ -72,14 +72,7 @@ class EventCounterManager:
             assert self._part.PART_TYPE_NAME in ('function', 'pulse', 'sql')
             self._part.exec_signals.sig_queue_counters_changed.connect(self._slot_queue_counters_changed)
 
-        def __get_init_data():
-            is_next, count_concur, count_after = part_box_item.part.get_queue_counts()
-            return is_next, count_concur, count_after
-
-        def __set_init_data(is_next, count_concur, count_after):
-            self._queue_counters_changed(is_next, count_concur, count_after)
-
-        AsyncRequest.call(__get_init_data, response_cb=__set_init_data)
+        self.__request_queue_counts()
 
     # --------------------------- instance PUBLIC properties and safe_slots ---------------------
 
@@ -113,7 +106,7 @@ class EventCounterManager:
         #     Reason: Colin implemented this class
         # is_next, count_concur, count_after = self.__part_box_item.part.get_queue_counts()
         # self._queue_counters_changed(is_next, count_concur, count_after)
-        AsyncRequest.call(self.__part_box_item.part.get_queue_counts, response_cb=self._queue_counters_changed)
+        self.__request_queue_counts()
 
     def _disconnect_all_slots(self):
         if self._part.PART_TYPE_NAME in 'actor':
@@ -133,3 +126,13 @@ class EventCounterManager:
     # --------------------------- instance _PROTECTED properties and safe slots -----------------
 
     # --------------------------- instance __PRIVATE members-------------------------------------
+
+    def __request_queue_counts(self):
+        """
+        Request the queue counts of the part. The request is scheduled, so when the counts change many times in
+        a row (as in an animated run), only the latest request is sent to the backend.
+        """
+        part_box_item = self.__part_box_item
+        AsyncRequest.schedule(part_box_item.part.get_queue_counts,
+                              response_cb=self._queue_counters_changed,
+                              is_visible=part_box_item.is_in_view)
@@ -1013,7 +1013,8 @@ class VariablePartWidget(FramedPartWidget):
         """
         Sets the data to the GUI.
         """
-        AsyncRequest.call(self._part.get_obj, response_cb=self.set_obj, unpack_response=False)
+        AsyncRequest.schedule(self._part.get_obj, response_cb=self.set_obj, unpack_response=False,
+                              is_visible=self._parent_part_box_item.is_in_view)
 
     def set_obj(self, obj: Any):
         """
@@ -1031,7 +1032,9 @@ class VariablePartWidget(FramedPartWidget):
         def __construct_py_expr():
             return PyExpr(obj)
 
-        AsyncRequest.call(__construct_py_expr, response_cb=__populate_data)
+        # when the object changes many times in a row (as in an animated run), only the latest one is displayed:
+        AsyncRequest.schedule(__construct_py_expr, target=self._part, response_cb=__populate_data,
+                              is_visible=self._parent_part_box_item.is_in_view)
 
     slot_set_obj = ext_safe_slot(set_obj, arg_types=[object])
 
@@ -1399,7 +1402,8 @@ class TablePartWidget(FramedPartWidget):
         super().__init__(part, parent_part_box_item)
         self.__part = part
         self._set_content_widget(TablePart2dContent())
-        self._table_model = TablePartTableModel(part)
+        is_visible = None if parent_part_box_item is None else parent_part_box_item.is_in_view
+        self._table_model = TablePartTableModel(part, is_visible=is_visible)
         self._content_widget.table_view.setModel(self._table_model)
 
         self._update_size_from_part()
@@ -2139,8 +2143,16 @@ class PlotPartWidget(BreakpointIndicator, FramedPartWidget):
 
     def __on_backend_plot_update(self):
         """
-        Updates the plot when the backend figure is changed.
+        Updates the plot when the backend figure is changed. The backend figure is always the same object, so once
+        a canvas shows it, the canvas is kept and only redrawn (at a limited rate).
         """
+        canvas = self._content_widget.canvas
+        figure = self._part.figure
+        if (self._content_widget.refreshed and canvas is not None and canvas.figure is figure
+                and self._content_widget.current_figure_dpi == figure.dpi):
+            canvas.update_figure()
+            return
+
         self._content_widget.remove_display_widget()
         self._content_widget.add_display_widget(PlotFigureCanvas(self._part.figure))
         self._content_widget.refreshed = True
@@ -21,7 +21,7 @@ from pathlib import Path
 from enum import IntEnum
 
 # [2. third-party]
-from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer
 from PyQt5.QtCore import QRectF, QPoint, QPointF, QLineF, QSize, QVariant
 from PyQt5.QtGui import QColor, QPen, QPainterPath, QPainter, QBrush, QKeyEvent, QPolygonF, QMouseEvent, QCursor
 from PyQt5.QtWidgets import QGraphicsObject, QGraphicsItem, QStyleOptionGraphicsItem, QWidget
@@ -78,6 +78,7 @@ class Decl(AnnotationDeclarations):
     PartBoxItem = 'PartBoxItem'
     LinkAnchorItem = 'LinkAnchorItem'
     LinkSceneObject = 'LinkSceneObject'
+    LinkSegmentBaseItem = 'LinkSegmentBaseItem'
 
 
 # -- Function definitions -----------------------------------------------------------------------
@@ -85,6 +86,45 @@ class Decl(AnnotationDeclarations):
 
 # -- Class Definitions --------------------------------------------------------------------------
 
+class LinkSegmentsGeometryUpdater:
+    """
+    Batches the geometry updates of link segments: when a link anchor moves or gets resized, the segments attached
+    to it schedule a geometry update here instead of re-computing it immediately. All the updates scheduled
+    during one pass of the event loop are done together on the next pass, once per segment. So when several parts
+    are moved at once (such as dragging a selection of parts), a link between two moved parts is re-computed only
+    once per frame, rather than once for each position and size change of each of its anchors.
+    """
+
+    def __init__(self):
+        self.__pending = {}  # id of segment -> segment
+
+    def schedule(self, segment: Decl.LinkSegmentBaseItem):
+        """Schedule the geometry update of a link segment; does nothing if already scheduled"""
+        if not self.__pending:
+            QTimer.singleShot(0, self.__update_pending)
+        self.__pending[id(segment)] = segment
+
+    def get_num_pending(self) -> int:
+        """Get the number of link segments that are waiting for their geometry to be updated"""
+        return len(self.__pending)
+
+    num_pending = property(get_num_pending)
+
+    def __update_pending(self):
+        """
+        Update the geometry of all the pending segments, except those that have been disposed of since they were
+        scheduled (such as the segments of a removed link). Each update is done via a safe slot, so that an
+        exception in one of them does not prevent the others.
+        """
+        pending, self.__pending = self.__pending, {}
+        for segment in pending.values():
+            if not segment.disposed:
+                segment._slot_update_geometry()
+
+
+_link_segments_geometry_updater = LinkSegmentsGeometryUpdater()
+
+
 class LinkAnchorSideEnum(IntEnum):
     """
     Enumeration class to indicate the side of the anchor that a link is attached.
@@ -594,14 +634,21 @@ class LinkSegmentBaseItem(QGraphicsObject):
         line = QLineF(self._start_point, self._end_point)
         return line.pointAt(0.5)
 
+    def update_geometry(self):
+        """
+        Re-compute the end points and path of the segment from the current geometry of its anchors. This is
+        called by the geometry updater for the segments that have had an anchor move or get resized.
+        """
+        self._calculate_link_end_points()
+
     def set_source_anchor_item(self, item: LinkAnchorItem):
         """
         Sets the source anchor item of the link.
         :param item: The item containing the anchor which is the source of the link.
         """
         self._source_anchor_item = item
-        self._source_anchor_item.sig_link_anchor_pos_changed.connect(self._slot_calculate_link_end_points)
-        self._source_anchor_item.sig_link_anchor_size_changed.connect(self._slot_calculate_link_end_points)
+        self._source_anchor_item.sig_link_anchor_pos_changed.connect(self._slot_schedule_geometry_update)
+        self._source_anchor_item.sig_link_anchor_size_changed.connect(self._slot_schedule_geometry_update)
         self._calculate_link_end_points()
 
         #DRWA
@@ -628,14 +675,14 @@ class LinkSegmentBaseItem(QGraphicsObject):
 
         if self._target_anchor_item is not None:
             # Disconnect the old connections...
-            self._target_anchor_item.sig_link_anchor_pos_changed.disconnect(self._slot_calculate_link_end_points)
-            self._target_anchor_item.sig_link_anchor_size_changed.disconnect(self._slot_calculate_link_end_points)
+            self._target_anchor_item.sig_link_anchor_pos_changed.disconnect(self._slot_schedule_geometry_update)
+            self._target_anchor_item.sig_link_anchor_size_changed.disconnect(self._slot_schedule_geometry_update)
 
         self._target_anchor_item = item
         if item is not None:
             # ... connect to the item's own front-end signals
-            self._target_anchor_item.sig_link_anchor_pos_changed.connect(self._slot_calculate_link_end_points)
-            self._target_anchor_item.sig_link_anchor_size_changed.connect(self._slot_calculate_link_end_points)
+            self._target_anchor_item.sig_link_anchor_pos_changed.connect(self._slot_schedule_geometry_update)
+            self._target_anchor_item.sig_link_anchor_size_changed.connect(self._slot_schedule_geometry_update)
 
         self._calculate_link_end_points()
 
@@ -775,7 +822,16 @@ class LinkSegmentBaseItem(QGraphicsObject):
         # The rectangle covers link completely with a diagonal length extending from one end of the link to the other.
         self._bounding_rect_path.addPolygon(link_poly)
 
+    def _schedule_geometry_update(self):
+        """
+        Schedule the update of the segment geometry for the next pass of the event loop: called when an anchor
+        of the segment has moved or been resized.
+        """
+        _link_segments_geometry_updater.schedule(self)
+
     _slot_calculate_link_end_points = safe_slot(_calculate_link_end_points)
+    _slot_schedule_geometry_update = safe_slot(_schedule_geometry_update)
+    _slot_update_geometry = safe_slot(update_geometry)
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
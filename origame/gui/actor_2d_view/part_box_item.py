@@ -443,6 +443,16 @@ class PartBoxItem(IInteractiveItem, LinkAnchorItem):
         """
         return self.__part_item.get_size()
 
+    def is_in_view(self) -> bool:
+        """
+        Returns True if this item is in the visible part of the 2D view. Used to give priority to the requests for
+        the data of visible items (see AsyncRequest.schedule()).
+        """
+        scene = self.scene()
+        if scene is None or self.__part_item is None:
+            return False
+        return scene.is_item_visible(self)
+
     def get_inner_item(self) -> Decl.IBoxedPartItem:
         """
         Accessor for the item in this PartBoxItem
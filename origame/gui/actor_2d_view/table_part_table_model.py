@@ -95,8 +95,15 @@ class TablePartTableModel(QAbstractTableModel):
 
     # --------------------------- instance (self) PUBLIC methods --------------------------------
 
-    def __init__(self, table_part: TablePart, parent: QWidget = None):
+    def __init__(self, table_part: TablePart, parent: QWidget = None, is_visible: Callable[[], bool] = None):
+        """
+        :param table_part: the backend part to view
+        :param parent: the parent of this model
+        :param is_visible: if given, returns True when the table is visible; requests to refresh a visible table are
+            sent to the backend first
+        """
         super().__init__(parent)
+        self.__is_visible = is_visible
 
         # The backend part to view
         self.__table_part = table_part
@@ -458,7 +465,9 @@ class TablePartTableModel(QAbstractTableModel):
             # init table records
             self.__update_table_record_cache(records, all_row_ids=all_row_ids)
 
-        AsyncRequest.call(async_get_table, response_cb=on_table_received)
+        # a table changed many times in a row (as in an animated run) gets refreshed only once:
+        AsyncRequest.schedule(async_get_table, target=table_part, response_cb=on_table_received,
+                              is_visible=self.__is_visible)
 
     def __update_table_record_cache(self, records: List[Tuple[Any]], all_row_ids: List[int] = None):
         """
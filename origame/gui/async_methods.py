@@ -12,7 +12,8 @@
 Enables the GUI (frontend) to asynchronously call functions (any callable) from the backend thread,
 and to receive the return values asynchronously into main thread. Application need only call
 AsyncRequest.set_target_thread() once, and optionally set_error_handler(), in order to call
-AsyncRequest.call() as many times as desired.
+AsyncRequest.call() as many times as desired. Requests that refresh the data shown by the GUI, and that may be
+repeated faster than the backend can answer them, should be made via AsyncRequest.schedule() instead.
 
 Version History: See SVN log.
 """
@@ -23,10 +24,11 @@ Version History: See SVN log.
 import logging
 import traceback
 import inspect
-from collections import deque
+from collections import deque, OrderedDict
+from functools import partial
 
 # [2. third-party]
-from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 
 # [3. local]
 from ..core import override, override_required
@@ -47,6 +49,7 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 __all__ = [
     # public API of module: one line per string
     'AsyncRequest',
+    'AsyncRequestScheduler',
     'IAsyncErrorHandler',
     'SimpleAsyncErrorHandler',
     'AsyncErrorInfo',
@@ -60,10 +63,12 @@ log = logging.getLogger('system')
 
 class Decl(AnnotationDeclarations):
     AsyncErrorInfo = 'AsyncErrorInfo'
+    AsyncRequestScheduler = 'AsyncRequestScheduler'
 
 
 ResponseCB = Callable[..., None]
 AsyncRequestErrorCallable = Callable[[Decl.AsyncErrorInfo], None]
+VisibilityCheck = Callable[[], bool]
 
 
 # -- Function definitions -----------------------------------------------------------------------
@@ -176,6 +181,11 @@ class AsyncRequester(QObject):
         self._global_error_handler = handler
         self.req_handler.global_error_handler = handler
 
+    def get_global_error_handler(self) -> Optional[IAsyncErrorHandler]:
+        return self._global_error_handler
+
+    global_error_handler = property(get_global_error_handler)
+
     def queue_request(self, call_info: Tuple):
         call_id = self.req_handler.next_call_id
         self.req_handler.next_call_id += 1
@@ -302,6 +312,7 @@ class AsyncRequest:
     """
 
     _requester = None  # singleton object to handle making requests for function calls
+    _scheduler = None  # singleton object to handle scheduled requests, created on first use
 
     @staticmethod
     def set_target_thread(backend_thread: QThread):
@@ -319,6 +330,9 @@ class AsyncRequest:
             AsyncRequest._requester = AsyncRequester(backend_thread)
         else:
             AsyncRequest._requester.reset(backend_thread)
+            if AsyncRequest._scheduler is not None:
+                # the responses to the requests in flight will never arrive:
+                AsyncRequest._scheduler.reset()
 
     @staticmethod
     def is_bound() -> bool:
@@ -369,6 +383,259 @@ class AsyncRequest:
         call_info = callable_obj, args, kwargs or {}, response_cb, unpack_response, error_cb
         AsyncRequest._requester.queue_request(call_info)
 
+    @staticmethod
+    def schedule(callable_obj: Callable, *args, target: Any = None, response_cb: ResponseCB = None,
+                 unpack_response=True, error_cb: AsyncRequestErrorCallable = None,
+                 is_visible: VisibilityCheck = None, **kwargs):
+        """
+        Same as call(), but the request goes through the request scheduler (see AsyncRequestScheduler): a request
+        for the same target and callable as a request still pending replaces it, and requests for visible widgets
+        are sent to the backend first. Use this for the requests that only refresh data shown by the GUI: the
+        response of a request replaced by a newer one is never given to its response_cb.
+
+        :param target: the object whose data is requested; by default, the object of callable_obj if it is a bound
+            method, else callable_obj itself
+        :param is_visible: if given, called (in the current thread) when the request is scheduled, to determine if
+            the request is for a visible widget
+        """
+        if error_cb:
+            assert len(inspect.signature(error_cb).parameters) == 1, "The error_cb must have exactly one parameter"
+
+        if AsyncRequest._requester is None:
+            raise RuntimeError("BUG: AsyncRequest.set_target_thread() not called yet")
+
+        AsyncRequest.get_scheduler().schedule(callable_obj, *args, target=target, response_cb=response_cb,
+                                              unpack_response=unpack_response, error_cb=error_cb,
+                                              is_visible=is_visible, **kwargs)
+
+    @staticmethod
+    def get_scheduler() -> Decl.AsyncRequestScheduler:
+        """Get the scheduler used by schedule(); its get_metrics() gives the depth of its queue"""
+        if AsyncRequest._scheduler is None:
+            AsyncRequest._scheduler = AsyncRequestScheduler()
+        return AsyncRequest._scheduler
+
+    @staticmethod
+    def get_global_error_handler() -> Optional[IAsyncErrorHandler]:
+        """Get the error handler set via set_global_error_handler(), if any"""
+        if AsyncRequest._requester is None:
+            return None
+        return AsyncRequest._requester.global_error_handler
+
+
+class _ScheduledRequest:
+    """
+    A request made via AsyncRequestScheduler.schedule(), pending or in flight.
+    """
+
+    def __init__(self, key: Tuple[int, str], target: Any, callable_obj: Callable, args: Tuple, kwargs: Dict[str, Any],
+                 response_cb: Optional[ResponseCB], unpack_response: bool,
+                 error_cb: Optional[AsyncRequestErrorCallable], is_visible: Optional[VisibilityCheck]):
+        self.key = key
+        self.target = target  # keeps the target alive, so its id() is not reused while the request exists
+        self.callable_obj = callable_obj
+        self.args = args
+        self.kwargs = kwargs
+        self.response_cb = response_cb
+        self.unpack_response = unpack_response
+        self.error_cb = error_cb
+        self.is_visible = is_visible
+        self.superseded = False
+
+    def is_for_visible_widget(self) -> bool:
+        """Returns True if the request is for a visible widget; a widget already destroyed is not visible"""
+        if self.is_visible is None:
+            return False
+
+        try:
+            return bool(self.is_visible())
+        except RuntimeError:
+            # wrapped C/C++ object has been deleted
+            return False
+
+
+class AsyncRequestScheduler:
+    """
+    Schedules the requests that populate the GUI with backend data. Such requests are typically made by a part
+    widget when it is created and each time the backend signals a change, so during an animated run the same data
+    can be requested many times before the backend even gets to the first request. The scheduler keeps the
+    requests in its own queue and only sends a few at a time to the backend (see AsyncRequest.call()), so that:
+
+    - a request for the same (target, callable) as a request still pending replaces it: only the newest one is
+      sent, with its own arguments and callbacks;
+    - a request for the same (target, callable) as a request in flight is sent once the response to the latter
+      arrives, and that response is dropped since it is superseded;
+    - pending requests for visible widgets are sent before the others, oldest first. The visibility of a request's
+      widget is checked when the request is scheduled (so it is not checked again each time requests are sent).
+
+    The scheduler must only be used from the main (GUI) thread. Its get_metrics() gives the depth of its queue and
+    the number of requests deduplicated.
+    """
+
+    # Maximum number of scheduled requests sent to the backend and not yet answered:
+    MAX_IN_FLIGHT = 8
+
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT):
+        """
+        :param max_in_flight: the maximum number of requests sent to the backend and not yet answered
+        """
+        self.__max_in_flight = max_in_flight
+        # (target id, callable name) -> _ScheduledRequest, oldest first, for visible and for hidden widgets:
+        self.__pending_visible = OrderedDict()
+        self.__pending_hidden = OrderedDict()
+        self.__in_flight = {}  # (target id, callable name) -> _ScheduledRequest
+        self.__dispatch_scheduled = False
+
+        self.__num_scheduled = 0
+        self.__num_superseded = 0
+        self.__num_responses_dropped = 0
+        self.__max_queue_depth = 0
+
+    def schedule(self, callable_obj: Callable, *args, target: Any = None, response_cb: ResponseCB = None,
+                 unpack_response=True, error_cb: AsyncRequestErrorCallable = None,
+                 is_visible: VisibilityCheck = None, **kwargs):
+        """
+        Schedule a call to callable_obj in the backend thread. The parameters are the same as for
+        AsyncRequest.schedule().
+        """
+        if target is None:
+            target = getattr(callable_obj, '__self__', callable_obj)
+        func = getattr(callable_obj, '__func__', callable_obj)
+        # the qualified name distinguishes the local functions defined in different methods:
+        key = (id(target), getattr(func, '__qualname__', repr(func)))
+
+        request = _ScheduledRequest(key, target, callable_obj, args, kwargs, response_cb, unpack_response, error_cb,
+                                    is_visible)
+        self.__num_scheduled += 1
+        if request.is_for_visible_widget():
+            pending, other_pending = self.__pending_visible, self.__pending_hidden
+        else:
+            pending, other_pending = self.__pending_hidden, self.__pending_visible
+        if key in pending or key in other_pending:
+            self.__num_superseded += 1
+            # a request whose widget visibility changed moves to the other queue:
+            other_pending.pop(key, None)
+        # replaced in place, so a request that keeps being superseded does not lose its turn:
+        pending[key] = request
+        self.__max_queue_depth = max(self.__max_queue_depth, self.get_queue_depth())
+
+        in_flight_request = self.__in_flight.get(key)
+        if in_flight_request is not None:
+            in_flight_request.superseded = True
+
+        self.__schedule_dispatch()
+
+    def reset(self):
+        """
+        Forget the requests in flight, whose responses will never arrive (the backend thread has changed). The
+        pending requests are kept.
+        """
+        self.__in_flight.clear()
+        self.__schedule_dispatch()
+
+    def get_queue_depth(self) -> int:
+        """Get the number of requests pending, i.e. not yet sent to the backend"""
+        return len(self.__pending_visible) + len(self.__pending_hidden)
+
+    def get_num_in_flight(self) -> int:
+        """Get the number of requests sent to the backend and not yet answered"""
+        return len(self.__in_flight)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """
+        Get the metrics of the scheduler:
+
+        - queue_depth: number of requests pending
+        - max_queue_depth: largest queue_depth so far
+        - in_flight: number of requests sent to the backend and not yet answered
+        - scheduled: number of requests scheduled so far
+        - superseded: number of pending requests replaced by a newer request for the same (target, callable)
+        - responses_dropped: number of responses not given to the response callback because superseded
+        """
+        return dict(queue_depth=self.get_queue_depth(),
+                    max_queue_depth=self.__max_queue_depth,
+                    in_flight=len(self.__in_flight),
+                    scheduled=self.__num_scheduled,
+                    superseded=self.__num_superseded,
+                    responses_dropped=self.__num_responses_dropped)
+
+    queue_depth = property(get_queue_depth)
+    num_in_flight = property(get_num_in_flight)
+
+    def __schedule_dispatch(self):
+        """Send pending requests on next pass of the event loop, unless already scheduled"""
+        if not self.__dispatch_scheduled:
+            self.__dispatch_scheduled = True
+            QTimer.singleShot(0, self.__dispatch)
+
+    def __dispatch(self):
+        """Send the pending requests to the backend, visible ones first, up to the maximum allowed in flight"""
+        self.__dispatch_scheduled = False
+        num_to_send = self.__max_in_flight - len(self.__in_flight)
+        if num_to_send <= 0:
+            return
+
+        ready = []
+        for pending in (self.__pending_visible, self.__pending_hidden):
+            for key, request in pending.items():
+                if len(ready) == num_to_send:
+                    break
+                # only one request per key in flight at a time, so responses arrive in order of requests:
+                if key not in self.__in_flight:
+                    ready.append((pending, request))
+
+        for pending, request in ready:
+            del pending[request.key]
+            self.__in_flight[request.key] = request
+            AsyncRequest.call(request.callable_obj, *request.args,
+                              response_cb=partial(self.__on_response, request), unpack_response=False,
+                              error_cb=partial(self.__on_error, request),
+                              **request.kwargs)
+
+    def __on_response(self, request: _ScheduledRequest, result: Any):
+        if not self.__on_request_done(request):
+            return
+
+        response_cb = request.response_cb
+        if response_cb is None:
+            return
+
+        if not inspect.signature(response_cb).parameters:
+            response_cb()
+        elif request.unpack_response and isinstance(result, tuple):
+            response_cb(*result)
+        else:
+            response_cb(result)
+
+    def __on_error(self, request: _ScheduledRequest, error_info: AsyncErrorInfo):
+        if not self.__on_request_done(request):
+            return
+
+        error_cb = request.error_cb
+        if error_cb is None:
+            handler = AsyncRequest.get_global_error_handler()
+            if handler is None:
+                return
+            error_cb = handler.on_call_error
+
+        error_cb(error_info)
+
+    def __on_request_done(self, request: _ScheduledRequest) -> bool:
+        """
+        Remove the request from those in flight and send more pending requests.
+        :return: False if the response to the request must be dropped because a newer request superseded it
+        """
+        if self.__in_flight.get(request.key) is request:
+            del self.__in_flight[request.key]
+        if self.__pending_visible or self.__pending_hidden:
+            self.__schedule_dispatch()
+
+        if request.superseded:
+            self.__num_responses_dropped += 1
+            return False
+
+        return True
+
 
 class SimpleAsyncErrorHandler(IAsyncErrorHandler):
     """
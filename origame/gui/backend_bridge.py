@@ -47,6 +47,11 @@ Once the monkey-patching is in place, the process is as follows:
 - When the extended slot gets notified, it retrieves the complex data from a queue, and calls the
   original slot (wrapped by the extended slot), thus completing the signaling.
 
+Signals created with BridgeSignal(..., coalesce=True) are "state" signals: only the latest data emitted
+by each is of interest to the UI (such as a counter or a time). These are coalesced: emitting one only records
+its data, and the recorded data of all such signals is emitted at most COALESCED_SIGNALS_FPS times per second
+(see BridgeSignalCoalesced). Other signals are emitted immediately, in order of emission.
+
 Version History: See SVN log.
 """
 
@@ -56,13 +61,16 @@ Version History: See SVN log.
 import logging
 from queue import Queue
 from inspect import Parameter
+from threading import Lock
+from time import perf_counter
 
 # [2. third-party]
-from PyQt5.QtCore import QObject, pyqtSignal, QThread, Qt, pyqtBoundSignal
+from PyQt5.QtCore import QObject, pyqtSignal, QThread, Qt, pyqtBoundSignal, QTimer
 from PyQt5.QtWidgets import QApplication
 from sip import wrappertype as pyqtWrapperType
 
 # [3. local]
+from ..core import override
 from ..core.typing import AnnotationDeclarations
 from ..core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
 from ..core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
@@ -83,6 +91,7 @@ __all__ = [
     'init_ext_sig_engine',
     'check_sig_data_requires_ext',
     'create_ext_slot',
+    'set_coalesced_signals_fps',
 ]
 
 log = logging.getLogger('system')
@@ -96,6 +105,9 @@ ExtSlot = Callable[[QObject], None]
 # Set this to True so that the app uses extended signal-slot system (nothing else to do, just one setting):
 USE_EXT_SIGNAL_SLOT_SYS = True
 
+# Max number of times per second that coalesced signals are emitted; 0 to emit them immediately:
+COALESCED_SIGNALS_FPS = 30
+
 
 # -- Function definitions -----------------------------------------------------------------------
 
@@ -108,6 +120,16 @@ def init_ext_sig_engine(backend_thread: QThread):
     _ext_sig_data.set_thread(backend_thread)
 
 
+def set_coalesced_signals_fps(fps: int):
+    """
+    Set the max number of times per second that the data of coalesced bridge signals (those created with
+    coalesce=True) are emitted. If 0, the coalesced signals are emitted immediately, like other signals.
+    """
+    global COALESCED_SIGNALS_FPS
+    COALESCED_SIGNALS_FPS = fps
+    log.info("Coalesced bridge signals will be emitted at {}", "{} fps".format(fps) if fps else "every emit")
+
+
 def check_sig_data_requires_ext(sig_args: Tuple) -> List[type]:
     """
     Check if a tuple of types, assumed to be those of a signal or slot, would require extended bridge signal/slot
@@ -166,14 +188,21 @@ def get_type_names(ext_types):
 
 class Decl(AnnotationDeclarations):
     BridgeSignalExt = 'BridgeSignalExt'
+    BridgeSignalCoalesced = 'BridgeSignalCoalesced'
     BridgeEmitter = 'BridgeEmitter'
+    _BridgeSignalCoalescedBound = '_BridgeSignalCoalescedBound'
 
 
-def bridge_signal(*arg_types: List[type]) -> Either[pyqtSignal, Decl.BridgeSignalExt]:
+def bridge_signal(*arg_types: List[type], coalesce: bool = False) -> Either[pyqtSignal, Decl.BridgeSignalExt]:
     """
-    Create the correct kind of signal: a regular pyqtSignal or an extended bridge signal.
+    Create the correct kind of signal: a regular pyqtSignal, an extended bridge signal, or a coalesced bridge
+    signal.
     :param arg_types: argument types for signal payload
+    :param coalesce: True if only the latest data emitted by the signal is of interest (see BridgeSignalCoalesced)
     """
+    if coalesce:
+        return BridgeSignalCoalesced(arg_types)
+
     if USE_EXT_SIGNAL_SLOT_SYS and check_sig_data_requires_ext(arg_types):
         return BridgeSignalExt(arg_types)
     else:
@@ -236,6 +265,7 @@ class ExtSigData:
 
 
 _ext_sig_data = ExtSigData()
+_ext_sig_emit_lock = Lock()
 
 
 class _BridgeSignalExtBound:
@@ -300,9 +330,12 @@ class _BridgeSignalExtBound:
         is connected to any number of extended slots in the frontend, and these slots will retrieve the data
         emitted and call the wrapped slot (a method on a QObject).
         """
-        _ext_sig_data.queue.put_nowait(args)
-        _ext_sig_data.queue.sig_ext_data_added.emit()
-        self.__qt_signal.emit()
+        # the data and the signals of an emit must not interleave with those of an emit from another thread (such
+        # as the scenario search worker), else the frontend would pop the data of one signal for the other:
+        with _ext_sig_emit_lock:
+            _ext_sig_data.queue.put_nowait(args)
+            _ext_sig_data.queue.sig_ext_data_added.emit()
+            self.__qt_signal.emit()
 
     def disconnect(self, safe_slot: ExtSlot = None):
         """
@@ -344,6 +377,10 @@ class BridgeSignalExt:
         """Create an extended signal bound to a BridgeEmitter instance"""
         return _BridgeSignalExtBound(qt_sig, self)
 
+    def new_qt_signal(self) -> pyqtSignal:
+        """Create the hidden (unbound) pyqtSignal that does the actual communication to frontend thread"""
+        return pyqtSignal()
+
     def connect(self, slot: ExtSlot):
         # Provided so IDE can support code completion on extended signals (which are not bound when seen by IDE)
         raise NotImplementedError
@@ -357,6 +394,115 @@ class BridgeSignalExt:
         raise NotImplementedError
 
 
+class _SignalCoalescer:
+    """
+    Hold the latest data emitted by each coalesced bridge signal since the last flush, and emit it at most
+    COALESCED_SIGNALS_FPS times per second. A flush occurs when a coalesced signal is emitted and the flush period
+    has elapsed since the last flush, or via a timer so that the latest data always gets emitted eventually (the
+    timer only fires once the emitting thread returns to its event loop).
+    """
+
+    def __init__(self):
+        self.__lock = Lock()
+        self.__pending = {}  # Dict[_BridgeSignalCoalescedBound, Tuple]: signal -> latest data emitted
+        self.__next_flush_time = 0.0
+        self.__timer_started = False
+
+    def post(self, signal: Decl._BridgeSignalCoalescedBound, args: Tuple):
+        """Record the data emitted by a coalesced signal, and flush if it is time to do so"""
+        if not COALESCED_SIGNALS_FPS:
+            signal.emit_now(args)
+            return
+
+        with self.__lock:
+            self.__pending[signal] = args
+            flush_due = perf_counter() >= self.__next_flush_time
+            start_timer = not flush_due and not self.__timer_started
+            if start_timer:
+                self.__timer_started = True
+
+        if flush_due:
+            self.flush()
+        elif start_timer:
+            QTimer.singleShot(int(1000 / COALESCED_SIGNALS_FPS), self.flush)
+
+    def flush(self):
+        """Emit the latest data of each coalesced signal emitted since last flush"""
+        with self.__lock:
+            pending = self.__pending
+            self.__pending = {}
+            self.__timer_started = False
+            if COALESCED_SIGNALS_FPS:
+                self.__next_flush_time = perf_counter() + 1 / COALESCED_SIGNALS_FPS
+
+        for signal, args in pending.items():
+            try:
+                signal.emit_now(args)
+            except RuntimeError:
+                # the emitter was deleted (by Qt) since the data was emitted
+                pass
+
+
+_signal_coalescer = _SignalCoalescer()
+
+
+class _BridgeSignalCoalescedBound(_BridgeSignalExtBound):
+    """
+    A coalesced signal bound to a specific instance of a BridgeEmitter. The emit() only records the data,
+    which _SignalCoalescer then emits via the hidden pyqtSignal: this has the same types as the coalesced signal
+    if they are all base types (so the signal connects to regular safe slots), else it is an extended signal.
+    """
+
+    def __init__(self, qt_sig: pyqtBoundSignal, unbound_sig: Decl.BridgeSignalCoalesced):
+        super().__init__(qt_sig, unbound_sig)
+        self.__qt_signal = qt_sig
+        self.__is_ext = unbound_sig.is_ext
+
+    @override(_BridgeSignalExtBound)
+    def connect(self, safe_slot: Callable, con_type: Qt.ConnectionType = None):
+        if self.__is_ext:
+            super().connect(safe_slot, con_type)
+        elif con_type is None:
+            self.__qt_signal.connect(safe_slot)
+        else:
+            self.__qt_signal.connect(safe_slot, con_type)
+
+    @override(_BridgeSignalExtBound)
+    def emit(self, *args):
+        """Record the data emitted. It will be emitted to the slots within 1/COALESCED_SIGNALS_FPS sec."""
+        _signal_coalescer.post(self, args)
+
+    def emit_now(self, args: Tuple):
+        """Emit the given data to the slots"""
+        if self.__is_ext:
+            super().emit(*args)
+        else:
+            self.__qt_signal.emit(*args)
+
+
+class BridgeSignalCoalesced(BridgeSignalExt):
+    """
+    This represents an unbound coalesced signal: a signal for which only the latest data emitted is of interest,
+    such as the value of a counter or clock. Since such signals can be emitted at very high frequency by the
+    backend while animating (every event of a simulation), the data emitted is sent to the frontend at
+    most COALESCED_SIGNALS_FPS times per second, thus limiting the number of signals the frontend has to process.
+    Note that this applies to all slots connected to the signal, so the backend should never depend on such
+    a signal.
+    """
+
+    def __init__(self, sig_arg_types: List[type]):
+        super().__init__(sig_arg_types)
+        self.is_ext = bool(USE_EXT_SIGNAL_SLOT_SYS and check_sig_data_requires_ext(sig_arg_types))
+
+    @override(BridgeSignalExt)
+    def new_bound(self, qt_sig: pyqtBoundSignal) -> _BridgeSignalCoalescedBound:
+        return _BridgeSignalCoalescedBound(qt_sig, self)
+
+    @override(BridgeSignalExt)
+    def new_qt_signal(self) -> pyqtSignal:
+        return super().new_qt_signal() if self.is_ext else pyqtSignal(self.sig_arg_types)
+
+
 class MetaBridgeEmitterExt(pyqtWrapperType):
     """
     This meta class for BridgeEmitter creates an unbound ghost signal for every unbound extended signal.
@@ -391,7 +537,7 @@ class MetaBridgeEmitterExt(pyqtWrapperType):
 
             # create the unbound pyqtSignal that is safe to use across threads
             qt_sig_name = '_xbridge_' + user_sig_name
-            qt_sig = pyqtSignal()
+            qt_sig = ext_sig_unbound.new_qt_signal()
             namespace[qt_sig_name] = qt_sig
 
             ext_sig_unbound.set_sig_info(cls_name, user_sig_name, qt_sig_name)
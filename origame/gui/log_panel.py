@@ -22,10 +22,13 @@ from itertools import accumulate
 from pathlib import Path, PureWindowsPath
 import csv
 from bisect import bisect_left
+from collections import defaultdict
+from heapq import merge
+from tempfile import TemporaryFile
 
 # [2. third-party]
 from PyQt5.QtWidgets import QWidget, QFileDialog, QPlainTextEdit, QMessageBox, QTextEdit, QPushButton
-from PyQt5.QtCore import QObject, QSettings, pyqtSignal, Qt
+from PyQt5.QtCore import QObject, QSettings, pyqtSignal, Qt, QTimer
 from PyQt5.QtGui import QKeyEvent, QKeySequence, QTextCharFormat, QTextCursor, QColor, QFont
 
 # [3. local]
@@ -150,14 +153,33 @@ LogMsgInfo = namedtuple('LogMsgInfo', [
 class LogCapture(QObject, logging.Handler):
     """
     Implements the Logging Handler and Log Stream slot-connections.
+
+    The log history is bounded: at most max_history log records (plus a chunk of max_history / 10, so that
+    dropping records is done in chunks) are kept in memory; older records are spilled to a temporary file, from
+    which they can be retrieved via get_filtered_spilled_log_history(). For each logger-level key, the ids of
+    the records in memory are indexed, so the filtered history is obtained in time proportional to the number
+    of records that pass the filter.
+
+    Log records can be emitted from any thread. The new records that pass the filter are sent to the log
+    view in batches, via new_log_records, at most once every NEW_RECORDS_BATCH_MSEC.
     """
 
-    new_log_record = pyqtSignal(LogMsgInfo)  # log info of the new record
+    # Default max number of log records kept in memory:
+    MAX_LOG_HISTORY = 100000
+    # Delay between the capture of a log record and the sending of the batch of new records it belongs to:
+    NEW_RECORDS_BATCH_MSEC = 50
+
+    new_log_records = pyqtSignal(list)  # log info of the new records (list of LogMsgInfo)
     filtering_changed = pyqtSignal()
 
+    _sig_records_pending = pyqtSignal()
+
     # --------------------------- instance (self) PUBLIC methods --------------------------------
 
-    def __init__(self):
+    def __init__(self, max_history: int = None):
+        """
+        :param max_history: max number of log records to keep in memory; if None, use MAX_LOG_HISTORY
+        """
         QObject.__init__(self)
         logging.Handler.__init__(self)
 
@@ -185,9 +207,17 @@ class LogCapture(QObject, logging.Handler):
                 settings_key = 'settings.log_filter.{}.{}'.format(log_name, log_level)
                 log_levels[log_level] = settings.value(settings_key, True, bool)
 
-        # Log filter parameters
+        # Log history: records in memory, ids of records in memory for each level key, records spilled to file
+        self.__max_history = max_history or self.MAX_LOG_HISTORY
         self.__log_history = []
-        self.__log_history_filtered = []
+        self.__history_ids = defaultdict(list)  # Dict[int, List[int]]: level key -> msg_id of records in memory
+        self.__next_msg_id = 0
+        self.__spill_file = None
+        self.__num_spilled = 0
+
+        # records not yet sent to log view; sent by main thread in batches:
+        self.__pending_records = []
+        self._sig_records_pending.connect(self.__slot_on_records_pending, Qt.QueuedConnection)
 
         # Log stdout and stderr streams
         self.__log_stdout = LogStream('stdout')
@@ -195,10 +225,25 @@ class LogCapture(QObject, logging.Handler):
 
     def clear_logs(self):
         """Clear the contents of the log cache"""
-        self.__log_history = []
-        self.__log_history_filtered = []
+        with self.lock:
+            self.__log_history = []
+            self.__history_ids.clear()
+            self.__pending_records = []
+            if self.__spill_file is not None:
+                self.__spill_file.close()
+                self.__spill_file = None
+            self.__num_spilled = 0
+
         self.filtering_changed.emit()
 
+    def get_max_history(self) -> int:
+        """Get the max number of log records kept in memory"""
+        return self.__max_history
+
+    def get_num_spilled(self) -> int:
+        """Get the number of log records that were spilled to file since the last clear_logs()"""
+        return self.__num_spilled
+
     def get_log_filter_settings(self, log_name: str, log_level: str):
         """
         Getter method for log filter user-settings
@@ -219,8 +264,9 @@ class LogCapture(QObject, logging.Handler):
         if not log_record or self.signalsBlocked():
             return
 
-        # Info to check filter settings
-        msg_id = len(self.__log_history)
+        # Info to check filter settings (note: the logging.Handler lock is held by caller)
+        msg_id = self.__next_msg_id
+        self.__next_msg_id += 1
         log_name = log_record.name  # e.g.: 'system' or 'user' or 'print'
         log_level = log_record.levelname  # e.g.: 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
         log_level_key = MAP_LOGGER_LEVELS_TO_KEYS[log_name][log_level]
@@ -228,14 +274,18 @@ class LogCapture(QObject, logging.Handler):
         num_lines = len(log_msg.splitlines())
         log_msg_info = LogMsgInfo(msg_id, log_level_key, log_msg, num_lines)
 
-        # Update log history list
+        # Update log history
         self.__log_history.append(log_msg_info)
+        self.__history_ids[log_level_key].append(msg_id)
+        if len(self.__log_history) > self.__max_history + self.__get_spill_chunk_size():
+            self.__spill_oldest_records()
 
         # If the filter settings allow...
         if self.__log_filter_settings[log_name][log_level]:
-            # Display the log and update the filtered list
-            self.__log_history_filtered.append(log_msg_info)
-            self.new_log_record.emit(log_msg_info)
+            # Display the log (once the batch is sent)
+            self.__pending_records.append(log_msg_info)
+            if len(self.__pending_records) == 1:
+                self._sig_records_pending.emit()
 
     def set_log_level(self, log_name: str, level: str, filter_set_to_view: bool):
         """
@@ -290,21 +340,41 @@ class LogCapture(QObject, logging.Handler):
             the second item is the log record.
         """
         start, end = index_range or (0, None)
-        if end is None:
-            if start > 0:
-                records = self.__log_history_filtered[start:]
-            else:
-                assert start == 0
-                records = self.__log_history_filtered[:]
-        else:
-            if start > 0:
-                records = self.__log_history_filtered[start:end + 1]
-            else:
-                assert start == 0
-                records = self.__log_history_filtered[:end + 1]
+        assert start >= 0
+        with self.lock:
+            if not self.__log_history:
+                return []
+
+            # the ids of each level key are sorted, so merging them gives the filtered ids in order:
+            filtered_ids = list(merge(*(self.__history_ids[log_key] for log_key in self.__get_visible_keys())))
+            filtered_ids = filtered_ids[start:] if end is None else filtered_ids[start:end + 1]
+            first_id = self.__log_history[0].msg_id
+            records = [self.__log_history[msg_id - first_id] for msg_id in filtered_ids]
+
+        return records
+
+    def get_filtered_spilled_log_history(self) -> List[LogMsgInfo]:
+        """
+        Retrieve the log records that are no longer in memory (they were spilled to file), filtered according
+        to the log capture settings. These records all precede those of get_filtered_log_history().
+        """
+        with self.lock:
+            if self.__spill_file is None:
+                return []
+
+            visible_keys = set(self.__get_visible_keys())
+            self.__spill_file.seek(0)
+            records = []
+            for msg_id, level_key, msg in csv.reader(self.__spill_file):
+                if int(level_key) in visible_keys:
+                    records.append(LogMsgInfo(int(msg_id), int(level_key), msg, len(msg.splitlines())))
+            self.__spill_file.seek(0, 2)  # back to end of file, for next spill
 
         return records
 
+    max_history = property(get_max_history)
+    num_spilled = property(get_num_spilled)
+
     # --------------------------- instance PUBLIC properties and safe_slots ---------------------
 
     slot_set_log_level_system_critical = safe_slot(set_log_level_system_critical)
@@ -325,50 +395,65 @@ class LogCapture(QObject, logging.Handler):
         """
         Filters the log-history in order to show only the log message types the user wants to see.
 
-        This algorithm uses two log message lists that are maintained for the duration of the application instance:
+        Each log message has a key identifying which combination of logger and level it has (the system logger
+        has 5 levels, the user logger has 5), e.g. system-INFO key = 1, user-INFO key = 6. The ids of the log
+        messages in memory are indexed by key, so there is nothing to rebuild when the filter settings change:
+        get_filtered_log_history() merges the ids of the keys that are visible per the filter settings. Since all
+        log messages are stored, any log message, whether displayed in the Log Window previously or not, can
+        be added to or removed from the Log Window at any time.
 
-            1. self.__log_history: a list that tracks all log messages - a complete log history -  regardless
-               of the user-applied filter currently selected. This list is not displayed in the Log Window.
-               It contains a key identifying which combination of logger and level (the system logger has
-               4 levels, the user logger has 5), and the log message.
-               Log history key corresponds to the log filter applied (e.g. system-INFO key = 3, print-INFO key = 9)
-            2. self.__log_history_filtered: a filtered log history list that contains only the subset of log messages
-               as filtered by the log-filter settings. It is this list which is displayed in the Log Window.
-               It contains an index into the self.__log_history, the corresponding log key, and the log message.
-
-        The log history keys are necessary to associate each log message stored in the lists with a specific
-        filter-setting, i.e. system-INFO log messages (key = 3) vs. user-INFO log messages (key = 8). This enables the
-        algorithm to quickly search through either list to add to, or remove logs from, the Log Window based on the
-        user-selected log-filter settings.
-
-        Finally and intuitively, the log message stored in the list is used to recover the log for display in the
-        Log Window as determined by the log-filter settings currently applied. Since all log messages are stored, any
-        log message, whether displayed in the Log Window previously or not, can be added to or removed from the Log
-        Window at any time.
-
-        Emits sig_filtering_changed at end.
+        Records that were captured but not yet sent to the log view are re-filtered. Emits
+        sig_filtering_changed at end.
 
         :param log_name: the logger name: e.g. 'system' or 'user'
         :param log_level: the log-level: e.g. 'INFO' and others
         :param filter_set_to_view: the filter setting: e.g. True (view message) or False (hide message)
         """
+        with self.lock:
+            # the new filtered history will include these:
+            self.__pending_records = []
 
-        # Assign the key corresponding to the logger and log-level selected
-        log_key = MAP_LOGGER_LEVELS_TO_KEYS[log_name][log_level]
+        self.filtering_changed.emit()
 
-        if filter_set_to_view:
-            # Add logs from the log history list to the filtered list
-            add_entries = [log_info for log_info in self.__log_history
-                           if log_info.level_key == log_key]
-            self.__log_history_filtered.extend(add_entries)
-            self.__log_history_filtered.sort()
+    def __get_visible_keys(self) -> List[int]:
+        """Get the level keys that are visible per the filter settings"""
+        return [MAP_LOGGER_LEVELS_TO_KEYS[log_name][log_level]
+                for log_name, log_levels in self.__log_filter_settings.items()
+                for log_level, visible in log_levels.items() if visible]
 
-        else:
-            # Remove logs from the existing filtered list
-            self.__log_history_filtered = [log_info for log_info in self.__log_history_filtered
-                                           if log_info.level_key != log_key]
+    def __get_spill_chunk_size(self) -> int:
+        """Number of records spilled at once (so that dropping records from memory is amortized)"""
+        return max(1, self.__max_history // 10)
 
-        self.filtering_changed.emit()
+    def __spill_oldest_records(self):
+        """Move the oldest records out of memory, to the spill file, so that max_history records remain"""
+        num_spill = len(self.__log_history) - self.__max_history
+        spilled = self.__log_history[:num_spill]
+        del self.__log_history[:num_spill]
+
+        first_id = self.__log_history[0].msg_id
+        for msg_ids in self.__history_ids.values():
+            del msg_ids[:bisect_left(msg_ids, first_id)]
+
+        if self.__spill_file is None:
+            self.__spill_file = TemporaryFile('w+', newline='', encoding='utf-8', prefix='origame_log_')
+        csv.writer(self.__spill_file).writerows((info.msg_id, info.level_key, info.msg) for info in spilled)
+        self.__num_spilled += num_spill
+
+    def __on_records_pending(self):
+        """Called in main thread when new records are pending: send them after a delay, to batch them"""
+        QTimer.singleShot(self.NEW_RECORDS_BATCH_MSEC, self.__send_pending_records)
+
+    def __send_pending_records(self):
+        """Send the pending records to the log view"""
+        with self.lock:
+            records = self.__pending_records
+            self.__pending_records = []
+
+        if records:
+            self.new_log_records.emit(records)
+
+    __slot_on_records_pending = safe_slot(__on_records_pending)
 
     def __save_setting(self, log_name, log_level, filter_set_to_view: bool):
         """Save the Log Window log-level config when the filter setting has changed"""
@@ -423,6 +508,16 @@ class LogLineMarker:
         """Return the currently marked log id. None if no log currently marked."""
         return self.__marked_log_id
 
+    def get_log_num(self, line_num: int) -> int:
+        """
+        Get the index, in the list of log messages displayed, of the log message that contains a line.
+        :param line_num: number of the line (>= 0) in the log view
+        """
+        log_num = bisect_left(self.__log_line_starts, line_num)
+        if log_num >= len(self.__log_line_starts) or self.__log_line_starts[log_num] != line_num:
+            log_num -= 1
+        return log_num
+
     # --------------------------- instance __PRIVATE members-------------------------------------
 
     def __get_marker_line_num(self, log_id: int, log_infos: List[LogMsgInfo]) -> Optional[int]:
@@ -445,10 +540,7 @@ class LogLineMarker:
         :param line_clicked: number of line clicked (>= 0)
         :param log_infos: list of log messages
         """
-        log_id = bisect_left(self.__log_line_starts, line_clicked)
-        if log_id >= len(self.__log_line_starts) or self.__log_line_starts[log_id] != line_clicked:
-            log_id -= 1
-
+        log_id = self.get_log_num(line_clicked)
         assert len(log_infos) == len(self.__log_line_starts)
         self.__marked_log_id = log_infos[log_id].msg_id
         self.__marker_offset = line_clicked - self.__log_line_starts[log_id]
@@ -764,7 +856,7 @@ class LogPanel(QWidget):
         # Log Capture
         self.__log_capture = LogCapture()
         self.__log_capture.filtering_changed.connect(self.__slot_on_filtering_changed)
-        self.__log_capture.new_log_record.connect(self.__slot_on_new_log_record)
+        self.__log_capture.new_log_records.connect(self.__slot_on_new_log_records)
         self.__filtered_logs = []
 
         # System Logger: set initial Log Filter check-marks from QSettings
@@ -861,9 +953,17 @@ class LogPanel(QWidget):
 
         QSettings().setValue(self.LOG_PATH_KEY, filename)
 
-        # Design decisions: the builtin enumerate(iterable, start=0) would help reduce the cost of the slicing, but
-        # the "enumerate" always starts from the first element and that would cost more if the logs are huge.
-        log_infos = self.__log_capture.get_filtered_log_history(index_range=self.__get_selection_line_numbers())
+        if self.ui.log_record_display.textCursor().hasSelection():
+            # the selection is in the view, so take the log messages from those displayed; their lines are not the
+            # indices in the log capture's history, which drops (spills) the oldest messages:
+            line_start, line_end = self.__get_selection_line_numbers()
+            log_start = self.__line_marker.get_log_num(line_start)
+            log_end = self.__line_marker.get_log_num(line_end)
+            log_infos = self.__filtered_logs[log_start:log_end + 1]
+        else:
+            # saving everything, so include the log messages that are no longer in memory:
+            log_infos = (self.__log_capture.get_filtered_spilled_log_history() +
+                         self.__log_capture.get_filtered_log_history())
         header_record = ['Time [MM/DD/YYYY HH:MM:SS.mmm]', 'Log Name', 'Log-Level', 'Message']
         list_by_range_stripped = [header_record]
         for log_info in log_infos:
@@ -939,21 +1039,27 @@ class LogPanel(QWidget):
         # The user didn't select anything. Our design decision is to save everything.
         return 0, self.ui.log_record_display.blockCount() - 1
 
-    def __on_new_log_record(self, log_info: LogMsgInfo):
-        """Append a message to the log view, and scrolls to it."""
+    def __on_new_log_records(self, log_infos: List[LogMsgInfo]):
+        """Append a batch of messages to the log view, and scrolls to the last one."""
+        if len(self.__filtered_logs) + len(log_infos) > self.__log_capture.max_history * 1.25:
+            # the oldest messages in view are no longer in capture memory, get rid of them:
+            self.__on_filtering_changed()
+            return
+
         log_view = self.ui.log_record_display
         if self.__text_horiz_slider_moved:
             current_scroll_h = log_view.horizontalScrollBar().value()
         else:
             current_scroll_h = 0
 
-        log_msg = log_info.msg
+        log_msgs = '\n'.join(log_info.msg for log_info in log_infos)
         with self.__sel_changed_by_self(True):
             with self.__cursor_pos_changed_by_self(True):
-                log_view.appendPlainText(log_msg)
-                self.__filtered_logs.append(log_info)
-                self.__line_marker.on_log_added(log_info)
-                self.__text_highlighter.on_log_added(log_view, log_msg)
+                log_view.appendPlainText(log_msgs)
+                self.__filtered_logs.extend(log_infos)
+                for log_info in log_infos:
+                    self.__line_marker.on_log_added(log_info)
+                self.__text_highlighter.on_log_added(log_view, log_msgs)
 
         vsb = log_view.verticalScrollBar()
         vsb.setValue(vsb.maximum())
@@ -1009,7 +1115,7 @@ class LogPanel(QWidget):
             self.__logs_hider.on_log_marked(log_id, self.__filtered_logs)
             self.__text_highlighter.mark_line(log_view, cursor)
 
-    __slot_on_new_log_record = safe_slot(__on_new_log_record)
+    __slot_on_new_log_records = safe_slot(__on_new_log_records)
     __slot_on_filtering_changed = safe_slot(__on_filtering_changed)
     __slot_on_text_horiz_slider_moved = safe_slot(__on_text_horiz_slider_moved)
     __slot_highlight_selection = safe_slot(__on_selection_changed)
@@ -32,7 +32,7 @@ from ..core.typing import Any, Either, Optional, Callable, PathType, TextIO, Bin
 from ..core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
 from ..scenario import ScenarioManager
 from ..scenario.defn_parts import BasePart
-from ..scenario.part_execs import PyDebugger
+from ..scenario.part_execs import PyDebugger, PartHotspotProfiler, PartHotspots
 from ..scenario.alerts import IScenAlertSource
 from ..batch_sim import BatchSimManager
 
@@ -41,7 +41,7 @@ from .Ui_mainwindow import Ui_MainWindow
 from .scenario_browser import ScenarioBrowserPanel
 from .log_panel import LogPanel
 from .object_properties.object_properties import ObjectPropertiesPanel
-from .sim import SimEventQueuePanel, BatchSimManagerBridge, MainSimBridge
+from .sim import SimEventQueuePanel, BatchSimManagerBridge, MainSimBridge, PartHotspotsDialog
 from .alerts_display import AlertsPanel
 from .sim.main import MainSimulationControlPanel
 from .sim.batch import BatchSimulationControlPanel
@@ -227,6 +227,14 @@ class MainWindow(QMainWindow):
                                             self.ui,
                                             main_control_status_panel.main_sim_shared_button_states)
 
+        # Part hotspot profiling of the main sim: the profiler samples the backend thread, where the sim runs
+        self.__part_hotspot_profiler = PartHotspotProfiler()
+        self.__action_profile_hotspots = QAction("Profile Part Hotspots", self)
+        self.__action_profile_hotspots.setCheckable(True)
+        self.__action_profile_hotspots.toggled.connect(self.__slot_on_profile_hotspots_toggled)
+        self.ui.menu_simulation.addSeparator()
+        self.ui.menu_simulation.addAction(self.__action_profile_hotspots)
+
         # Attach 'clear event queue' buttons from various locations to single slot on the Main Sim Manager
         self.__sim_event_queue_panel.sig_clear_event_queue.connect(self.__uil_main_sim.slot_on_clear_queue)
         main_control_status_panel.sig_clear_event_queue.connect(self.__uil_main_sim.slot_on_clear_queue)
@@ -570,6 +578,21 @@ class MainWindow(QMainWindow):
         """
         self.ui.action_save.setEnabled(enable)
 
+    def __on_profile_hotspots_toggled(self, checked: bool):
+        """
+        Start profiling the part hotspots of the scenario when checked; when unchecked, stop profiling and show
+        the results.
+        """
+        if checked:
+            AsyncRequest.call(self.__part_hotspot_profiler.enable)
+        else:
+            AsyncRequest.call(self.__part_hotspot_profiler.disable, response_cb=self.__show_part_hotspots)
+
+    def __show_part_hotspots(self, hotspots: PartHotspots):
+        dialog = PartHotspotsDialog(hotspots, parent=self)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.show()
+
     def __on_edit_context_changed(self, previous_widget: QWidget, current_widget: QWidget):
         """
         Implements context-based Edit menu actions to switch between scenario-context and text-context edit actions.
@@ -857,6 +880,7 @@ class MainWindow(QMainWindow):
     __slot_update_context_help = safe_slot(__update_context_help)
     __slot_reset_context_help = safe_slot(__reset_context_help)
     __slot_enable_save = safe_slot(__enable_save)
+    __slot_on_profile_hotspots_toggled = safe_slot(__on_profile_hotspots_toggled)
     __slot_on_edit_context_changed = safe_slot(__on_edit_context_changed, arg_types=['QWidget*', 'QWidget*'])
     __slot_new_scenario = safe_slot(__new_scenario)
     __slot_load_scenario = safe_slot(__load_scenario)
@@ -22,6 +22,7 @@ import urllib
 import subprocess
 from enum import IntEnum
 import sys
+from concurrent.futures import Future
 
 # [2. third-party]
 from PyQt5.QtCore import QObject, QSettings, QTimer, pyqtSignal
@@ -516,8 +517,9 @@ class ScenarioManagerBridge(QObject):
         # If a filename has not been set, launch Save As..
         if self.__last_used_scen_filepath:
             get_progress_bar().start_busy_progress('Saving')
-            AsyncRequest.call(self.__scenario_manager.save, self.__last_used_scen_filepath,
-                              response_cb=self.__save_successful, error_cb=self.__save_failed)
+            # saving to same file: only the parts that changed since last save need to be encoded
+            self.__call_save_async(self.__last_used_scen_filepath, self.__save_successful, self.__save_failed,
+                                   incremental=True)
             return True
         else:
             return self.__save_scenario_as()
@@ -578,10 +580,36 @@ class ScenarioManagerBridge(QObject):
 
         assert filepath is not None
         get_progress_bar().start_busy_progress('Saving as')
-        AsyncRequest.call(self.__scenario_manager.save, filepath, response_cb=on_save_successful,
-                          error_cb=on_save_failed)
+        self.__call_save_async(filepath, on_save_successful, on_save_failed)
         return True
 
+    def __call_save_async(self, filepath: PathType, response_cb: Callable[[list[str]], None],
+                          error_cb: Callable[[AsyncErrorInfo], None], incremental: bool = False):
+        """
+        Save the scenario without blocking the backend thread for the writing of the file: the backend only gets
+        a snapshot of the scenario, and the file is written by a worker thread. The callbacks are called, like for
+        AsyncRequest.call(), once the file has been written.
+        :param filepath: path to save to
+        :param response_cb: called with the list of non-serializable objects if save succeeded
+        :param error_cb: called if the save failed
+        :param incremental: passed on to ScenarioManager.save_async()
+        """
+
+        def check_file_written(async_save: Future):
+            if not async_save.done():
+                QTimer.singleShot(self.CHECK_SAVE_DELAY_MSEC, lambda: check_file_written(async_save))
+                return
+
+            exc = async_save.exception()
+            if exc is None:
+                response_cb(async_save.result())
+            else:
+                log.error("Scenario could not be saved to {}: {}", filepath, exc)
+                error_cb(AsyncErrorInfo(exc, self.__scenario_manager.save_async, response_cb))
+
+        AsyncRequest.call(self.__scenario_manager.save_async, filepath, incremental=incremental,
+                          response_cb=check_file_written, error_cb=error_cb)
+
     def __check_save_success(self, on_save_complete: NewLoadExitCallable):
         """
         This function monitors the current save operation that is underway and takes the appropriate action. If the
@@ -18,12 +18,14 @@ Version History: See SVN log.
 import logging
 import webbrowser
 from enum import IntEnum
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path, WindowsPath
 from copy import deepcopy
 
 # [2. third-party]
 from PyQt5.QtCore import pyqtSignal, QItemSelectionModel, QItemSelection, Qt, QAbstractTableModel, QVariant, QModelIndex
-from PyQt5.QtCore import QSettings
+from PyQt5.QtCore import QSettings, QTimer
 from PyQt5.QtWidgets import QAbstractItemView, QWidget, QHeaderView, QMessageBox, QInputDialog, QLineEdit, QDialog
 from PyQt5.QtWidgets import QFileDialog, QDialogButtonBox
 from PyQt5.QtGui import QIcon
@@ -34,10 +36,11 @@ from ...core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
 from ...core import override, override_required, override_optional, validate_python_name
 from ...scenario import ori
 from ...scenario.defn_parts import SheetPart, excel_column_letter, get_col_header, SheetIndexStyleEnum
-from ...scenario.defn_parts.sheet_part import read_from_excel, write_to_excel, get_excel_sheets
+from ...scenario.defn_parts.sheet_part import read_from_excel, write_to_excel, get_excel_sheets, CellBlock
 
 from ..gui_utils import exec_modal_dialog, PyExpr, get_icon_path, get_scenario_font, retrieve_cached_py_expr
 from ..safe_slot import safe_slot
+from ..async_methods import AsyncRequest
 
 from .special_value_editor import SpecialValueDisplay
 from .scenario_part_editor import BaseContentEditor
@@ -549,6 +552,14 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
     EVERY value in large sheets is costly, the PyExpr wrapper is only used in certain instances, such as when the value
     is double-clicked for editing. This 'lazy' evaluation is necessary to ensure the editor opens quickly for large
     sheets.
+
+    A note on large sheets: when the snapshot of the Sheet Part does not contain the cells (see
+    SheetPart.EDIT_SNAPSHOT_MAX_CELLS), the model is "virtual": the cells are fetched from the back-end, in blocks
+    of BLOCK_NUM_ROWS x BLOCK_NUM_COLS, when the view first shows them. At most MAX_CACHED_BLOCKS blocks are kept,
+    the least recently used being discarded first. The cells edited are kept separately, along with the back-end
+    values they replace, so only those are submitted, as a diff (see get_cell_diff()). Operations that need the
+    whole sheet (inserting or removing rows and columns, import and export) first load all the cells, after which
+    the model is no longer virtual.
     """
 
     # --------------------------- class-wide data and signals -----------------------------------
@@ -556,8 +567,13 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
     IndexPair = Tuple[int, int]
     CellRangeIndices = Tuple[IndexPair, IndexPair]
 
+    BLOCK_NUM_ROWS = 100
+    BLOCK_NUM_COLS = 25
+    MAX_CACHED_BLOCKS = 200
+
     sig_rows_changed = pyqtSignal(int)  # number or rows
     sig_cols_changed = pyqtSignal(int)  # number of columns
+    sig_all_cells_loaded = pyqtSignal(object)  # cells of the back-end sheet, when a virtual model loads them all
 
     # --------------------------- instance (self) PUBLIC methods --------------------------------
 
@@ -580,9 +596,18 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         # Cache back-end sheet data for quick front-end updates
         self.__col_name_cache = []
         self.__custom_name_cache = {}
-        self.__data_cache = []  # [] within [] to represent a sheet (table)
+        self.__data_cache = []  # [] within [] to represent a sheet (table); None if the model is virtual
         self.__cells_copied = None
 
+        # Cache of a virtual model:
+        self.__block_cache = OrderedDict()  # (block row, block col) -> rows of cells, least recently used first
+        self.__blocks_to_fetch = set()
+        self.__blocks_requested = set()
+        self.__edited_cells = {}  # (row, col) -> cell value edited
+        self.__replaced_cells = {}  # (row, col) -> back-end cell value replaced by the edited value
+        self.__all_cells_loaded_callbacks = []
+        self.__cache_generation = 0  # responses to requests made before the last reset are dropped
+
         self.__index_style = SheetIndexStyleEnum[self.__sheet_part.index_style]
         self.__sheet_part.signals.sig_col_idx_style_changed.connect(self.__slot_on_index_style_changed)
 
@@ -594,7 +619,7 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         """
         row_index = index.row()
         col_index = index.column()
-        return retrieve_cached_py_expr(self, self.__py_expr_cache, index, self.__data_cache[row_index][col_index])
+        return retrieve_cached_py_expr(self, self.__py_expr_cache, index, self.__get_cell_value(row_index, col_index))
 
     def set_cell(self, index: QModelIndex, val: PyExpr):
         """
@@ -602,7 +627,7 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         :param index: The index of the cell to set.
         :param val: The PyExpr object
         """
-        self.__data_cache[index.row()][index.column()] = val.obj
+        self.__set_cell_value(index.row(), index.column(), val.obj)
 
     # noinspection PyUnresolvedReferences
     @override(QAbstractTableModel)
@@ -716,7 +741,7 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
                 val_wrapper = retrieve_cached_py_expr(self,
                                                       self.__py_expr_cache,
                                                       index,
-                                                      self.__data_cache[row_index][col_index])
+                                                      self.__get_cell_value(row_index, col_index))
                 return str(val_wrapper)
             except (KeyError, IndexError):
                 # somehow the view is asking for data not in the cache, so nothing to return:
@@ -726,10 +751,14 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
             return Qt.AlignHCenter | Qt.AlignVCenter
 
         if role == Qt.ToolTipRole:
-            val_wrapper = retrieve_cached_py_expr(self,
-                                                  self.__py_expr_cache,
-                                                  index,
-                                                  self.__data_cache[row_index][col_index])
+            try:
+                val_wrapper = retrieve_cached_py_expr(self,
+                                                      self.__py_expr_cache,
+                                                      index,
+                                                      self.__get_cell_value(row_index, col_index))
+            except KeyError:
+                # cell not fetched yet
+                return QVariant()
             return val_wrapper.get_edit_tooltip()
 
         return QVariant()
@@ -767,13 +796,13 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
                 obj_value = value
 
             try:
-                self.__data_cache[row_index][col_index] = obj_value  # Override existing value
+                self.__set_cell_value(row_index, col_index, obj_value)  # Override existing value
                 field_index = self.index(row_index, col_index)
                 # noinspection PyUnresolvedReferences
                 self.dataChanged.emit(field_index, field_index)
                 return True
-            except IndexError:
-                # For some reason the View tried to set data to an index that doesn't exist
+            except (KeyError, IndexError):
+                # For some reason the View tried to set data to an index that doesn't exist (or not fetched yet)
                 pass
 
         return False
@@ -791,10 +820,14 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
 
         row_index = index.row()
         col_index = index.column()
-        val_wrapper = retrieve_cached_py_expr(self,
-                                              self.__py_expr_cache,
-                                              index,
-                                              self.__data_cache[row_index][col_index])
+        try:
+            val_wrapper = retrieve_cached_py_expr(self,
+                                                  self.__py_expr_cache,
+                                                  index,
+                                                  self.__get_cell_value(row_index, col_index))
+        except KeyError:
+            # not editable until fetched
+            return Qt.ItemIsSelectable | Qt.ItemIsEnabled
 
         if val_wrapper.is_representable():
             return Qt.ItemIsSelectable | Qt.ItemIsEditable | Qt.ItemIsEnabled
@@ -902,7 +935,10 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         """
         self.beginResetModel()
         self.__on_init_col_names(data['all_col_names'], data['custom_col_names'])
-        self.__on_init_sheet_data(data['sheet_data'])
+        if data.get('sheet_data') is None:
+            self.__on_init_virtual_sheet(data['sheet_size'])
+        else:
+            self.__on_init_sheet_data(data['sheet_data'])
         self.endResetModel()
 
     def fill_data_for_submission(self, data: Dict[str, Any]):
@@ -912,10 +948,83 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         Fills the the data dictionary with the edited sheet data for submission to the back-end Sheet Part.
         :param data: the data to submit.
         """
-        data['sheet_data'] = self.__data_cache
+        data['sheet_size'] = (self.__rows, self.__cols)
+        if self.__data_cache is None:
+            data['sheet_data'] = None
+            data['sheet_diff'] = self.get_cell_diff()
+        else:
+            data['sheet_data'] = self.__data_cache
+            data['sheet_diff'] = []
         data['all_col_names'] = self.__col_name_cache
         data['custom_col_names'] = self.__custom_name_cache
 
+    def get_cell_diff(self, replaced: bool = False) -> List[CellBlock]:
+        """
+        Get the cells edited in a virtual model, grouped in rectangular blocks. Empty if the model is not virtual.
+        :param replaced: if True, the blocks have the back-end values that the edited cells replace (i.e. the diff
+            that reverts the edits), else they have the edited values
+        :return: the blocks, in the format of SheetPart.apply_cell_diff()
+        """
+        cells = self.__replaced_cells if replaced else self.__edited_cells
+
+        # contiguous cells of each row:
+        runs = []
+        for row, col in sorted(cells):
+            if runs and runs[-1][0] == row and runs[-1][1] + len(runs[-1][2]) == col:
+                runs[-1][2].append(cells[row, col])
+            else:
+                runs.append((row, col, [cells[row, col]]))
+
+        # runs of same columns in consecutive rows:
+        blocks = []
+        open_blocks = {}  # (col, num cols) -> block that ends at the row of the previous run
+        for row, col, values in runs:
+            block = open_blocks.get((col, len(values)))
+            if block is not None and block[0] + len(block[2]) == row:
+                block[2].append(values)
+            else:
+                block = (row, col, [values])
+                blocks.append(block)
+                open_blocks[col, len(values)] = block
+
+        return blocks
+
+    def commit_edited_cells(self):
+        """
+        Indicate that the cells edited in a virtual model have been applied to the back-end: the following diffs
+        only contain the cells edited after this call.
+        """
+        for (row, col), value in self.__edited_cells.items():
+            block = self.__block_cache.get((row // self.BLOCK_NUM_ROWS, col // self.BLOCK_NUM_COLS))
+            if block is not None:
+                block[row % self.BLOCK_NUM_ROWS][col % self.BLOCK_NUM_COLS] = value
+
+        self.__edited_cells = {}
+        self.__replaced_cells = {}
+
+    def load_all_cells(self, on_loaded: Callable[[], None]):
+        """
+        Load all the cells of a virtual model from the back-end, after which the model is no longer virtual. The
+        cells edited are kept. Emits sig_all_cells_loaded with the back-end cells before on_loaded is called.
+        :param on_loaded: called once all the cells are loaded; called immediately if the model is not virtual
+        """
+        if self.__data_cache is not None:
+            on_loaded()
+            return
+
+        self.__all_cells_loaded_callbacks.append(on_loaded)
+        if len(self.__all_cells_loaded_callbacks) == 1:
+            AsyncRequest.call(self.__sheet_part.get_sheet_data,
+                              response_cb=partial(self.__on_all_cells_received, self.__cache_generation))
+
+    def get_is_virtual(self) -> bool:
+        """Returns True if the cells are fetched from the back-end as they are needed, instead of all loaded"""
+        return self.__data_cache is None
+
+    def get_num_cached_blocks(self) -> int:
+        """Get the number of blocks of cells cached by a virtual model"""
+        return len(self.__block_cache)
+
     def insert_rows(self, row_indexes_to_insert: List[int], where: InsertBeforeOrAfterEnum,
                     insert_after_selection: bool = True):
         """
@@ -924,6 +1033,9 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         :param where: indicates whether to insert before or after the row_index provided.
         :param insert_after_selection: indicates if the new rows should be inserted after or at the selected row.
         """
+        if self.__data_cache is None:
+            self.load_all_cells(partial(self.insert_rows, row_indexes_to_insert, where, insert_after_selection))
+            return
 
         if where == InsertBeforeOrAfterEnum.before:
 
@@ -973,6 +1085,9 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         :param row_start_index: the row where the selection starts.
         :param num_rows: the number of contiguously selected rows.
         """
+        if self.__data_cache is None:
+            self.load_all_cells(partial(self.remove_rows, row_start_index, num_rows))
+            return
 
         del self.__data_cache[row_start_index:row_start_index + num_rows]
 
@@ -992,6 +1107,9 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         :param where: indicates whether to insert before or after the col_index provided.
         :param insert_after_selection: indicates if the new columns should be inserted after or at the selected column.
         """
+        if self.__data_cache is None:
+            self.load_all_cells(partial(self.insert_columns, col_indexes_to_insert, where, insert_after_selection))
+            return
 
         # Handle 'Insert Before' button presses and 'Paste' Operations
         if where == InsertBeforeOrAfterEnum.before:
@@ -1075,6 +1193,9 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         :param col_start_index: the column where the selection starts.
         :param num_cols: the number of contiguously selected columns.
         """
+        if self.__data_cache is None:
+            self.load_all_cells(partial(self.remove_columns, col_start_index, num_cols))
+            return
 
         # Clear the header name from the cache
         del self.__col_name_cache[col_start_index:col_start_index + num_cols]
@@ -1124,26 +1245,31 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         row_end = selected_cells[1][0]
         col_end = selected_cells[1][1]
 
+        if values is not None:
+            # Augment start and end indexes in case values are updated after user selects a single cell
+            row_end = row_start + len(values) - 1
+            col_end = col_start + len(values[0]) - 1
+
+        if not self.__are_cells_loaded(row_start, row_end, col_start, col_end):
+            self.__load_cells(row_start, row_end, col_start, col_end,
+                              partial(self.update_cells, selected_cells, values))
+            return
+
         if values is None:
             # Iterate over the selected range and clear the current value
             for row_idx in range(row_start, row_end + 1):
                 for col_idx in range(col_start, col_end + 1):
-                    self.__data_cache[row_idx][col_idx] = 0
+                    self.__set_cell_value(row_idx, col_idx, 0)
 
         else:
             # Iterate over the values and update the cells starting from the currently selected cell.
             # Values are used to iterate rather than the selection since the user may copy a selection and then
             # click elsewhere to paste it.
-
-            # Augment start and end indexes in case values are updated after user selects a single cell
-            row_end = row_start + len(values) - 1
-            col_end = col_start + len(values[0]) - 1
-
             row_idx = row_start
             for cells in values:
                 col_idx = col_start
                 for cell in cells:
-                    self.__data_cache[row_idx][col_idx] = cell
+                    self.__set_cell_value(row_idx, col_idx, cell)
                     col_idx += 1
                 row_idx += 1
 
@@ -1159,6 +1285,11 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
 
         :param selected_cells: the cell selection as a list of indexes: [[top-left], [bottom-right].
         """
+        (row_start, col_start), (row_end, col_end) = selected_cells
+        if not self.__are_cells_loaded(row_start, row_end, col_start, col_end):
+            self.__load_cells(row_start, row_end, col_start, col_end, partial(self.cut_cells, selected_cells))
+            return
+
         self.copy_cells(selected_cells)
         self.update_cells(selected_cells)
 
@@ -1168,13 +1299,22 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
 
         :param selected_cells: the cell selection as a list of indexes: [[top-left], [bottom-right].
         """
-        self.__cells_copied = []
-
         row_start = selected_cells[0][0]
         row_end = selected_cells[1][0]
         col_start = selected_cells[0][1]
         col_end = selected_cells[1][1]
 
+        if not self.__are_cells_loaded(row_start, row_end, col_start, col_end):
+            self.__load_cells(row_start, row_end, col_start, col_end, partial(self.copy_cells, selected_cells))
+            return
+
+        self.__cells_copied = []
+        if self.__data_cache is None:
+            for row_idx in range(row_start, row_end + 1):
+                self.__cells_copied.append([self.__get_cell_value(row_idx, col_idx)
+                                            for col_idx in range(col_start, col_end + 1)])
+            return
+
         # Python omits the last index so must + 1
         data_copied = [data_row[:] for data_row in self.__data_cache[row_start:row_end + 1]]
 
@@ -1255,6 +1395,8 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
     rows = property(get_rows)
     cols = property(get_cols)
     col_names = property(get_col_names)
+    is_virtual = property(get_is_virtual)
+    num_cached_blocks = property(get_num_cached_blocks)
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
@@ -1286,10 +1428,176 @@ class SheetPartTableModelForEditing(QAbstractTableModel):
         beginModelReset() first, and call endModelReset() after.
         :param sheet_data: the data delivered from the back-end Sheet Part
         """
+        self.__reset_cell_cache()
         self.__data_cache = sheet_data
         self.__rows = len(sheet_data)
         self.sig_rows_changed.emit(self.__rows)
 
+    def __on_init_virtual_sheet(self, sheet_size: Tuple[int, int]):
+        """
+        Initialize a virtual model: the cells will be fetched as needed. Same requirements as
+        __on_init_sheet_data().
+        :param sheet_size: the number of rows and columns of the back-end Sheet Part
+        """
+        self.__reset_cell_cache()
+        self.__data_cache = None
+        self.__rows = sheet_size[0]
+        self.sig_rows_changed.emit(self.__rows)
+
+    def __reset_cell_cache(self):
+        """Discard the cells cached by a virtual model, and the edited cells"""
+        self.__block_cache.clear()
+        self.__blocks_to_fetch.clear()
+        self.__blocks_requested.clear()
+        self.__edited_cells = {}
+        self.__replaced_cells = {}
+        self.__all_cells_loaded_callbacks = []
+        self.__cache_generation += 1
+
+    def __get_cell_value(self, row_idx: int, col_idx: int) -> Any:
+        """
+        Get the value of a cell.
+        :raises: KeyError if the model is virtual and the block of the cell has not been fetched yet; the block is
+            then fetched, and dataChanged emitted for its cells when it arrives
+        """
+        if self.__data_cache is not None:
+            return self.__data_cache[row_idx][col_idx]
+
+        edited_value = self.__edited_cells.get((row_idx, col_idx), self.__edited_cells)
+        if edited_value is not self.__edited_cells:
+            return edited_value
+
+        if not (0 <= row_idx < self.__rows and 0 <= col_idx < self.__cols):
+            raise IndexError((row_idx, col_idx))
+
+        block_key = (row_idx // self.BLOCK_NUM_ROWS, col_idx // self.BLOCK_NUM_COLS)
+        block = self.__block_cache.get(block_key)
+        if block is None:
+            self.__schedule_block_fetch(block_key)
+            raise KeyError(block_key)
+
+        self.__block_cache.move_to_end(block_key)
+        return block[row_idx % self.BLOCK_NUM_ROWS][col_idx % self.BLOCK_NUM_COLS]
+
+    def __set_cell_value(self, row_idx: int, col_idx: int, value: Any):
+        """
+        Set the value of a cell.
+        :raises: KeyError if the model is virtual and the block of the cell has not been fetched yet
+        """
+        if self.__data_cache is not None:
+            self.__data_cache[row_idx][col_idx] = value
+            return
+
+        cell = (row_idx, col_idx)
+        if cell not in self.__replaced_cells:
+            self.__replaced_cells[cell] = self.__get_cell_value(row_idx, col_idx)
+        self.__edited_cells[cell] = value
+
+    def __get_block_keys(self, row_start: int, row_end: int, col_start: int, col_end: int) -> List[IndexPair]:
+        """Get the keys of the blocks that contain the cells of given range (inclusive)"""
+        return [(block_row, block_col)
+                for block_row in range(row_start // self.BLOCK_NUM_ROWS, row_end // self.BLOCK_NUM_ROWS + 1)
+                for block_col in range(col_start // self.BLOCK_NUM_COLS, col_end // self.BLOCK_NUM_COLS + 1)]
+
+    def __are_cells_loaded(self, row_start: int, row_end: int, col_start: int, col_end: int) -> bool:
+        """Returns True if the values of all the cells of given range (inclusive) are available"""
+        if self.__data_cache is not None:
+            return True
+
+        return all(key in self.__block_cache for key in self.__get_block_keys(row_start, row_end, col_start, col_end))
+
+    def __load_cells(self, row_start: int, row_end: int, col_start: int, col_end: int, on_loaded: Callable[[], None]):
+        """
+        Fetch the blocks of the cells of given range (inclusive) that are not cached, then call on_loaded. If the
+        range has more blocks than can be cached, all the cells are loaded instead (see load_all_cells()).
+        """
+        block_keys = self.__get_block_keys(row_start, row_end, col_start, col_end)
+        if len(block_keys) > self.MAX_CACHED_BLOCKS:
+            self.load_all_cells(on_loaded)
+            return
+
+        # the blocks of the range that are cached must not be the next ones discarded:
+        for key in block_keys:
+            if key in self.__block_cache:
+                self.__block_cache.move_to_end(key)
+
+        self.__fetch_blocks([key for key in block_keys if key not in self.__block_cache], on_fetched=on_loaded)
+
+    def __schedule_block_fetch(self, block_key: IndexPair):
+        """Fetch the given block at the next event loop pass, with the other blocks needed by then"""
+        if block_key in self.__blocks_requested or block_key in self.__blocks_to_fetch:
+            return
+
+        if not self.__blocks_to_fetch:
+            QTimer.singleShot(0, self.__fetch_scheduled_blocks)
+        self.__blocks_to_fetch.add(block_key)
+
+    def __fetch_scheduled_blocks(self):
+        block_keys = [key for key in self.__blocks_to_fetch if key not in self.__block_cache]
+        self.__blocks_to_fetch.clear()
+        if block_keys:
+            self.__fetch_blocks(block_keys)
+
+    def __fetch_blocks(self, block_keys: List[IndexPair], on_fetched: Callable[[], None] = None):
+        """
+        Fetch the given blocks from the back-end, in one request.
+        :param on_fetched: if given, called once the blocks have been cached
+        """
+        sheet_part = self.__sheet_part
+        num_rows, num_cols = self.BLOCK_NUM_ROWS, self.BLOCK_NUM_COLS
+
+        def get_blocks() -> List[Tuple[Tuple[int, int], List[List[Any]]]]:
+            return [(key, sheet_part.get_cell_block(key[0] * num_rows, key[1] * num_cols, num_rows, num_cols))
+                    for key in block_keys]
+
+        self.__blocks_requested.update(block_keys)
+        AsyncRequest.call(get_blocks,
+                          response_cb=partial(self.__on_blocks_received, self.__cache_generation, on_fetched))
+
+    def __on_blocks_received(self, generation: int, on_fetched: Optional[Callable[[], None]],
+                             blocks: List[Tuple[IndexPair, List[List[Any]]]]):
+        """Cache the blocks fetched by __fetch_blocks(), discarding the least recently used blocks if too many"""
+        if generation != self.__cache_generation:
+            # model was reset since the request
+            return
+
+        for key, rows in blocks:
+            self.__blocks_requested.discard(key)
+            self.__block_cache[key] = rows
+            self.__block_cache.move_to_end(key)
+
+        while len(self.__block_cache) > self.MAX_CACHED_BLOCKS:
+            self.__block_cache.popitem(last=False)
+
+        for (block_row, block_col), rows in blocks:
+            if rows:
+                row_start = block_row * self.BLOCK_NUM_ROWS
+                col_start = block_col * self.BLOCK_NUM_COLS
+                # noinspection PyUnresolvedReferences
+                self.dataChanged.emit(self.index(row_start, col_start),
+                                      self.index(row_start + len(rows) - 1, col_start + len(rows[0]) - 1))
+
+        if on_fetched is not None:
+            on_fetched()
+
+    def __on_all_cells_received(self, generation: int, sheet_data: List[List[Any]]):
+        """Make the model non-virtual with the cells fetched by load_all_cells(), and the cells edited"""
+        if generation != self.__cache_generation:
+            return
+
+        self.sig_all_cells_loaded.emit(sheet_data)
+
+        for (row_idx, col_idx), value in self.__edited_cells.items():
+            sheet_data[row_idx][col_idx] = value
+
+        callbacks = self.__all_cells_loaded_callbacks
+        self.beginResetModel()
+        self.__on_init_sheet_data(sheet_data)
+        self.endResetModel()
+
+        for on_loaded in callbacks:
+            on_loaded()
+
     def __on_index_style_changed(self, index_style: int):
         """
         Updates the index style attribute to correspond with the back-end sheet part.
@@ -1339,6 +1647,7 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
         self.ui.sheet_view.setSelectionMode(QAbstractItemView.ContiguousSelection)
         self.__sheet_model.sig_rows_changed.connect(self.__slot_on_row_number_model_update)
         self.__sheet_model.sig_cols_changed.connect(self.__slot_on_column_number_model_update)
+        self.__sheet_model.sig_all_cells_loaded.connect(self.__slot_on_all_cells_loaded)
         self.__selection_model.currentChanged.connect(self.__slot_on_item_changed)
         self.__selection_model.selectionChanged.connect(self.__slot_on_selection_changed)
 
@@ -1401,6 +1710,17 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
                      self.ui.change_column_count_spin_box]
         return tab_order
 
+    @override(BaseContentEditor)
+    def check_unapplied_changes(self) -> Either[Dict[str, Any], None]:
+        """
+        When the cells are fetched as needed (the sheet is too large for the editor snapshot), only the edited cells
+        are submitted, as a diff. The diff that reverts them is put in the initial data, so that the undo of the
+        changes re-applies the cells replaced.
+        """
+        if self.__sheet_model.is_virtual:
+            self._initial_data['sheet_diff'] = self.__sheet_model.get_cell_diff(replaced=True)
+        return super().check_unapplied_changes()
+
     @override(BaseContentEditor)
     def _get_data_for_submission(self) -> Dict[str, Any]:
         """
@@ -1419,6 +1739,17 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
         """
         self.__sheet_model.init_model(data)
 
+    @override(BaseContentEditor)
+    def _snapshot_initial_data(self, data: Dict[str, Any]):
+        """
+        When the cells are fetched as needed, the initial data does not have the cells: the cells applied to the
+        back-end become the initial cells of the model instead, and the next diff is relative to them.
+        """
+        BaseContentEditor._snapshot_initial_data(self, data)
+        if self._initial_data.get('sheet_data') is None:
+            self.__sheet_model.commit_edited_cells()
+            self._initial_data['sheet_diff'] = []
+
     @override(SpecialValueDisplay)
     def _get_special_value(self) -> object:
         return self.__sheet_model.get_cell(self.__special_cell_index)
@@ -1437,25 +1768,30 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
         :param src_data: The source dictionary to be copied from.
         :return The deep-copied data
         """
+        def copy_rows(rows: List[List[Any]]) -> List[List[Any]]:
+            new_grid_data = list()
+            for row_index, row in enumerate(rows):
+                a_row = list()
+                for col_index, value in enumerate(row):
+                    try:
+                        # Tests this value. If it can be copied, we leave it intact
+                        a_row.append(deepcopy(value))
+                    except:
+                        a_row.append(value)
+
+                new_grid_data.append(a_row)
+
+            return new_grid_data
+
         destination_data = dict()
         for key, val in src_data.items():
             if key == "sheet_data":
-                new_grid_data = list()
-                for row_index, row in enumerate(val):
-                    a_row = list()
-                    for col_index, value in enumerate(row):
-                        try:
-                            # Tests this value. If it can be copied, we leave it intact
-                            a_row.append(deepcopy(value))
-                        except:
-                            a_row.append(value)
-
-                    new_grid_data.append(a_row)
-
+                destination_data[key] = None if val is None else copy_rows(val)
+            elif key == "sheet_diff":
+                destination_data[key] = [(row, col, copy_rows(rows)) for row, col, rows in val]
             else:
                 destination_data[key] = deepcopy(val)
 
-        destination_data['sheet_data'] = new_grid_data
         return destination_data
 
     def __toggle_enabled_edit_buttons(self, enable: bool = True, enable_insert: bool = True):
@@ -1781,6 +2117,19 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
             self.__sheet_model.insert_columns(col_insert_indexes, InsertBeforeOrAfterEnum.after,
                                               insert_after_selection=False)
 
+    def __import_sheet(self):
+        """
+        Imports an Excel spreadsheet, once all the cells are loaded: the imported cells replace the whole sheet, so
+        the undo of the changes needs all the cells that they replace.
+        """
+        self.__sheet_model.load_all_cells(self.__launch_import_dialog)
+
+    def __export_sheet(self):
+        """
+        Exports the sheet to an Excel spreadsheet, once all the cells are loaded.
+        """
+        self.__sheet_model.load_all_cells(self.__launch_export_dialog)
+
     def __launch_import_dialog(self):
         """
         Launches the sheet import dialog to import data from an Excel spreadsheet.
@@ -1870,6 +2219,15 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
 
         return True
 
+    def __on_all_cells_loaded(self, sheet_data: List[List[Any]]):
+        """
+        When the model has loaded all the cells of the back-end, they become the initial cells, so that the undo of
+        the changes restores the whole sheet.
+        :param sheet_data: the cells of the back-end, without the edits
+        """
+        self._initial_data['sheet_data'] = self._get_deepcopy(dict(sheet_data=sheet_data))['sheet_data']
+        self._initial_data['sheet_diff'] = []
+
     def __prepare_for_cell_editing(self, index: QModelIndex):
         """
         Opens the Special Value Editor in response to a double-click at the given index if the value at the index is
@@ -1880,6 +2238,7 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
         self._open_special_value_editor()
 
     __slot_prepare_for_cell_editing = safe_slot(__prepare_for_cell_editing)
+    __slot_on_all_cells_loaded = safe_slot(__on_all_cells_loaded)
     __slot_on_item_changed = safe_slot(__on_item_changed)
     __slot_on_selection_changed = safe_slot(__on_selection_changed)
 
@@ -1893,8 +2252,8 @@ class SheetPartEditorPanel(BaseContentEditor, SpecialValueDisplay):
     __slot_paste = safe_slot(__paste)
     __slot_delete = safe_slot(__delete)
 
-    __slot_import_sheet = safe_slot(__launch_import_dialog)
-    __slot_export_sheet = safe_slot(__launch_export_dialog)
+    __slot_import_sheet = safe_slot(__import_sheet)
+    __slot_export_sheet = safe_slot(__export_sheet)
 
     __slot_on_row_number_model_update = safe_slot(__on_row_number_changed_by_model)
     __slot_on_column_number_model_update = safe_slot(__on_column_number_changed_by_model)
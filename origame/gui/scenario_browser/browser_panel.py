@@ -245,28 +245,18 @@ class ActorHierarchyModel(TreeModel):
 
     def create_tree_from_root(self, actors: List[ActorPart]) -> TreeItem:
         """
-        Method used to traverse an ActorPart and create a TreeItem.
+        Method used to create the root TreeItem of the tree, with one child TreeItem per actor. The children of the
+        actors are fetched when the view needs them (see TreeModel.fetchMore()).
         :param actors: A list of ActorParts, each of which may contain other child ActorParts.
         :return: root item of hierarchy
         """
         self.beginResetModel()
         self._root_item = TreeItem(["Actor Hierarchy"], model=self)
-        self.create_branch(actors, self._root_item)
+        self._root_item.insert_child_entries(0, [(actor, actor.name, True) for actor in actors])
         self.endResetModel()
 
         return self._root_item
 
-    def create_branch(self, actors: List[ActorPart], parent_item: TreeItem):
-        """
-        Method used to traverse an ActorPart's children and create TreeItems.
-        :param actors: A list of ActorParts, each of which may contain other child ActorParts.
-        :param parent_item: The root TreeItem object
-        """
-        for child in actors:
-            if child.PART_TYPE_NAME == ApKeys.PART_TYPE_ACTOR:
-                new_item = parent_item.add_child(child)
-                self.create_branch(child.children, new_item)
-
 
 class ListItemPartMonitor(QObject):
     def __init__(self, parent_list_item: QListWidgetItem, part: BasePart):
@@ -428,7 +418,8 @@ class ScenarioSearchPanel(IScenarioMonitor, QWidget):
 
         self.ui.list_search_results.clear()
 
-        AsyncRequest.call(scenario.search_parts, text, response_cb=self.__on_search_done)
+        # the hits, and the end of the search, are signaled by the scenario's shared state:
+        AsyncRequest.call(scenario.search_parts_async, text)
 
     slot_on_search_clicked = safe_slot(on_search_clicked)
     slot_on_cancel_search = safe_slot(on_cancel_search)
@@ -442,9 +433,11 @@ class ScenarioSearchPanel(IScenarioMonitor, QWidget):
         if self.__scenario_weak is not None and self.__scenario_weak() is not None:
             shared_signals = self.__scenario_weak().shared_state.signals
             shared_signals.sig_search_hit.disconnect(self.__slot_on_search_hit)
+            shared_signals.sig_search_done.disconnect(self.__slot_on_search_done)
 
         self.__scenario_weak = weakref.ref(scenario)
         scenario.shared_state.signals.sig_search_hit.connect(self.__slot_on_search_hit)
+        scenario.shared_state.signals.sig_search_done.connect(self.__slot_on_search_done)
 
         # When scenario has been replaced, clear panel
         self.ui.text_pattern.setText("")
@@ -457,7 +450,7 @@ class ScenarioSearchPanel(IScenarioMonitor, QWidget):
 
     def __on_search_done(self):
         """
-        Callback method once results have been obtained for a particular query. The results have been obtained
+        Called when the scenario search has completed or was cancelled. The results have been obtained
         one at a time already so they are merely sorted and the widgets states updated.
         """
         self.ui.button_cancel.hide()
@@ -508,6 +501,7 @@ class ScenarioSearchPanel(IScenarioMonitor, QWidget):
 
     __slot_on_search_box_text_edited = safe_slot(__on_search_box_text_edited)
     __slot_on_search_hit = ext_safe_slot(__on_search_hit, arg_types=(BasePart, list))
+    __slot_on_search_done = safe_slot(__on_search_done)
     __slot_show_search_hit_part = safe_slot(__show_search_hit_part)
 
 
@@ -562,15 +556,15 @@ class ActorHierarchyPanel(IScenarioMonitor, QWidget):
         self.actor_hierarchy_view.setModel(self.actor_hierarchy_model)
 
         # select root actor:
-        self.__select_root_item()
-        self.actor_hierarchy_view.expandAll()
+        index = self.__select_root_item()
+        self.actor_hierarchy_view.expand(index)
 
     def __on_model_reset(self):
         """
         When a new model is loaded set the currently selected item of the model to be the root actor.
         """
         index = self.__select_root_item()
-        self.actor_hierarchy_view.expandAll()
+        self.actor_hierarchy_view.expand(index)
         self.sig_user_selected_part.emit(index.data(Qt.UserRole))
 
     def __on_hovered(self, index: QModelIndex):
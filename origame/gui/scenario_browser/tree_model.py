@@ -27,9 +27,11 @@ Version History: based on the PyQt5 itemviews/editabletreemodel.py example
 
 # [1. standard library]
 import logging
+from bisect import bisect_left, bisect_right
+from functools import partial
 
 # [2. third-party]
-from PyQt5.QtCore import QAbstractItemModel, Qt, QObject, QModelIndex
+from PyQt5.QtCore import QAbstractItemModel, Qt, QObject, QModelIndex, QTimer
 from PyQt5.QtWidgets import QMessageBox
 
 # [3. local]
@@ -42,6 +44,7 @@ from ...scenario import OriActorPartKeys as ApKeys
 
 from ..safe_slot import safe_slot, ext_safe_slot
 from ..gui_utils import exec_modal_dialog
+from ..async_methods import AsyncRequest
 from ..undo_manager import RemovePartCommand, AddPartCommand, RenamePartCommand
 from ..undo_manager import scene_undo_stack
 
@@ -56,14 +59,44 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 
 log = logging.getLogger('system')
 
+# An actor child as fetched from the backend: (actor, name, whether the actor has actor children)
+ChildEntry = Tuple[ActorPart, str, bool]
+# The tree items of a parent are sorted by (name, session ID) of their actor:
+ChildSortKey = Tuple[str, int]
 
-# -- Class Definitions --------------------------------------------------------------------------
 
 class Decl(AnnotationDeclarations):
     TreeItem = 'TreeItem'
     TreeModel = 'TreeModel'
 
 
+# -- Function definitions -----------------------------------------------------------------------
+
+def get_actor_children_page(actor: ActorPart, after_key: Optional[ChildSortKey],
+                            max_children: int) -> Tuple[List[ChildEntry], bool, int]:
+    """
+    Get a page of the actor children of an actor, in the order of the tree items. This must be called from the
+    backend thread.
+    :param actor: the actor for which to get the children
+    :param after_key: the sort key of the last child of the previous page, or None to get the first page
+    :param max_children: the maximum number of children in the page
+    :return: the children of the page, a flag that is True if there are more children after this page, and the
+        total number of actor children of the actor
+    """
+    children = [((child.name, child.SESSION_ID), child) for child in actor.children
+                if child.PART_TYPE_NAME == ApKeys.PART_TYPE_ACTOR]
+    children.sort(key=lambda key_and_child: key_and_child[0])
+
+    start = 0 if after_key is None else bisect_right([key for key, _ in children], after_key)
+    page = [(child, key[0], any(grand_child.PART_TYPE_NAME == ApKeys.PART_TYPE_ACTOR
+                                for grand_child in child.children))
+            for key, child in children[start:start + max_children]]
+
+    return page, start + len(page) < len(children), len(children)
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
 class TreeItem(QObject):
     """
     An item in the TreeModel.  The user_data data member contains the BasePart (Currently only Actor)
@@ -86,6 +119,12 @@ class TreeItem(QObject):
         self.__model = model
         self._undo = scene_undo_stack()
 
+        # state of the lazy population of the children (see TreeModel.fetchMore()):
+        self.__may_have_children = True
+        self.__all_children_fetched = user_data is None  # items without an actor get their children explicitly
+        self.__fetch_pending = False
+        self.__fetch_cursor = None  # sort key of the last child fetched
+
         self.set_data(0, user_data, Qt.UserRole)
 
     def child(self, child_num: int):
@@ -99,7 +138,7 @@ class TreeItem(QObject):
         return len(self.__child_items)
 
     def child_number(self) -> int:
-        if not self._parent_item:
+        if self._parent_item is not None:
             return self._parent_item.__child_items.index(self)
         return 0
 
@@ -121,6 +160,25 @@ class TreeItem(QObject):
 
         return new_item
 
+    def insert_child_entries(self, position: int, entries: List[ChildEntry]) -> bool:
+        """
+        Insert one tree item for each of the given actor children.
+        :param position: The position at which to insert the first child.
+        :param entries: The children to insert, as obtained from get_actor_children_page().
+        :return: Boolean indicating whether or not the children TreeItem(s) were successfully inserted.
+        """
+        if position < 0 or position > len(self.__child_items):
+            return False
+
+        new_items = []
+        for child_part, name, has_actor_children in entries:
+            item = TreeItem([name], self, child_part, model=self.__model)
+            item.__may_have_children = has_actor_children
+            new_items.append(item)
+        self.__child_items[position:position] = new_items
+
+        return True
+
     def insert_children(self, position: int, count: int, columns: int) -> bool:
         if position < 0 or position > len(self.__child_items):
             return False
@@ -192,15 +250,14 @@ class TreeItem(QObject):
         if position < 0 or position + count > len(self.__child_items):
             return False
 
-        for row in range(position, position + count):
+        for child_item in self.__child_items[position:position + count]:
             # Disconnect this child's signal connections otherwise multiple calls to slots can trigger a bug
             # where child parts that have been removed are triggered to be removed again.
-            child_item = self.child(row)
             child_actor = child_item.user_data
             child_actor.signals.sig_child_added.disconnect(child_item.slot_on_child_added)
             child_actor.signals.sig_child_deleted.disconnect(child_item.slot_on_child_deleted)
             child_actor.part_frame.signals.sig_name_changed.disconnect(child_item.slot_on_renamed)
-            self.__child_items.pop(row)
+        del self.__child_items[position:position + count]
 
         return True
 
@@ -263,44 +320,61 @@ class TreeItem(QObject):
 
     def on_child_added(self, child_part: BasePart):
         """
-        This slot is called when a child gets added to the Actor hierarchy.
-        This is what creates a new tree item with the correct data.
-        :param id_part_to_add: The session id of the part object that is to be added.
+        This slot is called when a child gets added to the Actor hierarchy. The model creates the new tree item
+        (with the correct data) in a batch with the other children added or removed until the next event loop
+        pass, so bulk operations like pasting many actors only update the model once.
+        :param child_part: The part that was added.
         """
         if child_part.PART_TYPE_NAME != ApKeys.PART_TYPE_ACTOR:
             # if not an actor part, nothing else to do
             return
 
-        # Before the child can be added to this tree item (self), we need to determine self's QModelIndex.
-        self_index = self.__model.get_q_index(self)
-        if self_index is None:
-            # we are no longer a valid node in tree
-            return
-
-        position = self.__get_alphabetical_position(child_part, self)
-        self.__model.insertRows(position, 1, self_index)
-        child_index = self.__model.index(position, 0, self_index)
-
-        self.__model.set_index_data(child_index, child_part.part_frame.name)
-        self.__model.set_index_data(child_index, child_part, Qt.UserRole)
-
-        new_tree_item = child_index.internalPointer()
-
-        # In the case that an Actor has children, we need to create the hierarchy for it as well.
-        # This is the case when an Actor (potentially with children) is 'imported' into a another actor.
-        self.__model.create_branch(child_part.children, new_tree_item)
+        self.__model.schedule_child_added(self, child_part)
 
     def on_child_deleted(self, deleted_part_id: int):
         """
-        This slot is called when a child has been deleted in the backend.
-        When this slot is called, the child item is deleted from the current (self) tree item.
+        This slot is called when a child has been deleted in the backend. The child item is deleted from the
+        current (self) tree item in a batch, see on_child_added().
         :param deleted_part_id: The id of the part that needs to be found to delete the corresponding tree item.
         """
-        for child in self.__child_items:
-            if child.__user_data.SESSION_ID == deleted_part_id:
-                child_q_index = self.__model.get_q_index(child)
-                self.__model.removeRows(child_q_index.row(), 1, child_q_index.parent())
-                break
+        self.__model.schedule_child_removed(self, deleted_part_id)
+
+    def get_sort_key(self) -> ChildSortKey:
+        """Get the key that determines the position of this item among its siblings"""
+        return self.__item_data[0], self.__user_data.SESSION_ID
+
+    def get_may_have_children(self) -> bool:
+        """
+        Returns True if this item has child items, or if its actor may have actor children that have not been
+        fetched yet.
+        """
+        return bool(self.__child_items) or (not self.__all_children_fetched and self.__may_have_children)
+
+    def set_may_have_children(self, value: bool):
+        self.__may_have_children = value
+
+    def get_can_fetch_more(self) -> bool:
+        """Returns True if the children of this item have not all been fetched and no fetch is in progress"""
+        return not self.__all_children_fetched and not self.__fetch_pending
+
+    def get_fetch_pending(self) -> bool:
+        return self.__fetch_pending
+
+    def set_fetch_pending(self, value: bool):
+        self.__fetch_pending = value
+
+    def get_all_children_fetched(self) -> bool:
+        return self.__all_children_fetched
+
+    def set_all_children_fetched(self, value: bool):
+        self.__all_children_fetched = value
+
+    def get_fetch_cursor(self) -> Optional[ChildSortKey]:
+        """Get the sort key of the last child fetched, or None if no page of children has been fetched"""
+        return self.__fetch_cursor
+
+    def set_fetch_cursor(self, value: Optional[ChildSortKey]):
+        self.__fetch_cursor = value
 
     def on_renamed(self, new_name: str):
         """
@@ -347,6 +421,12 @@ class TreeItem(QObject):
     child_items = property(get_child_items)
     item_data = property(get_item_data, set_item_data)
     user_data = property(get_user_data)
+    sort_key = property(get_sort_key)
+    may_have_children = property(get_may_have_children, set_may_have_children)
+    can_fetch_more = property(get_can_fetch_more)
+    fetch_pending = property(get_fetch_pending, set_fetch_pending)
+    all_children_fetched = property(get_all_children_fetched, set_all_children_fetched)
+    fetch_cursor = property(get_fetch_cursor, set_fetch_cursor)
 
     def __reinsert_tree_item(self, position: int, tree_item: Decl.TreeItem, columns: int) -> bool:
         if position < 0 or position > len(self.__child_items):
@@ -402,12 +482,22 @@ class TreeModel(QAbstractItemModel):
     we used BasePart as the argument/return types instead!!!
     Then I wouldn't have to implement them for BasePart again for communicating with other Panels.
     TreeItem was supposed to be an internal class!!
+
+    The children of an actor item are populated lazily: the view calls fetchMore() on an item when it gets
+    expanded, and the actor children are then fetched from the backend in pages of CHILDREN_PAGE_SIZE, each page
+    inserted as one range of rows. Children added to or removed from the actors after that are applied in
+    batches of contiguous row ranges at the next event loop pass, rather than one row (or one reset) at a time.
     """
 
+    # Maximum number of children fetched from the backend, and inserted in the model, at once:
+    CHILDREN_PAGE_SIZE = 200
+
     def __init__(self, root_item: TreeItem = None, parent: QObject = None):
         super().__init__(parent)
         self._root_item = None
         self._undo_stack = scene_undo_stack()
+        # parent item -> (children added by session ID, session IDs of children removed), in scheduling order:
+        self.__pending_changes = {}
 
     def get_item(self, index: QModelIndex) -> TreeItem:
         if index.isValid():
@@ -438,6 +528,35 @@ class TreeModel(QAbstractItemModel):
         except IndexError:
             return None
 
+    @override(QAbstractItemModel)
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """
+        Children that have not been fetched yet count, so the view shows actors as expandable before their
+        children are fetched.
+        """
+        parent_item = self.get_item(parent)
+        return parent_item.may_have_children if parent_item else False
+
+    @override(QAbstractItemModel)
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        parent_item = self.get_item(parent)
+        return parent_item.can_fetch_more if parent_item else False
+
+    @override(QAbstractItemModel)
+    def fetchMore(self, parent: QModelIndex):
+        """
+        Fetch the next page of children of the item at parent, from the backend. The following pages are
+        fetched automatically, one request each, until all the children have been fetched.
+        """
+        parent_item = self.get_item(parent)
+        if parent_item is None or not parent_item.can_fetch_more:
+            return
+
+        parent_item.fetch_pending = True
+        AsyncRequest.call(get_actor_children_page, parent_item.user_data, parent_item.fetch_cursor,
+                          self.CHILDREN_PAGE_SIZE,
+                          response_cb=partial(self.__on_children_page_received, parent_item))
+
     @override(QAbstractItemModel)
     def flags(self, index: QModelIndex) -> Qt.ItemFlags:
         """ Returns what kinds of interactions the user can have with an item at a particular location
@@ -535,41 +654,35 @@ class TreeModel(QAbstractItemModel):
         """
         This method is used to get a QModelIndex given a TreeItem.
         :param tree_item: The tree item for which to get the QModelIndex for.
-        :return: QModelIndex
-        """
-
-        # This list will hold a list of TreeItem objects that forms the link to
-        # the tree_item that we need to find the QModelIndex for.  The right most
-        # TreeItem object in this list will be the tree_item we are looking the QModelIndex for.
-        # The left most TreeItem object in this list will be the root tree item.
-        tree_item_path_to_root = [tree_item]
-
-        # This while loop fills the tree_item_path_to_root with TreeItem objects.
-        # At the end of this loop, tree_item_path_to_root should look like (as an example):
-        # [tree_item_root, tree_item1, tree_item2, tree_item]
-        while tree_item.parent() is not None:
-            tree_item = tree_item.parent()
-            tree_item_path_to_root.insert(0, tree_item)
-
-        # This gives us the TreeModel's root QModelIndex from which we can
-        # determine all other QModelIndex's within this model.
-        index = QModelIndex()
-
-        # The for loop here starts at element one because element 0 is the TreeItem
-        # that is inserted into the Actor Hierarchy panel (so essentially, this TreeItem
-        # isn't shown as part of being 'within' the tree.  Therefor, Origame's 'Root Actor' TreeItem
-        # is actually element 1.
-        # In the first iteration of this loop, we are looking for the QModelIndex
-        # of Origame's 'Root Actor'.  Once we get that, we just keep looping over the
-        # tree_item_path_to_root list until we get the QModelIndex of the tree_item that
-        # is of interest.
-        for tree_item in tree_item_path_to_root[1:]:
-            new_index = self.get_index_in_parent(tree_item, index)
-            if new_index is None:
-                break
-            index = new_index
+        :return: QModelIndex (invalid for the root tree item, which is not shown in the view)
+        """
+        if tree_item is None or tree_item is self._root_item:
+            return QModelIndex()
+
+        return self.createIndex(tree_item.child_number(), 0, tree_item)
 
-        return index
+    def schedule_child_added(self, parent_item: TreeItem, child_part: ActorPart):
+        """
+        Schedule the insertion of a tree item for an actor added to the actor of parent_item. The insertion is
+        done, with all other changes scheduled until then, at the next event loop pass.
+        """
+        added, removed = self.__get_pending_changes(parent_item)
+        added[child_part.SESSION_ID] = child_part
+
+    def schedule_child_removed(self, parent_item: TreeItem, child_part_id: int):
+        """
+        Schedule the removal of the tree item of a part removed from the actor of parent_item. See
+        schedule_child_added().
+        """
+        added, removed = self.__get_pending_changes(parent_item)
+        added.pop(child_part_id, None)
+        removed.add(child_part_id)
+
+    def get_num_pending_changes(self) -> int:
+        """Get the number of tree items for which child insertions or removals are scheduled"""
+        return len(self.__pending_changes)
+
+    num_pending_changes = property(get_num_pending_changes)
 
     def find_part_in_model(self, part: BasePart) -> QModelIndex:
         """
@@ -582,9 +695,15 @@ class TreeModel(QAbstractItemModel):
         for part in parts_path:
             found_index = self._find_child(part, parent_index)
             if found_index is None:
-                return None
-            else:
-                parent_index = found_index
+                parent_item = self.get_item(parent_index)
+                if parent_item.all_children_fetched or part.PART_TYPE_NAME != ApKeys.PART_TYPE_ACTOR:
+                    return None
+
+                # the part has not been fetched yet: insert it now, the fetch will skip it
+                self.__insert_child_entries(parent_item, [(part, part.name, True)])
+                found_index = self._find_child(part, parent_index)
+
+            parent_index = found_index
 
         return parent_index
 
@@ -701,11 +820,156 @@ class TreeModel(QAbstractItemModel):
         :param parent_index: index of model item containing children to search
         :return: QModelIndex of the found TreeItem associated with find_part, or None if not found
         """
-        row_count = self.rowCount(parent_index)
-        for row in range(0, row_count):
-            idx = self.index(row, 0, parent_index)
-            part_obj = self.data(idx, Qt.UserRole)
-            if part_obj is find_part:
-                return idx
+        parent_item = self.get_item(parent_index)
+        if parent_item is None:
+            return None
+
+        for row, child_item in enumerate(parent_item.child_items):
+            if child_item.user_data is find_part:
+                return self.createIndex(row, 0, child_item)
 
         return None
+
+    def __get_pending_changes(self, parent_item: TreeItem) -> Tuple[Dict[int, ActorPart], Set[int]]:
+        """Get the changes scheduled for the children of parent_item; schedules the flush if none were"""
+        if not self.__pending_changes:
+            QTimer.singleShot(0, self.__apply_pending_changes)
+
+        changes = self.__pending_changes.get(parent_item)
+        if changes is None:
+            changes = ({}, set())
+            self.__pending_changes[parent_item] = changes
+
+        return changes
+
+    def __apply_pending_changes(self):
+        """Apply all the scheduled child insertions and removals, as contiguous ranges of rows"""
+        pending_changes = self.__pending_changes
+        self.__pending_changes = {}
+
+        for parent_item, (added, removed) in pending_changes.items():
+            if not self.__is_in_model(parent_item):
+                continue
+
+            if removed:
+                self.__remove_child_items(parent_item, removed)
+
+            if added:
+                entries = [(child_part, child_part.name, True) for child_part in added.values()]
+                if not parent_item.all_children_fetched and not parent_item.fetch_pending:
+                    # children that will be fetched later must not be inserted now
+                    cursor = parent_item.fetch_cursor
+                    if cursor is not None:
+                        entries = [entry for entry in entries if (entry[1], entry[0].SESSION_ID) <= cursor]
+                    elif parent_item.may_have_children:
+                        entries = []
+                self.__insert_child_entries(parent_item, entries)
+
+        log.debug("Scenario browser: applied child changes of {} actors", len(pending_changes))
+
+    def __insert_child_entries(self, parent_item: TreeItem, entries: List[ChildEntry]) -> int:
+        """
+        Insert the tree items of the given children of parent_item, at their sorted position, with one row
+        insertion per group of children that are contiguous in the model. Children that already have a tree item
+        are skipped.
+        :return: the number of tree items inserted
+        """
+        displayed_ids = {child_item.user_data.SESSION_ID for child_item in parent_item.child_items}
+        new_entries = {}
+        for entry in entries:
+            child_id = entry[0].SESSION_ID
+            if child_id not in displayed_ids:
+                new_entries[child_id] = ((entry[1], child_id), entry)
+        if not new_entries:
+            return 0
+
+        existing_keys = [child_item.sort_key for child_item in parent_item.child_items]
+        parent_index = self.get_q_index(parent_item)
+        num_inserted = 0
+
+        def insert_run(position: int, run_entries: List[ChildEntry]):
+            nonlocal num_inserted
+            row = position + num_inserted
+            self.beginInsertRows(parent_index, row, row + len(run_entries) - 1)
+            parent_item.insert_child_entries(row, run_entries)
+            self.endInsertRows()
+            num_inserted += len(run_entries)
+
+        run_position = None
+        run_entries = []
+        for key, entry in sorted(new_entries.values(), key=lambda key_and_entry: key_and_entry[0]):
+            position = bisect_left(existing_keys, key)
+            if run_entries and position != run_position:
+                insert_run(run_position, run_entries)
+                run_entries = []
+            run_position = position
+            run_entries.append(entry)
+        insert_run(run_position, run_entries)
+
+        return num_inserted
+
+    def __remove_child_items(self, parent_item: TreeItem, child_part_ids: Set[int]):
+        """
+        Remove the tree items of given children of parent_item, with one row removal per group of children that
+        are contiguous in the model. Children that do not have a tree item are ignored.
+        """
+        rows = [row for row, child_item in enumerate(parent_item.child_items)
+                if child_item.user_data.SESSION_ID in child_part_ids]
+        if not rows:
+            return
+
+        parent_index = self.get_q_index(parent_item)
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][1] == row - 1:
+                ranges[-1][1] = row
+            else:
+                ranges.append([row, row])
+
+        # from the end so that the rows of the ranges not yet removed remain valid:
+        for first_row, last_row in reversed(ranges):
+            self.beginRemoveRows(parent_index, first_row, last_row)
+            parent_item.remove_children(first_row, last_row - first_row + 1)
+            self.endRemoveRows()
+
+    def __on_children_page_received(self, parent_item: TreeItem, page: List[ChildEntry], has_more: bool,
+                                    num_children: int):
+        """
+        Insert a page of children fetched by fetchMore(), and fetch the next one if there is one.
+        :param parent_item: the tree item for which the page was fetched
+        :param page: the children of the page, sorted
+        :param has_more: True if there are more children after the page
+        :param num_children: the total number of actor children of the actor of parent_item
+        """
+        parent_item.fetch_pending = False
+        if not self.__is_in_model(parent_item):
+            return
+
+        self.__insert_child_entries(parent_item, page)
+        if page:
+            last_part, last_name, _ = page[-1]
+            parent_item.fetch_cursor = (last_name, last_part.SESSION_ID)
+
+        if not has_more:
+            parent_item.all_children_fetched = True
+            if parent_item.child_count() < num_children:
+                # a child was renamed to before the cursor while the pages were fetched: fetch again (the children
+                # already in the model are skipped)
+                log.debug("Scenario browser: children of {} changed while fetched, re-fetching", parent_item.user_data)
+                parent_item.fetch_cursor = None
+                parent_item.all_children_fetched = False
+            elif not page and parent_item.child_count() == 0:
+                parent_item.may_have_children = False
+
+        if parent_item.can_fetch_more:
+            self.fetchMore(self.get_q_index(parent_item))
+
+    def __is_in_model(self, tree_item: TreeItem) -> bool:
+        """Returns True if tree_item is still part of the tree of this model (it may have been removed)"""
+        while tree_item is not self._root_item:
+            parent_item = tree_item.parent()
+            if parent_item is None or tree_item not in parent_item.child_items:
+                return False
+            tree_item = parent_item
+
+        return True
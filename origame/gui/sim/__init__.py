@@ -25,3 +25,4 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 
 from .main_win_manager import BatchSimManagerBridge, MainSimBridge
 from .sim_event_queue import SimEventQueuePanel, CreateEventDialog
+from .part_hotspots import PartHotspotsDialog
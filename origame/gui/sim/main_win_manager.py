@@ -57,6 +57,9 @@ log = logging.getLogger('system')
 DEFAULT_AUTO_UPDATE_MAIN_SIM_ANIM_INTERVAL_MSEC = 100  # smaller than 100 can lead to freezes
 DEFAULT_AUTO_UPDATE_MAIN_SIM_NO_ANIM_INTERVAL_MSEC = 1
 
+# Max time spent by backend processing events, between each processing of GUI requests, when animation is off
+DEFAULT_AUTO_UPDATE_MAIN_SIM_SLICE_SEC = 0.03
+
 
 # -- Class Definitions --------------------------------------------------------------------------
 
@@ -93,15 +96,19 @@ class BatchSimManagerBridge(QObject):
 class AutoUpdaterMainSim:
     """
     Auto-updater to call the current sim controller's update() method in the backend thread,
-    when requested.
+    when requested. Each request processes events for a slice of time (see SimController.sim_update_slice()),
+    so the cost of the round-trip between threads is shared by many events when animation is off, while the
+    backend still gets to process the GUI's requests (pause, step, etc) between slices.
     """
 
-    def __init__(self, sim_controller: SimController):
+    def __init__(self, sim_controller: SimController, slice_sec: float = DEFAULT_AUTO_UPDATE_MAIN_SIM_SLICE_SEC):
         """
         :param sim_controller: the SimController instance on which to call update()
+        :param slice_sec: max duration of each slice of event processing, in seconds
         """
         self.__sim_controller = sim_controller
         self.__sim_state = MainSimStatesEnum.paused
+        self.__slice_sec = slice_sec
 
     def start_loop(self):
         """Start calling the sim controller's update() method"""
@@ -120,7 +127,7 @@ class AutoUpdaterMainSim:
         if self.__sim_state == MainSimStatesEnum.paused:
             return
 
-        AsyncRequest.call(self.__sim_controller.sim_update, response_cb=self.__request_update)
+        AsyncRequest.call(self.__sim_controller.sim_update_slice, self.__slice_sec, response_cb=self.__request_update)
 
 
 # noinspection PyUnresolvedReferences
@@ -0,0 +1,108 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Display of the part hotspots of a profiled simulation
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import logging
+from pathlib import Path
+
+# [2. third-party]
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QDialog, QWidget, QVBoxLayout, QTabWidget, QTableWidget, QTableWidgetItem
+from PyQt5.QtWidgets import QDialogButtonBox, QPushButton, QLabel, QFileDialog, QHeaderView
+
+# [3. local]
+from ...core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from ...core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from ...scenario.part_execs import PartHotspots, HotspotTimes
+from ..safe_slot import safe_slot
+from ..gui_utils import set_default_dialog_frame_flags
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'PartHotspotsDialog',
+]
+
+log = logging.getLogger('system')
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class PartHotspotsDialog(QDialog):
+    """
+    Shows the results of a PartHotspotProfiler: one sortable table for each of parts, actors and link edges, with
+    the self and cumulative times of each. The collapsed stacks can be saved for viewing in a flame graph tool.
+    """
+
+    COLUMN_HEADERS = ['Path', 'Self (sec)', 'Cumulative (sec)', 'Cumulative (%)']
+
+    def __init__(self, hotspots: PartHotspots, parent: QWidget = None):
+        QDialog.__init__(self, parent)
+        set_default_dialog_frame_flags(self)
+        self.setWindowTitle("Part Hotspots")
+        self.resize(700, 500)
+        self.__hotspots = hotspots
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Time sampled: {:.3f} sec".format(hotspots.total_sec)))
+        tabs = QTabWidget(self)
+        tabs.addTab(self.__create_table(hotspots.get_part_times()), "Parts")
+        tabs.addTab(self.__create_table(hotspots.get_actor_times()), "Actors")
+        tabs.addTab(self.__create_table(hotspots.get_link_times()), "Links")
+        layout.addWidget(tabs)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.Close, parent=self)
+        save_button = QPushButton("Save collapsed stacks...")
+        button_box.addButton(save_button, QDialogButtonBox.ActionRole)
+        save_button.clicked.connect(self.__slot_on_save_clicked)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+
+    def __create_table(self, times: List[HotspotTimes]) -> QTableWidget:
+        table = QTableWidget(len(times), len(self.COLUMN_HEADERS), self)
+        table.setHorizontalHeaderLabels(self.COLUMN_HEADERS)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.verticalHeader().hide()
+        for row, item_times in enumerate(times):
+            table.setItem(row, 0, QTableWidgetItem(item_times.name))
+            values = (item_times.self_sec, item_times.cumul_sec, item_times.percent)
+            for column, value in enumerate(values, start=1):
+                item = QTableWidgetItem()
+                # numeric data so that the column sorts by value rather than alphabetically
+                item.setData(Qt.DisplayRole, round(value, 3))
+                table.setItem(row, column, item)
+
+        table.setSortingEnabled(True)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        return table
+
+    def __on_save_clicked(self):
+        (file_name, ok) = QFileDialog.getSaveFileName(self, "Save Collapsed Stacks...",
+                                                      str(Path.cwd() / "hotspots.collapsed"),
+                                                      filter="Collapsed stacks (*.collapsed)")
+        if not file_name:
+            return
+        self.__hotspots.save_collapsed(file_name)
+
+    __slot_on_save_clicked = safe_slot(__on_save_clicked)
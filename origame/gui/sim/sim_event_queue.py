@@ -751,6 +751,14 @@ class SimEventQueuePanel(QWidget, IHasAnimationMode, IScenarioMonitor):
         else:
             self.__process_add_new_event(predecessor_id, event_info)
 
+    def _on_backend_event_batch_added(self, added_events: List[Tuple[int, EventInfo]]):
+        """
+        Adds a batch of new events to the UI Event Queue.
+        :param added_events: the predecessor ID and EventInfo of each event added, in order of addition
+        """
+        for predecessor_id, event_info in added_events:
+            self._on_backend_events_added(predecessor_id, event_info)
+
     def _on_backend_event_removed(self, event_id: int):
         """
         Removes a list of events from the UI Event Queue
@@ -853,6 +861,7 @@ class SimEventQueuePanel(QWidget, IHasAnimationMode, IScenarioMonitor):
         if self.__backend_event_queue is not None:
             event_queue_signals = self.__backend_event_queue.signals
             event_queue_signals.sig_event_added.disconnect(self._slot_on_backend_events_added)
+            event_queue_signals.sig_events_added.disconnect(self._slot_on_backend_event_batch_added)
             event_queue_signals.sig_event_removed.disconnect(self._slot_on_backend_event_removed)
             event_queue_signals.sig_queue_cleared.disconnect(self._slot_on_backend_queue_cleared)
             event_queue_signals.sig_time_stamps_changed.disconnect(self._slot_on_backend_time_stamps_changed)
@@ -864,6 +873,7 @@ class SimEventQueuePanel(QWidget, IHasAnimationMode, IScenarioMonitor):
         self.__backend_event_queue = scenario.get_event_queue()
         event_queue_signals = self.__backend_event_queue.signals
         event_queue_signals.sig_event_added.connect(self._slot_on_backend_events_added)
+        event_queue_signals.sig_events_added.connect(self._slot_on_backend_event_batch_added)
         event_queue_signals.sig_event_removed.connect(self._slot_on_backend_event_removed)
         event_queue_signals.sig_args_changed.connect(self._slot_on_backend_event_args_changed)
         event_queue_signals.sig_queue_cleared.connect(self._slot_on_backend_queue_cleared)
@@ -906,6 +916,7 @@ class SimEventQueuePanel(QWidget, IHasAnimationMode, IScenarioMonitor):
     _slot_on_user_delete_event = safe_slot(_on_user_delete_event)
     _slot_on_user_clear_queue = safe_slot(_on_user_clear_queue)
     _slot_on_backend_events_added = ext_safe_slot(_on_backend_events_added)
+    _slot_on_backend_event_batch_added = ext_safe_slot(_on_backend_event_batch_added)
     _slot_on_backend_event_removed = safe_slot(_on_backend_event_removed)
     _slot_on_backend_event_args_changed = ext_safe_slot(_on_backend_event_args_changed)
     _slot_on_backend_queue_cleared = safe_slot(_on_backend_queue_cleared)
@@ -39,6 +39,7 @@ from .async_methods import AsyncRequest, AsyncErrorInfo
 from .safe_slot import safe_slot
 from .gui_utils import exec_modal_dialog
 from .actions_utils import config_action
+from .undo_storage import UndoPayloadStore, UndoPayloadRef, pack_payloads, unpack_payloads
 
 # -- Meta-data ----------------------------------------------------------------------------------
 
@@ -170,6 +171,7 @@ class UndoCommandBase(QUndoCommand):
         self.__on_async_cmd_done_cb = None
         self.__clipboard_after_undo = clipboard_after_undo
         self.__clipboard_after_redo = clipboard_after_redo
+        self.__expired = False
 
     def save_view_context(self, viewed_actor: ActorPart, viewport: Tuple[Position, float]):
         """
@@ -313,6 +315,28 @@ class UndoCommandBase(QUndoCommand):
         """True if either clipboard exists"""
         return self.__clipboard_after_undo is not None or self.__clipboard_after_redo is not None
 
+    @override_optional
+    def get_payload_refs(self) -> List[UndoPayloadRef]:
+        """
+        Get the references to the payloads that this command holds in the undo stack's payload store. By default,
+        commands do not hold any.
+        """
+        return []
+
+    def expire(self):
+        """
+        Drop the payloads held by this command, to free memory. The command can no longer be undone (and neither
+        can the commands older than it on the stack).
+        """
+        self.__expired = True
+        self._drop_payloads()
+
+    def get_is_expired(self) -> bool:
+        """True if expire() has been called on this command"""
+        return self.__expired
+
+    is_expired = property(get_is_expired)
+
     # ---------------------------- instance PUBLIC properties ----------------------------
 
     view_actor = property(get_view_actor)
@@ -321,6 +345,14 @@ class UndoCommandBase(QUndoCommand):
 
     # --------------------------- instance _PROTECTED and _INTERNAL methods ---------------------
 
+    @override_optional
+    def _drop_payloads(self):
+        """
+        Commands that override get_payload_refs() must override this to drop their references to the payloads
+        (called by expire()).
+        """
+        pass
+
     @override_optional
     def _get_description_try_do(self) -> str:
         """Get the description for try-do. By default, returns self._get_description_redo"""
@@ -420,6 +452,9 @@ class UndoStackExt(QUndoStack):
     - handle failed action: it does not get put on the stack
     - manage two QActions: one for undo, and the other for redo, so the GUI always knows whether the stack has
       actions that can be done or undone.
+    - hold the heavy payloads of commands in a payload store with a memory budget: when the commands pushed
+      exceed the budget, the payloads of the oldest commands are spilled to disk (if enabled) or these commands
+      are expired (so the oldest actions can no longer be undone).
     """
 
     # --------------------------- class-wide data and signals -----------------------------------
@@ -431,6 +466,7 @@ class UndoStackExt(QUndoStack):
     def __init__(self):
         super().__init__()
         self.__actor_2d_panel = None
+        self.__payload_store = UndoPayloadStore()
 
         self.__action_redo = self.createRedoAction(self.__actor_2d_panel)
         config_action(self.__action_redo,
@@ -560,6 +596,10 @@ class UndoStackExt(QUndoStack):
         # if the viewport is different, then that is when we want to pan.
         idx = self.index() - 1  # because for undo, it's the command previous to index that will be undone
         command = self.command(idx)
+        if command.is_expired:
+            log.warning("UNDO: the older undo history was discarded to stay within the undo memory budget")
+            return
+
         if self.__check_same_viewport(command):
             self.setActive(False)
             super().undo()
@@ -575,6 +615,22 @@ class UndoStackExt(QUndoStack):
                                                     center=command.view_position,
                                                     zoom_factor=command.view_zoom_factor)
 
+    def get_payload_store(self) -> UndoPayloadStore:
+        """Get the store in which commands put their heavy payloads (see PartEditorApplyChangesCommand)"""
+        return self.__payload_store
+
+    def set_memory_budget(self, memory_budget: int, spill_to_disk: bool = None):
+        """
+        Set the maximum number of bytes of command payloads held in memory, and optionally whether the payloads of
+        the oldest commands get spilled to disk (rather than the commands expired) when over budget.
+        """
+        self.__payload_store.set_memory_budget(memory_budget, spill_to_disk=spill_to_disk)
+        self.__enforce_memory_budget()
+
+    def get_memory_usage(self) -> Tuple[int, int]:
+        """Get the number of bytes of command payloads held in memory and spilled to disk, respectively"""
+        return self.__payload_store.memory_used, self.__payload_store.disk_used
+
     def find_previous_command(self, *cls: UndoCommandBase) -> UndoCommandBase:
         """
         Get the most recent command *older* than current undo stack index.
@@ -596,6 +652,7 @@ class UndoStackExt(QUndoStack):
     # ---------------------------- instance PUBLIC properties ----------------------------
 
     actor_2d_panel = property(get_actor_2d_panel, set_actor_2d_panel)
+    payload_store = property(get_payload_store)
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
@@ -608,6 +665,34 @@ class UndoStackExt(QUndoStack):
         if event == UndoEventEnum.try_do_success:
             # DO NOT call self.push(), infinite recursion because it calls this method
             super().push(cmd)
+            self.__enforce_memory_budget()
+
+    def __enforce_memory_budget(self):
+        """
+        Bring the payloads in memory back within budget, going from the oldest command towards the most recent
+        one done (which is always kept, as are the commands undone): spill the command's payloads to disk if the
+        store allows it, else expire the command.
+        """
+        store = self.__payload_store
+        for cmd_index in range(self.index() - 1):
+            if not store.is_over_budget():
+                break
+
+            command = self.command(cmd_index)
+            refs = command.get_payload_refs()
+            if not refs:
+                continue
+
+            if store.spill_to_disk:
+                for ref in refs:
+                    store.spill(ref)
+            elif not command.is_expired:
+                log.info("Undo history: command \"{}\" expired to stay within undo memory budget",
+                         command.actionText())
+                command.expire()
+
+        memory_used, disk_used = self.get_memory_usage()
+        log.debug("Undo history payloads: {} bytes in memory, {} bytes on disk", memory_used, disk_used)
 
     def __check_same_viewport(self, command: UndoCommandBase) -> bool:
         """
@@ -1656,10 +1741,20 @@ class PartEditorApplyChangesCommand(UndoCommandBase):
         super().__init__()
         self.__undone_at_least_once = False
         self.__part = part
+        # the snapshots can hold the whole content of the part, so the heavy values go in the payload store; this
+        # is done by the first redo, in the backend thread, so the GUI does not wait on the pickling:
+        self.__payload_store = scene_undo_stack().payload_store
         self.__initial_data = initial_data
         self.__new_data = new_data
         self.__order = order
 
+    @override(UndoCommandBase)
+    def get_payload_refs(self) -> List[UndoPayloadRef]:
+        if self.is_expired:
+            return []
+        return [value for data in (self.__initial_data, self.__new_data) for value in data.values()
+                if isinstance(value, UndoPayloadRef)]
+
     @override(UndoCommandBase)
     def _get_description_redo(self) -> str:
         return 'Requesting save of part {} edits'.format(self.__part)
@@ -1672,18 +1767,29 @@ class PartEditorApplyChangesCommand(UndoCommandBase):
     def _get_redo_cb(self) -> BackendCallable:
         def receive_submitted_data():
             if self.__undone_at_least_once:
-                self.__part.receive_edited_snapshot(self.__new_data, self.__order)
+                new_data = unpack_payloads(self.__payload_store, self.__new_data)
+                self.__part.receive_edited_snapshot(new_data, self.__order)
+            else:
+                # the editor already submitted new_data to the part, only the snapshots need to be stored:
+                self.__initial_data = pack_payloads(self.__payload_store, self.__initial_data)
+                self.__new_data = pack_payloads(self.__payload_store, self.__new_data)
 
         return receive_submitted_data
 
     @override(UndoCommandBase)
     def _get_undo_cb(self) -> BackendCallable:
         def receive_submitted_data():
-            self.__part.receive_edited_snapshot(self.__initial_data, self.__order)
+            initial_data = unpack_payloads(self.__payload_store, self.__initial_data)
+            self.__part.receive_edited_snapshot(initial_data, self.__order)
             self.__undone_at_least_once = True
 
         return receive_submitted_data
 
+    @override(UndoCommandBase)
+    def _drop_payloads(self):
+        self.__initial_data = None
+        self.__new_data = None
+
 
 class ResizeCommand(UndoCommandBase):
     """
@@ -0,0 +1,298 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Storage of the heavy payloads held by undo commands
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import logging
+import pickle
+import sys
+from hashlib import sha1
+from itertools import islice
+from tempfile import TemporaryFile
+from threading import RLock
+from weakref import finalize
+
+# [2. third-party]
+
+# [3. local]
+from ..core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from ..core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from ..core.typing import AnnotationDeclarations
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'UndoPayloadRef',
+    'UndoPayloadStore',
+    'pack_payloads',
+    'unpack_payloads',
+]
+
+log = logging.getLogger('system')
+
+# Values smaller than this (once pickled) are not worth putting in the store:
+HEAVY_PAYLOAD_MIN_BYTES = 64 * 1024
+# Number of items of a container that estimate_payload_size() measures, to extrapolate the size of the container:
+SIZE_ESTIMATE_SAMPLE_LEN = 8
+
+
+class Decl(AnnotationDeclarations):
+    UndoPayloadStore = 'UndoPayloadStore'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def estimate_payload_size(value: Any) -> int:
+    """
+    Get a rough estimate of the number of bytes of value once pickled, at a cost that does not depend on the
+    number of items of the containers in value (such as the records of a table): the size of a list, tuple, set or
+    dict is extrapolated from that of its first SIZE_ESTIMATE_SAMPLE_LEN items.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+
+    if isinstance(value, dict):
+        sample = list(islice(value.items(), SIZE_ESTIMATE_SAMPLE_LEN))
+        sample_size = sum(estimate_payload_size(key) + estimate_payload_size(item) for key, item in sample)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        sample = list(islice(value, SIZE_ESTIMATE_SAMPLE_LEN))
+        sample_size = sum(estimate_payload_size(item) for item in sample)
+    else:
+        # arrays (such as numpy's) know their size; for other objects, their own size will have to do:
+        nbytes = getattr(value, 'nbytes', None)
+        return nbytes if isinstance(nbytes, int) else sys.getsizeof(value)
+
+    return len(value) * sample_size // len(sample) if sample else 0
+
+
+def pack_payloads(store: Decl.UndoPayloadStore, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get a copy of data in which every heavy value (at least HEAVY_PAYLOAD_MIN_BYTES once pickled) is replaced by
+    a reference to the value in the store. Other values are kept as is. Only the values that estimate_payload_size()
+    finds heavy get pickled, so the light values of the data cost next to nothing.
+    :param store: the store in which to put the heavy values
+    :param data: the data to pack, such as a part editor snapshot
+    :return: the packed data; see unpack_payloads()
+    """
+    packed = {}
+    for key, value in data.items():
+        if estimate_payload_size(value) < HEAVY_PAYLOAD_MIN_BYTES:
+            packed[key] = value
+            continue
+
+        try:
+            pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # not picklable, keep as is
+            packed[key] = value
+            continue
+
+        if len(pickled) < HEAVY_PAYLOAD_MIN_BYTES:
+            packed[key] = value
+        else:
+            packed[key] = store.add_pickled(pickled)
+
+    return packed
+
+
+def unpack_payloads(store: Decl.UndoPayloadStore, packed: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the data that was packed by pack_payloads(). Each heavy value is a new object re-created from the store,
+    so the caller can modify it without affecting the payload.
+    """
+    return {key: store.get(value) if isinstance(value, UndoPayloadRef) else value
+            for key, value in packed.items()}
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class UndoPayloadRef:
+    """
+    Reference to a payload of an UndoPayloadStore. The payload is released from the store once all the
+    references to it have been garbage collected, so an undo command only has to drop its references (or be
+    deleted) for its payloads to be freed.
+    """
+
+    def __init__(self, store: Decl.UndoPayloadStore, key: str):
+        self.__key = key
+        finalize(self, store.release, key)
+
+    def get_key(self) -> str:
+        """Get the key of the payload in the store (the digest of its content)"""
+        return self.__key
+
+    key = property(get_key)
+
+
+class UndoPayloadStore:
+    """
+    Stores the heavy payloads of undo commands (such as the records of a table part in a part editor snapshot) in
+    pickled form, which is more compact than the objects and cannot be affected by later changes to them.
+
+    Payloads are identified by the digest of their content, so identical content given by several undo commands
+    (such as the data of a part after an edit, which is also the data before the next edit) is stored only once,
+    and reference counted.
+
+    The store has a memory budget: when the payloads held in memory exceed it, the owner of the store is expected
+    to evict the oldest payloads, either by spilling them to a temporary file (see spill()), if spilling is
+    enabled, or by dropping the undo commands that hold them.
+
+    The store is thread-safe: payloads are added from the GUI thread, but retrieved by the backend thread when
+    commands are undone/redone, and released whenever their references get garbage collected.
+    """
+
+    # Default maximum number of bytes of payloads held in memory:
+    DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+    def __init__(self, memory_budget: int = DEFAULT_MEMORY_BUDGET, spill_to_disk: bool = False):
+        """
+        :param memory_budget: maximum number of bytes of payloads held in memory
+        :param spill_to_disk: True if payloads may be moved to a temporary file when over budget
+        """
+        # re-entrant because payload references can get garbage collected (hence released) while the lock is held:
+        self.__lock = RLock()
+        self.__memory_budget = memory_budget
+        self.__spill_to_disk = spill_to_disk
+
+        self.__pickled = {}  # key -> pickled payload, for payloads in memory
+        self.__spilled = {}  # key -> (offset, length) in spill file, for payloads on disk
+        self.__ref_counts = {}  # key -> number of live UndoPayloadRef
+        self.__memory_used = 0
+        self.__disk_used = 0
+        self.__spill_file = None
+
+    def add(self, value: Any) -> UndoPayloadRef:
+        """Add a payload (must be picklable) to the store; returns the reference to it"""
+        return self.add_pickled(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def add_pickled(self, pickled: bytes) -> UndoPayloadRef:
+        """Add a payload already pickled to the store; returns the reference to it"""
+        key = sha1(pickled).hexdigest()
+        with self.__lock:
+            if key in self.__ref_counts:
+                self.__ref_counts[key] += 1
+            else:
+                self.__ref_counts[key] = 1
+                self.__pickled[key] = pickled
+                self.__memory_used += len(pickled)
+
+        return UndoPayloadRef(self, key)
+
+    def get(self, ref: UndoPayloadRef) -> Any:
+        """Get a new copy of the payload referenced by ref"""
+        with self.__lock:
+            pickled = self.__pickled.get(ref.key)
+            if pickled is None:
+                offset, length = self.__spilled[ref.key]
+                self.__spill_file.seek(offset)
+                pickled = self.__spill_file.read(length)
+
+        return pickle.loads(pickled)
+
+    def release(self, key: str):
+        """
+        Release one reference to the payload of given key; the payload is removed from the store once it has no
+        more references. This is called automatically when an UndoPayloadRef gets garbage collected.
+        """
+        with self.__lock:
+            self.__ref_counts[key] -= 1
+            if self.__ref_counts[key] > 0:
+                return
+
+            del self.__ref_counts[key]
+            pickled = self.__pickled.pop(key, None)
+            if pickled is not None:
+                self.__memory_used -= len(pickled)
+            else:
+                offset, length = self.__spilled.pop(key)
+                self.__disk_used -= length
+                if not self.__spilled:
+                    # the space of released payloads is only recovered once the file no longer holds any
+                    self.__spill_file.close()
+                    self.__spill_file = None
+
+    def spill(self, ref: UndoPayloadRef) -> int:
+        """
+        Move the payload referenced by ref from memory to the spill file. Does nothing if spilling is disabled or
+        the payload is already on disk.
+        :return: the number of bytes of memory freed
+        """
+        if not self.__spill_to_disk:
+            return 0
+
+        with self.__lock:
+            pickled = self.__pickled.pop(ref.key, None)
+            if pickled is None:
+                return 0
+
+            if self.__spill_file is None:
+                self.__spill_file = TemporaryFile()
+            self.__spill_file.seek(0, 2)
+            self.__spilled[ref.key] = (self.__spill_file.tell(), len(pickled))
+            self.__spill_file.write(pickled)
+            self.__memory_used -= len(pickled)
+            self.__disk_used += len(pickled)
+
+        log.debug("Undo storage: spilled {} bytes to disk", len(pickled))
+        return len(pickled)
+
+    def is_in_memory(self, ref: UndoPayloadRef) -> bool:
+        """Return True if the payload referenced by ref is in memory, False if it has been spilled to disk"""
+        return ref.key in self.__pickled
+
+    def set_memory_budget(self, memory_budget: int, spill_to_disk: bool = None):
+        """
+        Set the maximum number of bytes of payloads held in memory and, if spill_to_disk not None, whether
+        payloads may be spilled to disk. Takes effect at the owner's next check of is_over_budget().
+        """
+        self.__memory_budget = memory_budget
+        if spill_to_disk is not None:
+            self.__spill_to_disk = spill_to_disk
+
+    def get_memory_budget(self) -> int:
+        return self.__memory_budget
+
+    def get_spill_to_disk(self) -> bool:
+        return self.__spill_to_disk
+
+    def is_over_budget(self) -> bool:
+        """Return True if the payloads held in memory exceed the memory budget"""
+        return self.__memory_used > self.__memory_budget
+
+    def get_memory_used(self) -> int:
+        """Get the number of bytes of payloads held in memory"""
+        return self.__memory_used
+
+    def get_disk_used(self) -> int:
+        """Get the number of bytes of payloads spilled to disk (and not yet released)"""
+        return self.__disk_used
+
+    def get_num_payloads(self) -> int:
+        """Get the number of distinct payloads in the store"""
+        return len(self.__ref_counts)
+
+    memory_budget = property(get_memory_budget)
+    spill_to_disk = property(get_spill_to_disk)
+    memory_used = property(get_memory_used)
+    disk_used = property(get_disk_used)
+    num_payloads = property(get_num_payloads)
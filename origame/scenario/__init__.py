@@ -30,6 +30,7 @@ from .batch_data import create_batch_data_file, get_db_path, BatchDataMgr, BATCH
 from .event_queue import EventQueue, CallInfo, EventInfo
 from .sim_controller import SimController, SimStatesEnum, SimControllerSettings, SimSteps, MIN_REPLIC_ID, MIN_VARIANT_ID
 from .sim_controller import new_seed, check_seed, RunRolePartsError
+from .sim_metrics import SimMetrics, Histogram, SIM_METRICS_FILE_NAME
 from .file_util_base import ScenarioFormatNotSavable, ScenarioFormatNotLoadable
 
 from .ori import *
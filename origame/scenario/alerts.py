@@ -17,6 +17,7 @@ Version History: See SVN log.
 
 # [1. standard library]
 import logging
+from collections import Counter
 from contextlib import contextmanager
 from enum import Enum
 
@@ -50,6 +51,7 @@ log = logging.getLogger('system')
 
 class Decl(AnnotationDeclarations):
     IScenAlertSource = 'IScenAlertSource'
+    AlertCountKey = 'AlertCountKey'
 
 
 # -- Function definitions -----------------------------------------------------------------------
@@ -85,6 +87,38 @@ class ScenAlertInfo:
         assert len(ScenAlertManageEnum) == 2
         self.manage = ScenAlertManageEnum.auto if auto else ScenAlertManageEnum.on_demand
         self.err_data = err_data
+        self.count_key = AlertCountKey.get(level, category, self.manage)
+
+
+class AlertCountKey:
+    """
+    The key under which an alert is counted by the alert sources. There is only one instance per combination of
+    level, category and management type, so the key hashes by identity: this is much faster than hashing a
+    tuple of enums, and alert counts are updated at every level of the source tree.
+    """
+
+    __instances = {}
+
+    def __init__(self, level: ScenAlertLevelEnum, category: Enum, manage: ScenAlertManageEnum):
+        self.level = level
+        self.category = category
+        self.manage = manage
+
+    @staticmethod
+    def get(level: ScenAlertLevelEnum, category: Enum, manage: ScenAlertManageEnum) -> Decl.AlertCountKey:
+        """Get the unique key for given level, category and management type"""
+        instances = AlertCountKey.__instances
+        key = instances.get((level, category, manage))
+        if key is None:
+            key = AlertCountKey(level, category, manage)
+            instances[(level, category, manage)] = key
+        return key
+
+    def matches(self, level: ScenAlertLevelEnum, category: Enum, manage: ScenAlertManageEnum) -> bool:
+        """Return True if this key satisfies the given filters (None matches anything)"""
+        return ((level is None or self.level == level) and
+                (category is None or self.category == category) and
+                (manage is None or self.manage == manage))
 
 
 class IScenAlertSource:
@@ -93,6 +127,12 @@ class IScenAlertSource:
     has the concept of a "parent" source that gets notified of new alerts in a child (recursively). Therefore
     it has the notion of "own" alerts vs alerts from descendant sources. It also
     provides methods to check and clear on-demand alerts, and emits signal when alerts added or removed.
+
+    A source only stores its own alerts. For descendant sources, it only keeps a count of alerts by level,
+    category and management type: the alerts themselves are gathered from descendants when requested, and only
+    from the branches that have matching alerts. The signals are emitted by the root source (the one without
+    alert parent) once the outermost batched_alert_signals() block exits, or at the end of each change if no
+    such block is active: every source that had alerts changed, itself or in a descendant, then emits once.
     """
 
     class AlertSignals(BridgeEmitter):
@@ -104,33 +144,26 @@ class IScenAlertSource:
     def __init__(self):
         self.alert_signals = IScenAlertSource.AlertSignals()
         self.__alerts = set()
+        # AlertCountKey -> number of alerts in self and descendant sources:
+        self.__alert_counts = {}
         self.__propagating_to_children = False
+        # next two only used when self is the root source:
+        self.__alert_batch_depth = 0
+        self.__dirty_alert_sources = {}  # dict rather than set so signals are emitted in order of changes
         self._source_name = None
 
     def get_alerts(self, level: ScenAlertLevelEnum = None,
                    category: Enum = None, manage: ScenAlertManageEnum = None) -> Set[ScenAlertInfo]:
         """
-        Get the currently stored alerts for this source.
+        Get the currently stored alerts for this source and its descendant sources.
         :param level: the level to filter for; only alerts *at* that level will be returned
         :param category: the category to filter for
         :param manage: the management flag to filter for
         :return: the set of alerts that satisfy the set of filters given (or all alerts, if no filtering)
         """
-        container = self.__alerts
-
-        if level is not None:
-            container = [err for err in container if err.level == level]
-
-        if manage is not None:
-            container = [err for err in container if err.manage == manage]
-
-        if category is not None:
-            container = [err for err in container if err.category == category]
-
-        # return results; must not be the self container
-        container = container.copy() if container is self.__alerts else set(container)
-        assert container is not self.__alerts
-        return container
+        alerts = set()
+        self.__gather_alerts(alerts, level, category, manage)
+        return alerts
 
     def has_alerts(self, level: ScenAlertLevelEnum = None,
                    category: Enum = None, manage: ScenAlertManageEnum = None) -> bool:
@@ -140,7 +173,7 @@ class IScenAlertSource:
         :param manage: the management flag to filter for
         :return: True if there are any alerts with given filter criteria (or any alerts at all, if no filtering).
         """
-        return bool(self.get_alerts(level=level, category=category, manage=manage))
+        return self.__count_alerts(level, category, manage) > 0
 
     def check_ondemand_alerts(self):
         """
@@ -160,8 +193,9 @@ class IScenAlertSource:
                     child.check_ondemand_alerts()
 
         else:
-            self._clear_own_alerts(manage=ScenAlertManageEnum.on_demand)
-            self._on_get_ondemand_alerts()
+            with self.batched_alert_signals():
+                self._clear_own_alerts(manage=ScenAlertManageEnum.on_demand)
+                self._on_get_ondemand_alerts()
 
     def clear_ondemand_alerts(self):
         """
@@ -188,6 +222,22 @@ class IScenAlertSource:
                 for child in children_sources:
                     child.clear_ondemand_alerts()
 
+    @contextmanager
+    def batched_alert_signals(self):
+        """
+        Context manager that suspends the emission of sig_alert_status_changed by all sources of the tree that
+        self belongs to, until the outermost "with" block exits: then each source that had alert changes emits
+        once. The sim controller uses this around each event.
+        """
+        root = self.__get_alert_root()
+        root.__alert_batch_depth += 1
+        try:
+            yield
+        finally:
+            root.__alert_batch_depth -= 1
+            if root.__alert_batch_depth == 0 and root.__dirty_alert_sources:
+                root.__flush_alert_signals()
+
     def get_source_name(self) -> str:
         """
         Gets the ready-made source name
@@ -271,14 +321,7 @@ class IScenAlertSource:
         """
         alert = ScenAlertInfo(level, category, message, self, auto, **err_data)
         self.__alerts.add(alert)
-        if self._notify_alert_changes():
-            self.alert_signals.sig_alert_status_changed.emit()
-
-        # propagate up the chain of parents:
-        alert_parent = self._get_alert_parent()
-        if alert_parent is not None:
-            alert_parent.__add_child_alert(alert)
-
+        self.__update_alert_counts([alert], 1)
         self._source_name = self._get_source_name()
         return alert
 
@@ -299,7 +342,7 @@ class IScenAlertSource:
         if not self.__alerts:
             return
 
-        remove_alerts = set(alert for alert in self.__alerts if alert.source is self)
+        remove_alerts = self.__alerts
         if level is not None:
             remove_alerts = set(err for err in remove_alerts if err.level == level)
         if categories:
@@ -313,13 +356,7 @@ class IScenAlertSource:
             self.__alerts.difference_update(remove_alerts)
 
         if remove_alerts:
-            if self._notify_alert_changes():
-                self.alert_signals.sig_alert_status_changed.emit()
-
-            # propagate up the chain of parents:
-            alert_parent = self._get_alert_parent()
-            if alert_parent is not None:
-                alert_parent.__remove_child_alerts(remove_alerts)
+            self.__update_alert_counts(remove_alerts, -1)
 
     def _clear_all_own_alerts(self):
         """
@@ -328,42 +365,98 @@ class IScenAlertSource:
         if not self.__alerts:
             return
 
-        remove_alerts = set(alert for alert in self.__alerts if alert.source is self)
-        self.__alerts.difference_update(remove_alerts)
-        if self._notify_alert_changes():
-            self.alert_signals.sig_alert_status_changed.emit()
+        remove_alerts = self.__alerts
+        self.__alerts = set()
+        self.__update_alert_counts(remove_alerts, -1)
 
-        # propagate up the chain of parents:
+    def _remove_alerts_from_parent(self):
+        """
+        Remove the alert counts of self and its descendants from the alert parent and its ancestors. Must be
+        called before the alert parent changes, with _add_alerts_to_parent() called once it has changed.
+        """
         alert_parent = self._get_alert_parent()
-        if alert_parent is not None:
-            alert_parent.__remove_child_alerts(remove_alerts)
+        if alert_parent is not None and self.__alert_counts:
+            alert_parent.__update_ancestor_counts(self.__alert_counts, -1)
 
-    # --------------------------- instance __PRIVATE members-------------------------------------
+    def _add_alerts_to_parent(self):
+        """Add the alert counts of self and its descendants to the (new) alert parent and its ancestors."""
+        alert_parent = self._get_alert_parent()
+        if alert_parent is not None and self.__alert_counts:
+            alert_parent.__update_ancestor_counts(self.__alert_counts, 1)
 
-    def __add_child_alert(self, alert: ScenAlertInfo):
-        """Add the given alert. Assumes called by a child."""
-        self.__alerts.add(alert)
-        if self._notify_alert_changes():
-            self.alert_signals.sig_alert_status_changed.emit()
+    # --------------------------- instance __PRIVATE members-------------------------------------
 
-        # propagate up the chain of parents:
-        alert_parent = self._get_alert_parent()
-        if alert_parent is not None:
-            alert_parent.__add_child_alert(alert)
+    def __count_alerts(self, level: ScenAlertLevelEnum, category: Enum, manage: ScenAlertManageEnum) -> int:
+        """Get the number of alerts of self and its descendants that match the given filters (None for any)"""
+        if level is None and category is None and manage is None:
+            return sum(self.__alert_counts.values())
+        return sum(count for key, count in self.__alert_counts.items() if key.matches(level, category, manage))
 
-    def __remove_child_alerts(self, alerts: Set[ScenAlertInfo]):
+    def __gather_alerts(self, alerts: Set[ScenAlertInfo], level: ScenAlertLevelEnum, category: Enum,
+                        manage: ScenAlertManageEnum):
         """
-        Remove a set of alerts. Assumes each alert of the set was added via __add_child_alert(). Alerts from
-        the set that are not in this source do not cause an error.
+        Add to alerts the alerts of self and its descendants that match the given filters. The branches
+        that have no matching alerts are skipped.
         """
-        self.__alerts.difference_update(alerts)
-        if self._notify_alert_changes():
-            self.alert_signals.sig_alert_status_changed.emit()
+        if self.__count_alerts(level, category, manage) == 0:
+            return
+
+        for alert in self.__alerts:
+            if alert.count_key.matches(level, category, manage):
+                alerts.add(alert)
+
+        for child in self._get_children_alert_sources() or ():
+            child.__gather_alerts(alerts, level, category, manage)
 
-        # propagate up the chain of parents:
+    def __update_alert_counts(self, alerts: Iterable[ScenAlertInfo], sign: int):
+        """Add (sign=1) or remove (sign=-1) the given alerts of self to the counts of self and its ancestors"""
+        alert_counts = Counter(alert.count_key for alert in alerts)
+        self.__update_ancestor_counts(alert_counts, sign)
+
+    def __update_ancestor_counts(self, alert_counts: Dict[AlertCountKey, int], sign: int):
+        """
+        Add (sign=1) or subtract (sign=-1) alert_counts to the counts of self and each of its ancestors, and
+        mark them as having alert changes. The root source emits the signals right away unless in a batch.
+        """
+        # copy since alert_counts could be those of self or an ancestor:
+        alert_counts = list(alert_counts.items())
+        changed_sources = []
+        source = self
+        while source is not None:
+            counts = source.__alert_counts
+            for key, count in alert_counts:
+                new_count = counts.get(key, 0) + sign * count
+                assert new_count >= 0
+                if new_count:
+                    counts[key] = new_count
+                else:
+                    del counts[key]
+            changed_sources.append(source)
+            source = source._get_alert_parent()
+
+        root = changed_sources[-1]
+        dirty_sources = root.__dirty_alert_sources
+        for source in changed_sources:
+            dirty_sources[source] = None
+        if root.__alert_batch_depth == 0:
+            root.__flush_alert_signals()
+
+    def __get_alert_root(self) -> Decl.IScenAlertSource:
+        """Get the source at the top of the chain of alert parents of self (self if no alert parent)"""
+        source = self
         alert_parent = self._get_alert_parent()
-        if alert_parent is not None:
-            alert_parent.__remove_child_alerts(alerts)
+        while alert_parent is not None:
+            source = alert_parent
+            alert_parent = source._get_alert_parent()
+        return source
+
+    def __flush_alert_signals(self):
+        """Emit sig_alert_status_changed from each source marked as having alert changes. Self must be the root."""
+        dirty_sources = self.__dirty_alert_sources
+        self.__dirty_alert_sources = {}
+        for source in dirty_sources:
+            if source._notify_alert_changes():
+                source.alert_signals.sig_alert_status_changed.emit()
 
     def __check_ondemand_alerts(self):
         """
@@ -377,15 +470,14 @@ class IScenAlertSource:
     def __one_alert_signal(self):
         """
         Context manager that can be used to automatically suspend emission of sig_alert_status_changed, and
-        automatically emit only at exit of the "with" block.
+        automatically emit only at exit of the "with" block. Self does not propagate clearing of on-demand
+        alerts to children while in the block.
         """
-        # entry:
-        orig_val = self.__propagating_to_children
-        self.__propagating_to_children = True
-
-        yield
-
-        # exit:
-        self.__propagating_to_children = orig_val
-        if self._notify_alert_changes():
-            self.alert_signals.sig_alert_status_changed.emit()
+        with self.batched_alert_signals():
+            orig_val = self.__propagating_to_children
+            self.__propagating_to_children = True
+            try:
+                yield
+            finally:
+                # must be restored before the batch emits the signals:
+                self.__propagating_to_children = orig_val
@@ -128,10 +128,15 @@ class Rotation3D:
     This class represents 3-D rotation information.
     """
 
-    def __init__(self, roll: float = 0.0, pitch: float = 0.0, yaw: float = 0.0):
+    def __init__(self, roll: float = 0.0, pitch: float = 0.0, yaw: float = 0.0, on_changed: Callable[[], None] = None):
+        """
+        :param on_changed: if given, called every time one of the angles is set (the rotation is accessible to
+            scripts, which can modify it in place)
+        """
         self._roll = roll
         self._pitch = pitch
         self._yaw = yaw
+        self.__on_changed = on_changed
 
     def get_roll(self) -> float:
         """
@@ -145,6 +150,7 @@ class Rotation3D:
         :param value: The new roll angle, in degrees.
         """
         self._roll = value
+        self.__notify_changed()
 
     def get_pitch(self) -> float:
         """
@@ -158,6 +164,7 @@ class Rotation3D:
         :param value: The new pitch angle, in degrees.
         """
         self._pitch = value
+        self.__notify_changed()
 
     def get_yaw(self) -> float:
         """
@@ -171,6 +178,7 @@ class Rotation3D:
         :param value: The new yaw angle, in degrees.
         """
         self._yaw = value
+        self.__notify_changed()
 
     def get_rpy_deg(self) -> Tuple[float, float, float]:
         """Get 3D rotation as a triplet Roll, Pitch, Yaw, in degrees"""
@@ -181,6 +189,10 @@ class Rotation3D:
     yaw = property(get_yaw, set_yaw)
     rpy_deg = property(get_rpy_deg)
 
+    def __notify_changed(self):
+        if self.__on_changed is not None:
+            self.__on_changed()
+
 
 class ActorIfxPortSide(IntEnum):
     left, right, both = range(3)
@@ -241,7 +253,7 @@ class ActorPart(BasePart):
         sig_parts_restored = BridgeSignal(list)  # BasePart
         sig_waypoints_restored = BridgeSignal(dict)  # Dict[PartLink, List[LinkWaypoint]]
 
-        sig_queue_actor_counters_changed = BridgeSignal()
+        sig_queue_actor_counters_changed = BridgeSignal(coalesce=True)
 
         sig_ifx_port_added = BridgeSignal(PartFrame, bool, int)  # port, left side, index
         sig_ifx_port_removed = BridgeSignal(PartFrame, bool)  # port, left side
@@ -266,6 +278,10 @@ class ActorPart(BasePart):
     # we have 0 or more BasePart children ORI serializable
     _ORI_HAS_CHILDREN = True
 
+    # ORI state only changes via methods of the actor, which flag the changes; the children that must be checked
+    # by has_ori_changes() are tracked separately (see _on_child_ori_changes_flagged())
+    _ORI_TRACKS_CHANGES = True
+
     # --------------------------- instance (self) PUBLIC methods --------------------------------
 
     def __init__(self, parent: Optional[ParentType], name: str = None, position: Position = None):
@@ -275,6 +291,8 @@ class ActorPart(BasePart):
         :param name: The name to be associated with the newly instantiated Actor Part.
         :param position: A position to be assigned to the newly instantiated Actor Part.
         """
+        # children that must be checked for ORI changes: must exist before BasePart init creates the frame
+        self.__ori_check_children = set()
         BasePart.__init__(self, parent, name=name, position=position)
         assert (self._parent_actor_part is not None) or (not isinstance(parent, ActorPart))
 
@@ -296,7 +314,7 @@ class ActorPart(BasePart):
         self.__proxy_position = Position()
         self.__image_id = None
         self.__rotation_2d = 0.0
-        self.__rotation_3d = Rotation3D()
+        self.__rotation_3d = Rotation3D(on_changed=self._flag_ori_changes)
 
         self.__children = []
         self.__children_index_from_id = {}
@@ -362,6 +380,7 @@ class ActorPart(BasePart):
         """
         if x != self.__proxy_position.x or y != self.__proxy_position.y:
             self.__proxy_position = Position(x, y)
+            self._flag_ori_changes()
             if self._anim_mode_shared:
                 self.signals.sig_proxy_pos_changed.emit(x, y)
 
@@ -392,6 +411,8 @@ class ActorPart(BasePart):
             return
 
         self.__rotation_2d = rotation_2d
+        self._on_searchable_state_changed()
+        self._flag_ori_changes()
         if self._anim_mode_shared:
             self.signals.sig_rotation_2d_changed.emit(rotation_2d)
 
@@ -607,6 +628,9 @@ class ActorPart(BasePart):
 
         # TODO build 3: for now, always regenerate the children indices, but should do this only when necessary:
         self.__regen_children_indices()
+        self.__on_searchable_subtree_changed(part)
+        self.__ori_check_children.discard(part)
+        self._flag_ori_changes()
 
         # After child has been deleted, notify any listeners.
         if self._anim_mode_shared:
@@ -681,6 +705,9 @@ class ActorPart(BasePart):
         if paste_offset is not None:
             current_pos = part.part_frame.get_pos_vec()
             part.part_frame.set_pos_from_vec(current_pos + paste_offset)
+        self.__on_searchable_subtree_changed(part)
+        self.__ori_check_children.add(part)
+        self._flag_ori_changes()
 
         if restore_info.restore_ifx_level is not None:
             part.part_frame.restore_ifx_level(restore_info.restore_ifx_level, links=single_op)
@@ -1102,6 +1129,8 @@ class ActorPart(BasePart):
                     log.error("Part: {} unable to remove its reference to an image from the Image Dictionary. "
                               "Error: {}", str(self), str(e))
 
+            self._on_searchable_state_changed()
+            self._flag_ori_changes()
             if self._anim_mode_shared:
                 self.signals.sig_image_changed.emit(self.get_image_path())
 
@@ -1121,6 +1150,8 @@ class ActorPart(BasePart):
             image_dict = self._shared_scenario_state.image_dictionary
             self.__image_id = image_dict.new_image(image_path)
 
+        self._on_searchable_state_changed()
+        self._flag_ori_changes()
         if self._anim_mode_shared:
             self.signals.sig_image_changed.emit(self.get_image_path())
 
@@ -1158,6 +1189,8 @@ class ActorPart(BasePart):
                           "Error: {}", str(self), str(e))
 
             self.__image_id = None
+            self._on_searchable_state_changed()
+            self._flag_ori_changes()
 
             if self._anim_mode_shared:
                 self.signals.sig_image_changed.emit(None)
@@ -1209,6 +1242,7 @@ class ActorPart(BasePart):
         else:
             result = None
         to_bin.append(from_bin.pop(from_index))
+        self._flag_ori_changes()
 
         self.signals.sig_ifx_port_side_changed.emit(descendant_frame, from_left, len(to_bin) - 1)
         return result
@@ -1230,6 +1264,7 @@ class ActorPart(BasePart):
 
         from_index = from_bin.index(descendant_frame)
         to_bin.insert(restore_info.index, from_bin.pop(from_index))
+        self._flag_ori_changes()
 
         self.signals.sig_ifx_port_side_changed.emit(descendant_frame, from_left, restore_info.index)
 
@@ -1260,6 +1295,7 @@ class ActorPart(BasePart):
             to_index = len(bin) - 1
         if to_index != from_index:
             bin.insert(to_index, bin.pop(from_index))
+            self._flag_ori_changes()
             if restorable:
                 result = RestoreIfxPortIndexInfo(from_index, left, to_index)
             self.signals.sig_ifx_port_index_changed.emit(from_index, left, to_index)
@@ -1275,6 +1311,7 @@ class ActorPart(BasePart):
         bin = self.__ifx_ports_left if restore.left_side else self.__ifx_ports_right
         assert bin[restore.to_index] is descendant_frame
         bin.insert(restore.from_index, bin.pop(restore.to_index))
+        self._flag_ori_changes()
         self.signals.sig_ifx_port_index_changed.emit(restore.from_index, restore.left_side, restore.to_index)
 
     def has_ifx_port(self, part_frame: PartFrame) -> bool:
@@ -1287,6 +1324,7 @@ class ActorPart(BasePart):
         This function notifies the Actor that it's Part Frame name has changed. In turn, the Actor Part notifies
         each child that its parent's path (within the scenario) has changed.
         """
+        super().on_frame_name_changed()
         try:
             for child in self.__children:
                 child.on_parent_path_changed()
@@ -1463,6 +1501,12 @@ class ActorPart(BasePart):
     def _get_children_alert_sources(self) -> List[IScenAlertSource]:
         return self.__children
 
+    @override(BasePart)
+    def _invalidate_path_cache(self):
+        super()._invalidate_path_cache()
+        for child in self.__children:
+            child._invalidate_path_cache()
+
     @internal(PartFrame)
     def _add_ifx_port(self, descendant_frame: PartFrame, bottom_level: int, top_level: int):
         """
@@ -1528,6 +1572,7 @@ class ActorPart(BasePart):
                 # order does not matter:
                 restoration[parent] = RestoreIfxPortInfo(index, removed_from_left)
 
+            parent._flag_ori_changes()
             parent.signals.sig_ifx_port_removed.emit(descendant_frame, removed_from_left)
             parent = parent.parent_actor_part
             level += 1
@@ -1638,8 +1683,10 @@ class ActorPart(BasePart):
             self.__rotation_3d = Rotation3D(
                 roll=ori_rot[R3dKeys.ROLL],
                 pitch=ori_rot[R3dKeys.PITCH],
-                yaw=ori_rot[R3dKeys.YAW]
+                yaw=ori_rot[R3dKeys.YAW],
+                on_changed=self._flag_ori_changes,
             )
+            self._flag_ori_changes()
 
         if part_content_ori.get(ApKeys.IMAGE_ID) is not None:
             if context == OriContextEnum.export:
@@ -1797,9 +1844,14 @@ class ActorPart(BasePart):
         children_context = context
         if context == OriContextEnum.assign:
             children_context = OriContextEnum.copy
+        # when saving with a segment cache (see OriJsonSegmentCache), non-actor children are obtained from it:
+        ori_segments = kwargs.get('ori_segments')
         ori_children = actor_ori_def[ApKeys.CHILDREN]
         for child in self.__children:
-            ori_child = child.get_ori_def(context=children_context)
+            if ori_segments is None or child.PART_TYPE_NAME == self.PART_TYPE_NAME:
+                ori_child = child.get_ori_def(context=children_context, **kwargs)
+            else:
+                ori_child = ori_segments.get_part_ori_def(child, children_context)
             ori_children.append(ori_child)
 
         return ori_def
@@ -1808,7 +1860,7 @@ class ActorPart(BasePart):
     def _get_ori_snapshot_local(self, snapshot: JsonObj, snapshot_slow: JsonObj):
         BasePart._get_ori_snapshot_local(self, snapshot, snapshot_slow)
 
-        if self.__image_id:
+        if self.__image_id is not None:
             try:
                 image_path = self._shared_scenario_state.image_dictionary.get_image_path(self.__image_id)
             except Exception as e:
@@ -1831,9 +1883,16 @@ class ActorPart(BasePart):
         if BasePart._has_ori_changes_children(self):
             return True
 
+        # only the children that flagged changes, or that don't track their changes, need to be checked (all of
+        # them when verifying the tracking):
+        if self.VERIFY_ORI_CHANGES_TRACKING:
+            check_children = list(self.__children)
+        else:
+            check_children = list(self.__ori_check_children)
+
         # first check the non-actor children, so will only go deeper in tree if none of them have changed:
         actor_children = []
-        for child in self.__children:
+        for child in check_children:
             if child.PART_TYPE_NAME == self.PART_TYPE_NAME:
                 actor_children.append(child)
             elif child.has_ori_changes():
@@ -1844,14 +1903,47 @@ class ActorPart(BasePart):
             if child.has_ori_changes():
                 return True
 
+        # children that track changes and have been found to have none (i.e. changes were reverted) no longer
+        # need checking:
+        for child in check_children:
+            if child._ORI_TRACKS_CHANGES and not child._needs_ori_check():
+                self.__ori_check_children.discard(child)
+
         return False
 
     @override(BasePart)
     def _set_ori_snapshot_baseline_children(self, baseline_id: OriBaselineEnum):
         BasePart._set_ori_snapshot_baseline_children(self, baseline_id)
-        for child in self.__children:
+        # the children that need no check have no changes anywhere in their subtree, so their baseline is current:
+        if baseline_id == OriBaselineEnum.changed and not self.VERIFY_ORI_CHANGES_TRACKING:
+            baseline_children = list(self.__ori_check_children)
+        else:
+            baseline_children = self.__children
+        for child in baseline_children:
             child.set_ori_snapshot_baseline(baseline_id)
 
+        self.__ori_check_children = {child for child in baseline_children
+                                     if not child._ORI_TRACKS_CHANGES or child._needs_ori_check()}
+        if self.__ori_check_children:
+            # parent (if any) must keep checking self:
+            self._on_ori_changes_flagged()
+
+    @override(IOriSerializable)
+    def _needs_ori_check(self) -> bool:
+        """The actor must be checked if it flagged changes or if any of its children must be checked"""
+        return BasePart._needs_ori_check(self) or bool(self.__ori_check_children)
+
+    @internal(BasePart)
+    def _on_child_ori_changes_flagged(self, child: BasePart):
+        """
+        Called by a child part when its ORI changes get flagged: the child must be checked by the next
+        has_ori_changes(), and so must self (by its parent).
+        """
+        needed_check = self._needs_ori_check()
+        self.__ori_check_children.add(child)
+        if not needed_check:
+            self._on_ori_changes_flagged()
+
     @override(IOriSerializable)
     def _check_ori_diffs(self, other_ori: Decl.ActorPart, diffs: Dict[str, Any], tol_float: float):
         BasePart._check_ori_diffs(self, other_ori, diffs, tol_float)
@@ -1886,12 +1978,14 @@ class ActorPart(BasePart):
         put_left = len(self.__ifx_ports_left) <= len(self.__ifx_ports_right)
         ports_bin = self.__ifx_ports_left if put_left else self.__ifx_ports_right
         ports_bin.append(descendant_frame)
+        self._flag_ori_changes()
         self.signals.sig_ifx_port_added.emit(descendant_frame, put_left, ports_bin.index(descendant_frame))
 
     def __restore_ifx_port(self, descendant_frame: PartFrame, restore_port: RestoreIfxPortInfo):
         """Restore just one port for descendant frame on self, i.e. no propagation up hierarchy"""
         ports_bin = self.__ifx_ports_left if restore_port.left_side else self.__ifx_ports_right
         ports_bin.insert(restore_port.index, descendant_frame)
+        self._flag_ori_changes()
         self.signals.sig_ifx_port_added.emit(descendant_frame, restore_port.left_side, restore_port.index)
 
     def __fix_sides_ori_ifx_ports(self, content_ori: OriScenData, refs_map: Dict[int, BasePart]):
@@ -1981,11 +2075,19 @@ class ActorPart(BasePart):
         assert part.parent_actor_part is self
         self.__children.append(part)
         self.__children_index_from_id[part.SESSION_ID] = len(self.__children) - 1
+        self.__on_searchable_subtree_changed(part)
+        self.__ori_check_children.add(part)
+        self._flag_ori_changes()
 
         # Notify any listeners of the event.
         if self._anim_mode_shared:
             self.signals.sig_child_added.emit(part)
 
+    def __on_searchable_subtree_changed(self, part: BasePart):
+        """Notify the scenario search index that given child part (and its descendants) was added or removed"""
+        if self._shared_scenario_state is not None:
+            self._shared_scenario_state.search_index.mark_subtree_changed(part)
+
     def __regen_children_indices(self):
         # TODO build 3: this is rather costly when many children abandonned; the order matters only to support build 1
         # legacy scenarios where the string path for link endpoints relied on index within array; therefore, the
@@ -27,7 +27,7 @@ from enum import IntEnum
 
 # [3. local]
 from ...core import UniqueIdGenerator, BridgeSignal, BridgeEmitter, AttributeAggregator
-from ...core import override, override_optional, override_required, get_enum_val_name
+from ...core import override, override_optional, override_required, internal, get_enum_val_name
 from ...core.typing import Any, Either, Optional, List, Tuple, Sequence, Set, Dict, Iterable, Callable, PathType
 from ...core.constants import SECONDS_PER_DAY
 from ...core.typing import AnnotationDeclarations
@@ -184,6 +184,12 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
     USER_CREATABLE = True
     CAN_BE_LINK_SOURCE = False
 
+    # Derived classes that override get_matching_content() must override this to True:
+    HAS_SEARCHABLE_CONTENT = False
+    # Derived classes that have searchable properties that can change without a setter being called (such as
+    # values derived from sim time) must list their names here, so the scenario search index re-reads them:
+    VOLATILE_SEARCHABLE_PROPERTIES = ()
+
     # Min size for the widget. The default numbers are based on the observations of the prototype framed widgets.
     # The width can go as low as 4 when the widget is at the minimal detail level.
     # Derived classes that have different min size must override this. For example, the hub would have to do it.
@@ -243,6 +249,12 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
             self._shared_scenario_state = parent.shared_scenario_state
             self._anim_mode_shared = self._shared_scenario_state.animation_mode_reader
 
+        # path caches, filled on demand by get_parts_path()/get_path_list()/get_path(); must exist before the
+        # frame is created since setting the frame name invalidates them:
+        self.__parts_path = None
+        self.__path_lists = {}
+        self.__paths = {}
+
         # frame:
         name = name or default_name_for_part(self)
         self._part_frame = PartFrame(self, name, self._anim_mode_shared)
@@ -317,6 +329,8 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
         """
         log.debug("Receiving submitted data")
         self._receive_edited_snapshot(submitted_data, order)
+        self._on_searchable_state_changed()
+        self._flag_ori_changes()
         self.base_part_signals.sig_bulk_edit_done.emit(initiator_id)
 
     @override_optional
@@ -415,7 +429,9 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
 
         # Inform the parent Actor Part to detach this child part.
         assert self.__in_scenario_parent.in_scenario_state == InScenarioState.active
+        self._remove_alerts_from_parent()
         self._parent_actor_part = None
+        self._invalidate_path_cache()
 
         if restorable:
             part_restore.part_scen_data = scen_data_restore
@@ -442,6 +458,8 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
         parent = parent or restore_part_info.parent_part
         assert self in parent.children
         self._parent_actor_part = parent
+        self._add_alerts_to_parent()
+        self._invalidate_path_cache()
 
         self.on_restored_to_scenario(restore_part_info.part_scen_data)
         assert self.__in_scenario_parent is self._parent_actor_part
@@ -593,29 +611,28 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
         NOTE: because of this, do not use this method to determine if a part is root; instead, use part.is_root
         property or associated getter.
 
-        NOTE: a new list is generated at every call, so this is somewhat expensive call. This is in case self is
-        moved to another actor, although it would now be quite straightforward to cache this thanks to
-        on_removed/restored_from/to_scenario() methods.
+        NOTE: the chain of parts is cached, and the cache is invalidated when self or one of its ancestors is
+        renamed or moved to another actor (see _invalidate_path_cache()). A new list is returned at every call
+        so the caller is free to modify it.
         """
         if self._parent_actor_part is None:
             return [self] if with_root and with_part else []
 
-        path = []
-        part = self if with_part else self._parent_actor_part
-        while part is not None:
-            if part.is_root and not with_root:
-                break
-            path.insert(0, part)
-            part = part._parent_actor_part
-
-        return path
+        parts_path = self.__get_full_parts_path()
+        return list(parts_path[(0 if with_root else 1):(None if with_part else -1)])
 
     def get_path_list(self, with_root: bool = False, with_name=True) -> List[str]:
         """
-        Get the list of part names from root actor to this part; a new list is generated at every call. See
+        Get the list of part names from root actor to this part; a new list is returned at every call. See
         self.get_parts_path() for details on root parameter.
         """
-        return [part.name for part in self.get_parts_path(with_root=with_root, with_part=with_name)]
+        key = (with_root, with_name)
+        names = self.__path_lists.get(key)
+        if names is None:
+            names = tuple(part.name for part in self.get_parts_path(with_root=with_root, with_part=with_name))
+            self.__path_lists[key] = names
+
+        return list(names)
 
     def get_path(self, with_root: Either[bool, str] = DEFAULT_PATH_SEPARATOR, with_name: bool = True) -> str:
         """
@@ -636,16 +653,40 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
         - root.get_path() returns '/'
         - root.get_path(with_root=False) returns ''
         - root.get_path(with_root=True) returns 'root'
+
+        NOTE: the path string is cached, see get_parts_path() for details.
         """
+        key = (with_root, with_name)
+        path = self.__paths.get(key)
+        if path is not None:
+            return path
+
         if with_root == self.DEFAULT_PATH_SEPARATOR:
-            return with_root + self.DEFAULT_PATH_SEPARATOR.join(self.get_path_list(with_name=with_name))
+            path = with_root + self.DEFAULT_PATH_SEPARATOR.join(self.get_path_list(with_name=with_name))
         else:
-            return self.DEFAULT_PATH_SEPARATOR.join(self.get_path_list(with_root=with_root, with_name=with_name))
+            path = self.DEFAULT_PATH_SEPARATOR.join(self.get_path_list(with_root=with_root, with_name=with_name))
+
+        self.__paths[key] = path
+        return path
+
+    def get_searchable_properties(self) -> Dict[str, Any]:
+        """
+        Get the value of every property of this part that is searched by get_matching_properties(): those of the
+        part frame (keys prefixed by 'part_frame.'), and those of AUTO_SEARCHING_API_CUMUL. The scenario search
+        index uses this to index the part.
+        :return: a map of property name to property value, in search order
+        """
+        searchable = {('part_frame.' + prop_name): prop_val
+                      for prop_name, prop_val in self._part_frame.get_searchable_properties().items()}
+        for prop_name in self.AUTO_SEARCHING_API_CUMUL:
+            searchable[prop_name] = getattr(self, prop_name)
+
+        return searchable
 
-    @override_optional
     def get_matching_properties(self, re_pattern: str) -> List[str]:
         """
         Get the names of all properties of this frame that have a string representation that matches a pattern (case insensitive).
+        The content of the part is also searched, via get_matching_content().
 
         :param re_pattern: the regular expression pattern to match on
 
@@ -653,13 +694,12 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
             of part's frame is 'hello' and the derived part has a property named "script" that equal to "print('hell')"
         """
         regexp = re.compile(re.escape(re_pattern), re.IGNORECASE)
-        matches = self._part_frame.get_matching_properties(re_pattern)
-        matches = [('part_frame.' + match) for match in matches]
+        matches = []
 
         # look through all properties used for editing, and capture any matches:
         #
-        for prop_name in self.AUTO_SEARCHING_API_CUMUL:
-            prop_val_as_str = str(getattr(self, prop_name))
+        for prop_name, prop_val in self.get_searchable_properties().items():
+            prop_val_as_str = str(prop_val)
             result = regexp.search(prop_val_as_str)
             if result:
                 MAX_LEN_MATCHED_PROP_VAL = 100
@@ -667,9 +707,23 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
                           self, prop_name, re_pattern, prop_val_as_str[:MAX_LEN_MATCHED_PROP_VAL])
                 matches.append(prop_name)
 
-        # no other place to look for matches:
+        if self.HAS_SEARCHABLE_CONTENT:
+            matches.extend(self.get_matching_content(re_pattern))
+
         return matches
 
+    @override_optional
+    def get_matching_content(self, re_pattern: str) -> List[str]:
+        """
+        Get the names of the items of the content of this part that match a pattern (case insensitive). Parts
+        that have content that is not available via properties (such as table records, data part keys, etc)
+        must set HAS_SEARCHABLE_CONTENT to True and override this. By default, there is no content to search.
+
+        :param re_pattern: the pattern to match on
+        :return: list of names of matching content items
+        """
+        return []
+
     @override_optional
     def can_add_outgoing_link(self, part_type_str: str=None) -> bool:
         """
@@ -738,18 +792,21 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
     @override_optional
     def on_frame_name_changed(self):
         """
-        This is automatically called by the Part Frame when its name is changed.
+        This is automatically called by the Part Frame when its name is changed. It discards the cached path
+        of this part. Derived classes that override this must call the base class version.
         """
-        pass
+        self.__clear_path_cache()
 
     @override_optional
     def on_parent_path_changed(self):
         """
         This function must be called by the parent part when the parent part's path (path/get_path())
-        within the scenario has changed. It emits the sig_parent_path_change signal.
+        within the scenario has changed. It discards the cached path of this part and emits the
+        sig_parent_path_change signal.
         Note: changing self's frame name does not cause the signal to be emitted because although this
         changes self's path, it does not affect the parent's path.
         """
+        self.__clear_path_cache()
         if self._anim_mode_shared:
             self.base_part_signals.sig_parent_path_change.emit()
 
@@ -1014,8 +1071,8 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
 
     """
     List the members (properties, mostly) that will be automatically searched by BasePart.get_matching_properties().
-    For searching portions of an object without a corresponding property, override this method() for the additional
-    search coverage.
+    For searching portions of an object without a corresponding property, override get_matching_content() (and
+    HAS_SEARCHABLE_CONTENT) for the additional search coverage.
     """
     META_AUTO_SEARCHING_API_EXTEND = META_AUTO_EDITING_API_EXTEND
 
@@ -1233,6 +1290,9 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
         # we only set the frame from ORI when context is not assignment:
         if context != OriContextEnum.assign:
             self._part_frame.set_from_ori(ori_data.get_sub_ori(CpKeys.PART_FRAME), context=context, **kwargs)
+        self._on_searchable_state_changed()
+        # set_from_ori() will make this state the baseline, but it may differ from the state last saved:
+        self._flag_ori_changes()
 
     @override(IOriSerializable)
     def _get_ori_def_impl(self, context: OriContextEnum, **kwargs) -> JsonObj:
@@ -1263,6 +1323,35 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
         for prop_name in self.AUTO_ORI_DIFFING_CUMUL:
             self.__check_ori_diff_prop(prop_name, other_ori, diffs)
 
+    @internal(PartFrame)
+    def _on_searchable_state_changed(self):
+        """
+        Notify the scenario search index that the searchable properties of this part may have changed. Derived
+        classes must call this when the value of a property that is in AUTO_SEARCHING_API_CUMUL changes.
+        """
+        if self._shared_scenario_state is not None:
+            self._shared_scenario_state.search_index.mark_part_changed(self)
+
+    @override(IOriSerializable)
+    def _on_ori_changes_flagged(self):
+        """
+        Notify the parent actor that this part must be checked by the next has_ori_changes(), and the scenario's
+        ORI segment cache that the text last saved for this part is stale
+        """
+        if self._parent_actor_part is not None:
+            self._parent_actor_part._on_child_ori_changes_flagged(self)
+        if self._shared_scenario_state is not None:
+            self._shared_scenario_state.ori_segment_cache.mark_part_changed(self)
+
+    @override_optional
+    def _invalidate_path_cache(self):
+        """
+        Discard the cached path of this part. This is called when the parent of this part changes. Derived
+        classes that have children parts must override this to also invalidate the cache of every descendant
+        (the base class version must be called).
+        """
+        self.__clear_path_cache()
+
     @override(IScenAlertSource)
     def _get_alert_parent(self) -> IScenAlertSource:
         """If alerts should be propagated up to a "parent" alert source, override this method to return it"""
@@ -1274,6 +1363,26 @@ class BasePart(IOriSerializable, IScenAlertSource, ScenarioObject, metaclass=Att
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
+    def __get_full_parts_path(self) -> Tuple[Decl.BasePart]:
+        """
+        Get the cached tuple of parts from root actor to this part, both included. The tuple is built from
+        the parent's cached tuple, so building the paths of all parts of an actor is O(1) per part.
+        """
+        if self.__parts_path is None:
+            parent = self._parent_actor_part
+            if parent is None:
+                self.__parts_path = (self,)
+            else:
+                self.__parts_path = parent.__get_full_parts_path() + (self,)
+
+        return self.__parts_path
+
+    def __clear_path_cache(self):
+        """Discard the cached path data of this part only (not descendants)"""
+        self.__parts_path = None
+        self.__path_lists.clear()
+        self.__paths.clear()
+
     def __check_ori_diff_prop(self, prop_name: str, other_ori: Decl.BasePart, diffs: Dict[str, Any], tol_value=0.00001):
         """
         Check whether a property of ours has different value as same property in another instance. Any differences
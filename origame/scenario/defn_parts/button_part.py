@@ -183,6 +183,7 @@ class ButtonPart(BasePart):
                     log.error("Part: {} unable to remove its reference to an image from the Image Dictionary. "
                               "Error: {}", str(self), str(e))
 
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_image_pressed_path_changed.emit(self.get_image_pressed_path())
 
@@ -216,6 +217,7 @@ class ButtonPart(BasePart):
                     log.error("Part: {} unable to remove its reference to an image from the Image Dictionary. "
                               "Error: {}", str(self), str(e))
 
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_image_released_path_changed.emit(self.get_image_released_path())
 
@@ -232,6 +234,7 @@ class ButtonPart(BasePart):
         else:
             image_dict = self._shared_scenario_state.image_dictionary
             self.__image_id_pressed = image_dict.new_image(image_path)
+            self._on_searchable_state_changed()
 
         if self._anim_mode_shared:
             # We don't check if the value is actually changed in order to signal here, because the signal is needed
@@ -252,6 +255,7 @@ class ButtonPart(BasePart):
         else:
             image_dict = self._shared_scenario_state.image_dictionary
             self.__image_id_released = image_dict.new_image(image_path)
+            self._on_searchable_state_changed()
 
         if self._anim_mode_shared:
             # We don't check if the value is actually changed in order to signal here, because the signal is needed
@@ -316,6 +320,7 @@ class ButtonPart(BasePart):
                           "Error: {}", str(self), str(e))
 
             self.__image_id_pressed = None
+            self._on_searchable_state_changed()
 
             if self._anim_mode_shared:
                 self.signals.sig_image_pressed_path_changed.emit(None)
@@ -334,6 +339,7 @@ class ButtonPart(BasePart):
                           "Error: {}", str(self), str(e))
 
             self.__image_id_released = None
+            self._on_searchable_state_changed()
 
             if self._anim_mode_shared:
                 self.signals.sig_image_released_path_changed.emit(None)
@@ -351,6 +357,7 @@ class ButtonPart(BasePart):
         :param: The new state of the button.
         """
         self._state = state
+        self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_button_state_changed.emit(self._state.value)
 
@@ -366,6 +373,7 @@ class ButtonPart(BasePart):
         """
         if self.__button_action != action:
             self.__button_action = action
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_button_action_changed.emit(self.__button_action.value)
             # Design decisions:
@@ -384,6 +392,7 @@ class ButtonPart(BasePart):
         """
         if self.__button_trigger_style != trigger_style:
             self.__button_trigger_style = trigger_style
+            self._on_searchable_state_changed()
 
     def get_rotation_2d_pressed(self) -> float:
         """
@@ -397,6 +406,7 @@ class ButtonPart(BasePart):
         """
         if self.__rotation_2d_pressed != rotation:
             self.__rotation_2d_pressed = rotation
+            self._on_searchable_state_changed()
 
             if self._anim_mode_shared:
                 self.signals.sig_rotation_2d_pressed_changed.emit(self.__rotation_2d_pressed)
@@ -413,6 +423,7 @@ class ButtonPart(BasePart):
         """
         if self.__rotation_2d_released != rotation:
             self.__rotation_2d_released = rotation
+            self._on_searchable_state_changed()
 
             if self._anim_mode_shared:
                 self.signals.sig_rotation_2d_released_changed.emit(self.__rotation_2d_released)
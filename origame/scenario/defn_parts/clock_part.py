@@ -24,6 +24,7 @@ from dateutil.relativedelta import relativedelta
 
 # [3. local]
 from ...core import override, BridgeSignal, BridgeEmitter, SECONDS_TO_DAYS
+from ...core.typing import Any, Dict
 from ...core.typing import AnnotationDeclarations
 
 from ..ori import IOriSerializable, OriContextEnum, OriScenData, JsonObj
@@ -32,7 +33,7 @@ from ..proto_compat_warn import prototype_compat_method_alias, prototype_compat_
 
 from .base_part import BasePart
 from .actor_part import ActorPart
-from .common import Position
+from .common import Position, SimTimeAnchor
 from .part_types_info import register_new_part_type
 
 # -- Meta-data ----------------------------------------------------------------------------------
@@ -72,14 +73,15 @@ class ClockPart(BasePart):
     Calendar time is initialized to the local PC's date/time at ClockPart instantiation. It progresses at the same rate
     as the simulation time.
 
-    A ClockPart instance subscribes to Sim Controller sim time update events in order to keep itself in sync.
+    A ClockPart instance computes its tick value and date/time when they are read, from the advance of sim time
+    since they were last updated (see SimTimeAnchor), in order to keep itself in sync.
     """
 
     class Signals(BridgeEmitter):
-        sig_tick_value_changed = BridgeSignal(float)  # number of ticks
+        sig_tick_value_changed = BridgeSignal(float, coalesce=True)  # number of ticks
         sig_tick_period_days_changed = BridgeSignal(float)  # period(days)
         # year, month, day, hour, minute, second, microsecond
-        sig_date_time_changed = BridgeSignal(int, int, int, int, int, int, int)
+        sig_date_time_changed = BridgeSignal(int, int, int, int, int, int, int, coalesce=True)
 
     DEFAULT_TICK_PERIOD_DAYS = 1.0
     DEFAULT_TICK_VALUE_TICKS = 0.0
@@ -91,6 +93,7 @@ class ClockPart(BasePart):
     DEFAULT_VISUAL_SIZE = dict(width=7.2, height=4.65)
 
     USER_CREATABLE = False
+    VOLATILE_SEARCHABLE_PROPERTIES = ('date_time', 'tick_value')  # derived from sim time
     PART_TYPE_NAME = "clock"
     DESCRIPTION = """\
         Use this part to define when delayed signals should be sent.  The code that creates the signal should be linked
@@ -114,11 +117,9 @@ class ClockPart(BasePart):
         self._tick_period_days = self.DEFAULT_TICK_PERIOD_DAYS
         self._tick_value_ticks = self.DEFAULT_TICK_VALUE_TICKS
         self._date_time = datetime.now()
-        self._current_sim_time_days = 0.0
-        if parent:
-            sim_controller = self.shared_scenario_state.sim_controller
-            self._current_sim_time_days = sim_controller.get_sim_time_days()
-            sim_controller.signals.sig_sim_time_days_changed.connect(self.__sim_time_days_changed)
+        # the tick value and date/time are as of the last update, see __update_from_sim_time()
+        sim_controller = self.shared_scenario_state.sim_controller if parent else None
+        self.__sim_time_anchor = SimTimeAnchor(sim_controller, self.__on_sim_time_advanced)
 
         log.warning('Part {} is of deprecated type Clock.', self)
 
@@ -126,6 +127,7 @@ class ClockPart(BasePart):
         """
         Get the current data/time setting for the clock part.
         """
+        self.__update_from_sim_time()
         return self._date_time
 
     def set_date_time(self, date_time: datetime):
@@ -133,8 +135,10 @@ class ClockPart(BasePart):
         Set the current date/time value for the clock part.
         Note: Calling the setter does not cause the associated signal to be raised.
         """
+        self.__update_from_sim_time()
         if self._date_time != date_time:
             self._date_time = date_time
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -150,6 +154,7 @@ class ClockPart(BasePart):
         Get the year portion of the clock's calender date/time.
         Note: This function is consistent with the original prototype's Clock Part API.
         """
+        self.__update_from_sim_time()
         return self._date_time.year
 
     def set_year(self, new_year: int) -> Decl.ClockPart:
@@ -162,11 +167,13 @@ class ClockPart(BasePart):
         :param new_year: The new year value for the clock part's date/time attribute.
         :return: The updated clock part instance.
         """
+        self.__update_from_sim_time()
         if new_year != self._date_time.year:
             _, max_days = calendar.monthrange(new_year, self.month)
             if self.day > max_days:
                 self._date_time = self._date_time.replace(day=max_days)
             self._date_time = self._date_time.replace(year=new_year)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -184,6 +191,7 @@ class ClockPart(BasePart):
         Get the month portion of the clock's calender date/time.
         Note: This function is consistent with the original prototype's Clock Part API.
         """
+        self.__update_from_sim_time()
         return self._date_time.month
 
     def set_month(self, new_month: int) -> Decl.ClockPart:
@@ -196,11 +204,13 @@ class ClockPart(BasePart):
         :param new_month: The new month value for the clock part's date/time attribute.
         :return: The updated clock part instance.
         """
+        self.__update_from_sim_time()
         if new_month != self._date_time.month:
             _, max_days = calendar.monthrange(self.year, new_month)
             if self.day > max_days:
                 self._date_time = self._date_time.replace(day=max_days)
             self._date_time = self._date_time.replace(month=new_month)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -218,6 +228,7 @@ class ClockPart(BasePart):
         Get the days portion of the clock's calender date/time.
         Note: This function is consistent with the original prototype's Clock Part API.
         """
+        self.__update_from_sim_time()
         return self._date_time.day
 
     def set_day(self, new_day: int) -> Decl.ClockPart:
@@ -230,6 +241,7 @@ class ClockPart(BasePart):
         :param new_day: The new month value for the clock part's date/time attribute.
         :return: The updated clock part instance.
         """
+        self.__update_from_sim_time()
         if new_day != self._date_time.day:
             _, max_days = calendar.monthrange(self.year, self.month)
             if new_day > max_days:
@@ -237,6 +249,7 @@ class ClockPart(BasePart):
                             new_day, max_days, self._date_time.day)
                 new_day = max_days
             self._date_time = self._date_time.replace(day=new_day)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -254,6 +267,7 @@ class ClockPart(BasePart):
         Get the hours portion of the clock's calender date/time.
         Note: This function is consistent with the original prototype's Clock Part API.
         """
+        self.__update_from_sim_time()
         return self._date_time.hour
 
     def set_hour(self, new_hour: int) -> Decl.ClockPart:
@@ -264,8 +278,10 @@ class ClockPart(BasePart):
         :param new_hour: The new hour value to be set.
         :return: The updated instance of the clock part.
         """
+        self.__update_from_sim_time()
         if new_hour != self._date_time.hour:
             self._date_time = self._date_time.replace(hour=new_hour)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -283,6 +299,7 @@ class ClockPart(BasePart):
         Get the minutes portion of the clock's calender date/time.
         Note: This function is consistent with the original prototype's Clock Part API.
         """
+        self.__update_from_sim_time()
         return self._date_time.minute
 
     def set_minute(self, new_minute: int) -> Decl.ClockPart:
@@ -293,8 +310,10 @@ class ClockPart(BasePart):
         :param new_minute: The new minute value to be set.
         :return: The updated instance of the clock part.
         """
+        self.__update_from_sim_time()
         if new_minute != self._date_time.minute:
             self._date_time = self._date_time.replace(minute=new_minute)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -312,6 +331,7 @@ class ClockPart(BasePart):
         Get the seconds portion of the clock's calender date/time.
         Note: This function is consistent with the original prototype's Clock Part API.
         """
+        self.__update_from_sim_time()
         return self._date_time.second
 
     def set_second(self, new_second: int) -> Decl.ClockPart:
@@ -322,8 +342,10 @@ class ClockPart(BasePart):
         :param new_second: The new seconds value to be set.
         :return: The updated instance of the clock part.
         """
+        self.__update_from_sim_time()
         if new_second != self._date_time.second:
             self._date_time = self._date_time.replace(second=new_second)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self._date_time.year,
                                                         self._date_time.month,
@@ -366,6 +388,7 @@ class ClockPart(BasePart):
         to maintain the tick time.
         :param tick_period_days: The new period duration in days for a time tick.
         """
+        self.__update_from_sim_time()
         # tt1 = tv1 * tp1
         # tv2 = tv1 * tp1 / tp2
 
@@ -373,6 +396,7 @@ class ClockPart(BasePart):
             tv2 = self._tick_value_ticks * self._tick_period_days / tick_period_days
             self._tick_value_ticks = tv2
             self._tick_period_days = tick_period_days
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_tick_period_days_changed.emit(self._tick_period_days)
                 self.signals.sig_tick_value_changed.emit(self._tick_value_ticks)
@@ -389,8 +413,10 @@ class ClockPart(BasePart):
         effect the tick period but does affect tick time.
         :param tick_value: The new number of ticks.
         """
+        self.__update_from_sim_time()
         if self._tick_value_ticks != tick_value:
             self._tick_value_ticks = tick_value
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_tick_value_changed.emit(self._tick_value_ticks)
 
@@ -399,6 +425,7 @@ class ClockPart(BasePart):
         This function returns the tick value (the number of "ticks" measured in tick time units (the period)).
         :return: The current tick value of the clock.
         """
+        self.__update_from_sim_time()
         return self._tick_value_ticks
 
     def __call__(self, ticks_or_year: float,
@@ -432,6 +459,16 @@ class ClockPart(BasePart):
             return self.__get_sim_time_from_datetime(year=year, month=month, day=day,
                                                      hour=hour, minute=minute, second=second)
 
+    @override(BasePart)
+    def on_removing_from_scenario(self, scen_data: Dict[BasePart, Any], restorable: bool = False):
+        BasePart.on_removing_from_scenario(self, scen_data, restorable=restorable)
+        self.__sim_time_anchor.detach()
+
+    @override(BasePart)
+    def on_restored_to_scenario(self, scen_data: Dict[BasePart, Any]):
+        BasePart.on_restored_to_scenario(self, scen_data)
+        self.__sim_time_anchor.attach()
+
     # --------------------------- instance PUBLIC properties ----------------------------
 
     # Calendar:
@@ -504,6 +541,7 @@ class ClockPart(BasePart):
 
     @override(IOriSerializable)
     def _get_ori_def_impl(self, context: OriContextEnum, **kwargs) -> JsonObj:
+        self.__update_from_sim_time()
         ori_def = BasePart._get_ori_def_impl(self, context, **kwargs)
         clock_ori_def = {
             ClkKeys.DATE_TIME: {
@@ -523,6 +561,7 @@ class ClockPart(BasePart):
 
     @override(BasePart)
     def _get_ori_snapshot_local(self, snapshot: JsonObj, snapshot_slow: JsonObj):
+        self.__update_from_sim_time()
         BasePart._get_ori_snapshot_local(self, snapshot, snapshot_slow)
         snapshot.update({
             ClkKeys.YEAR: self._date_time.year,
@@ -537,42 +576,36 @@ class ClockPart(BasePart):
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
-    def __sim_time_days_changed(self, new_sim_time_days: float, sim_time_delta_days: float):
+    def __update_from_sim_time(self):
         """
-        This function is the signal handler for the SimController sig_sim_time_days_changed event. It computes the
-        new tick time parameter (tick value) for this instance based on the simulation time delta announced by the
-        Sim Controller and advances the instance's date/time setting accordingly.
-        :param new_sim_time_days: The new absolute simulation time according to the Sim Controller.
-        :param sim_time_delta_days: The time delta between the new simulation time and the
-            previously reported simulation time.
+        Advance the tick value and date/time by the advance of sim time since the last update. Sim resets are not
+        advances: the clock part times don't reset for a sim reset.
         """
-
-        self._current_sim_time_days = new_sim_time_days
-
-        # Only update the time values if the simulation time 'delta' passed in is greater than zero. A negative
-        # delta would indicate a simulation reset and the clock part times don't reset for a sim reset.
-        if sim_time_delta_days > 0:
+        advance_days = self.__sim_time_anchor.take_advance_days()
+        if advance_days > 0:
             # Update tick time
             # tt1 = tv1 * tp1
             # tv2 = (tv1 * tp1 + dT) / tp1
             tv1 = self._tick_value_ticks
             tp1 = self._tick_period_days
-            tv2 = (tv1 * tp1 + sim_time_delta_days) / tp1
+            tv2 = (tv1 * tp1 + advance_days) / tp1
             self._tick_value_ticks = tv2
 
             # Update date/time
-            self._date_time = self._date_time + timedelta(days=sim_time_delta_days)
-
-            if self._anim_mode_shared:
-                self.signals.sig_tick_value_changed.emit(self._tick_value_ticks)
-                self.signals.sig_date_time_changed.emit(self._date_time.year,
-                                                        self._date_time.month,
-                                                        self._date_time.day,
-                                                        self._date_time.hour,
-                                                        self._date_time.minute,
-                                                        self._date_time.second,
-                                                        self._date_time.microsecond
-                                                        )
+            self._date_time = self._date_time + timedelta(days=advance_days)
+
+    def __on_sim_time_advanced(self):
+        """Called by the sim time anchor when sim time advances while animated, to update the GUI"""
+        self.__update_from_sim_time()
+        self.signals.sig_tick_value_changed.emit(self._tick_value_ticks)
+        self.signals.sig_date_time_changed.emit(self._date_time.year,
+                                                self._date_time.month,
+                                                self._date_time.day,
+                                                self._date_time.hour,
+                                                self._date_time.minute,
+                                                self._date_time.second,
+                                                self._date_time.microsecond
+                                                )
 
     def __get_sim_time_after_tick_value_delay(self, tick_value_delay: float):
         """
@@ -583,7 +616,7 @@ class ClockPart(BasePart):
         tick value delay.
         """
         delay_in_days = tick_value_delay * self._tick_period_days
-        return self._current_sim_time_days + delay_in_days
+        return self.__sim_time_anchor.sim_time_days + delay_in_days
 
     def __get_sim_time_after_datetime_delay(self, years: float = 0, months: float = 0, days: float = 0,
                                             hours: float = 0, minutes: float = 0, seconds: float = 0):
@@ -605,11 +638,12 @@ class ClockPart(BasePart):
         :return: The simulation time that corresponds to the current clock part date/time plus the specified
             delay.
         """
+        self.__update_from_sim_time()
         relative_delta_time = relativedelta(years=years, months=months, days=days,
                                             hours=hours, minutes=minutes, seconds=seconds)
         new_time = self._date_time + relative_delta_time
         absolute_delta = new_time - self._date_time
-        return self._current_sim_time_days + absolute_delta.total_seconds() * SECONDS_TO_DAYS
+        return self.__sim_time_anchor.sim_time_days + absolute_delta.total_seconds() * SECONDS_TO_DAYS
 
     def __get_sim_time_from_tick_value(self, tick_value: float):
         """
@@ -621,8 +655,9 @@ class ClockPart(BasePart):
         :param tick_value: The tick value at which the corresponding simulation time is to be calculated.
         :return: The simulation time corresponding to the input tick time.
         """
+        self.__update_from_sim_time()
         tick_time_delta = self._tick_period_days * (tick_value - self._tick_value_ticks)
-        return self._current_sim_time_days + tick_time_delta
+        return self.__sim_time_anchor.sim_time_days + tick_time_delta
 
     def __get_sim_time_from_datetime(self, year: float = 0, month: float = 0, day: float = 0, hour: float = 0,
                                      minute: float = 0,
@@ -642,6 +677,7 @@ class ClockPart(BasePart):
         :raises ValueError: Raised if one of the input time components is out of range.
         :raises OverflowError: Raised if a time calculation results in a datetime value that is out of range.
         """
+        self.__update_from_sim_time()
         try:
             new_time = datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
             time_delta = new_time - self._date_time
@@ -649,7 +685,7 @@ class ClockPart(BasePart):
             log.exception("ClockPart datetime calculation error. Inputs: y({}), m({}), d({}), h({}), m({}), s({}). \
                 Error: {}", year, month, day, hour, minute, second, str(err))
             raise err
-        return self._current_sim_time_days + (time_delta.total_seconds() * SECONDS_TO_DAYS)
+        return self.__sim_time_anchor.sim_time_days + (time_delta.total_seconds() * SECONDS_TO_DAYS)
 
 
 # Add this part to the global part type/class lookup dictionary
@@ -40,6 +40,7 @@ __all__ = [
     'Size',
     'Position',
     'Vector',
+    'SimTimeAnchor',
 ]
 
 log = logging.getLogger('system')
@@ -48,6 +49,7 @@ log = logging.getLogger('system')
 class Decl(AnnotationDeclarations):
     Position = 'Position'
     Vector = 'Vector'
+    SimController = 'SimController'
 
 
 # -- Function definitions -----------------------------------------------------------------------
@@ -249,3 +251,92 @@ class ExcelWriteError(Exception):
     a sheet value, such a number of rows or columns is invalid for the current Sheet part.
     """
     pass
+
+
+class SimTimeAnchor:
+    """
+    Tracks how much the simulation time has advanced since an anchor point, for parts whose state progresses with
+    sim time (clock, datetime and time parts). Such a part stores its state as of the anchor, and computes its
+    current state only when it is read, from the advance since the anchor. Only forward changes of sim time count:
+    resetting the sim time does not decrease the advance.
+
+    The advance is obtained on demand from the sim controller, so the part is not notified of every sim time
+    change: a part that is not read costs nothing while the simulation runs. Only while animation is on is the
+    on_advance callback called at every advance of sim time, so the part can notify the GUI. The part must call
+    detach() when it is removed from its scenario, so its anchor no longer listens to the sim controller, and
+    attach() if it is restored.
+    """
+
+    def __init__(self, sim_controller: Optional[Decl.SimController], on_advance: Callable[[], None]):
+        """
+        :param sim_controller: the sim controller of the part's scenario; if None, sim time never advances
+        :param on_advance: the callable to call, without arguments, when sim time advances while animation is on
+        """
+        self.__sim_controller = sim_controller
+        self.__on_advance = on_advance
+        self.__anchor_days = self.__get_total_advance_days()
+        self.__tracking = False
+        self.__attached = False
+        self.attach()
+
+    def attach(self):
+        """Listen to the sim controller (done on creation), so on_advance gets called while animation is on"""
+        if self.__sim_controller is None or self.__attached:
+            return
+
+        self.__sim_controller.signals.sig_animation_mode_changed.connect(self.__on_animation_mode_changed)
+        self.__set_tracking(self.__sim_controller.is_animated)
+        self.__attached = True
+
+    def detach(self):
+        """
+        Stop listening to the sim controller, so on_advance is no longer called. The advance of sim time since the
+        anchor is still available from take_advance_days().
+        """
+        if not self.__attached:
+            return
+
+        self.__set_tracking(False)
+        self.__sim_controller.signals.sig_animation_mode_changed.disconnect(self.__on_animation_mode_changed)
+        self.__attached = False
+
+    def get_sim_time_days(self) -> float:
+        """Get the current sim time (in days), or 0 if there is no sim controller"""
+        return 0.0 if self.__sim_controller is None else self.__sim_controller.sim_time_days
+
+    def take_advance_days(self) -> float:
+        """
+        Get the advance of sim time (in days) since the anchor, and move the anchor to now. The caller must apply the
+        advance to its state, which is then the state as of the new anchor.
+        """
+        total_advance_days = self.__get_total_advance_days()
+        advance_days = total_advance_days - self.__anchor_days
+        self.__anchor_days = total_advance_days
+        return advance_days
+
+    sim_time_days = property(get_sim_time_days)
+
+    def __get_total_advance_days(self) -> float:
+        return 0.0 if self.__sim_controller is None else self.__sim_controller.sim_time_advance_days
+
+    def __set_tracking(self, track: bool):
+        """Track the changes of sim time only while animated: that is the only time the GUI needs them"""
+        if track == self.__tracking:
+            return
+
+        time_signal = self.__sim_controller.signals.sig_sim_time_days_changed
+        if track:
+            time_signal.connect(self.__on_sim_time_days_changed)
+        else:
+            time_signal.disconnect(self.__on_sim_time_days_changed)
+        self.__tracking = track
+
+    def __on_animation_mode_changed(self, animated: bool):
+        self.__set_tracking(animated)
+        if animated:
+            # the GUI was not notified of the advances while not animated:
+            self.__on_advance()
+
+    def __on_sim_time_days_changed(self, _: float, sim_time_delta_days: float):
+        if sim_time_delta_days > 0:
+            self.__on_advance()
@@ -97,6 +97,7 @@ class DataPart(BasePart):
 
     DEFAULT_VISUAL_SIZE = dict(width=10.0, height=5.1)
     PART_TYPE_NAME = "data"
+    HAS_SEARCHABLE_CONTENT = True
     DESCRIPTION = """\
         Data parts are used to store multiple variables.  Data variables can be accessed from a function that is
         linked to it. The function script uses dot-notation. For example, 'link.data.area = 10', accesses the part
@@ -140,9 +141,9 @@ class DataPart(BasePart):
         return data
 
     @override(BasePart)
-    def get_matching_properties(self, re_pattern: str) -> List[str]:
-        """In addition to basic search, add first key or value that matches pattern (case insensitive)."""
-        matches = BasePart.get_matching_properties(self, re_pattern)
+    def get_matching_content(self, re_pattern: str) -> List[str]:
+        """Search the keys and values for the first one that matches pattern (case insensitive)."""
+        matches = []
 
         regexp = re.compile(re.escape(re_pattern), re.IGNORECASE)
         for key, value in self.__get_as_ordered_dict().items():
@@ -259,6 +260,7 @@ class DataPart(BasePart):
         :param display_order: The display order on the GUI.
         """
         super().__setattr__('_display_order', DisplayOrderEnum(display_order))
+        self._on_searchable_state_changed()
         self.signals.sig_display_order_changed.emit(display_order.value)
 
     def assign_from_object(self, rhs_obj: Either[Dict[str, Any], Decl.DataPart]):
@@ -318,6 +320,7 @@ class DataPart(BasePart):
         should_append = key not in self.__dict__ and key not in self.__class__.__dict__ and "_Order" in self.__dict__
         if key == 'display_order':
             super().__setattr__('_display_order', DisplayOrderEnum(value))
+            self._on_searchable_state_changed()
         else:
             self.__dict__[key] = value
 
@@ -24,6 +24,7 @@ from dateutil.relativedelta import relativedelta
 
 # [3. local]
 from ...core import override, BridgeSignal, BridgeEmitter, SECONDS_TO_DAYS
+from ...core.typing import Any, Dict
 from ...core.typing import AnnotationDeclarations
 
 from ..ori import OriCommonPartKeys as CpKeys, OriScenData, JsonObj
@@ -31,7 +32,7 @@ from ..ori import OriDateTimePartKeys as DtKeys
 from ..ori import IOriSerializable, OriContextEnum
 
 from .base_part import BasePart
-from .common import Position
+from .common import Position, SimTimeAnchor
 from .actor_part import ActorPart
 from .part_types_info import register_new_part_type
 
@@ -60,16 +61,18 @@ log = logging.getLogger('system')
 
 class DateTimePart(BasePart):
     """
-    The DateTimePart contains date and time information. They are kept in sync with the Event Queue.
+    The DateTimePart contains date and time information. They are kept in sync with the Event Queue: the date and
+    time are computed when read, from the advance of sim time since they were last updated (see SimTimeAnchor).
     """
 
     # --------------------------- class-wide data and signals -----------------------------------
     class Signals(BridgeEmitter):
         # year, month, day, hour, minute, second, microsecond
-        sig_date_time_changed = BridgeSignal(int, int, int, int, int, int, int)
+        sig_date_time_changed = BridgeSignal(int, int, int, int, int, int, int, coalesce=True)
 
     DEFAULT_VISUAL_SIZE = dict(width=6.2, height=3.1)
 
+    VOLATILE_SEARCHABLE_PROPERTIES = ('date_time',)  # derived from sim time
     PART_TYPE_NAME = "datetime"
     DESCRIPTION = """\
         Use this part to define when delayed signals should be sent.  The code that creates the signal should be linked
@@ -92,16 +95,15 @@ class DateTimePart(BasePart):
         BasePart.__init__(self, parent, name=name, position=position)
         self.signals = DateTimePart.Signals()
 
-        self.__date_time = datetime.now()
-        self.__current_sim_time_days = 0.0
-        if parent:
-            sim_controller = self.shared_scenario_state.sim_controller
-            sim_controller.signals.sig_sim_time_days_changed.connect(self.__sim_time_days_changed)
+        self.__date_time = datetime.now()  # as of the last update, see __update_date_time()
+        sim_controller = self.shared_scenario_state.sim_controller if parent else None
+        self.__sim_time_anchor = SimTimeAnchor(sim_controller, self.__on_sim_time_advanced)
 
     def get_date_time(self) -> datetime:
         """
         Get the current data/time setting for the part.
         """
+        self.__update_date_time()
         return self.__date_time
 
     def set_date_time(self, date_time: datetime):
@@ -109,8 +111,10 @@ class DateTimePart(BasePart):
         Set the current date/time value for the part.
         Note: Calling the setter does not cause the associated signal to be raised.
         """
+        self.__update_date_time()
         if self.__date_time != date_time:
             self.__date_time = date_time
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -125,6 +129,7 @@ class DateTimePart(BasePart):
         """
         Get the year portion of the date/time.
         """
+        self.__update_date_time()
         return self.__date_time.year
 
     def set_year(self, new_year: int):
@@ -136,11 +141,13 @@ class DateTimePart(BasePart):
 
         :param new_year: The new year value for the part's date/time attribute.
         """
+        self.__update_date_time()
         if new_year != self.__date_time.year:
             _, max_days = calendar.monthrange(new_year, self.month)
             if self.day > max_days:
                 self.__date_time = self.__date_time.replace(day=max_days)
             self.__date_time = self.__date_time.replace(year=new_year)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -155,6 +162,7 @@ class DateTimePart(BasePart):
         """
         Get the month portion of the date/time.
         """
+        self.__update_date_time()
         return self.__date_time.month
 
     def set_month(self, new_month: int):
@@ -166,11 +174,13 @@ class DateTimePart(BasePart):
 
         :param new_month: The new month value for the part's date/time attribute.
         """
+        self.__update_date_time()
         if new_month != self.__date_time.month:
             _, max_days = calendar.monthrange(self.year, new_month)
             if self.day > max_days:
                 self.__date_time = self.__date_time.replace(day=max_days)
             self.__date_time = self.__date_time.replace(month=new_month)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -185,6 +195,7 @@ class DateTimePart(BasePart):
         """
         Get the days portion of the date/time.
         """
+        self.__update_date_time()
         return self.__date_time.day
 
     def set_day(self, new_day: int):
@@ -196,6 +207,7 @@ class DateTimePart(BasePart):
 
         :param new_day: The new month value for the date/time attribute.
         """
+        self.__update_date_time()
         if new_day != self.__date_time.day:
             _, max_days = calendar.monthrange(self.year, self.month)
             if new_day > max_days:
@@ -203,6 +215,7 @@ class DateTimePart(BasePart):
                             new_day, max_days, self.__date_time.day)
                 new_day = max_days
             self.__date_time = self.__date_time.replace(day=new_day)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -217,6 +230,7 @@ class DateTimePart(BasePart):
         """
         Get the hours portion of the date/time.
         """
+        self.__update_date_time()
         return self.__date_time.hour
 
     def set_hour(self, new_hour: int):
@@ -226,8 +240,10 @@ class DateTimePart(BasePart):
 
         :param new_hour: The new hour value to be set.
         """
+        self.__update_date_time()
         if new_hour != self.__date_time.hour:
             self.__date_time = self.__date_time.replace(hour=new_hour)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -242,6 +258,7 @@ class DateTimePart(BasePart):
         """
         Get the minutes portion of the date/time.
         """
+        self.__update_date_time()
         return self.__date_time.minute
 
     def set_minute(self, new_minute: int):
@@ -251,8 +268,10 @@ class DateTimePart(BasePart):
 
         :param new_minute: The new minute value to be set.
         """
+        self.__update_date_time()
         if new_minute != self.__date_time.minute:
             self.__date_time = self.__date_time.replace(minute=new_minute)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -267,6 +286,7 @@ class DateTimePart(BasePart):
         """
         Get the seconds portion of the date/time.
         """
+        self.__update_date_time()
         return self.__date_time.second
 
     def set_second(self, new_second: int):
@@ -276,8 +296,10 @@ class DateTimePart(BasePart):
 
         :param new_second: The new seconds value to be set.
         """
+        self.__update_date_time()
         if new_second != self.__date_time.second:
             self.__date_time = self.__date_time.replace(second=new_second)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_date_time_changed.emit(self.__date_time.year,
                                                         self.__date_time.month,
@@ -307,6 +329,7 @@ class DateTimePart(BasePart):
         :param seconds: The seconds component of a time delay.
         :return: The simulation time corresponding to this instance's current time plus the specified time delta.
         """
+        self.__update_date_time()
         relative_delta_time = relativedelta(years=years, months=months, days=days,
                                             hours=hours, minutes=minutes, seconds=seconds)
         # A technique to convert a delta to days. The relativedelta is handy when we want to pass all the date time
@@ -314,7 +337,17 @@ class DateTimePart(BasePart):
         # all the date time components but it has total_seconds(). So, we do this:
         new_time = self.__date_time + relative_delta_time
         duration_in_timedelta = new_time - self.__date_time
-        return self.__current_sim_time_days + duration_in_timedelta.total_seconds() * SECONDS_TO_DAYS
+        return self.__sim_time_anchor.sim_time_days + duration_in_timedelta.total_seconds() * SECONDS_TO_DAYS
+
+    @override(BasePart)
+    def on_removing_from_scenario(self, scen_data: Dict[BasePart, Any], restorable: bool = False):
+        BasePart.on_removing_from_scenario(self, scen_data, restorable=restorable)
+        self.__sim_time_anchor.detach()
+
+    @override(BasePart)
+    def on_restored_to_scenario(self, scen_data: Dict[BasePart, Any]):
+        BasePart.on_restored_to_scenario(self, scen_data)
+        self.__sim_time_anchor.attach()
 
     # --------------------------- instance PUBLIC properties and safe_slots ---------------------
 
@@ -359,6 +392,7 @@ class DateTimePart(BasePart):
 
         :return: A simulation time corresponding to the input argument(s).
         """
+        self.__update_date_time()
         try:
             new_time = datetime(year=year, month=month, day=day, hour=hour, minute=minute, second=second)
             time_delta = new_time - self.__date_time
@@ -366,7 +400,7 @@ class DateTimePart(BasePart):
             log.exception("DateTimePart datetime calculation error. Inputs: y({}), m({}), d({}), h({}), m({}), s({}). \
                 Error: {}", year, month, day, hour, minute, second, str(err))
             raise err
-        return self.__current_sim_time_days + (time_delta.total_seconds() * SECONDS_TO_DAYS)
+        return self.__sim_time_anchor.sim_time_days + (time_delta.total_seconds() * SECONDS_TO_DAYS)
 
     # --------------------------- instance _PROTECTED and _INTERNAL methods ---------------------
 
@@ -390,7 +424,8 @@ class DateTimePart(BasePart):
         #2017-10-31 DRWA BUG FIX
         #Fix issue where loaded datetime part has different time than when saved
 
-        delta = self.__date_time - timedelta(days = self.__current_sim_time_days)
+        self.__update_date_time()
+        delta = self.__date_time - timedelta(days = self.__sim_time_anchor.sim_time_days)
 
         ori_def = BasePart._get_ori_def_impl(self, context, **kwargs)
         datetime_ori_def = {
@@ -409,6 +444,7 @@ class DateTimePart(BasePart):
 
     @override(BasePart)
     def _get_ori_snapshot_local(self, snapshot: JsonObj, snapshot_slow: JsonObj):
+        self.__update_date_time()
         BasePart._get_ori_snapshot_local(self, snapshot, snapshot_slow)
         snapshot.update({
             DtKeys.YEAR: self.__date_time.year,
@@ -423,31 +459,26 @@ class DateTimePart(BasePart):
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
-    def __sim_time_days_changed(self, new_sim_time_days: float, sim_time_delta_days: float):
-        """
-        This function is the signal handler for the SimController sig_sim_time_days_changed event.
-        :param new_sim_time_days: The new absolute simulation time according to the Sim Controller.
-        :param sim_time_delta_days: The time delta between the new simulation time and the
-            previously reported simulation time.
-        """
-
-        self.__current_sim_time_days = new_sim_time_days
-
-        # Only update the time values if the simulation time 'delta' passed in is greater than zero. A negative
-        # delta would indicate a simulation reset and the part times don't reset for a sim reset.
-        if sim_time_delta_days > 0:
-            # Update date/time
-            self.__date_time = self.__date_time + timedelta(days=sim_time_delta_days)
-
-            if self._anim_mode_shared:
-                self.signals.sig_date_time_changed.emit(self.__date_time.year,
-                                                        self.__date_time.month,
-                                                        self.__date_time.day,
-                                                        self.__date_time.hour,
-                                                        self.__date_time.minute,
-                                                        self.__date_time.second,
-                                                        self.__date_time.microsecond
-                                                        )
+    def __update_date_time(self):
+        """
+        Add to the date/time the advance of sim time since the last update. Sim resets are not advances: the part
+        times don't reset for a sim reset.
+        """
+        advance_days = self.__sim_time_anchor.take_advance_days()
+        if advance_days > 0:
+            self.__date_time = self.__date_time + timedelta(days=advance_days)
+
+    def __on_sim_time_advanced(self):
+        """Called by the sim time anchor when sim time advances while animated, to update the GUI"""
+        self.__update_date_time()
+        self.signals.sig_date_time_changed.emit(self.__date_time.year,
+                                                self.__date_time.month,
+                                                self.__date_time.day,
+                                                self.__date_time.hour,
+                                                self.__date_time.minute,
+                                                self.__date_time.second,
+                                                self.__date_time.microsecond
+                                                )
 
 
 # Add this part to the global part type/class lookup dictionary
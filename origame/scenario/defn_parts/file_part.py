@@ -138,6 +138,7 @@ class FilePart(BasePart):
                 self.__path = path_str
             else:
                 self.__path = None
+            self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_path_changed.emit(self.__path)
 
@@ -157,6 +158,7 @@ class FilePart(BasePart):
         """
         if is_relative != self.__relative_to_scen_folder:
             self.__relative_to_scen_folder = is_relative
+            self._on_searchable_state_changed()
 
             if self._anim_mode_shared:
                 self.signals.sig_is_relative_to_scen_folder_changed.emit(is_relative)
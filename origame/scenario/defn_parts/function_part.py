@@ -194,6 +194,8 @@ class FunctionPart(ScriptedScenModifierPart, IExecutablePart):
             if role_enum not in self.__run_roles:
                 self.__run_roles.add(role_enum)
                 self._sim_controller.register_part_with_role(self, role_enum)
+                self._on_searchable_state_changed()
+                self._flag_ori_changes()
                 if self._anim_mode_shared:
                     self.func_signals.sig_run_role_added.emit(role_enum.value)
 
@@ -207,6 +209,8 @@ class FunctionPart(ScriptedScenModifierPart, IExecutablePart):
 
                 self.__run_roles.remove(role_enum)
                 self._sim_controller.unregister_part_with_role(self, role_enum)
+                self._on_searchable_state_changed()
+                self._flag_ori_changes()
                 if self._anim_mode_shared:
                     self.func_signals.sig_run_role_removed.emit(role_enum.value)
 
@@ -230,6 +234,7 @@ class FunctionPart(ScriptedScenModifierPart, IExecutablePart):
                 del self.__roles_prioritizing[role]
             else:
                 self.__roles_prioritizing[role] = priority
+            self._flag_ori_changes()
             if self._anim_mode_shared:
                 self.func_signals.sig_run_role_reprioritized.emit(role.value, priority, current_priority)
 
@@ -79,6 +79,9 @@ class HubPart(BasePart):
         it to each variable.  Then any parts needing access to the variables need only link to the hub.
     """
 
+    # ORI state only changes via setters, which flag the changes:
+    _ORI_TRACKS_CHANGES = True
+
     def __init__(self, parent: ActorPart, name: str = None, position: Position = None):
         """
         :param parent: The parent Actor Part to which this instance belongs.
@@ -87,6 +90,8 @@ class HubPart(BasePart):
         """
 
         BasePart.__init__(self, parent, name=name, position=position)
+        # the proxy caches link resolutions, so there must be only one per hub:
+        self.__scripting_proxy = HubPartScriptingProxy(self)
 
     def get_attribute(self, key: str) -> Either[BasePart, object]:
         """
@@ -108,9 +113,21 @@ class HubPart(BasePart):
     def get_as_link_target_part(self) -> Decl.HubPartScriptingProxy:
         """
         Get a proxy that represents hub as a link target so that setattr etc can be provided outside of hub
-        :return: HubPartScriptingProxy(self) which provides setattr and getattr methods
+        :return: the HubPartScriptingProxy of self, which provides setattr and getattr methods
         """
-        return HubPartScriptingProxy(self)
+        return self.__scripting_proxy
+
+    @override(BasePart)
+    def on_outgoing_link_removed(self, link: PartLink):
+        self.__scripting_proxy.invalidate_link_cache(link.name)
+
+    @override(BasePart)
+    def on_outgoing_link_renamed(self, old_name: str, new_name: str):
+        self.__scripting_proxy.invalidate_link_cache(old_name)
+
+    @override(BasePart)
+    def on_link_target_part_changed(self, link: PartLink):
+        self.__scripting_proxy.invalidate_link_cache(link.name)
 
     @override(BasePart)
     def _fwd_link_chain_sources(self,
@@ -198,18 +215,34 @@ class HubPartScriptingProxy:
     requirements for HubParts in Origame script notation. It isolates implementations of the Python special
     methods __setattr__() and __getattr__() from the HubPart class to simplify their implementation and to exploit
     common functionality required in those methods and other similar methods defined in this module.
+
+    Like LinkedPartsScriptingProxy, it caches the resolved target of each link accessed, so that repeated
+    accesses from scripts do not search the hub's links (nor walk node chains) every time. The hub invalidates
+    the cache of a link when the link is removed, renamed or its target changes.
     """
 
     def __init__(self, hub_part: HubPart):
         """
         :param hub_part: The HubPart instance being wrapped by this class.
         """
+        # the caches must be set before _hub_part, as once _hub_part is set, __setattr__ assigns to links:
+        self.__link_target_cache = {}  # link name -> link target part
+        self.__part_frame_cache = {}  # frame reference name (_link_name_) -> part frame
         self._hub_part = hub_part
 
     def get_as_link_target_value(self) -> Decl.HubPartScriptingProxy:
         """Do not want to forward this to proxied hub, because the value is the proxy"""
         return self
 
+    def invalidate_link_cache(self, link_name: str):
+        """
+        Remove the cached target of a link, and of its frame reference. Must be called when the link is
+        removed or renamed, or its target changes.
+        :param link_name: The name of the link.
+        """
+        self.__link_target_cache.pop(link_name, None)
+        self.__part_frame_cache.pop('_{}_'.format(link_name), None)
+
     def __getattr__(self, attr: Any) -> Either[BasePart, object]:
         """
         This function returns the attribute requested of the HubPart or the resolved target of a HubPart link.
@@ -219,18 +252,29 @@ class HubPartScriptingProxy:
         :param attr: The attribute being request of this instance. It will likely be a function or a link name.
         :return: The attribute of the HubPart class or the resolved target of a HubPart link.
         """
+        # only link names are cached, and those are never attributes of the hub, so cache first:
+        target_part = self.__link_target_cache.get(attr)
+        if target_part is not None:
+            return target_part.get_as_link_target_value()
+        part_frame = self.__part_frame_cache.get(attr)
+        if part_frame is not None:
+            return part_frame
+
         if hasattr(self._hub_part, attr):
             return getattr(self._hub_part, attr, None)
+
+        is_frame, _ = check_link_name_is_frame(attr)
+        if is_frame:
+            part_frame = self._hub_part.get_attribute(attr)
+            if part_frame is not None:
+                self.__part_frame_cache[attr] = part_frame
+            return part_frame
         else:
-            # TODO build 3: apply same caching strategy as LinkedPartsScriptingProxy
-            is_frame, _ = check_link_name_is_frame(attr)
-            if is_frame:
-                part_frame = self._hub_part.get_attribute(attr)
-                return part_frame
-            else:
-                part = self._hub_part.get_attribute(attr)
-                target_part = part.get_as_link_target_part()
-                return target_part.get_as_link_target_value()
+            part = self._hub_part.get_attribute(attr)
+            target_part = part.get_as_link_target_part()
+            if target_part is not None:
+                self.__link_target_cache[attr] = target_part
+            return target_part.get_as_link_target_value()
 
     def __setattr__(self, link_name: str, value: Either[BasePart, object]):
         """
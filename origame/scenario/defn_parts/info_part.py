@@ -74,6 +74,9 @@ class InfoPart(BasePart):
         Double-click the part to open its editor and enter information.
     """
 
+    # ORI state only changes via setters, which flag the changes:
+    _ORI_TRACKS_CHANGES = True
+
     # --------------------------- instance (self) PUBLIC methods --------------------------------
 
     def __init__(self, parent: ActorPart, name: str = None, position: Position = None):
@@ -102,6 +105,8 @@ class InfoPart(BasePart):
         """
         if self._text != text:
             self._text = text
+            self._on_searchable_state_changed()
+            self._flag_ori_changes()
             if self._anim_mode_shared:
                 self.signals.sig_text_changed.emit(self._text)
 
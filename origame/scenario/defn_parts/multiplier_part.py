@@ -171,15 +171,16 @@ class MultiplierPart(BasePart, IExecutablePart):
             self.__linking_changed = False
 
         if _as_signal:
-            # Signal all parts pointed at by outgoing links.
+            # Signal all parts pointed at by outgoing links, in one batch since there can be many links
+            parts = []
             for link in self.__sorted_outgoing_links:
                 part = link.target_part_frame.part.get_as_link_target_part()
                 if part is not None:
-                    self._sim_controller.add_event(iexec_part=part, args=args,
-                                                   priority=EventQueue.ASAP_PRIORITY_VALUE)
+                    parts.append(part)
                 else:
                     log.warning("Resolved link target from {} is None, used by multipler {}: can't signal",
                                 link.target_part_frame.part, self)
+            self._sim_controller.add_events(parts, args=args, priority=EventQueue.ASAP_PRIORITY_VALUE)
 
         else:
             # Call all parts pointed at by outgoing links.
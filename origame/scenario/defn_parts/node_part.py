@@ -91,31 +91,53 @@ class NodePart(BasePart):
         A node can only have 1 outgoing link.
     """
 
+    # ORI state only changes via setters, which flag the changes:
+    _ORI_TRACKS_CHANGES = True
+
     # -------------------------------- instance (self) PUBLIC properties -------------------------
 
     def __init__(self, parent: Decl.ActorPart, name: str = None, position: Position = None):
         BasePart.__init__(self, parent, name=name, position=position)
+        # the endpoint found by the last get_endpoint_part(); only valid until a link of the chain changes:
+        self.__endpoint_part = None
+        self.__endpoint_valid = False
 
     def get_endpoint_part(self) -> BasePart:
         """
         If this node is linked to any part except another node, return that part. Else, follow the chain of
-        nodes to the first non-node part, and return that. This uses get_next_part_frame(). Note: follows the
-        chain of nodes every time the method is called, and this search is somewhat expensive.
+        nodes to the first non-node part, and return that. This uses get_next_part_frame(). The part found is
+        cached by every node of the chain, until a link change anywhere downstream in the chain (see
+        on_outgoing_link_added() etc), so the chain is only followed after such a change.
         """
-        # TODO build 3: optimize this by having nodes cache the found part, and have a "cache dirty" flag that
-        #    gets set to true when any node link gets changed, and true gets propagated to all incoming links that
-        #    originate at another node
+        if self.__endpoint_valid:
+            return self.__endpoint_part
+
+        # follow the chain until a non-node part, or a node that has its endpoint cached:
         found_part = None
+        chain = {self}
         node = self
-        while node and not found_part:
+        while True:
             part_frame = node.get_next_part_frame()
             if not part_frame:  # node not connected to any part
                 break
 
-            if part_frame.part.PART_TYPE_NAME == self.PART_TYPE_NAME:
-                node = part_frame.part
-            else:
-                found_part = part_frame.part
+            next_part = part_frame.part
+            if next_part.PART_TYPE_NAME != self.PART_TYPE_NAME:
+                found_part = next_part
+                break
+            if next_part.__endpoint_valid:
+                found_part = next_part.__endpoint_part
+                break
+            if next_part in chain:
+                log.warning('Node {} is part of a loop of nodes, it has no endpoint', self)
+                break
+
+            node = next_part
+            chain.add(node)
+
+        for node in chain:
+            node.__endpoint_part = found_part
+            node.__endpoint_valid = True
 
         return found_part
 
@@ -135,17 +157,17 @@ class NodePart(BasePart):
         part = self.get_endpoint_part()
         return None if part is None else part.get_as_link_target_part()
 
+    @override(BasePart)
+    def on_outgoing_link_added(self, link: PartLink):
+        self.__on_chain_changed()
+
     @override(BasePart)
     def on_outgoing_link_removed(self, link: PartLink):
-        for link in self._part_frame.incoming_links:
-            origin_part = link.source_part_frame.part
-            origin_part.on_link_target_part_changed(link)
+        self.__on_chain_changed()
 
     @override(BasePart)
     def on_link_target_part_changed(self, link: PartLink):
-        for link in self._part_frame.incoming_links:
-            origin_part = link.source_part_frame.part
-            origin_part.on_link_target_part_changed(link)
+        self.__on_chain_changed()
 
     @override(BasePart)
     def can_add_outgoing_link(self, part_type_str: str=None) -> bool:
@@ -172,6 +194,28 @@ class NodePart(BasePart):
 
     # --------------------------- instance _PROTECTED and _INTERNAL methods ---------------------
 
+    # --------------------------- instance __PRIVATE members-------------------------------------
+
+    def __on_chain_changed(self):
+        """
+        Clear the cached endpoint of this node and of every node upstream of it (linked to it directly or through
+        other nodes), and notify the other parts linked to these nodes that their link target changed. This is
+        done without recursion, so that long chains do not exhaust the stack.
+        """
+        nodes = [self]
+        visited = {self}
+        while nodes:
+            node = nodes.pop()
+            node.__endpoint_part = None
+            node.__endpoint_valid = False
+            for link in node._part_frame.incoming_links:
+                origin_part = link.source_part_frame.part
+                if origin_part.PART_TYPE_NAME != self.PART_TYPE_NAME:
+                    origin_part.on_link_target_part_changed(link)
+                elif origin_part not in visited:
+                    visited.add(origin_part)
+                    nodes.append(origin_part)
+
 
 # Add this part to the global part type/class lookup dictionary.
 register_new_part_type(NodePart, NpKeys.PART_TYPE_NODE)
@@ -200,6 +200,8 @@ class PartFrame(IOriSerializable):
 
     # we have 0 or more PartLink children that are ORI serializable
     _ORI_HAS_CHILDREN = True
+    # changes (including those of outgoing links) are flagged to the part:
+    _ORI_TRACKS_CHANGES = True
 
     # properties that can be edited on a frame
     __property_names_for_edit = ['pos_x', 'pos_y', 'name', 'visible', 'comment']
@@ -302,6 +304,8 @@ class PartFrame(IOriSerializable):
 
         self.__outgoing_links[new_link.SESSION_ID] = new_link
         self.__part.on_outgoing_link_added(new_link)
+        self._flag_ori_changes()
+        self.__part._on_searchable_state_changed()
         if self.__anim_mode_shared:
             self.signals.sig_outgoing_link_added.emit(new_link)
             propagation_history = list()
@@ -525,6 +529,8 @@ class PartFrame(IOriSerializable):
             link_name = str(link)
             restore_link_info = link.remove_by_source(restorable=restorable)
             self.__part.on_outgoing_link_removed(link)
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
             if self.__anim_mode_shared:
                 self.signals.sig_outgoing_link_removed.emit(link.SESSION_ID, link_name)
                 propagation_history = list()
@@ -559,6 +565,8 @@ class PartFrame(IOriSerializable):
                 restore_link_info = link.remove_by_source(restorable=restorable)
                 del self.__outgoing_links[link.SESSION_ID]
                 self.__part.on_outgoing_link_removed(link)
+                self._flag_ori_changes()
+                self.__part._on_searchable_state_changed()
                 if self.__anim_mode_shared:
                     self.signals.sig_outgoing_link_removed.emit(link.SESSION_ID, link_name)
                     propagation_history = list()
@@ -592,6 +600,8 @@ class PartFrame(IOriSerializable):
         link.restore_by_source(link_info=info)
 
         self.__part.on_outgoing_link_added(link)
+        self._flag_ori_changes()
+        self.__part._on_searchable_state_changed()
         if self.__anim_mode_shared:
             self.signals.sig_outgoing_link_added.emit(link)
             propagation_history = list()
@@ -683,6 +693,8 @@ class PartFrame(IOriSerializable):
             if self.__anim_mode_shared:
                 self.signals.sig_name_changed.emit(self.__name)
             self.__part.on_frame_name_changed()
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
 
     def get_highest_ifx_actor(self) -> Decl.ActorPart:
         """
@@ -755,6 +767,7 @@ class PartFrame(IOriSerializable):
             self.__part.parent_actor_part._add_ifx_port(self, old_level + 1, new_level)
 
         self.__ifx_level = new_level
+        self._flag_ori_changes()
         self.signals.sig_ifx_level_changed.emit(self.__ifx_level)
 
         return result
@@ -789,6 +802,7 @@ class PartFrame(IOriSerializable):
         # not be restorable to full level (could even be 0)
         max_ifx_level = self.get_max_ifx_level()
         self.__ifx_level = min(restore_info.from_level, max_ifx_level)
+        self._flag_ori_changes()
 
         parent_part = self.__part.parent_actor_part
         assert parent_part is not None
@@ -928,6 +942,7 @@ class PartFrame(IOriSerializable):
         """
         if self.__frame_style != value:
             self.__frame_style = FrameStyleEnum(value)
+            self._flag_ori_changes()
             if self.__anim_mode_shared:
                 self.signals.sig_frame_style_changed.emit(self.__frame_style.value)
 
@@ -952,6 +967,8 @@ class PartFrame(IOriSerializable):
             self.__visible = value
             if self.__anim_mode_shared:
                 self.signals.sig_visible_changed.emit(self.__visible)
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
 
     def get_detail_level(self) -> DetailLevelEnum:
         """
@@ -967,6 +984,7 @@ class PartFrame(IOriSerializable):
         """
         if self.__detail_level != value:
             self.__detail_level = value
+            self._flag_ori_changes()
 
             if self.__anim_mode_shared:
                 self.signals.sig_detail_level_changed.emit(value)
@@ -1059,6 +1077,8 @@ class PartFrame(IOriSerializable):
             if self.__anim_mode_shared:
                 self.signals.sig_position_changed.emit(*self.__position.to_tuple())
             self.__part._on_frame_position_changed()
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
 
     def set_pos_y(self, y: float):
         """Set the y position of the frame, in global scenario coordinates"""
@@ -1067,6 +1087,8 @@ class PartFrame(IOriSerializable):
             if self.__anim_mode_shared:
                 self.signals.sig_position_changed.emit(*self.__position.to_tuple())
             self.__part._on_frame_position_changed()
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
 
     def get_position(self) -> Tuple[float, float]:
         """
@@ -1086,6 +1108,8 @@ class PartFrame(IOriSerializable):
             if self.__anim_mode_shared:
                 self.signals.sig_position_changed.emit(x, y)
             self.__part._on_frame_position_changed()
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
 
     def get_pos_vec(self) -> Position:
         """Get the frame's position as a vector"""
@@ -1094,6 +1118,7 @@ class PartFrame(IOriSerializable):
     def set_pos_from_vec(self, pos: Position):
         """Set the frame's position from a vector"""
         self.__position = pos
+        self._flag_ori_changes()
 
     def get_comment(self) -> str:
         """
@@ -1110,6 +1135,8 @@ class PartFrame(IOriSerializable):
             self.__comment = value
             if self.__anim_mode_shared:
                 self.signals.sig_comment_changed.emit(self.__comment)
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
 
     def get_anim_mode(self) -> bool:
         """
@@ -1117,6 +1144,17 @@ class PartFrame(IOriSerializable):
         """
         return bool(self.__anim_mode_shared)
 
+    def get_searchable_properties(self) -> Dict[str, Any]:
+        """
+        Get the values of the properties of this frame that are searchable, by property name. The outgoing links
+        are searchable by name, as 'outgoing_links[link_name]'.
+        """
+        props = {prop_name: getattr(self, prop_name) for prop_name in self.__property_names_for_edit}
+        for out_link in self.__outgoing_links.values():
+            props['outgoing_links[{}]'.format(out_link.name)] = out_link.name
+
+        return props
+
     def get_matching_properties(self, re_pattern: str) -> List[str]:
         """
         Get the names of all properties of this frame that have a string representation that matches a pattern (case insensitive).
@@ -1127,20 +1165,8 @@ class PartFrame(IOriSerializable):
             and name is 'hell'
         """
         regexp = re.compile(re.escape(re_pattern), re.IGNORECASE)
-        matches = []
-
-        # local properties
-        for prop_name in self.__property_names_for_edit:
-            prop_val_as_str = str(getattr(self, prop_name))
-            if regexp.search(prop_val_as_str):
-                matches.append(prop_name)
-
-        # outgoing links:
-        for out_link in self.__outgoing_links.values():
-            if regexp.search(out_link.name):
-                matches.append('outgoing_links[{}]'.format(out_link.name))
-
-        return matches
+        return [prop_name for prop_name, prop_val in self.get_searchable_properties().items()
+                if regexp.search(str(prop_val))]
 
     def propagate_up_link_chain_change_signal(self, propagation_history: List[int]):
         """
@@ -1153,21 +1179,30 @@ class PartFrame(IOriSerializable):
         part frames.
 
         :param propagation_history: history of part session ID traversed so far (to prevent infinite cycles)
-        """
-        if self.__anim_mode_shared:
-            self.signals.sig_link_chain_changed.emit()
 
-            if self.__part.SESSION_ID in propagation_history:
-                return
-            else:
-                propagation_history.append(self.__part.SESSION_ID)
+        Note: the chain is traversed without recursion, so that long chains (of nodes, typically) do not exhaust
+        the stack.
+        """
+        if not self.__anim_mode_shared:
+            return
 
-            for link in self.__incoming_links:
-                link.source_part_frame.propagate_up_link_chain_change_signal(propagation_history)
+        visited_ids = set(propagation_history)
+        frames = [self]
+        while frames:
+            frame = frames.pop()
+            frame.signals.sig_link_chain_changed.emit()
+            if frame.__part.SESSION_ID in visited_ids:
+                continue
+            visited_ids.add(frame.__part.SESSION_ID)
+            propagation_history.append(frame.__part.SESSION_ID)
+            frames.extend(link.source_part_frame for link in frame.__incoming_links
+                          if link.source_part_frame.__anim_mode_shared)
 
     def on_outgoing_link_renamed(self, old_name: str, new_name: str):
         """Get notified when link has been renamed"""
         self.__part.on_outgoing_link_renamed(old_name, new_name)
+        self._flag_ori_changes()
+        self.__part._on_searchable_state_changed()
         if self.__anim_mode_shared:
             propagation_history = list()
             self.propagate_up_link_chain_change_signal(propagation_history)
@@ -1213,6 +1248,8 @@ class PartFrame(IOriSerializable):
 
                     self.__outgoing_links[link.SESSION_ID] = link
                     self.__part.on_outgoing_link_added(link)
+                    self._flag_ori_changes()
+                    self.__part._on_searchable_state_changed()
                     if self.__anim_mode_shared:
                         self.signals.sig_outgoing_link_added.emit(link)
                         propagation_history = list()
@@ -1390,6 +1427,8 @@ class PartFrame(IOriSerializable):
 
         for link in self.__outgoing_links.values():
             self.__part.on_outgoing_link_removed(link)
+            self._flag_ori_changes()
+            self.__part._on_searchable_state_changed()
         # Will get deleted in self.resolve_ori_link_paths() when called by parent:
         self.__unresolved_ori_links = self.__build_links_from(outgoing_links)
 
@@ -1465,6 +1504,10 @@ class PartFrame(IOriSerializable):
         for link in self.__outgoing_links.values():
             link.set_ori_snapshot_baseline(baseline_id)
 
+    @override(IOriSerializable)
+    def _on_ori_changes_flagged(self):
+        self.__part._flag_ori_changes()
+
     @override(IOriSerializable)
     def _check_ori_diffs(self, other_ori: Decl.ActorPart, diffs: Dict[str, Any], tol_float: float):
         if self.__name != other_ori.name:
@@ -1554,3 +1597,4 @@ class PartFrame(IOriSerializable):
             scale_3d = self.__size.scale_3d
 
         self.__size = Size(width, height, scale_3d=scale_3d)
+        self._flag_ori_changes()
@@ -360,6 +360,9 @@ class LinkWaypoint(IOriSerializable, ScenarioObject):
 
     SCENARIO_OBJECT_TYPE = ScenarioObjectType.waypoint
 
+    # changes are flagged to the link:
+    _ORI_TRACKS_CHANGES = True
+
     class Signals(BridgeEmitter):
         sig_position_changed = BridgeSignal(float, float)  # x, y
 
@@ -408,6 +411,7 @@ class LinkWaypoint(IOriSerializable, ScenarioObject):
         """
         if x != self.__position.x or y != self.__position.y:
             self.__position = Position(x, y)
+            self._flag_ori_changes()
             if self.__anim_mode_shared:
                 self.signals.sig_position_changed.emit(x, y)
 
@@ -418,6 +422,7 @@ class LinkWaypoint(IOriSerializable, ScenarioObject):
     def set_pos_from_vec(self, pos: Position):
         """Set position from a vector"""
         self.__position = pos
+        self._flag_ori_changes()
         if self.__anim_mode_shared:
             self.signals.sig_position_changed.emit(pos.x, pos.y)
 
@@ -464,6 +469,10 @@ class LinkWaypoint(IOriSerializable, ScenarioObject):
             }
         )
 
+    @override(IOriSerializable)
+    def _on_ori_changes_flagged(self):
+        self.__link._flag_ori_changes()
+
         # --------------------------- instance _PROTECTED properties and safe slots -----------------
 
 
@@ -691,6 +700,8 @@ class PartLink(IOriSerializable, ScenarioObject):
 
     # we have 0 or more BasePart children ORI serializable
     _ORI_HAS_CHILDREN = True
+    # changes (including those of waypoints) are flagged to the source part frame:
+    _ORI_TRACKS_CHANGES = True
 
     # All links have a unique ID. It is however specific to the session (does not get saved/loaded with scenario,
     # because pieces of one scenario can be imported into other scenarios)
@@ -1052,6 +1063,7 @@ class PartLink(IOriSerializable, ScenarioObject):
             and not self.__source_part_frame.is_link_temp_name_taken(new_name)):
             old_name = self.__name
             self.__name = new_name
+            self._flag_ori_changes()
             self.__source_part_frame.on_outgoing_link_renamed(old_name, new_name)
             if self.__anim_mode_shared:
                 self.signals.sig_name_changed.emit(new_name)
@@ -1069,6 +1081,7 @@ class PartLink(IOriSerializable, ScenarioObject):
 
         old_name = self.__name
         self.__name = new_name
+        self._flag_ori_changes()
         self.__source_part_frame.on_outgoing_link_renamed(old_name, new_name)
 
         if self.__anim_mode_shared:
@@ -1107,6 +1120,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         """
         if self.__declutter != value:
             self.__declutter = value
+            self._flag_ori_changes()
             if self.__anim_mode_shared:
                 self.signals.sig_link_decluttering_changed.emit(value)
 
@@ -1123,6 +1137,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         """
         if self.__bold != value:
             self.__bold = value
+            self._flag_ori_changes()
             if self.__anim_mode_shared:
                 self.signals.sig_link_bold_changed.emit(value)
 
@@ -1139,6 +1154,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         """
         if self.__visible != value:
             self.__visible = value
+            self._flag_ori_changes()
             if self.__anim_mode_shared:
                 self.signals.sig_link_visibility_changed.emit(value)
 
@@ -1164,6 +1180,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         self.__target_part_frame.detach_incoming_link(self)
         self.__target_part_frame = new_target_frame
         self.__target_part_frame.attach_incoming_link(self)
+        self._flag_ori_changes()
         self.__source_part_frame.part.on_link_target_part_changed(self)
         if self.__anim_mode_shared:
             self.signals.sig_target_changed.emit()
@@ -1178,6 +1195,8 @@ class PartLink(IOriSerializable, ScenarioObject):
         self.__target_part_frame.detach_incoming_link(self)
         self.__target_part_frame = orig_target_frame
         self.__target_part_frame.attach_incoming_link(self)
+        self._flag_ori_changes()
+        self.__source_part_frame.part.on_link_target_part_changed(self)
         if self.__anim_mode_shared:
             self.signals.sig_target_changed.emit()
 
@@ -1192,6 +1211,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         if index is None:
             index = len(self.__link_waypoints)
         self.__link_waypoints.insert(index, waypoint)
+        self._flag_ori_changes()
         if self.__anim_mode_shared:
             self.signals.sig_waypoint_added.emit(index)
         return waypoint
@@ -1204,6 +1224,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         """
         index = self.__link_waypoints.index(waypoint)
         self.__link_waypoints.remove(waypoint)
+        self._flag_ori_changes()
         if self.__anim_mode_shared:
             self.signals.sig_waypoint_removed.emit(index)
         return index
@@ -1215,6 +1236,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         :param index: the index of teh waypoint to restore.
         """
         self.__link_waypoints.insert(index, waypoint)
+        self._flag_ori_changes()
         if self.__anim_mode_shared:
             self.signals.sig_waypoint_added.emit(index)
 
@@ -1250,6 +1272,7 @@ class PartLink(IOriSerializable, ScenarioObject):
         """
         for index, waypoint in zip(indeces, waypoints):
             self.__link_waypoints.insert(index, waypoint)
+            self._flag_ori_changes()
             if self.__anim_mode_shared:
                 self.signals.sig_waypoint_added.emit(index)
 
@@ -1443,6 +1466,11 @@ class PartLink(IOriSerializable, ScenarioObject):
         for waypoint in self.__link_waypoints:
             waypoint.set_ori_snapshot_baseline(baseline_id)
 
+    @override(IOriSerializable)
+    def _on_ori_changes_flagged(self):
+        if self.__source_part_frame is not None:
+            self.__source_part_frame._flag_ori_changes()
+
     def __has_elevated_endpoint(self, part: Decl.BasePart):
         cca = get_cca(self.__source_part_frame.part, self.__target_part_frame.part)
         if cca is part:
@@ -329,7 +329,8 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
     # --------------------------- class-wide data and signals -----------------------------------
 
     class PlotSignals(BridgeEmitter):
-        sig_axes_changed = BridgeSignal()
+        # a plot can be updated at every event of a run, but the GUI only needs the latest figure once per frame:
+        sig_axes_changed = BridgeSignal(coalesce=True)
         sig_script_changed = BridgeSignal(str)
 
     DEFAULT_FACE_COLOR = "white"
@@ -388,6 +389,7 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
         self.__script_str = value
         self.__try_reset_fig = True
         self._update_debuggable_script(self.__script_str)
+        self._on_searchable_state_changed()
 
         if self._anim_mode_shared:
             self.signals.sig_script_changed.emit(value)
@@ -396,7 +398,10 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
         """
         By default, data is cleared every time the update_fig() is called.
         :param setting: Set this to False for update_fig() to leave previous data in axes. This is mostly useful
-            when points need to be added, instead of plotting entirely new data.
+            when points need to be added, instead of plotting entirely new data, and for plots that are updated
+            frequently: the plot() function can then keep the artists it created (lines, scatter collections, etc)
+            and only update their data (via set_data(), set_offsets(), etc), which is much faster than re-creating
+            them. The axes limits are re-computed from the data after each update.
         """
         self.__clear_data_on_each_plot = bool(setting)
 
@@ -466,15 +471,11 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
                 assert hasattr(axes, 'patches')
                 assert hasattr(axes, 'collections')
                 assert hasattr(axes, 'legend_')
-                # remove lines
-                while len(axes.lines):
-                    axes.lines[0].remove()
-                # remove patches
-                while len(axes.patches):
-                    axes.patches[0].remove()
-                # remove collections (to clear scatter plots)
-                while len(axes.collections):
-                    axes.collections[0].remove()
+                # remove lines, patches and collections (to clear scatter plots); removing from the end avoids
+                # shifting the remaining artists of the axes at each removal
+                for artists in (axes.lines, axes.patches, axes.collections):
+                    for artist in reversed(list(artists)):
+                        artist.remove()
                 axes.legend_ = None
                 axes.set_prop_cycle(None)  # reset color cycling
                 axes.relim()  # axes scaling
@@ -483,6 +484,11 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
 
         try:
             self._py_exec(self.__script_update_fig)
+            if not self.__clear_data_on_each_plot:
+                # the data of kept artists may have been changed in place, so the limits must follow:
+                for axes in self.__figure.get_axes():
+                    axes.relim()
+                    axes.autoscale_view()
             self.__plot_update_reqd__possible = False
             if self._anim_mode_shared:
                 self.signals.sig_axes_changed.emit()
@@ -511,6 +517,7 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
         """Set the dpi of the pyplot Figure instance for this part"""
         self.__dpi = dpi
         self.__set_min_content_size(self.__dpi)
+        self._flag_ori_changes()
 
     def export_fig(self, filepath: str, dpi: int = 200, file_format: str = None):
         """
@@ -703,7 +710,7 @@ class PlotPart(BasePart, PyScriptExec, IScriptedPart):
     @override(BasePart)
     def _get_ori_snapshot_local(self, snapshot: JsonObj, snapshot_slow: JsonObj):
         BasePart._get_ori_snapshot_local(self, snapshot, snapshot_slow)
-        snapshot.update({PpKeys.SCRIPT: hash(self.__script_str)})
+        snapshot.update({PpKeys.SCRIPT: hash(self.__script_str), PpKeys.DPI: self.__dpi})
 
     @override(PyScriptExec)
     def _check_compile_and_exec(self):
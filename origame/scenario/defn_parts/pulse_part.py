@@ -173,6 +173,7 @@ class PulsePart(BasePart, IExecutablePart):
         """
         if self.__pulse_period_days != pulse_period_days:
             self.__pulse_period_days = pulse_period_days
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_pulse_period_days_changed.emit(pulse_period_days)
 
@@ -189,6 +190,7 @@ class PulsePart(BasePart, IExecutablePart):
         if state != self.__state:
             self.__state = state
             self.init_pulse_event()
+            self._on_searchable_state_changed()
 
             if self._anim_mode_shared:
                 self.signals.sig_state_changed.emit(state.value)
@@ -205,6 +207,7 @@ class PulsePart(BasePart, IExecutablePart):
         """
         if priority != self.__priority:
             self.__priority = priority
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_priority_changed.emit(priority)
 
@@ -325,15 +328,16 @@ class PulsePart(BasePart, IExecutablePart):
             # Pulse event popped
             assert not self.is_queued
 
-            # Signal all parts pointed at by outgoing links.
+            # Signal all parts pointed at by outgoing links, in one batch since there can be many links
+            parts = []
             for link in self.__sorted_outgoing_links:
                 part = link.target_part_frame.part.get_as_link_target_part()
                 if part is not None:
-                    self.__sim_controller.add_event(iexec_part=part, args=args,
-                                                    priority=EventQueue.ASAP_PRIORITY_VALUE)
+                    parts.append(part)
                 else:
                     log.warning("Resolved link target from {} is None, used by pulse {}: can't signal",
                                 link.target_part_frame.part, self)
+            self.__sim_controller.add_events(parts, args=args, priority=EventQueue.ASAP_PRIORITY_VALUE)
 
             # Put pulse event back on queue at next pulse
             self.init_pulse_event(use_pulse_period=True)
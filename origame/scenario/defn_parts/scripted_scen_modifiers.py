@@ -82,6 +82,7 @@ PartFrames = List[Either[str, PartFrame]]
 
 class Decl(AnnotationDeclarations):
     SimController = 'SimController'
+    SimMetrics = 'SimMetrics'
 
 
 # -- Function definitions -----------------------------------------------------------------------
@@ -97,6 +98,9 @@ class ScriptedScenModifierPart(BasePart, PyScriptExec, IScriptedPart):
     the PyScriptExec base class.
     """
 
+    # ORI state only changes via setters, which flag the changes:
+    _ORI_TRACKS_CHANGES = True
+
     # NOTE: functions that are published in the scripting API must have a consistent API. For instance, functions
     # that work on parts linked from self should be referenced by part frame instead of part, and should all
     # support the part frame being given directly or via the name of a link. This affects for example copy_contents,
@@ -182,6 +186,8 @@ class ScriptedScenModifierPart(BasePart, PyScriptExec, IScriptedPart):
             # reset the namespace since any symbols defined by the script that were added by last execution of script
             # are possible no longer valid:
             self._setup_namespace()
+            self._on_searchable_state_changed()
+            self._flag_ori_changes()
             if self._anim_mode_shared:
                 self.scripting_signals.sig_script_changed.emit(self._script_str)
 
@@ -439,6 +445,7 @@ class ScriptedScenModifierPart(BasePart, PyScriptExec, IScriptedPart):
     def _get_ori_snapshot_local(self, snapshot: JsonObj, snapshot_slow: JsonObj):
         snapshot.update({
             LibKeys.SCRIPT: self._script_str,
+            PsxKeys.SCRIPT_IMPORTS: self.get_all_imports(),
         })
 
     @override(PyScriptExec)
@@ -551,6 +558,15 @@ class SimControllerReaderProxy:
         """Get the number of events currently on the queue"""
         return self._sim_controller.get_num_events()
 
+    def get_metrics(self) -> Decl.SimMetrics:
+        """
+        Get the metrics of the simulation since last reset: number of events processed (num_events,
+        num_asap_events, num_timed_events), events_per_sec, histograms of event processing times and queue
+        depths, and execution times per part (get_part_exec_times(part)). Use to_json() to get all of them.
+        The times are only measured for one event out of sim.metrics.EVENT_SAMPLING_PERIOD.
+        """
+        return self._sim_controller.get_metrics()
+
     runtime_animation = property(get_runtime_animation_setting)
     realtime_mode = property(get_realtime_mode)
     realtime_scale = property(get_realtime_scale)
@@ -561,6 +577,7 @@ class SimControllerReaderProxy:
 
     sim_time_days = property(get_sim_time_days)
     num_events = property(get_num_events)
+    metrics = property(get_metrics)
 
 
 class SimControllerProxy(SimControllerReaderProxy):
@@ -85,6 +85,8 @@ log = logging.getLogger('system')
 
 InCellRange = Either[str, int, Tuple[int, int], Tuple[int, slice], Tuple[slice, int], Tuple[slice, slice]]
 RowOrColSubset = Either[int, Tuple[int, int], None]
+# A rectangular block of cells: (top row index, left column index, rows of cell values):
+CellBlock = Tuple[int, int, List[List[Any]]]
 
 COL_PATTERN = r'^[A-Z]{1,3}_[A-Z]{1,3}$'  # pattern describing a column cell range A_A, A_B, AA_ABC
 ROW_PATTERN = r'^[0-9]+$'  # pattern describing a row cell range
@@ -780,6 +782,49 @@ class ExcelSheet:
 
         return orig_item
 
+    def get_cell_block(self, row_idx: int, col_idx: int, num_rows: int, num_cols: int) -> List[List[Any]]:
+        """
+        This function returns a copy of the cells of a rectangular block of the sheet. The block is clipped to the
+        sheet dimensions, so it has fewer rows and columns than requested if it extends beyond them.
+        :param row_idx: The row index (zero-based) of the top of the block.
+        :param col_idx: The column index (zero-based) of the left of the block.
+        :param num_rows: The number of rows of the block.
+        :param num_cols: The number of columns of the block.
+        :return: The rows of cell values of the block.
+        """
+        return [row[col_idx:col_idx + num_cols] for row in self._sheet_data[row_idx:row_idx + num_rows]]
+
+    @override_optional
+    def apply_cell_diff(self, diff: List[CellBlock]) -> Optional[Tuple[int, int, int, int]]:
+        """
+        This function sets the cells of the given blocks, which typically are the cells changed in an editor. All
+        the blocks are validated before any cell is set.
+        :param diff: The blocks of cells to set.
+        :return: The range (start row idx, end row idx, start col idx, end col idx) that contains all the blocks, or
+            None if diff is empty.
+        :raises: ExcelSheetIndexError - This exception is raised when a block extends beyond the current Sheet part
+            dimensions.
+        :raises: ValueError - This exception is raised when a block has no rows, or has a row with no cells.
+        """
+        if not diff:
+            return None
+
+        for row_idx, col_idx, rows in diff:
+            if not rows or min(len(row) for row in rows) == 0:
+                raise ValueError('Cell block at row {}, column {} is empty or has an empty row'.format(row_idx, col_idx))
+            self.validate_indices(row_idx, col_idx)
+            self.validate_indices(row_idx + len(rows) - 1, col_idx + max(len(row) for row in rows) - 1)
+
+        # the values are set as is, like set_data() does:
+        for row_idx, col_idx, rows in diff:
+            for sheet_row, row in zip(self._sheet_data[row_idx:row_idx + len(rows)], rows):
+                sheet_row[col_idx:col_idx + len(row)] = row
+
+        return (min(row_idx for row_idx, _, _ in diff),
+                max(row_idx + len(rows) - 1 for row_idx, _, rows in diff),
+                min(col_idx for _, col_idx, _ in diff),
+                max(col_idx + max(len(row) for row in rows) - 1 for _, col_idx, rows in diff))
+
     def get_row(self, row_idx: int) -> List[Any]:
         """
         This function returns the list of column values for the specified row.
@@ -1983,6 +2028,7 @@ class SheetPart(BasePart, ExcelSheet):
 
     DEFAULT_VISUAL_SIZE = dict(width=10.0, height=5.1)
     PART_TYPE_NAME = "sheet"
+    HAS_SEARCHABLE_CONTENT = True
     DESCRIPTION = """\
         Sheets organize data in a grid that can be accessed by a function script using standard spreadsheet notation,
         for example 'link.sheet.A1 = 5'.
@@ -1992,6 +2038,10 @@ class SheetPart(BasePart, ExcelSheet):
 
     _ORI_HAS_SLOW_DATA = True
 
+    # Sheets with more cells than this are not put whole in the snapshot for edit: the editor fetches the cells
+    # it shows in blocks (see get_cell_block()) and submits only the cells changed (see apply_cell_diff()).
+    EDIT_SNAPSHOT_MAX_CELLS = 100000
+
     def __init__(self, parent: ActorPart,
                  name: str = None,
                  position: Position = None,
@@ -2013,7 +2063,12 @@ class SheetPart(BasePart, ExcelSheet):
     def get_snapshot_for_edit(self) -> {}:
         data = super().get_snapshot_for_edit()
 
-        data['sheet_data'] = self.get_sheet_data()
+        data['sheet_size'] = (self._num_rows, self._num_cols)
+        if self._num_rows * self._num_cols > self.EDIT_SNAPSHOT_MAX_CELLS:
+            data['sheet_data'] = None
+        else:
+            data['sheet_data'] = self.get_sheet_data()
+        data['sheet_diff'] = []
         data['custom_col_names'] = deepcopy(self.get_named_cols())
         data['all_col_names'] = []
 
@@ -2025,8 +2080,9 @@ class SheetPart(BasePart, ExcelSheet):
         return data
 
     @override(BasePart)
-    def get_matching_properties(self, re_pattern: str) -> List[str]:
-        matches = BasePart.get_matching_properties(self, re_pattern)
+    def get_matching_content(self, re_pattern: str) -> List[str]:
+        """Search the cells for the first one that matches pattern (case insensitive)."""
+        matches = []
 
         regexp = re.compile(re.escape(re_pattern), re.IGNORECASE)
         for row_num, row in enumerate(self._sheet_data):
@@ -2051,6 +2107,19 @@ class SheetPart(BasePart, ExcelSheet):
         if self._anim_mode_shared and orig_item != item:
             self.signals.sig_cell_changed.emit(row_idx, col_idx)
 
+    @override(ExcelSheet)
+    def apply_cell_diff(self, diff: List[CellBlock]) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Executes the super method and then emits one signal to front-end, for the range that contains all the
+        blocks.
+        """
+        changed_range = super().apply_cell_diff(diff)
+
+        if self._anim_mode_shared and changed_range is not None:
+            self.signals.sig_sheet_subset_changed.emit(*changed_range)
+
+        return changed_range
+
     @override(ExcelSheet)
     def set_row(self, row_idx: int, row_data: List[object]):
         """
@@ -2087,6 +2156,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         orig_style = super().set_index_style(style)
+        self._on_searchable_state_changed()
         if self._anim_mode_shared and orig_style != style:
             self.signals.sig_col_idx_style_changed.emit(self._index_style.value)
 
@@ -2141,6 +2211,7 @@ class SheetPart(BasePart, ExcelSheet):
         """
         orig_cols = self.num_cols
         col_idx = super().add_col(col_idx)
+        self._on_searchable_state_changed()
         assert col_idx is not None
         if self._anim_mode_shared and orig_cols != self.num_cols:
             self.signals.sig_cols_added.emit(col_idx, 1)
@@ -2152,6 +2223,7 @@ class SheetPart(BasePart, ExcelSheet):
         """
         orig_cols = self.num_cols
         col_idx = super().add_cols(num_cols, col_idx)
+        self._on_searchable_state_changed()
         assert col_idx is not None
         if self._anim_mode_shared and orig_cols != self.num_cols:
             self.signals.sig_cols_added.emit(col_idx, num_cols)
@@ -2163,6 +2235,7 @@ class SheetPart(BasePart, ExcelSheet):
         """
         orig_cols = self.num_cols
         col_idx = super().delete_col(col_idx)
+        self._on_searchable_state_changed()
         assert col_idx is not None
         if self._anim_mode_shared and orig_cols != self.num_cols:
             self.signals.sig_cols_added.emit(col_idx, -1)
@@ -2174,6 +2247,7 @@ class SheetPart(BasePart, ExcelSheet):
         """
         orig_cols = self.num_cols
         col_idx = super().delete_cols(num_cols, col_idx)
+        self._on_searchable_state_changed()
         assert col_idx is not None
         if self._anim_mode_shared and orig_cols != self.num_cols:
             self.signals.sig_cols_added.emit(col_idx, -1 * num_cols)
@@ -2193,6 +2267,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         super().clear()
+        self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_full_sheet_changed.emit()
 
@@ -2202,6 +2277,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         super().set_col_name(col_idx, name)
+        self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_col_name_changed.emit(col_idx, name)
 
@@ -2211,6 +2287,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         indeces = super().del_col_name(name, col_idx, emit)
+        self._on_searchable_state_changed()
         if indeces is not None and emit and self._anim_mode_shared:
             xls_idx, name_col_idx = indeces
             self.signals.sig_col_name_changed.emit(name_col_idx, xls_idx)
@@ -2223,6 +2300,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         super().set_data(data)
+        self._on_searchable_state_changed()
         if not isinstance(data, TablePart) and self._anim_mode_shared:
             self.signals.sig_full_sheet_changed.emit()
 
@@ -2232,6 +2310,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         super().read_excel(xls_file, xls_sheet, xls_range, accept_empty_cells=accept_empty_cells)
+        self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_full_sheet_changed.emit()
 
@@ -2241,6 +2320,7 @@ class SheetPart(BasePart, ExcelSheet):
         Executes the super method and then emits signal to front-end.
         """
         excel_sheet = super().copyfrom(other_sheet)
+        self._on_searchable_state_changed()
         assert excel_sheet is self  # ensure what is being returned is self
         if self._anim_mode_shared:
             self.signals.sig_full_sheet_changed.emit()
@@ -2317,11 +2397,16 @@ class SheetPart(BasePart, ExcelSheet):
 
     @override(BasePart)
     def _receive_edited_snapshot(self, submitted_data: Dict[str, Any], order: List[str] = None):
-        """Reset the Sheet Part data and signal the Sheet widget to update"""
+        """
+        Reset the Sheet Part data and signal the Sheet widget to update. If the sheet data was left out of the
+        snapshot (see EDIT_SNAPSHOT_MAX_CELLS), only the cells of the submitted diff are set.
+        """
         super()._receive_edited_snapshot(submitted_data, order=order)
 
         # Replace sheet the data and drop column names
-        self.set_data(submitted_data['sheet_data'])
+        if submitted_data.get('sheet_data') is not None:
+            self.set_data(submitted_data['sheet_data'])
+        self.apply_cell_diff(submitted_data.get('sheet_diff'))
 
         # Update the customized column names
         self._named_cols = submitted_data['custom_col_names']
@@ -2405,9 +2490,10 @@ class SheetPart(BasePart, ExcelSheet):
                 SpKeys.DATA: md5_sheet_data,
             })
 
+        # copies so that the snapshot is not modified along with the sheet:
         snapshot.update({
-            SpKeys.COL_WIDTHS: self._col_widths,
-            SpKeys.NAMED_COLS: self._named_cols,
+            SpKeys.COL_WIDTHS: self._col_widths.copy(),
+            SpKeys.NAMED_COLS: self._named_cols.copy(),
             SpKeys.NUM_COLS: self._num_cols,
             SpKeys.NUM_ROWS: self._num_rows,
             SpKeys.INDEX_STYLE: self._index_style
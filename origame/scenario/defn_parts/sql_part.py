@@ -80,6 +80,9 @@ class SqlPart(BasePart, SqlPartExec, IScriptedPart):
         within the SQL, e.g. 'select * from {{link.table}}'.
     """
 
+    # ORI state only changes via setters, which flag the changes:
+    _ORI_TRACKS_CHANGES = True
+
     # --------------------------- instance (self) PUBLIC methods --------------------------------
 
     def __init__(self, parent: ActorPart, name: str = None, position: Position = None):
@@ -125,6 +128,8 @@ class SqlPart(BasePart, SqlPartExec, IScriptedPart):
         :param sql_str: It represents the SQL script.
         """
         self._sql_script_str = sql_str
+        self._on_searchable_state_changed()
+        self._flag_ori_changes()
         if self._anim_mode_shared:
             self.signals.sig_sql_script_changed.emit(sql_str)
 
@@ -411,6 +411,7 @@ class TablePart(BasePart):
 
     DEFAULT_VISUAL_SIZE = dict(width=10.0, height=5.1)
     PART_TYPE_NAME = "table"
+    HAS_SEARCHABLE_CONTENT = True
     DESCRIPTION = """\
         Use this part to create and access a relational database table.
 
@@ -518,12 +519,16 @@ class TablePart(BasePart):
             self.__flag_notify_gui = True
 
     @override(BasePart)
-    def get_matching_properties(self, re_pattern: str) -> List[str]:
+    def get_matching_content(self, re_pattern: str) -> List[str]:
         """
-        Extend basic search to add first column name that has data that matches pattern, if any,
-        and to check if search has been interrupted after every N rows.
+        Search the column names, and the records for the first column name that has data that matches pattern,
+        if any, and check if search has been interrupted after every N rows. The column names are searched here
+        rather than being in the search index, because they are stored in the embedded database.
         """
-        matches = BasePart.get_matching_properties(self, re_pattern)
+        matches = []
+        regexp = re.compile(re.escape(re_pattern), re.IGNORECASE)
+        if regexp.search(str(self.get_column_names())):
+            matches.append('column_names')
 
         num_rows_to_search = 100
         for first_row_to_search in range(0, self.get_number_of_records(), num_rows_to_search):
@@ -1328,7 +1333,7 @@ class TablePart(BasePart):
     # --------------------------- CLASS META data for public API ------------------------
 
     META_AUTO_EDITING_API_EXTEND = ()
-    META_AUTO_SEARCHING_API_EXTEND = (column_names,)
+    META_AUTO_SEARCHING_API_EXTEND = ()  # column names are searched by get_matching_content()
     META_AUTO_ORI_DIFFING_API_EXTEND = ()
     META_AUTO_SCRIPTING_API_EXTEND = (
         database_table_name, get_database_table_name,
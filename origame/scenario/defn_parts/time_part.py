@@ -40,7 +40,7 @@ from ..ori import OriTimePartKeys as TiKeys
 
 from .base_part import BasePart
 from .actor_part import ActorPart
-from .common import Position
+from .common import Position, SimTimeAnchor
 from .part_types_info import register_new_part_type
 
 # -- Meta-data ----------------------------------------------------------------------------------
@@ -69,14 +69,17 @@ log = logging.getLogger('system')
 class TimePart(BasePart):
     """
     The TimePart represents the elapsed time since the part is last reset. The elapsed time is adjusted only when
-    the state of the part is active.
+    the state of the part is active. It is computed when read, from the advance of sim time since it was last
+    updated (see SimTimeAnchor).
     """
 
     # --------------------------- class-wide data and signals -----------------------------------
     class Signals(BridgeEmitter):
-        sig_elapsed_time_changed = BridgeSignal(float, float, float, int)  # days, hours, minutes and seconds
+        # days, hours, minutes and seconds
+        sig_elapsed_time_changed = BridgeSignal(float, float, float, int, coalesce=True)
 
     DEFAULT_VISUAL_SIZE = dict(width=6.2, height=3.4)
+    VOLATILE_SEARCHABLE_PROPERTIES = ('elapsed_time',)  # derived from sim time
     PART_TYPE_NAME = "time"
     DESCRIPTION = """\
         Use this part to track the elapsed time.
@@ -98,12 +101,9 @@ class TimePart(BasePart):
         BasePart.__init__(self, parent, name=name, position=position)
         self.signals = TimePart.Signals()
 
-        self.__elapsed_time = timedelta()
-        self.__current_sim_time_days = 0.0
-
-        if parent:
-            sim_controller = self.shared_scenario_state.sim_controller
-            sim_controller.signals.sig_sim_time_days_changed.connect(self.__sim_time_days_changed)
+        self.__elapsed_time = timedelta()  # as of the last update, see __update_elapsed_time()
+        sim_controller = self.shared_scenario_state.sim_controller if parent else None
+        self.__sim_time_anchor = SimTimeAnchor(sim_controller, self.__on_sim_time_advanced)
 
     def get_elapsed_time(self) -> timedelta:
         """
@@ -112,6 +112,7 @@ class TimePart(BasePart):
         and micro-seconds. In order to get hours, minutes, weeks etc, the caller can use relativedelta,
         or one of the timedelta <-> relativedelta conversion functions.
         """
+        self.__update_elapsed_time()
         return self.__elapsed_time
 
     def set_elapsed_time(self, elapsed_time: timedelta):
@@ -120,10 +121,12 @@ class TimePart(BasePart):
         from the current value.
         :param elapsed_time:
         """
+        self.__update_elapsed_time()
         if self.__elapsed_time != elapsed_time:
             delta = timedelta_to_rel(elapsed_time)
             self.__elapsed_time = timedelta(days=delta.days, hours=delta.hours, minutes=delta.minutes,
                                             seconds=delta.seconds, microseconds=delta.microseconds)
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_elapsed_time_changed.emit(delta.days,
                                                            delta.hours,
@@ -135,11 +138,23 @@ class TimePart(BasePart):
         Sets the elapsed time to zero. It is equivalent to self.set_elapsed_time(timedelta()).
         """
         zero_val = timedelta()
+        self.__update_elapsed_time()
         if self.__elapsed_time != zero_val:
             self.__elapsed_time = zero_val
+            self._on_searchable_state_changed()
             if self._anim_mode_shared:
                 self.signals.sig_elapsed_time_changed.emit(0, 0, 0, 0)
 
+    @override(BasePart)
+    def on_removing_from_scenario(self, scen_data: Dict[BasePart, Any], restorable: bool = False):
+        BasePart.on_removing_from_scenario(self, scen_data, restorable=restorable)
+        self.__sim_time_anchor.detach()
+
+    @override(BasePart)
+    def on_restored_to_scenario(self, scen_data: Dict[BasePart, Any]):
+        BasePart.on_restored_to_scenario(self, scen_data)
+        self.__sim_time_anchor.attach()
+
     # --------------------------- instance PUBLIC properties and safe_slots ---------------------
     elapsed_time = property(get_elapsed_time, set_elapsed_time)
 
@@ -163,10 +178,10 @@ class TimePart(BasePart):
         :return: A simulation time corresponding to the input argument(s).
         """
         delta = (timedelta(weeks=weeks, days=days, hours=hours, minutes=minutes, seconds=seconds) -
-                 self.__elapsed_time)
+                 self.get_elapsed_time())
         delta_in_days = delta.total_seconds() * SECONDS_TO_DAYS
 
-        return self.__current_sim_time_days + delta_in_days
+        return self.__sim_time_anchor.sim_time_days + delta_in_days
 
     # --------------------------- instance _PROTECTED and _INTERNAL methods ---------------------
 
@@ -188,11 +203,11 @@ class TimePart(BasePart):
         #2017-10-31 DRWA BUG FIX
         #Fix issue where loaded time part has different time than when saved
 
-        delta = timedelta_to_rel(self.__elapsed_time)
+        delta = timedelta_to_rel(self.get_elapsed_time())
 
         ori_def = BasePart._get_ori_def_impl(self, context, **kwargs)
         time_ori_def = {
-            TiKeys.DAYS: delta.days - self.__current_sim_time_days,
+            TiKeys.DAYS: delta.days - self.__sim_time_anchor.sim_time_days,
             TiKeys.HOURS: delta.hours,
             TiKeys.MINUTES: delta.minutes,
             TiKeys.SECONDS: delta.seconds
@@ -204,7 +219,7 @@ class TimePart(BasePart):
     @override(BasePart)
     def _get_ori_snapshot_local(self, snapshot: JsonObj, snapshot_slow: JsonObj):
         BasePart._get_ori_snapshot_local(self, snapshot, snapshot_slow)
-        delta = timedelta_to_rel(self.__elapsed_time)
+        delta = timedelta_to_rel(self.get_elapsed_time())
         snapshot.update({
             TiKeys.DAYS: delta.days,
             TiKeys.HOURS: delta.hours,
@@ -216,28 +231,22 @@ class TimePart(BasePart):
 
     # --------------------------- instance __PRIVATE members-------------------------------------
 
-    def __sim_time_days_changed(self, new_sim_time_days: float, sim_time_delta_days: float):
+    def __update_elapsed_time(self):
         """
-        This function is the signal handler for the SimController sig_sim_time_days_changed event.
-        :param new_sim_time_days: The new absolute simulation time according to the Sim Controller.
-        :param sim_time_delta_days: The time delta between the new simulation time and the
-            previously reported simulation time.
+        Add to the elapsed time the advance of sim time since the last update. Sim resets are not advances: the
+        part doesn't reset for a sim reset.
         """
-
-        self.__current_sim_time_days = new_sim_time_days
-
-
-        # Only update the value if the simulation time 'delta' passed in is greater than zero. A negative
-        # delta would indicate a simulation reset and the part doesn't reset for a sim reset.
-        if sim_time_delta_days > 0:
-            self.__elapsed_time += timedelta(days=sim_time_delta_days)
-
-            if self._anim_mode_shared:
-                delta = timedelta_to_rel(self.__elapsed_time)
-                self.signals.sig_elapsed_time_changed.emit(delta.days,
-                                                           delta.hours,
-                                                           delta.minutes,
-                                                           delta.seconds)
+        advance_days = self.__sim_time_anchor.take_advance_days()
+        if advance_days > 0:
+            self.__elapsed_time += timedelta(days=advance_days)
+
+    def __on_sim_time_advanced(self):
+        """Called by the sim time anchor when sim time advances while animated, to update the GUI"""
+        delta = timedelta_to_rel(self.get_elapsed_time())
+        self.signals.sig_elapsed_time_changed.emit(delta.days,
+                                                   delta.hours,
+                                                   delta.minutes,
+                                                   delta.seconds)
 
 
 # Add this part to the global part type/class lookup dictionary
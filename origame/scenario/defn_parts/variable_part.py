@@ -71,7 +71,7 @@ class VariablePart(BasePart):
 
     class Signals(BridgeEmitter):
         sig_editable_str_changed = BridgeSignal(str)
-        sig_obj_changed = BridgeSignal(object)
+        sig_obj_changed = BridgeSignal(object, coalesce=True)
 
     DEFAULT_VISUAL_SIZE = dict(width=8.0, height=3.1)
     PART_TYPE_NAME = "variable"
@@ -131,6 +131,7 @@ class VariablePart(BasePart):
 
         obj_verified = get_verified_eval(editable_str)
         self._editable_str = editable_str
+        self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_editable_str_changed.emit(self._editable_str)
 
@@ -164,6 +165,7 @@ class VariablePart(BasePart):
             self.signals.sig_obj_changed.emit(self._value_obj)
 
         self._editable_str = repr(self._value_obj)
+        self._on_searchable_state_changed()
         if self._anim_mode_shared:
             self.signals.sig_editable_str_changed.emit(self._editable_str)
 
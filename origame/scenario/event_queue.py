@@ -645,6 +645,7 @@ class EventQueue(IOriSerializable):
         sig_queue_cleared = BridgeSignal()
         sig_time_stamps_changed = BridgeSignal(float)  # number of days
         sig_event_added = BridgeSignal(int, EventInfo)  # predecessor ID (CallInfo.unique_id), EventInfo added
+        sig_events_added = BridgeSignal(list)  # list of (predecessor ID, EventInfo added), in order of addition
         sig_event_removed = BridgeSignal(int)  # CallInfo.unique_id
         sig_args_changed = BridgeSignal(CallInfo)
 
@@ -721,6 +722,54 @@ class EventQueue(IOriSerializable):
         self.__add_event(time_days, priority, call_info)
         return call_info
 
+    def add_events(self, time_days: float, priority: float, iexecs: Sequence[IExecutablePart],
+                   args: Tuple = ()) -> List[CallInfo]:
+        """
+        Add an event for each of several executable parts, all with the same time, priority and call arguments.
+        The events are queued in the order of iexecs, exactly as if add_event() had been called for each one, but
+        the queue totals and next-event state are updated, and the signals emitted, only once for the whole batch:
+        sig_queue_totals_changed, and if animation is on, sig_events_added (instead of one sig_event_added per
+        event).
+
+        :param time_days: the simulation time (in days) at which events should be processed; see add_event()
+        :param priority: numerical value of priority, or ASAP_PRIORITY_VALUE if ASAP
+        :param iexecs: executable parts to add, in the order in which they are to be queued
+        :param args: call arguments given to each part when its event eventually gets processed
+        :return: the created CallInfo objects, in the same order as iexecs
+        :raise ValueError: if one of iexecs does not derive from IExecutablePart; no event is added in that case
+        """
+        for iexec in iexecs:
+            if not isinstance(iexec, IExecutablePart):
+                raise ValueError("Event can only be created for callable part (part '{}' of type {} is not callable)"
+                                 .format(iexec.path, iexec.PART_TYPE_NAME))
+
+        if not iexecs:
+            return []
+
+        if time_days is None:
+            time_days = self.__last_pop_time or MIN_EVENT_TIME
+
+        call_infos = []
+        added_events = []
+        for iexec in iexecs:
+            call_info = CallInfo(self.__gen_next_event_id(), iexec, args)
+            event_time_days = self.__insert_event(time_days, priority, call_info)
+            call_infos.append(call_info)
+            if self.__animation_on:
+                # the predecessor must be obtained now, so the GUI can add the events one after the other:
+                event_info = EventInfo(event_time_days, priority, call_info)
+                added_events.append((self.get_predecessor_id(event_info), event_info))
+
+        log.info('{} events added, now {} events on queue',
+                 len(call_infos), self.__num_scheduled_events + self.__asap_queue.num_events)
+
+        self.signals.sig_queue_totals_changed.emit(self.__num_scheduled_events, self.__asap_queue.num_events)
+        if self.__animation_on:
+            self.__update_next_info()
+            self.signals.sig_events_added.emit(added_events)
+
+        return call_infos
+
     def edit_event(self, event_info: EventInfo, new_time_days: float, new_priority: float, new_call_args_str: str):
         """
         Edit an event that is on this queue. Note: if none of the new_ arguments change the event, the event will
@@ -1074,8 +1123,26 @@ class EventQueue(IOriSerializable):
 
     def __add_event(self, time_days: float, priority: float, call_info: CallInfo, predecessor_id: int = None):
         """
-        Queue a CallInfo for given time and priority. When priority=ASAP, time is automatically
-        self.__last_pop_time.
+        Queue a CallInfo for given time and priority, and emit the signals for it. When priority=ASAP, time is
+        automatically self.__last_pop_time.
+        """
+        time_days = self.__insert_event(time_days, priority, call_info, predecessor_id)
+        log.info('Now {} events on queue', self.__num_scheduled_events + self.__asap_queue.num_events)
+
+        # Notifications of new state:
+        self.signals.sig_queue_totals_changed.emit(self.__num_scheduled_events, self.__asap_queue.num_events)
+        if self.__animation_on:
+            self.__update_next_info()
+            event_info = EventInfo(time_days, priority, call_info)
+            predecessor_id = self.get_predecessor_id(event_info)
+            self.signals.sig_event_added.emit(predecessor_id, event_info)
+
+    def __insert_event(self, time_days: float, priority: float, call_info: CallInfo,
+                       predecessor_id: int = None) -> float:
+        """
+        Insert a CallInfo in the proper bin for given time and priority, and update the queue counters of its
+        executable part. No signals are emitted: this is left to caller.
+        :return: the time at which the event was actually queued (see __add_event())
         """
         assert len(self.__sorted_times_keys) == len(self.__scheduled_queue)
         if LOG_RAW_EVENT_PUSH_POP and self.__starttime is None:
@@ -1109,13 +1176,10 @@ class EventQueue(IOriSerializable):
                      call_info.unique_id, call_info.iexec, call_info.iexec.PART_TYPE_NAME, time_days, priority,
                      call_info.args)
 
-        log.info('Now {} events on queue', self.__num_scheduled_events + self.__asap_queue.num_events)
-
         if to_bin is self.__next_bin:
             # event put in next bin, need to update its next-bin counter:
             call_info.iexec.change_count_concurrent_next(+1)
 
-        # Notifications of new state:
         if LOG_RAW_EVENT_PUSH_POP:
             el = "{0}|||{1}|||{2}|||{3}|||{4}|||{5}".format("___push___", time_days, priority,
                                                             "root" + call_info.iexec.path, call_info.args,
@@ -1125,12 +1189,7 @@ class EventQueue(IOriSerializable):
                 f.write("\n")
                 f.close()
 
-        self.signals.sig_queue_totals_changed.emit(self.__num_scheduled_events, self.__asap_queue.num_events)
-        if self.__animation_on:
-            self.__update_next_info()
-            event_info = EventInfo(time_days, priority, call_info)
-            predecessor_id = self.get_predecessor_id(event_info)
-            self.signals.sig_event_added.emit(predecessor_id, event_info)
+        return time_days
 
     def __add_scheduled_event(self, time_days: float, priority: float, call_info: CallInfo,
                               predecessor_id: int) -> TimedEventsQueue:
@@ -21,7 +21,7 @@ from pathlib import Path
 # [2. third-party]
 
 # [3. local]
-from ..core import override_required
+from ..core import override_required, override_optional
 from ..core.typing import Any, Either, Optional, List, Tuple, Sequence, Set, Dict, Iterable, Callable, PathType
 from .ori import OriSchemaEnum, OriScenData
 
@@ -114,26 +114,28 @@ class ScenarioReaderWriter:
             If the pathname already exists, it is deleted and replaced by the a new instance.
         :raises: Exception: An error occurred while saving the specified file.
         """
-        path, pathname = Path(path), str(path)
-        try:
-            if path.exists():
-                if path.is_file():
-                    path.unlink()  # Delete existing file
-                else:
-                    raise IsADirectoryError('Directory specified instead of file path: ' + pathname)
-
-            if not path.parent.exists():
-                path.parent.mkdir(parents=True)
+        return self.__save(self._dump_to_file, ori_scenario, path)
 
-            return self._dump_to_file(ori_scenario, path)
+    def get_save_snapshot(self, ori_scenario: OriScenData) -> Any:
+        """
+        Get an immutable snapshot of the ori scenario data, for save_snapshot(). The snapshot is quick to create
+        compared to the encoding done by save(), and no longer refers to any scenario object, so it can be
+        saved from another thread while the scenario continues to change.
 
-        except Exception as exc:
-            log.exception('Error saving scenario to file "{}": {}', path, exc)
-            raise ScenarioFileSaveError('Error saving file "{}": {}'.format(path, exc))
+        :param ori_scenario: the scenario data, as for save()
+        :return: an object that should only be given to save_snapshot() of an instance of the same class
+        :raises: Exception: An error occurred while creating the snapshot.
+        """
+        return self._get_save_snapshot(ori_scenario)
 
-        log.info('Scenario file saved: {}', path)
+    def save_snapshot(self, snapshot: Any, path: PathType) -> List[str]:
+        """
+        Same as save(), but for a snapshot obtained from get_save_snapshot(). This can be called from any thread.
+        """
+        return self.__save(self._dump_snapshot_to_file, snapshot, path)
 
-    def find_save_error_objs(self, data: any) -> list[str]:
+    @staticmethod
+    def find_save_error_objs(data: any) -> list[str]:
         '''Returns the list of SaveError objects to be saved in the file or loaded from the file'''
         non_serialized_obj = []
     
@@ -159,3 +161,35 @@ class ScenarioReaderWriter:
     def _dump_to_file(self, ori_scenario: OriScenData, path: Path):
         """Derived class must implement writing the provided ORI dict to the given file object"""
         raise ScenarioFormatNotSavable('File format does not support saving to')
+
+    @override_optional
+    def _get_save_snapshot(self, ori_scenario: OriScenData) -> Any:
+        """Derived class that supports saving from a snapshot must return the snapshot of the provided ORI dict"""
+        raise ScenarioFormatNotSavable('File format does not support saving from a snapshot')
+
+    @override_optional
+    def _dump_snapshot_to_file(self, snapshot: Any, path: Path):
+        """Derived class that supports saving from a snapshot must write the snapshot to the given file object"""
+        raise ScenarioFormatNotSavable('File format does not support saving from a snapshot')
+
+    def __save(self, dump: Callable[[Any, Path], List[str]], data: Any, path: PathType) -> List[str]:
+        """Prepare the path for a new file, then dump the data to it. See save() for details."""
+        path, pathname = Path(path), str(path)
+        try:
+            if path.exists():
+                if path.is_file():
+                    path.unlink()  # Delete existing file
+                else:
+                    raise IsADirectoryError('Directory specified instead of file path: ' + pathname)
+
+            if not path.parent.exists():
+                path.parent.mkdir(parents=True)
+
+            non_serialized_obj = dump(data, path)
+
+        except Exception as exc:
+            log.exception('Error saving scenario to file "{}": {}', path, exc)
+            raise ScenarioFileSaveError('Error saving file "{}": {}'.format(path, exc))
+
+        log.info('Scenario file saved: {}', path)
+        return non_serialized_obj
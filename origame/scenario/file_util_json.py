@@ -21,6 +21,7 @@ Version History: See SVN log.
 # [1. standard library]
 import json
 import logging
+import re
 from pathlib import Path
 import datetime
 
@@ -28,9 +29,10 @@ import datetime
 
 # [3. local]
 from ..core import override
-from ..core.typing import Tuple
+from ..core.typing import Any, Tuple, List, Dict
+from ..core.typing import AnnotationDeclarations
 from .file_util_base import ScenarioReaderWriter
-from .ori import OriScenData, SaveError, SaveErrorLocationEnum
+from .ori import OriScenData, OriContextEnum, SaveError, SaveErrorLocationEnum
 
 # -- Meta-data ----------------------------------------------------------------------------------
 
@@ -44,12 +46,27 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 
 __all__ = [
     # public API of module
-    'ScenFileUtilJsonOri'
+    'ScenFileUtilJsonOri',
+    'OriJsonSegmentCache',
+    'dumps_ori',
+    'splice_ori_segments',
 ]
 
 log = logging.getLogger('system')
 
 
+class Decl(AnnotationDeclarations):
+    BasePart = 'BasePart'
+    OriJsonSegmentCache = 'OriJsonSegmentCache'
+
+
+# JSON text of the ORI definition of a part, and the SaveError strings it contains:
+OriJsonSegment = Tuple[str, List[str]]
+
+# placeholder of a segment (OriJsonSegmentCache.PLACEHOLDER) in JSON text created by dumps_ori():
+RE_ORI_SEGMENT_PLACEHOLDER = re.compile(r'^( *)"\\u0000ori-segment:(\d+)"', re.MULTILINE)
+
+
 # -- Function definitions -----------------------------------------------------------------------
 
 def as_python_object(dct):
@@ -61,6 +78,50 @@ def as_python_object(dct):
     #    return set(json.loads(str(dct['_set_object'])))
     return dct
 
+
+def dumps_ori(ori_data: Any, compact: bool = False, sort_keys: bool = True) -> str:
+    """
+    Encode ORI data as JSON text, formatted as in .ori files (non-serializable objects become SaveError's).
+
+    :param compact: if True, the text has no indentation or whitespace; this is much faster to create, and
+        dumps_ori(json.loads(text), sort_keys=False) is then the same as dumps_ori(ori_data)
+    :param sort_keys: if False, the keys of dicts are in the order of ori_data
+    """
+    default = lambda o: SaveError(o, SaveErrorLocationEnum.other).to_json()
+    if compact:
+        return json.dumps(ori_data, separators=(',', ':'), sort_keys=sort_keys, cls=ExtendedJSONEncoder,
+                          default=default)
+    return json.dumps(ori_data, indent=4, separators=(',', ': '), sort_keys=sort_keys, cls=ExtendedJSONEncoder,
+                      default=default)
+
+
+def find_save_errors(jsond: str) -> List[str]:
+    """Get the SaveError strings of JSON text created by dumps_ori(). The text is only decoded if it has some."""
+    if 'SaveError: ' not in jsond:
+        return []
+    return ScenarioReaderWriter.find_save_error_objs(json.loads(jsond))
+
+
+def splice_ori_segments(jsond: str, segments: Dict[int, OriJsonSegment], save_errors: List[str]) -> str:
+    """
+    Replace the OriJsonSegmentCache placeholders of JSON text created by dumps_ori() by the JSON text of
+    the corresponding segments, at the indentation of the placeholder.
+
+    :param jsond: the JSON text that contains placeholders
+    :param segments: the (JSON text, save errors) of each part that has a placeholder, by part session ID
+    :param save_errors: the save errors of jsond; the save errors of the segments spliced in are added to it
+    :return: the new JSON text
+    """
+
+    def replace_placeholder(match) -> str:
+        indent, session_id = match.groups()
+        part_jsond, part_save_errors = segments[int(session_id)]
+        save_errors.extend(error for error in part_save_errors if error not in save_errors)
+        return indent + part_jsond.replace('\n', '\n' + indent)
+
+    return RE_ORI_SEGMENT_PLACEHOLDER.sub(replace_placeholder, jsond)
+
+
 # -- Class Definitions --------------------------------------------------------------------------
 
 class ExtendedJSONEncoder(json.JSONEncoder):
@@ -91,14 +152,141 @@ class ScenFileUtilJsonOri(ScenarioReaderWriter):
 
         return OriScenData(ori_scenario), non_serialized_obj
 
+    def __init__(self, segment_cache: Decl.OriJsonSegmentCache = None):
+        """
+        :param segment_cache: if given, the ORI data to save was obtained with this cache (the ORI data of some
+            parts are placeholders for JSON text held by the cache)
+        """
+        self.__segment_cache = segment_cache
+
     @override(ScenarioReaderWriter)
     def _dump_to_file(self, ori_scenario: OriScenData, path: Path):
-        default = lambda o: SaveError(o, SaveErrorLocationEnum.other).to_json()
-        jsond = json.dumps(ori_scenario, indent=4, separators=(',', ': '), sort_keys=True, cls=ExtendedJSONEncoder, default=default)
+        if self.__segment_cache is None:
+            jsond = dumps_ori(ori_scenario)
+            non_serialized_obj = find_save_errors(jsond)
+        else:
+            jsond, non_serialized_obj = self.__segment_cache.dumps(ori_scenario)
 
         with path.open("w") as f:
             f.write(jsond)
 
-        non_serialized_obj = self.find_save_error_objs(json.loads(jsond))
+        return non_serialized_obj
+
+    @override(ScenarioReaderWriter)
+    def _get_save_snapshot(self, ori_scenario: OriScenData) -> Tuple[str, Dict[int, OriJsonSegment]]:
+        """
+        The snapshot is the compact JSON text of the ORI data (the C encoder creates it several times faster
+        than the indented text), with the segments of the segment cache, if any, that it refers to.
+        """
+        segments = {} if self.__segment_cache is None else self.__segment_cache.get_pending_segments()
+        return dumps_ori(ori_scenario, compact=True), segments
+
+    @override(ScenarioReaderWriter)
+    def _dump_snapshot_to_file(self, snapshot: Tuple[str, Dict[int, OriJsonSegment]], path: Path):
+        compact_jsond, segments = snapshot
+        # keys were sorted when the snapshot was taken, so keep their order (keys that were not strings would
+        # otherwise sort differently once converted to strings):
+        jsond = dumps_ori(json.loads(compact_jsond), sort_keys=False)
+        non_serialized_obj = find_save_errors(jsond)
+        jsond = splice_ori_segments(jsond, segments, non_serialized_obj)
+
+        with path.open("w") as f:
+            f.write(jsond)
 
         return non_serialized_obj
+
+
+class OriJsonSegmentCache:
+    """
+    Cache of the JSON text of the ORI definition of scenario parts, used to save a scenario incrementally
+    to a .ori file: only the parts that have changed since the last save are re-encoded.
+
+    While getting the ORI definition of the scenario (by giving this cache as ori_segments keyword argument of
+    Scenario.get_ori_def()), each actor calls get_part_ori_def() for its non-actor children: this returns a
+    placeholder string that dumps() replaces by the part's JSON text, so the file is exactly the same as that
+    obtained from a full save. The actors and scenario-level data (event queue, etc) are always encoded.
+
+    A cached text is re-used only if the part did not flag ORI changes since it was cached (see
+    mark_part_changed()), and, for parts that do not track their ORI changes, if has_ori_changes() is False.
+    The texts obtained during a save only become the cache if the save succeeds (commit()).
+    """
+
+    PLACEHOLDER = '\0ori-segment:{}'
+
+    def __init__(self):
+        self.__segments = {}  # Dict[BasePart, Tuple[str, List[str]]]: part -> (JSON text, save errors) as last saved
+        self.__pending = {}  # Dict[int, Tuple[BasePart, Tuple[str, List[str]]]]: segments of save in progress
+        self.__changed_parts = set()
+        self.__num_encoded = 0
+
+    def mark_part_changed(self, part: Decl.BasePart):
+        """Indicate that the ORI state of given part has changed, so its cached text must not be used"""
+        if part in self.__segments:
+            self.__changed_parts.add(part)
+
+    def clear(self):
+        """Drop all cached texts: the next save will encode every part"""
+        self.__segments.clear()
+        self.__pending.clear()
+        self.__changed_parts.clear()
+
+    def get_part_ori_def(self, part: Decl.BasePart, context: OriContextEnum) -> str:
+        """
+        Get the placeholder to use in lieu of part.get_ori_def(context). The part is encoded as JSON if
+        it does not have valid cached text.
+        """
+        assert context == OriContextEnum.save_load
+        segment = self.__segments.get(part)
+        if (segment is None or part in self.__changed_parts
+                or (not part._ORI_TRACKS_CHANGES and part.has_ori_changes())):
+            segment = self.__encode(part.get_ori_def(context=context))
+            self.__num_encoded += 1
+
+        self.__pending[part.SESSION_ID] = (part, segment)
+        return self.PLACEHOLDER.format(part.SESSION_ID)
+
+    def dumps(self, ori_data: OriScenData) -> Tuple[str, List[str]]:
+        """
+        Encode the ORI data of a scenario, obtained with this cache since the last commit() or discard(), as JSON.
+        :return: the JSON text, and the list of SaveError strings that it contains
+        """
+        jsond, save_errors = self.__encode(ori_data)
+        return splice_ori_segments(jsond, self.get_pending_segments(), save_errors), save_errors
+
+    def get_pending_segments(self) -> Dict[int, OriJsonSegment]:
+        """
+        Get the segments obtained since the last commit() or discard(), by part session ID. The dict is a copy
+        so it can be used from another thread.
+        """
+        return {session_id: segment for session_id, (_, segment) in self.__pending.items()}
+
+    def commit(self):
+        """
+        Call when the save has succeeded: the texts used by that save become the cache (so the texts of parts
+        no longer in the scenario are dropped).
+        """
+        log.debug("ORI segment cache: {} of {} parts encoded", self.__num_encoded, len(self.__pending))
+        self.__segments = {part: segment for part, segment in self.__pending.values()}
+        self.__pending = {}
+        self.__changed_parts.clear()
+        self.__num_encoded = 0
+
+    def discard(self):
+        """Call when the save has failed: the cache is unchanged"""
+        self.__pending = {}
+        self.__num_encoded = 0
+
+    def get_num_encoded(self) -> int:
+        """Get the number of parts encoded since the last commit() or discard()"""
+        return self.__num_encoded
+
+    def get_num_parts(self) -> int:
+        """Get the number of parts that have cached text"""
+        return len(self.__segments)
+
+    num_encoded = property(get_num_encoded)
+    num_parts = property(get_num_parts)
+
+    def __encode(self, ori_data: Any) -> Tuple[str, List[str]]:
+        jsond = dumps_ori(ori_data)
+        return jsond, find_save_errors(jsond)
@@ -85,3 +85,17 @@ class ScenFileUtilPickle(ScenarioReaderWriter):
         non_serialized_obj = self.find_save_error_objs(pickle.loads(pickled))
 
         return non_serialized_obj
+
+    @override(ScenarioReaderWriter)
+    def _get_save_snapshot(self, ori_scenario: OriScenData) -> bytes:
+        """The snapshot is the pickled ORI data"""
+        return pickle.dumps(ori_scenario)
+
+    @override(ScenarioReaderWriter)
+    def _dump_snapshot_to_file(self, pickled: bytes, path: Path):
+        with path.open("wb") as file_obj:
+            file_obj.write(pickled)
+
+        non_serialized_obj = self.find_save_error_objs(pickle.loads(pickled))
+
+        return non_serialized_obj
@@ -19,6 +19,7 @@ Version History: See SVN log.
 
 # [1. standard library]
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path, PureWindowsPath
 from distutils.dir_util import copy_tree
 import logging
@@ -34,7 +35,7 @@ from ..core.typing import Any, Either, Optional, List, Tuple, Sequence, Set, Dic
 
 from .defn_parts import ActorPart, BasePart
 from .scenario import Scenario
-from .file_util_base import ScenarioFileNotFoundError
+from .file_util_base import ScenarioFileNotFoundError, ScenarioReaderWriter
 from .file_util_json import ScenFileUtilJsonOri
 from .file_util_prototype import ScenFileUtilPrototype
 from .file_util_pickle import ScenFileUtilPickle
@@ -269,6 +270,9 @@ class ScenarioManager:
         self.signals = ScenarioManager.Signals(thread=thread, thread_is_main=is_main_thread)
         self.__scenario = None  # The current scenario definition object
         self.__anim_mode_constness = True  # constant and True by default
+        self.__save_executor = None  # created at first save_async()
+        self.__async_save = None  # Future of last save_async()
+        self.__async_save_failed = False
         UniqueIdGenerator.reset()  # assumes one instance per app session
 
     def config_logging(self, config: argparse.Namespace):
@@ -342,7 +346,13 @@ class ScenarioManager:
         Determine if the scenario file has unsaved changes.
         :return: True if there are changes, False if no changes since last load or save
         """
-        has_changes = False if self.__scenario is None else self.__scenario.has_ori_changes()
+        if self.__scenario is None:
+            has_changes = False
+        else:
+            # a failed save_async() has set the ORI baseline as though the scenario had been saved:
+            if self.__async_save is not None and self.__async_save.done():
+                self.wait_for_async_save()
+            has_changes = self.__async_save_failed or self.__scenario.has_ori_changes()
         log.info("Checked for changes in scenario: {}", has_changes)
         return has_changes
 
@@ -352,6 +362,8 @@ class ScenarioManager:
         :return: The new default scenario definition.
         """
         log.info("New scenario requested")
+        self.wait_for_async_save()
+        self.__async_save_failed = False
         orig_scenario = self.__scenario
         self.__scenario = Scenario(anim_mode_constness=self.__anim_mode_constness)
 
@@ -382,6 +394,8 @@ class ScenarioManager:
             scenario file format is invalid.
         """
         log.info("Scenario load of '{}' requested", path)
+        self.wait_for_async_save()
+        self.__async_save_failed = False
         orig_scenario = self.__scenario
         path = Path(path)
         scen_ori_def, path, non_serialized_obj = self.__load_ori(path)
@@ -414,37 +428,82 @@ class ScenarioManager:
 
         return self.__scenario, non_serialized_obj
 
-    def save(self, path: PathType = None) -> list[str]:
+    def save(self, path: PathType = None, incremental: bool = False) -> list[str]:
         """
         This function saves the current scenario to the specified path. The function serves double-duty for 'save' and
         'save as' operations. If a file already exists at the specified path it will be overwritten without warning.
         If a path is not specified, the last loaded or saved filename is used.
         Prototype database (.db) and Origame scenario (.ori) file formats are supported.
         :param path: The full path at which to save the file.
+        :param incremental: if True, and the scenario is saved to the .ori file it was last saved to, only the parts
+            that have changed since then are re-encoded (the JSON text of the other parts is re-used); otherwise,
+            the whole scenario is encoded.
         """
-        path = Path(path or self.__scenario.filepath)
-        assert path
+        log.info("Save scenario to '{}' requested", path or self.__scenario.filepath)
+        self.wait_for_async_save()
+        path = self.__get_save_path(path)
+        incremental = incremental and path == self.__scenario.filepath
+        non_serialized_obj = self.__save_ori(path, self.__scenario, incremental=incremental)
 
-        log.info("Save scenario to '{}' requested", path)
+        log.info("Scenario saving completed successfully")
 
-        # If the specified filename doesn't include an extension, the Origame file extension is assumed and
-        # appended to the filename.
-        path_suffix = path.suffix
-        if not path_suffix:
-            path_suffix = self.ORIGAME_EXTENSION
-            path = path.with_suffix(path_suffix)
+        return non_serialized_obj
 
-        non_serialized_obj = self.__save_ori(path, self.__scenario)
+    def save_async(self, path: PathType = None, incremental: bool = False) -> Future:
+        """
+        Same as save(), but only the ORI data of the scenario is obtained by this call, along with a snapshot
+        of it that no longer refers to the scenario: the formatting and writing of the snapshot to the file are
+        done in a worker thread, so the scenario can be used while the file is being written. The scenario is
+        considered saved as soon as this returns (its filepath is set, the filepath signal is emitted and it
+        has no more ORI changes), but sig_scenario_saved is only emitted (from the worker thread) once the file
+        has been written; if the write fails, check_for_changes() returns True until the next successful save.
 
-        log.info("Scenario saving completed successfully")
+        The snapshot is the compact JSON text of the ORI data, so the encoding of the ORI data is done by this
+        call: the ORI data refers to the state of the parts (the value of variables, the named columns of sheets,
+        etc), which the scenario continues to change, and copying it would take about as long as encoding it.
 
-        return non_serialized_obj
+        Only one save can be in progress at a time: save(), save_async(), load(), new_scenario() and
+        shutdown() first wait for the previous save_async() to complete.
+
+        :return: the future of the write: its result() is the list of non-serializable objects (as returned by
+            save()), or it raises the exception that save() would have raised
+        :raises: Exception: An error occurred while getting the ORI data or the snapshot.
+        """
+        log.info("Asynchronous save of scenario to '{}' requested", path or self.__scenario.filepath)
+        self.wait_for_async_save()
+        path = self.__get_save_path(path)
+        incremental = incremental and path == self.__scenario.filepath
+        save_util, snapshot = self.__save_ori(path, self.__scenario, incremental=incremental, snapshot=True)
+
+        if self.__save_executor is None:
+            self.__save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ScenarioSave')
+        self.__async_save = self.__save_executor.submit(save_util.save_snapshot, snapshot, path)
+        self.__async_save.add_done_callback(self.__on_async_save_done)
+
+        return self.__async_save
+
+    def wait_for_async_save(self):
+        """
+        Wait for the last save_async() to complete. Does nothing if there is no save in progress. Any error
+        of the save is not raised (it is available from the future returned by save_async()).
+        """
+        async_save = self.__async_save
+        if async_save is None:
+            return
+
+        if not async_save.done():
+            log.info("Waiting for asynchronous scenario save to complete")
+        if async_save.exception() is not None:
+            self.__async_save_failed = True
+        self.__async_save = None
 
     def erase_scenario_file(self):
         """Remove the saved scenario from filesystem. Does nothing if never saved."""
         if self.__scenario is None:
             return
 
+        self.wait_for_async_save()
+
         filepath = self.__scenario.filepath
         if filepath is None:
             return
@@ -519,6 +578,11 @@ class ScenarioManager:
 
     def shutdown(self):
         """Shutdown the manager. It is no longer usable after this call."""
+        self.wait_for_async_save()
+        if self.__save_executor is not None:
+            self.__save_executor.shutdown()
+            self.__save_executor = None
+
         if self.__scenario is not None:
             self.__scenario.shutdown()
             self.__scenario = None
@@ -575,11 +639,31 @@ class ScenarioManager:
 
         return ori_scenario, path, non_serialized_obj
 
-    def __save_ori(self, path: Path, scenario: Scenario) -> list[str]:
+    def __get_save_path(self, path: Either[PathType, None]) -> Path:
+        """
+        Get the path to save the current scenario to: the scenario's filepath if path is None. If the path
+        doesn't include an extension, the Origame file extension is assumed and appended to the filename.
+        """
+        path = Path(path or self.__scenario.filepath)
+        assert path
+
+        if not path.suffix:
+            path = path.with_suffix(self.ORIGAME_EXTENSION)
+
+        return path
+
+    def __save_ori(self, path: Path, scenario: Scenario, incremental: bool = False,
+                   snapshot: bool = False) -> Either[list[str], Tuple[ScenarioReaderWriter, Any]]:
         """
         Save a scenario instance to file system.
         :param path: path to .ORI file in which to save scenario
         :param scenario: instance to save
+        :param incremental: if True, re-use the JSON text cached by the last save of scenario for the parts that
+            have not changed since then (only for .ori format)
+        :param snapshot: if True, the file is not written: the scenario is considered saved once a snapshot of its
+            ORI data has been obtained from the file writer
+        :return: the list of non-serializable objects; if snapshot is True, the file writer and the snapshot
+            to give to its save_snapshot()
         """
         # create the file writer:
         path_suffix = path.suffix
@@ -591,17 +675,38 @@ class ScenarioManager:
         if SaveUtil is None:
             log.error("Cannot save unresolved scenario file type: {}", path)
             raise RuntimeError("The Scenario type (" + path_suffix + ") specified for save is invalid")
-        save_util = SaveUtil()
+        # the JSON segment cache is always filled when saving the current scenario to .ori, so the next save can
+        # be incremental; a non-incremental save re-encodes everything:
+        segment_cache = None
+        # after an incremental save, only the parts that have changes flagged need a new ORI baseline:
+        saved_baseline_id = OriBaselineEnum.current
+        if SaveUtil is ScenFileUtilJsonOri and scenario is self.__scenario:
+            segment_cache = scenario.shared_state.ori_segment_cache
+            # the cache was committed by a save_async() that then failed, so it can't be trusted:
+            if incremental and not self.__async_save_failed:
+                segment_cache.discard()
+                saved_baseline_id = OriBaselineEnum.changed
+            else:
+                segment_cache.clear()
+        if segment_cache is None:
+            save_util = SaveUtil()
+        else:
+            save_util = SaveUtil(segment_cache=segment_cache)
 
         # get the scenario's ORI data:
-        ori_scenario = scenario.get_ori_def(context=OriContextEnum.save_load)
+        ori_scenario = scenario.get_ori_def(context=OriContextEnum.save_load, ori_segments=segment_cache)
         image_manager = ImageManager()
         image_manager.post_process_image_dict_ori(path, image_dict_ori=ori_scenario[ScKeys.IMAGE_DICT])
         log.info("Got ORI definition data from scenario instance")
         try:
-            non_serialized_obj = save_util.save(ori_scenario, path)
+            if snapshot:
+                ori_snapshot = save_util.get_save_snapshot(ori_scenario)
+            else:
+                non_serialized_obj = save_util.save(ori_scenario, path)
         except Exception:
             scenario.set_ori_snapshot_baseline(OriBaselineEnum.existing)
+            if segment_cache is not None:
+                segment_cache.discard()
             raise
 
         # now that the commit has succeeded, commit the path to scenario:
@@ -613,11 +718,27 @@ class ScenarioManager:
             image_manager.pre_process_image_dict_ori(path, ori_scenario[ScKeys.IMAGE_DICT])
             scenario.image_dictionary.update_image_paths(ori_scenario[ScKeys.IMAGE_DICT])
 
-        scenario.set_ori_snapshot_baseline(OriBaselineEnum.current)
+        scenario.set_ori_snapshot_baseline(saved_baseline_id)
+        if segment_cache is not None:
+            segment_cache.commit()
         if scenario is self.__scenario:
+            self.__async_save_failed = False
             # only emit saved signals if the scenario to save is the current one
             # i.e. not for exported scenarios
             self.signals.sig_scenario_filepath_changed.emit(str(path))
-            self.signals.sig_scenario_saved.emit()
+            # a snapshot is not saved until save_async() has written it:
+            if not snapshot:
+                self.signals.sig_scenario_saved.emit()
 
+        if snapshot:
+            return save_util, ori_snapshot
         return non_serialized_obj
+
+    def __on_async_save_done(self, async_save: Future):
+        """Called (from the save worker thread) when the write of a save_async() has completed"""
+        exc = async_save.exception()
+        if exc is None:
+            log.info("Asynchronous scenario saving completed successfully")
+            self.signals.sig_scenario_saved.emit()
+        else:
+            log.error("Asynchronous scenario saving failed: {}", exc)
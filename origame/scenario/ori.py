@@ -207,6 +207,9 @@ class OriBaselineEnum(IntEnum):
     existing = 1  # use the existing baseline already saved
     current = 2  # create a new baseline based on current state
     last_get = 3  # use the baseline that was saved as part of the last get_ori_def() (and discard existing)
+    # like current, but objects that track changes and have none flagged keep their existing baseline (which is
+    # their current state), and so do their ORI children when the object tracks which of them have changes:
+    changed = 4
 
 
 @unique
@@ -344,6 +347,17 @@ class IOriSerializable:
     supports changes occurring via scripting and GUI, and changes being reverted. Some breakdown of has_ori_changes()
     into several steps decreases the likelihood that user will have to wait more than a split second to know if
     there are unsaved changes, even for a rather large scenario.
+
+    Derived classes whose ORI state only changes via methods that they control can avoid most of the traversal
+    by tracking changes: such a class sets _ORI_TRACKS_CHANGES to True and calls _flag_ori_changes() every time
+    its ORI state, or the ORI state of one of its ORI children, changes. The flag is cleared when the current state
+    becomes the baseline. As long as the flag is not set, has_ori_changes() returns False without taking a snapshot and without
+    checking the children, which must therefore flag their changes to their ORI parent (via an override of
+    _on_ori_changes_flagged()). When the flag is set, the snapshots are compared as usual, so reverted changes
+    are still detected as "no changes". Objects that don't track changes (such as parts that scripts can modify
+    in place) are always compared; a container that tracks changes but has such children must include them in
+    _needs_ori_check(). Setting VERIFY_ORI_CHANGES_TRACKING to True causes the snapshots of objects that track
+    changes to always be compared, and an error to be logged if a change was not flagged (for debugging).
     """
 
     # Any derived class that uses _has_ori_changes_children() must have this set to true
@@ -352,12 +366,19 @@ class IOriSerializable:
     # Any derived class that uses _has_ori_changes_slow() must have this set to true
     _ORI_HAS_SLOW_DATA = False
 
+    # Any derived class that calls _flag_ori_changes() whenever its ORI state changes can set this to true
+    _ORI_TRACKS_CHANGES = False
+
+    # Set to True to verify, via snapshot comparison, that objects which track changes flag all of them:
+    VERIFY_ORI_CHANGES_TRACKING = False
+
     __ORI_FAST_DATA_INDEX, __ORI_SLOW_DATA_INDEX = 0, 1
 
     def __init__(self):
         """By default, an IOriSerializable does not have any baseline so it will default to "has changes"."""
         self._ori_snapshot_locals_baseline = None
         self._ori_snapshot_locals_last_get = None
+        self.__ori_changes_flagged = True
 
     def set_from_ori(self,
                      ori_data: OriScenData,
@@ -387,50 +408,33 @@ class IOriSerializable:
         _has_ori_changes_slow() to derived class can compare costly data to baseline.
         If _ORI_HAS_CHILDREN is true, calls _has_ori_changes_children() so derived class can call
         has_ori_changes() on all its children.
+
+        If _ORI_TRACKS_CHANGES is true, all this is skipped (and False returned) unless _needs_ori_check() is true.
         """
         if self._ori_snapshot_locals_baseline is None:
             return True
 
-        # Oliver FIXME: should only get slow data if fast_changed False
-        self._ori_snapshot_locals_last_get = (JsonObj(), JsonObj())
-        self._get_ori_snapshot_local(*self._ori_snapshot_locals_last_get)
-        # first check fast data:
-        fast_data = self._ori_snapshot_locals_last_get[self.__ORI_FAST_DATA_INDEX]
-        fast_changed = (fast_data != self._ori_snapshot_locals_baseline[self.__ORI_FAST_DATA_INDEX])
-        if fast_changed:
-            self.__log_ori_change()
-            return True
+        if self._ORI_TRACKS_CHANGES and not self._needs_ori_check():
+            if self.VERIFY_ORI_CHANGES_TRACKING and self.__has_ori_changes_snapshots():
+                log.error('ORI change tracking failed: "{}" has changes that were not flagged', self._ori_id())
+                return True
+            return False
 
-        # no fast changes, get slow and check it:
-        if self._ORI_HAS_SLOW_DATA:
-            last_get = self._ori_snapshot_locals_last_get[self.__ORI_SLOW_DATA_INDEX]
-            baseline = self._ori_snapshot_locals_baseline[self.__ORI_SLOW_DATA_INDEX]
-            has_slow_change = self._has_ori_changes_slow(baseline, last_get)
-            if has_slow_change:
-                self.__log_ori_change('"slow"')
-            return has_slow_change
+        return self.__has_ori_changes_snapshots()
 
-        if self._ORI_HAS_CHILDREN:
-            has_child_change = self._has_ori_changes_children()
-            if has_child_change:
-                self.__log_ori_change('child')
-            return has_child_change
-
-        # no slow data changed either, done:
-        return False
-
-    def get_ori_def(self, context: OriContextEnum = OriContextEnum.save_load) -> JsonObj:
+    def get_ori_def(self, context: OriContextEnum = OriContextEnum.save_load, **kwargs) -> JsonObj:
         """
         Get a data structure that represents the current state of this instance, according to the ORI schema.
         Also creates a temporary baseline from this state by calling derived _get_ori_snapshot_local(fast, slow).
         The temp baseline should be "committed" or dropped via a suitable call to set_ori_snapshot_baseline().
         :param context: The context under which the function is being called (save, copy, or export).
+        :param kwargs: settings that will be passed as-is to _get_ori_def_impl(context, **kwargs)
         """
         if self._ori_snapshot_locals_last_get is None:
             self._ori_snapshot_locals_last_get = ({}, {})
             self._get_ori_snapshot_local(*self._ori_snapshot_locals_last_get)
 
-        return self._get_ori_def_impl(context)
+        return self._get_ori_def_impl(context, **kwargs)
 
     def set_ori_snapshot_baseline(self, baseline_id: OriBaselineEnum):
         """
@@ -439,17 +443,27 @@ class IOriSerializable:
         IOriSerializable the new baseline.
 
         :param baseline_id: value to indicate which baseline to keep: current to create a new one based on current
-            state; last_get to keep the one created by get_ori_def(); existing to drop the one created by
-            get_ori_def().
+            state; changed to do the same only for the objects that have changes flagged or don't track changes;
+            last_get to keep the one created by get_ori_def(); existing to drop the one created by get_ori_def().
         """
-        if baseline_id == OriBaselineEnum.current:
+        self_baseline_id = baseline_id  # the children get the original one
+        if baseline_id == OriBaselineEnum.changed:
+            if (self._ORI_TRACKS_CHANGES and not self.__ori_changes_flagged and not self.VERIFY_ORI_CHANGES_TRACKING
+                    and self._ori_snapshot_locals_baseline is not None):
+                self._ori_snapshot_locals_last_get = None
+            else:
+                self_baseline_id = OriBaselineEnum.current
+
+        if self_baseline_id == OriBaselineEnum.current:
             self._ori_snapshot_locals_baseline = ({}, {})
             self._get_ori_snapshot_local(*self._ori_snapshot_locals_baseline)
             self._ori_snapshot_locals_last_get = None
+            self.__ori_changes_flagged = False
 
         if baseline_id == OriBaselineEnum.last_get:
             self._ori_snapshot_locals_baseline = self._ori_snapshot_locals_last_get
             self._ori_snapshot_locals_last_get = None
+            # the flag is kept: changes flagged since the get_ori_def() are not in this baseline
 
         if baseline_id == OriBaselineEnum.existing:
             self._ori_snapshot_locals_last_get = None
@@ -565,6 +579,36 @@ class IOriSerializable:
         """
         raise NotImplementedError('Derived class that has _ORI_HAS_CHILDREN=True must override this')
 
+    def _flag_ori_changes(self):
+        """
+        Derived classes that have _ORI_TRACKS_CHANGES true must call this whenever their ORI state changes (see
+        class docstring). The first call since the last baselining calls _on_ori_changes_flagged().
+        """
+        if not self.__ori_changes_flagged:
+            self.__ori_changes_flagged = True
+            self._on_ori_changes_flagged()
+
+    def _is_ori_changes_flagged(self) -> bool:
+        """True if _flag_ori_changes() was called since the last baselining (always True if never baselined)"""
+        return self.__ori_changes_flagged
+
+    @override_optional
+    def _on_ori_changes_flagged(self):
+        """
+        Called when changes get flagged via _flag_ori_changes(). Derived classes that are ORI children of an object
+        that tracks changes must override this to flag the change in their ORI parent. By default, does nothing.
+        """
+        pass
+
+    @override_optional
+    def _needs_ori_check(self) -> bool:
+        """
+        Only used if _ORI_TRACKS_CHANGES is true: return True if has_ori_changes() must compare the snapshots
+        and check the children. By default, this is the case when changes have been flagged. A derived class that
+        has children which do not track changes must extend this.
+        """
+        return self.__ori_changes_flagged
+
     @override_optional
     def _ori_id(self) -> str:
         """
@@ -584,6 +628,38 @@ class IOriSerializable:
         """
         return
 
+    def __has_ori_changes_snapshots(self) -> bool:
+        """
+        Compare the current snapshot of local data to the baseline, first the fast data, then the slow data (if
+        _ORI_HAS_SLOW_DATA); if no changes, check the children (if _ORI_HAS_CHILDREN).
+        """
+        self._ori_snapshot_locals_last_get = (JsonObj(), JsonObj())
+        self._get_ori_snapshot_local(*self._ori_snapshot_locals_last_get)
+        # first check fast data:
+        fast_data = self._ori_snapshot_locals_last_get[self.__ORI_FAST_DATA_INDEX]
+        fast_changed = (fast_data != self._ori_snapshot_locals_baseline[self.__ORI_FAST_DATA_INDEX])
+        if fast_changed:
+            self.__log_ori_change()
+            return True
+
+        # no fast changes, get slow and check it:
+        if self._ORI_HAS_SLOW_DATA:
+            last_get = self._ori_snapshot_locals_last_get[self.__ORI_SLOW_DATA_INDEX]
+            baseline = self._ori_snapshot_locals_baseline[self.__ORI_SLOW_DATA_INDEX]
+            has_slow_change = self._has_ori_changes_slow(baseline, last_get)
+            if has_slow_change:
+                self.__log_ori_change('"slow"')
+                return True
+
+        if self._ORI_HAS_CHILDREN:
+            has_child_change = self._has_ori_changes_children()
+            if has_child_change:
+                self.__log_ori_change('child')
+            return has_child_change
+
+        # no slow data changed either, done:
+        return False
+
     def __log_ori_change(self, change_type=None):
         """
         Log a message about the type of ORI change found. Since many different classes can derive from
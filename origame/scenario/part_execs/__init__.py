@@ -28,6 +28,8 @@ __copyright__ = "(c) Her Majesty the Queen in Right of Canada"
 from .iexecutable_part import IExecutablePart
 from .py_script_exec import PyScriptExec, PyScriptCompileError, PyScriptFuncRunError, PyScriptFuncCallError
 from .py_script_exec import LINKS_SCRIPT_OBJ_NAME, PyScenarioImportsManager
+from .py_script_exec import get_script_part
+from .part_hotspots import PartHotspots, PartHotspotProfiler, HotspotTimes, OUTSIDE_PARTS_FRAME
 from .sql_part_exec import SqlPartExec
 from .py_debugger import PyDebugger, PyDebugInfo, IPyDebuggingListener
 from .scripting_utils import get_signature_from_str, get_params_from_str, get_func_proxy_from_str
@@ -23,6 +23,7 @@ Version History: See SVN log.
 import logging
 from enum import Enum
 from inspect import signature
+from time import perf_counter_ns
 
 # [2. third-party]
 
@@ -79,7 +80,7 @@ class IExecutablePart(metaclass=AttributeAggregator):
     """
 
     class ExecSignals(BridgeEmitter):
-        sig_queue_counters_changed = BridgeSignal(bool, int, int)  # concurrent with next, after next
+        sig_queue_counters_changed = BridgeSignal(bool, int, int, coalesce=True)  # concurrent with next, after next
         sig_exec_done = BridgeSignal()
         sig_params_changed = BridgeSignal(str)
 
@@ -119,6 +120,8 @@ class IExecutablePart(metaclass=AttributeAggregator):
             self._signature = self.get_signature()
             self._param_validator = get_func_proxy_from_str(value)
             self._on_parameters_changed()
+            self._on_searchable_state_changed()
+            self._flag_ori_changes()
             if self._anim_mode_shared:
                 self.exec_signals.sig_params_changed.emit(self._param_str)
 
@@ -370,6 +373,12 @@ class IExecutablePart(metaclass=AttributeAggregator):
         log.info('Executable part {} executing via {}{}',
                  self, ('debug ' if _debug_mode else ''), ('signal' if _as_signal else 'call'))
 
+        shared_state = self._shared_scenario_state
+        metrics = None  # the sim metrics, if this execution is sampled
+        if shared_state is not None and shared_state.sim_metrics.sampling:
+            metrics = shared_state.sim_metrics
+
+        start_ns = 0 if metrics is None else perf_counter_ns()
         try:
             self.__set_last_exec_error_info(None)
             result = self._exec(_debug_mode, _as_signal, *args, **kwargs)
@@ -382,3 +391,7 @@ class IExecutablePart(metaclass=AttributeAggregator):
         except Exception as exc:
             self.__set_last_exec_error_info(exc)
             raise
+
+        finally:
+            if metrics is not None:
+                metrics.record_part_exec(self, perf_counter_ns() - start_ns)
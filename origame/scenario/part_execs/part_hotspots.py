@@ -0,0 +1,296 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Attribution of profiled time to scenario parts
+
+A cProfile of a scenario shows each part's script as code of an anonymous file, which says little to a modeller.
+The PartHotspotProfiler instead samples the call stack and maps the code of each frame back to the part whose
+script it belongs to (see get_script_part()), so that the time can be reported per part path: per part, per
+actor subtree, and per link edge (part calling another part).
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import logging
+from collections import Counter
+from pathlib import Path
+
+# [2. third-party]
+
+# [3. local]
+from ...core.utils import SamplingProfiler, get_profile_path
+from ...core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from ...core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from ...core.typing import AnnotationDeclarations
+
+from .py_script_exec import get_script_part
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'PartHotspots',
+    'PartHotspotProfiler',
+    'HotspotTimes',
+    'OUTSIDE_PARTS_FRAME',
+]
+
+log = logging.getLogger('system')
+
+# Frame name used for the samples taken while no part script was on the stack (simulation engine, GUI, etc):
+OUTSIDE_PARTS_FRAME = '(outside parts)'
+
+PATH_SEPARATOR = '/'
+
+# A stack of part paths, outermost first:
+PartStack = Tuple[str, ...]
+
+
+class Decl(AnnotationDeclarations):
+    PartHotspots = 'PartHotspots'
+    PartHotspotProfiler = 'PartHotspotProfiler'
+    PyScriptExec = 'PyScriptExec'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def get_actor_paths(part_path: str) -> List[str]:
+    """Get the paths of the actors that contain the part of given path, root actor first"""
+    names = part_path.strip(PATH_SEPARATOR).split(PATH_SEPARATOR)[:-1]
+    return [PATH_SEPARATOR] + [PATH_SEPARATOR + PATH_SEPARATOR.join(names[:i + 1]) for i in range(len(names))]
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class HotspotTimes:
+    """
+    POD structure with the time of one item (part, actor or link edge) of PartHotspots: self time is the time
+    during which the item was the innermost one on the stack, cumulative time includes the time of the parts it
+    called.
+    """
+
+    def __init__(self, name: str, self_sec: float, cumul_sec: float, percent: float):
+        """
+        :param name: the part path, actor path or link edge ('caller path -> callee path')
+        :param self_sec: the self time, in seconds
+        :param cumul_sec: the cumulative time, in seconds
+        :param percent: the cumulative time as percentage of the total time sampled
+        """
+        self.name = name
+        self.self_sec = self_sec
+        self.cumul_sec = cumul_sec
+        self.percent = percent
+
+
+class PartHotspots:
+    """
+    The result of a PartHotspotProfiler: the number of samples and the time of each distinct stack of part paths,
+    from which the time per part, per actor subtree and per link edge is computed. Each time is an estimate: the
+    sum of the times of the samples (see SamplingProfiler).
+    """
+
+    def __init__(self, part_stacks: Dict[PartStack, int], part_stack_secs: Dict[PartStack, float]):
+        """
+        :param part_stacks: number of samples of each stack of part paths (outermost first); the samples taken
+            outside of part scripts have stack (OUTSIDE_PARTS_FRAME,)
+        :param part_stack_secs: time (in seconds) of the samples of each stack of part_stacks
+        """
+        self.__part_stacks = part_stacks
+        self.__part_stack_secs = part_stack_secs
+
+    def get_part_stacks(self) -> Dict[PartStack, int]:
+        """Get the number of samples of each stack of part paths"""
+        return self.__part_stacks
+
+    def get_total_sec(self) -> float:
+        """Get the total time sampled"""
+        return sum(self.__part_stack_secs.values())
+
+    def get_part_times(self) -> List[HotspotTimes]:
+        """Get the times of each part, by decreasing cumulative time"""
+        self_secs = Counter()
+        cumul_secs = Counter()
+        for stack, stack_sec in self.__part_stack_secs.items():
+            if stack[-1] == OUTSIDE_PARTS_FRAME:
+                continue
+            self_secs[stack[-1]] += stack_sec
+            # a part that calls itself, directly or not, is counted once per sample
+            for part_path in set(stack):
+                cumul_secs[part_path] += stack_sec
+
+        return self.__get_times(self_secs, cumul_secs)
+
+    def get_actor_times(self) -> List[HotspotTimes]:
+        """
+        Get the times of each actor subtree, by decreasing cumulative time: the self time of an actor is the time
+        during which the innermost part on the stack was in its subtree, and its cumulative time is the time during
+        which any part of its subtree was on the stack.
+        """
+        self_secs = Counter()
+        cumul_secs = Counter()
+        for stack, stack_sec in self.__part_stack_secs.items():
+            if stack[-1] == OUTSIDE_PARTS_FRAME:
+                continue
+            for actor_path in get_actor_paths(stack[-1]):
+                self_secs[actor_path] += stack_sec
+            actor_paths = set()
+            for part_path in stack:
+                actor_paths.update(get_actor_paths(part_path))
+            for actor_path in actor_paths:
+                cumul_secs[actor_path] += stack_sec
+
+        return self.__get_times(self_secs, cumul_secs)
+
+    def get_link_times(self) -> List[HotspotTimes]:
+        """
+        Get the times of each link edge (a part calling another part), by decreasing cumulative time: the self time
+        is the time during which the callee was the innermost part called by the caller, and the cumulative time
+        is the time during which the callee was called by the caller.
+        """
+        self_secs = Counter()
+        cumul_secs = Counter()
+        for stack, stack_sec in self.__part_stack_secs.items():
+            if len(stack) < 2:
+                continue
+            self_secs[self.__get_edge_name(stack[-2], stack[-1])] += stack_sec
+            edges = set(self.__get_edge_name(caller, callee) for caller, callee in zip(stack, stack[1:]))
+            for edge in edges:
+                cumul_secs[edge] += stack_sec
+
+        return self.__get_times(self_secs, cumul_secs)
+
+    def save_collapsed(self, path: PathType):
+        """
+        Save the part stacks to a file in the "collapsed stacks" format read by flame graph tools (such as
+        flamegraph.pl and speedscope): one line per distinct stack, with the part paths separated by semicolons,
+        then a space and the number of samples.
+        """
+        with Path(path).open('w') as collapsed_file:
+            for stack, count in sorted(self.__part_stacks.items()):
+                frames = (frame.replace(';', ',') for frame in stack)
+                collapsed_file.write('{} {}\n'.format(';'.join(frames), count))
+        log.info('Part hotspots saved to {}', path)
+
+    part_stacks = property(get_part_stacks)
+    total_sec = property(get_total_sec)
+
+    def __get_times(self, self_secs: Dict[str, float], cumul_secs: Dict[str, float]) -> List[HotspotTimes]:
+        total_sec = self.get_total_sec()
+        times = [HotspotTimes(name, self_secs[name], cumul_sec, 100 * cumul_sec / total_sec)
+                 for name, cumul_sec in cumul_secs.items()]
+        times.sort(key=lambda item: item.cumul_sec, reverse=True)
+        return times
+
+    @staticmethod
+    def __get_edge_name(caller_path: str, callee_path: str) -> str:
+        return '{} -> {}'.format(caller_path, callee_path)
+
+
+class PartHotspotProfiler:
+    """
+    Profiles the scenario parts whose scripts execute in the thread that calls enable(), until disable(): the
+    stack of the thread is sampled regularly (see SamplingProfiler), and the frames of part scripts are mapped to
+    the paths of their parts. Frames of other code (simulation engine, libraries) are attributed to the innermost
+    part that called them. Can be used as a context manager:
+
+    with PartHotspotProfiler('hotspots.collapsed'):
+        ...stuff to profile...
+    """
+
+    DEFAULT_INTERVAL_SEC = 0.001
+
+    @staticmethod
+    def for_script(py_part: Decl.PyScriptExec, **out_info) -> Decl.PartHotspotProfiler:
+        """
+        Create a profiler for a part script: when used as context manager, it saves the collapsed stacks to the
+        scenario's path with suffix .collapsed, with out_info inserted in the file name (see ScenProfiler).
+        """
+        scen_path = py_part.shared_scenario_state.scen_filepath or Path.cwd() / 'unsaved.ori'
+        return PartHotspotProfiler(get_profile_path(scen_path, '.collapsed', **out_info))
+
+    def __init__(self, out_path: PathType = None, interval_sec: float = DEFAULT_INTERVAL_SEC):
+        """
+        :param out_path: the file in which to save the collapsed stacks when the profiler is used as context
+            manager; if None, nothing is saved
+        :param interval_sec: the sampling interval
+        """
+        self.__out_path = out_path
+        self.__interval_sec = interval_sec
+        self.__sampler = None
+        self.__hotspots = None
+
+    def enable(self):
+        """Start profiling the calling thread; the results of a previous profiling are discarded"""
+        self.__hotspots = None
+        self.__sampler = SamplingProfiler(self.__interval_sec, record_stacks=True)
+        self.__sampler.enable()
+
+    def disable(self) -> PartHotspots:
+        """Stop profiling; returns the results (also available from get_hotspots())"""
+        self.__sampler.disable()
+        self.__hotspots = PartHotspots(*self.__get_part_stacks())
+        self.__sampler = None
+        return self.__hotspots
+
+    def is_enabled(self) -> bool:
+        """Return True if profiling (enabled and not yet disabled)"""
+        return self.__sampler is not None
+
+    def get_hotspots(self) -> Optional[PartHotspots]:
+        """Get the results of the last profiling (None if never profiled, or still profiling)"""
+        return self.__hotspots
+
+    hotspots = property(get_hotspots)
+
+    def __enter__(self):
+        log.warning("Part hotspot profiling starting")
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        hotspots = self.disable()
+        if self.__out_path is not None:
+            hotspots.save_collapsed(self.__out_path)
+        return False
+
+    def __get_part_stacks(self) -> Tuple[Dict[PartStack, int], Dict[PartStack, float]]:
+        """
+        Convert the stacks of function keys sampled into stacks of part paths. Returns the number of samples and
+        the time of each stack of part paths.
+        """
+        part_paths = {}  # code file path -> part path, or None if not part code
+        part_stacks = Counter()
+        part_stack_secs = Counter()
+        stack_times = self.__sampler.get_stack_times()
+        for stack, count in self.__sampler.get_stacks().items():
+            part_stack = []
+            for file_path, _, _ in stack:
+                if file_path not in part_paths:
+                    part = get_script_part(file_path)
+                    part_paths[file_path] = None if part is None else part.get_path()
+                part_path = part_paths[file_path]
+                # consecutive frames of a same part (functions defined in its script) are one part frame
+                if part_path is not None and (not part_stack or part_stack[-1] != part_path):
+                    part_stack.append(part_path)
+
+            part_stack = tuple(part_stack) if part_stack else (OUTSIDE_PARTS_FRAME,)
+            part_stacks[part_stack] += count
+            part_stack_secs[part_stack] += stack_times[stack]
+
+        return dict(part_stacks), dict(part_stack_secs)
@@ -107,8 +107,10 @@ class PyDebugger(Bdb):
 
     The debugger requires scenario parts that support debugger to register themselves via register_part.
     Then a function that should be called "in debug mode" should call debug_call(); this will call
-    the user_line() to automatically get called when the function is entered, a breakpoint is hit, or
-    requested next line (step over, in, or out of) is reached. The user_line() method determines if the line of
+    the user_line() to automatically get called when a breakpoint is hit, or
+    requested next line (step over, in, or out of) is reached. Only the frames that can stop are traced: those
+    of code that has breakpoints, plus all frames while stepping into; so debug mode costs little when
+    breakpoints are few, and nothing when there are none. The user_line() method determines if the line of
     code is in a scenario part's script (rather than in library or application code); if so, it repeatedly
     calls the "user action callback" until an action is obtained, then resumes execution, and the process
     repeats.
@@ -213,9 +215,6 @@ class PyDebugger(Bdb):
         # alive, so use weak ref set
         self.__blockage_listeners = WeakSet()
 
-        # prevent inadvertent use of Bdb's runcall, which we will use internally
-        self.__runcall = self.runcall
-
     def get_current_debug_info(self) -> PyDebugInfo:
         """
         Get the debug info for the line that user_line() is currently blocked on. Returns None if not at a breakpoint.
@@ -224,7 +223,16 @@ class PyDebugger(Bdb):
 
     @override(Bdb)
     def trace_dispatch(self, frame, event, arg):
-        """Intercept Bdb's trace_dispatch so we can forward to the code coverage tracer, if any"""
+        """
+        Intercept Bdb's trace_dispatch so that frames that cannot stop are not traced at all, and so we can forward
+        to the code coverage tracer, if any. When not stepping into, a frame can only stop if its code has
+        breakpoints: at its call, returning None gives it no local trace function. Breakpoints can only be set in
+        registered parts, whose file names are canonic, so the file name of the frame's code can be used as is.
+        """
+        if (event == 'call' and self.stopframe is not None and frame is not self.stopframe and
+                frame.f_code.co_filename not in self.breaks):
+            return None
+
         if self.__chain_tracer:
             self.__chain_tracer(frame, event, arg)
 
@@ -248,8 +256,12 @@ class PyDebugger(Bdb):
 
     def debug_call(self, func: Callable, *args, **kwargs) -> object:
         """
-        Call the given function so breakpoints will be hit and stepping can be used.
+        Call the given function so breakpoints will be hit and stepping can be used. If there are no breakpoints,
+        the function is called without tracing, since nothing can stop it.
         """
+        if not self.breaks:
+            return func(*args, **kwargs)
+
         log.debug("PyDb: starting debug call of func {}", func)
         self.__step_into_part_frame = None
         self.__entered_func = False
@@ -257,7 +269,7 @@ class PyDebugger(Bdb):
         self.__stop_exec = False
         orig_tracer = sys.gettrace()
         try:
-            return self.__runcall(func, *args, **kwargs)
+            return self.__run_call(func, *args, **kwargs)
 
         except BdbQuit:
             log.error("BUG: PyDb should never get here, please report this")
@@ -374,6 +386,7 @@ class PyDebugger(Bdb):
         """Execute the current line, stopping at next line in same frame"""
         log.debug("PyDb: will step to next line")
         # WARNING: Bdb docs are misleading but set_next(frame) is "step to next line in frame"
+        self.__trace_calling_frames()
         self.set_next(self.__frame)
         self.__have_next_command = True
 
@@ -381,6 +394,7 @@ class PyDebugger(Bdb):
         """Stop at next entry into a sub-frame that is in a scenario part script"""
         log.debug("PyDb: will step into next frame (further from caller)")
         # WARNING: Bdb docs are misleading but set_step() is "step into"
+        self.__trace_calling_frames()
         self.set_step()
         self.__step_into_part_frame = self.__frame
         self.__have_next_command = True
@@ -389,6 +403,7 @@ class PyDebugger(Bdb):
         """Stop at next return from a frame"""
         # Oliver TODO build 3: adjust this class to the next return frame is in a part script
         log.debug("PyDb: will step out of current frame")
+        self.__trace_calling_frames()
         self.set_return(self.__frame)
         self.__have_next_command = True
 
@@ -431,6 +446,46 @@ class PyDebugger(Bdb):
             log.debug(err_msg)
             raise ValueError(err_msg)
 
+    @override(Bdb)
+    def reset(self):
+        """
+        Same as Bdb.reset(), but without checking every file of the line cache (which Bdb does on every call):
+        set_break() checks the cache of the file in which it sets the breakpoint.
+        """
+        self.botframe = None
+        self._set_stopinfo(None, None)
+
     # --------------------------- instance PUBLIC properties ----------------------------
 
     current_debug_info = property(get_current_debug_info)
+
+    # --------------------------- instance __PRIVATE members-------------------------------------
+
+    def __run_call(self, func: Callable, *args, **kwargs) -> object:
+        """
+        Same as Bdb.runcall(), except that execution starts in "continue" mode (stop only at breakpoints) rather
+        than "step" mode: otherwise every frame entered before the first line of func gets traced, and func's
+        frame stays traced even if its code has no breakpoints.
+        """
+        self.reset()
+        self.botframe = sys._getframe()
+        self._set_stopinfo(self.botframe, None, -1)
+        sys.settrace(self.trace_dispatch)
+        try:
+            return func(*args, **kwargs)
+        except BdbQuit:
+            return None
+        finally:
+            self.quitting = True
+            sys.settrace(None)
+
+    def __trace_calling_frames(self):
+        """
+        Give a local trace function to the frame stopped at and to every frame that called it, up to the bottom
+        frame, like pdb's set_trace() does: frames of code without breakpoints get none at their call (see
+        trace_dispatch()), yet stepping can return into them.
+        """
+        frame = self.__frame
+        while frame is not None and frame is not self.botframe:
+            frame.f_trace = self.trace_dispatch
+            frame = frame.f_back
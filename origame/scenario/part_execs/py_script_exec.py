@@ -26,6 +26,7 @@ from importlib import import_module
 from pathlib import Path
 from textwrap import dedent
 from traceback import extract_tb
+from weakref import WeakValueDictionary
 import re
 
 # [2. third-party]
@@ -62,6 +63,8 @@ __all__ = [
 
     'PyScenarioImportsManager',
     'PyScriptAutoImports',
+
+    'get_script_part',
 ]
 
 log = logging.getLogger('system')
@@ -72,9 +75,14 @@ LINKS_SCRIPT_OBJ_NAME = 'link'
 ImportSources = Either[str, Tuple[str, str]]
 ImportSource = Tuple[str, str]
 
+# Each PyScriptExec compiles its script with a file name unique to it, so the code objects of a part's script
+# (found in stack frames, profiler stats, etc) can be traced back to the part:
+_script_parts_by_file_path = WeakValueDictionary()
+
 
 class Decl(AnnotationDeclarations):
     PartLink = 'PartLink'
+    PyScriptExec = 'PyScriptExec'
 
 
 # -- Function definitions -----------------------------------------------------------------------
@@ -102,6 +110,14 @@ def get_sym_import_info(source_info: ImportSources, alias: str=None) -> Tuple[st
     return sym_name, module_name, obj_name
 
 
+def get_script_part(file_path: str) -> Optional[Decl.PyScriptExec]:
+    """
+    Get the part whose script was compiled with given file path, i.e. the part that owns a code object whose
+    co_filename is file_path. Returns None if no such part exists (anymore).
+    """
+    return _script_parts_by_file_path.get(file_path)
+
+
 # -- Class Definitions --------------------------------------------------------------------------
 
 class PyScriptCompileError(Exception):
@@ -441,6 +457,7 @@ class PyScriptExec:
             temp_file = tempfile.NamedTemporaryFile(delete=False, mode='w')
             self.__src_file_path = self.__debugger.canonic(temp_file.name)
             self.__debugger.register_part(self)
+        _script_parts_by_file_path[self.__src_file_path] = self
 
         self.__whole_script = None
         self.py_script_exec_signals = PyScriptExec.PyScriptExecSignals()
@@ -484,16 +501,19 @@ class PyScriptExec:
         # add debug_line_offset to account for "header" lines added to script by derived class
         line_num = line_num + self.get_debug_line_offset()
         self.__debugger.set_break(self.__debugger.canonic(self.__src_file_path), line_num)
+        self._on_searchable_state_changed()
 
     def unset_breakpoint(self, line_num: int):
         if self.__debugger is None:
             raise RuntimeError("No debugger available, can't unset breakpoints")
         self.__debugger.clear_break(self.__src_file_path, line_num + self.get_debug_line_offset())
+        self._on_searchable_state_changed()
 
     def clear_all_breakpoints(self):
         if self.__debugger is None:
             return
         self.__debugger.clear_all_file_breaks(self.__src_file_path)
+        self._on_searchable_state_changed()
 
     def get_breakpoints(self) -> Set[int]:
         """Get the list of breakpoint lines of this function part's script. First line is 1."""
@@ -604,6 +624,8 @@ class PyScriptExec:
             self.__script_imports_mgr.add_symbol(source_info, alias=sym_name)
         
         self._setup_namespace()
+        self._on_searchable_state_changed()
+        self._flag_ori_changes()
 
     def get_resolved_imports(self) -> Dict[str, ImportSource]:
         """Get all symbols that could be resolved to an object (even those that could not be imported)"""
@@ -753,7 +775,10 @@ class PyScriptExec:
             scen_path = self._shared_scenario_state.scen_filepath
             return None if scen_path is None else scen_path.name
 
-        def profiler(**out_info):
+        def profiler(hotspots: bool = False, **out_info):
+            if hotspots:
+                from .part_hotspots import PartHotspotProfiler
+                return PartHotspotProfiler.for_script(self, **out_info)
             return ScenProfiler(self, **out_info)
 
         profiler.__doc__ = ScenProfiler.__doc__
@@ -826,6 +851,10 @@ class ScenProfiler(BlockProfiler):
     then the output file will be c:\\folder\path_v_1_r_2.pstats so it is easy to use the profile in multiple
     places in one scenario run (out_info can contain a unique identifier for each section of code being
     profiled).
+
+    With profiler(hotspots=True), the time is instead attributed to the scenario parts whose scripts were
+    executing (see PartHotspotProfiler), and saved to c:\\folder\path.collapsed, a collapsed-stack file of
+    part paths that flame graph tools can read.
     """
 
     def __init__(self, py_part: PyScriptExec, **out_info):
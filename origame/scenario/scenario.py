@@ -21,6 +21,7 @@ from pathlib import Path
 from enum import IntEnum, Enum
 import pickle
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from textwrap import indent
 
 # [2. third-party]
@@ -42,6 +43,8 @@ from .ori import IOriSerializable, OriBaselineEnum, OriContextEnum, JsonObj, pic
 from .ori import OriScenarioDefKeys as SdKeys, OriImageDictionaryKeys as IdKeys
 from .ori import OriScenarioKeys as SKeys, OriSchemaEnum, OriScenData
 from .animation import SharedAnimationModeReader, AnimationMode
+from .search_index import ScenarioSearchIndex
+from .file_util_json import OriJsonSegmentCache
 
 # -- Meta-data ----------------------------------------------------------------------------------
 
@@ -310,6 +313,7 @@ class SharedScenarioState:
 
     - scenario sim controller (which has the sim event queue and sim time)
     - sim controller proxy to be shared by all scripts
+    - sim metrics (same object as the sim controller's, reset in place)
     - integrated database
     - history etc
 
@@ -320,6 +324,7 @@ class SharedScenarioState:
     class Signals(BridgeEmitter):
         sig_search_progress = BridgeSignal(str)
         sig_search_hit = BridgeSignal(BasePart, list)  # List[str]
+        sig_search_done = BridgeSignal()
         sig_scenario_path_changed = BridgeSignal(str) # whenever path to scenario changes (save-as, New, Load)
 
     def __init__(self, sim_controller: SimController, anim_reader: SharedAnimationModeReader,
@@ -338,6 +343,7 @@ class SharedScenarioState:
         self.__scen_filepath = None  # needed so scripts have access to scenario file path
 
         self.sim_controller = sim_controller
+        self.sim_metrics = sim_controller.metrics
         self.animation_mode_reader = anim_reader
         self.sim_controller_scripting_proxy = SimControllerProxy(sim_controller)
         self.sim_controller_scripting_proxy_ro = SimControllerReaderProxy(sim_controller)
@@ -350,6 +356,10 @@ class SharedScenarioState:
         self.image_dictionary = image_dict
 
         self.__search_state = SearchingStateEnum.idle
+        self.__search_executor = None
+        self.__search = None  # Future of the last search submitted to the executor
+        self.search_index = ScenarioSearchIndex()
+        self.ori_segment_cache = OriJsonSegmentCache()
 
     @property
     def scen_folder_path(self) -> Optional[Path]:
@@ -388,9 +398,12 @@ class SharedScenarioState:
             self.signals.sig_search_hit.emit(part, prop_names)
 
     def cancel_search(self):
-        """Cancel an in-progress search: any children not already searched will be skipped."""
-        assert self.__search_state in (SearchingStateEnum.in_progress, SearchingStateEnum.cancelled)
-        self.__search_state = SearchingStateEnum.cancelled
+        """
+        Cancel an in-progress search: any children not already searched will be skipped. Does nothing if
+        not searching (the search may have ended in its worker thread while the cancellation was requested).
+        """
+        if self.__search_state == SearchingStateEnum.in_progress:
+            self.__search_state = SearchingStateEnum.cancelled
 
     def is_search_in_progress(self) -> bool:
         """True if start_search() was called, and end_search() was not"""
@@ -401,9 +414,46 @@ class SharedScenarioState:
         return self.__search_state == SearchingStateEnum.cancelled
 
     def end_search(self):
-        """Mark in-progress search as done (due to completion or cancellation)"""
+        """Mark in-progress search as done (due to completion or cancellation), and emit sig_search_done"""
         assert self.__search_state in (SearchingStateEnum.in_progress, SearchingStateEnum.cancelled)
         self.__search_state = SearchingStateEnum.idle
+        self.signals.sig_search_done.emit()
+
+    def submit_search(self, search: Callable, *args) -> Future:
+        """
+        Call search(*args) in the search worker thread, so the backend thread can continue while the search is
+        completed. The search must only read data that can be read from any thread (such as the search index),
+        and must call end_search() when done. Only one search can be in progress at a time: the caller must
+        wait_for_search() before starting a new search.
+        :return: the future of the search
+        """
+        if self.__search_executor is None:
+            self.__search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ScenarioSearch')
+        self.__search = self.__search_executor.submit(search, *args)
+        return self.__search
+
+    def wait_for_search(self):
+        """
+        Wait for the last search submitted with submit_search() to complete. Does nothing if there is no search
+        in progress. Any error of the search is not raised (it is available from the future returned by
+        submit_search()).
+        """
+        search = self.__search
+        if search is None:
+            return
+
+        if not search.done():
+            log.info("Waiting for scenario search to complete")
+        search.exception()
+        self.__search = None
+
+    def shutdown_search(self):
+        """Cancel the search in progress, if any, and stop the search worker thread"""
+        self.cancel_search()
+        self.wait_for_search()
+        if self.__search_executor is not None:
+            self.__search_executor.shutdown()
+            self.__search_executor = None
 
     scen_filepath = property(get_scen_filepath)
 
@@ -434,6 +484,7 @@ class ScenarioDefinition(IOriSerializable, IScenAlertSource):
         self._shared_scenario_state = shared_scenario_state
         self._root_actor = ActorPart(self)
         self.__alert_parent = alert_parent
+        shared_scenario_state.search_index.set_root_actor(self._root_actor)
 
     def import_scenario(self, ori_data: OriScenData, dest_actor: ActorPart):
         """
@@ -473,12 +524,51 @@ class ScenarioDefinition(IOriSerializable, IScenAlertSource):
 
     def search_parts(self, re_pattern: str) -> {BasePart: List[str]}:
         """
-        Find all parts that have properties with string value that matches a pattern.
+        Find all parts that have properties with string value that matches a pattern. This is the same as
+        search_parts_async(), but waits for the search to complete. The result is the same as
+        self.root_actor.search_parts(re_pattern).
+
         :param re_pattern: pattern to match
-        :return: dictionary where each key is the path through actor hierarchy, and value is a list of property names
-            on the associated part
+        :return: dictionary where each key is a part that matched pattern in some property, and value is a list
+            of property names on the associated part
         """
-        return self._root_actor.search_parts(re_pattern, new_search=True)
+        return self.search_parts_async(re_pattern).result()
+
+    def search_parts_async(self, re_pattern: str) -> Future:
+        """
+        Start a search of all parts that have properties with string value that matches a pattern. Only the part
+        of the search that must read the parts is done by this call: the scenario's search index is brought up to
+        date (only the parts that changed since the previous search are re-indexed), and the content of parts
+        that have content (tables, sheets, etc) is searched. The matching of the indexed properties is then done
+        in the search worker thread (see SharedScenarioState.submit_search()), so the backend thread can continue.
+
+        The hits are reported via the shared state's add_search_result(), in the order in which
+        ActorPart.search_parts() visits the parts, and sig_search_done is emitted when the search has completed
+        or was cancelled.
+
+        :param re_pattern: pattern to match
+        :return: the future of the search; its result() is the same as that of search_parts()
+        """
+        shared_state = self._shared_scenario_state
+        search_index = shared_state.search_index
+
+        shared_state.wait_for_search()
+        shared_state.start_search()
+        content_found = {}
+        try:
+            search_index.update()
+            for part, content_names in search_index.find_in_content(re_pattern):
+                if shared_state.is_search_cancelled():
+                    break
+                shared_state.update_search_progress(part.path)
+                if content_names:
+                    content_found[part] = content_names
+
+        except:
+            shared_state.end_search()
+            raise
+
+        return shared_state.submit_search(self.__find_search_hits, re_pattern, content_found)
 
     def cancel_search(self):
         """
@@ -553,6 +643,31 @@ class ScenarioDefinition(IOriSerializable, IScenAlertSource):
         """
         return self._name
 
+    # --------------------------- instance __PRIVATE members-------------------------------------
+
+    def __find_search_hits(self, re_pattern: str,
+                           content_found: Dict[BasePart, List[str]]) -> Dict[BasePart, List[str]]:
+        """
+        Match the indexed properties of parts against a pattern, and report the parts that match, merged with the
+        parts whose content matched (content_found), in tree order. This is called in the search worker thread.
+        """
+        shared_state = self._shared_scenario_state
+        search_index = shared_state.search_index
+        parts_found = {}
+        try:
+            props_found = dict(search_index.find(re_pattern, is_cancelled=shared_state.is_search_cancelled))
+            for part in search_index.sort_in_tree_order(props_found.keys() | content_found.keys()):
+                if shared_state.is_search_cancelled():
+                    break
+                # content names come after property names, as in BasePart.get_matching_properties():
+                parts_found[part] = props_found.get(part, []) + content_found.get(part, [])
+                shared_state.add_search_result(part, parts_found[part])
+
+        finally:
+            shared_state.end_search()
+
+        return parts_found
+
 
 class Scenario(IOriSerializable, IScenAlertSource):
     """
@@ -636,6 +751,7 @@ class Scenario(IOriSerializable, IScenAlertSource):
         # if not self._sim_controller.is_state(SimStatesEnum.paused):
         #    self._sim_controller.sim_pause()
 
+        self._shared_state.shutdown_search()
         self._scenario_def.on_scenario_shutdown()
         self._embedded_db.shutdown()
 
@@ -717,11 +833,20 @@ class Scenario(IOriSerializable, IScenAlertSource):
         """
         return self._scenario_def.search_parts(re_pattern)
 
+    def search_parts_async(self, re_pattern: str) -> Future:
+        """
+        Start a search of all parts that have properties with string value that matches a pattern. See
+        ScenarioDefinition.search_parts_async().
+        :param re_pattern: pattern to match
+        :return: the future of the search; its result() is the same as that of search_parts()
+        """
+        return self._scenario_def.search_parts_async(re_pattern)
+
     def cancel_search(self):
         """
-        Cancel a search started with search_parts(). The cancellation takes effect as soon as current part doing
-        search has completed its local search. Any children remaining are skipped.
-        NOTE: this must not be called asynchronously, since the backend event loop is busy during the whole search
+        Cancel a search started with search_parts() or search_parts_async(). The cancellation takes effect as soon
+        as current part doing search has completed its local search. Any parts remaining are skipped.
+        NOTE: this must not be called asynchronously, since the backend event loop can be busy during the search
         """
         self._scenario_def.cancel_search()
 
@@ -0,0 +1,368 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Full-text search index over the searchable properties of scenario parts
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import logging
+from collections import defaultdict
+from datetime import date, time, timedelta
+from enum import Enum
+from pathlib import PurePath
+from threading import RLock
+
+# [2. third-party]
+
+# [3. local]
+from ..core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from ..core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from ..core.typing import AnnotationDeclarations
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'ScenarioSearchIndex',
+]
+
+log = logging.getLogger('system')
+
+
+class Decl(AnnotationDeclarations):
+    BasePart = 'BasePart'
+    ActorPart = 'ActorPart'
+
+
+# a "document" of the index is one searchable property of one part:
+IndexDoc = Tuple[Decl.BasePart, str]
+
+CancelCheckCallable = Callable[[], bool]
+
+# Types of the values of searchable properties that can only change when their part's setters are called:
+IMMUTABLE_TYPES = (str, bytes, int, float, complex, tuple, frozenset, Enum, date, time, timedelta, PurePath,
+                   type(None))
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def get_ngrams(text: str, length: int) -> Set[str]:
+    """Get the set of all substrings of given length in text (empty if text is shorter than length)"""
+    return {text[index:index + length] for index in range(len(text) - length + 1)}
+
+
+def is_immutable(value: Any) -> bool:
+    """Returns True if value is of a type that cannot be modified in place (only the value is checked, not its items)"""
+    return isinstance(value, IMMUTABLE_TYPES)
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class ScenarioSearchIndex:
+    """
+    Inverted index of the searchable properties of all parts of a scenario, i.e. the properties returned by
+    BasePart.get_searchable_properties() (frame name, comment, outgoing link names, scripts, parameters, etc).
+
+    Each property of each part is a "document" of the index, stored in lower case. Every n-gram (substring of
+    NGRAM_LEN characters) of every document maps to the set of documents that contain it. A case-insensitive
+    substring search (same semantics as BasePart.get_matching_properties()) then only needs to verify the
+    documents that contain all the n-grams of the search text, instead of converting every property of every
+    part to a string and matching it.
+
+    The index is maintained incrementally: parts notify it (via mark_part_changed() and mark_subtree_changed())
+    when their searchable state changes, and the changed parts are re-indexed on the next update(). This includes
+    the changes made by scripts, since the searchable properties of parts are changed via their setters. Some
+    properties can however change without a setter being called: those derived from sim time (listed in
+    BasePart.VOLATILE_SEARCHABLE_PROPERTIES, such as the elapsed time of time parts), and those that have a
+    mutable value, which can be modified in place (such as the run roles of function parts). These "volatile"
+    properties are re-read by every update(), and re-indexed if their value changed. Only set_root_actor()
+    marks the whole index as stale (mark_stale()), so that the next update() rebuilds it.
+
+    The index also keeps the order in which ActorPart.search_parts() visits the parts (depth first, children in
+    order), so that search results can be reported in that order (see sort_in_tree_order()). The order is
+    recomputed by update() only when parts were added or removed.
+
+    Content that is not kept in Python objects (such as table records, which are in the embedded database) is not
+    indexed: the parts that have such content (BasePart.HAS_SEARCHABLE_CONTENT is True) are searched via
+    BasePart.get_matching_content() at every search.
+
+    Note: update() and find_in_content() read the parts so they must be called from the backend thread; find()
+    and sort_in_tree_order() only read the index data (under a lock) so they can be called from any thread.
+    """
+
+    NGRAM_LEN = 3
+
+    # Number of candidate documents verified between each check for search cancellation:
+    NUM_DOCS_BETWEEN_CANCEL_CHECKS = 1000
+
+    def __init__(self):
+        self.__lock = RLock()
+        self.__root_actor = None
+
+        self.__docs = {}  # Dict[BasePart, Dict[str, str]]: part -> {prop_name: lower case prop value}
+        self.__postings = defaultdict(set)  # Dict[str, Set[IndexDoc]]: n-gram -> docs that contain it
+        self.__content_parts = set()  # parts that have HAS_SEARCHABLE_CONTENT True
+        self.__volatile_docs = {}  # Dict[BasePart, List[str]]: part -> names of its volatile properties
+        self.__tree_order = {}  # Dict[BasePart, int]: part -> rank in the order of ActorPart.search_parts()
+
+        self.__changed_parts = set()
+        self.__changed_subtrees = set()
+        self.__stale = True
+
+    def set_root_actor(self, root_actor: Decl.ActorPart):
+        """Set the root actor of the scenario to index. The index becomes stale."""
+        self.__root_actor = root_actor
+        self.mark_stale()
+
+    def mark_stale(self):
+        """Indicate that the whole index must be rebuilt at next update()"""
+        self.__stale = True
+
+    def mark_part_changed(self, part: Decl.BasePart):
+        """Indicate that the searchable properties of given part have changed"""
+        if not self.__stale:
+            self.__changed_parts.add(part)
+
+    def mark_subtree_changed(self, part: Decl.BasePart):
+        """
+        Indicate that the given part and, if it is an actor, all its descendants, must be re-indexed. This is
+        used when parts are added to or removed from the scenario.
+        """
+        if not self.__stale:
+            self.__changed_subtrees.add(part)
+
+    def get_is_stale(self) -> bool:
+        """Returns True if the whole index will be rebuilt at next update()"""
+        return self.__stale
+
+    def get_num_parts(self) -> int:
+        """Get the number of parts currently indexed"""
+        return len(self.__docs)
+
+    def update(self) -> int:
+        """
+        Bring the index up to date: rebuild it if it is stale, else re-index only the parts that have changed
+        since the last update, and the volatile properties that changed (see class docs).
+
+        :return: the number of parts (re-)indexed, including those that had only volatile properties re-indexed
+        """
+        with self.__lock:
+            if self.__stale:
+                return self.__rebuild()
+
+            parts = set(self.__changed_parts)
+            for part in self.__changed_subtrees:
+                parts.add(part)
+                descendants = {}
+                part.get_all_descendants_by_id(descendants)
+                parts.update(descendants.values())
+
+            structure_changed = bool(self.__changed_subtrees)
+            self.__changed_parts.clear()
+            self.__changed_subtrees.clear()
+
+            for part in parts:
+                self.__remove_part(part)
+                if part.in_scenario:
+                    self.__add_part(part)
+
+            if structure_changed:
+                self.__update_tree_order()
+
+            num_volatile_changed = 0
+            for part, prop_names in self.__volatile_docs.items():
+                if part not in parts and self.__update_volatile_docs(part, prop_names):
+                    num_volatile_changed += 1
+
+            num_updated = len(parts) + num_volatile_changed
+            if num_updated:
+                log.debug("Search index: {} parts re-indexed", num_updated)
+            return num_updated
+
+    def find(self, pattern: str, is_cancelled: CancelCheckCallable = None) -> List[Tuple[Decl.BasePart, List[str]]]:
+        """
+        Find the indexed properties that contain a pattern (case insensitive; the pattern is not a regular
+        expression). This does NOT search the content of parts that have HAS_SEARCHABLE_CONTENT True (use
+        find_in_content() for this), and does not update() the index.
+
+        :param pattern: the text to search for
+        :param is_cancelled: if given, called periodically; the search stops when it returns True
+        :return: list of (part, property names) pairs, in tree order (see sort_in_tree_order())
+        """
+        needle = pattern.lower()
+        with self.__lock:
+            candidates = self.__get_candidates(needle)
+            hits = defaultdict(list)
+            for count, (part, prop_name) in enumerate(candidates):
+                if needle in self.__docs[part][prop_name]:
+                    hits[part].append(prop_name)
+                if (is_cancelled is not None and count % self.NUM_DOCS_BETWEEN_CANCEL_CHECKS == 0
+                        and is_cancelled()):
+                    break
+
+            # order the property names of each part the same way as BasePart.get_matching_properties():
+            results = []
+            for part in self.sort_in_tree_order(hits):
+                prop_names = hits[part]
+                part_prop_order = list(self.__docs[part])
+                prop_names.sort(key=part_prop_order.index)
+                results.append((part, prop_names))
+
+        return results
+
+    def sort_in_tree_order(self, parts: Iterable[Decl.BasePart]) -> List[Decl.BasePart]:
+        """
+        Sort parts in the order in which ActorPart.search_parts() visits them, as of the last update(). Parts
+        not indexed at the last update() are put last.
+        """
+        with self.__lock:
+            num_ranks = len(self.__tree_order)
+            return sorted(parts, key=lambda part: self.__tree_order.get(part, num_ranks))
+
+    def find_in_content(self, pattern: str) -> Stream:
+        """
+        Search the content of the parts that have HAS_SEARCHABLE_CONTENT True, in tree order (see
+        sort_in_tree_order()). This calls the parts, so it must be called from the backend thread. Returns
+        a generator so the caller can stop the search at any part.
+
+        :param pattern: the text to search for
+        :return: generator of (part, matching content names) for each content part (content names list empty
+            if no match)
+        """
+        for part in self.sort_in_tree_order(self.__content_parts):
+            yield part, part.get_matching_content(pattern)
+
+    is_stale = property(get_is_stale)
+    num_parts = property(get_num_parts)
+
+    def __rebuild(self) -> int:
+        """Discard all index data and index every part of the scenario"""
+        self.__docs.clear()
+        self.__postings.clear()
+        self.__content_parts.clear()
+        self.__volatile_docs.clear()
+        self.__tree_order.clear()
+        self.__changed_parts.clear()
+        self.__changed_subtrees.clear()
+        self.__stale = False
+
+        if self.__root_actor is None:
+            return 0
+
+        parts = {self.__root_actor.SESSION_ID: self.__root_actor}
+        self.__root_actor.get_all_descendants_by_id(parts)
+        for part in parts.values():
+            self.__add_part(part)
+        self.__update_tree_order()
+
+        log.debug("Search index: rebuilt for {} parts", len(parts))
+        return len(parts)
+
+    def __add_part(self, part: Decl.BasePart):
+        """Index the searchable properties of given part, which must not already be in index"""
+        assert part not in self.__docs
+        props = part.get_searchable_properties()
+        docs = {prop_name: str(prop_val).lower() for prop_name, prop_val in props.items()}
+        self.__docs[part] = docs
+        for prop_name, prop_val in docs.items():
+            self.__add_postings((part, prop_name), prop_val)
+
+        if part.HAS_SEARCHABLE_CONTENT:
+            self.__content_parts.add(part)
+
+        volatile_prop_names = [prop_name for prop_name, prop_val in props.items()
+                               if prop_name in part.VOLATILE_SEARCHABLE_PROPERTIES or not is_immutable(prop_val)]
+        if volatile_prop_names:
+            self.__volatile_docs[part] = volatile_prop_names
+
+    def __remove_part(self, part: Decl.BasePart):
+        """Remove the given part from index. Does nothing if part not indexed."""
+        docs = self.__docs.pop(part, None)
+        if docs is None:
+            return
+
+        for prop_name, prop_val in docs.items():
+            self.__remove_postings((part, prop_name), prop_val)
+
+        self.__content_parts.discard(part)
+        self.__volatile_docs.pop(part, None)
+
+    def __update_volatile_docs(self, part: Decl.BasePart, prop_names: List[str]) -> bool:
+        """
+        Re-read the given volatile properties of a part, and re-index those that changed.
+        :return: True if any property changed
+        """
+        props = part.get_searchable_properties()
+        docs = self.__docs[part]
+        changed = False
+        for prop_name in prop_names:
+            prop_val = str(props[prop_name]).lower()
+            if prop_val != docs[prop_name]:
+                doc = (part, prop_name)
+                self.__remove_postings(doc, docs[prop_name])
+                self.__add_postings(doc, prop_val)
+                docs[prop_name] = prop_val
+                changed = True
+
+        return changed
+
+    def __add_postings(self, doc: IndexDoc, doc_text: str):
+        """Map every n-gram of doc_text to the document"""
+        for ngram in get_ngrams(doc_text, self.NGRAM_LEN):
+            self.__postings[ngram].add(doc)
+
+    def __remove_postings(self, doc: IndexDoc, doc_text: str):
+        """Remove the document from the map of every n-gram of doc_text"""
+        for ngram in get_ngrams(doc_text, self.NGRAM_LEN):
+            postings = self.__postings[ngram]
+            postings.discard(doc)
+            if not postings:
+                del self.__postings[ngram]
+
+    def __update_tree_order(self):
+        """Rank the indexed parts in the order in which ActorPart.search_parts() visits them"""
+        parts = {self.__root_actor.SESSION_ID: self.__root_actor}
+        self.__root_actor.get_all_descendants_by_id(parts)
+        self.__tree_order = {part: rank for rank, part in enumerate(parts.values())}
+
+    def __get_candidates(self, needle: str) -> Iterable[IndexDoc]:
+        """
+        Get the documents that could contain needle: those that have all the n-grams of needle. If needle is
+        shorter than an n-gram, all documents are candidates.
+        """
+        ngrams = get_ngrams(needle, self.NGRAM_LEN)
+        if not ngrams:
+            return [(part, prop_name) for part, docs in self.__docs.items() for prop_name in docs]
+
+        postings = []
+        for ngram in ngrams:
+            docs = self.__postings.get(ngram)
+            if not docs:
+                return []
+            postings.append(docs)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for docs in postings[1:]:
+            candidates.intersection_update(docs)
+            if not candidates:
+                break
+
+        return candidates
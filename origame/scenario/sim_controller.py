@@ -28,6 +28,7 @@ import random
 from copy import deepcopy
 from pathlib import Path
 from textwrap import dedent, indent
+from time import perf_counter
 from inspect import signature
 import inspect
 
@@ -45,6 +46,7 @@ from .part_execs import IExecutablePart
 from .defn_parts import RunRolesEnum, BasePart
 from .ori import IOriSerializable, OriSimConfigKeys as ScKeys, OriContextEnum, OriScenData, JsonObj, OriSchemaEnum
 from .event_queue import EventQueue, EventInfo, CallInfo
+from .sim_metrics import SimMetrics
 from .animation import AnimationMode
 from .part_execs import IPyDebuggingListener, PyDebugger
 
@@ -471,10 +473,15 @@ class EventStepperMixin:
         """
         sim_con = self._fsm_owner
         event_queue = sim_con._event_queue
-        if event_queue.get_num_events() <= 0:
+        queue_depth = event_queue.get_num_events()
+        if queue_depth <= 0:
             return
 
         time_days, priority, call_info = event_queue.pop_next()
+        # this is done for every event, so the metrics are only called for the sampled ones:
+        metrics = sim_con._metrics
+        metrics._events_until_sampled -= 1
+        start_ns = 0 if metrics._events_until_sampled else metrics._start_sampled_event()
         if time_days is not None:
             sim_con._set_sim_time_days(time_days)
 
@@ -486,14 +493,19 @@ class EventStepperMixin:
             signals = sim_con.signals
             signals.sig_wall_clock_time_sec_changed.emit(wall_clock_start_sec)
 
-        try:
-            call_info.iexec.signal(*call_info.args, _debug_mode=sim_con._debug_mode)
+        # alert changes caused by the event are signaled once the event is done
+        with sim_con.batched_alert_signals():
+            try:
+                call_info.iexec.signal(*call_info.args, _debug_mode=sim_con._debug_mode)
+
+            except Exception as exc:
+                log.error("Simulation controller reverting to PAUSED state due to error in signalled part {}",
+                          call_info.iexec)
+                sim_con._set_last_step_error(exc)
+                self._set_state(SimStateClasses.PAUSED)
 
-        except Exception as exc:
-            log.error("Simulation controller reverting to PAUSED state due to error in signalled part {}",
-                      call_info.iexec)
-            sim_con._set_last_step_error(exc)
-            self._set_state(SimStateClasses.PAUSED)
+        if start_ns:
+            metrics._end_sampled_event(priority == EventQueue.ASAP_PRIORITY_VALUE, start_ns, queue_depth)
 
         if is_anim:
             wall_clock_end_sec = sim_con._run_timer_wall_clock.total_time_sec
@@ -527,9 +539,9 @@ class SimStatePaused(BaseFsmState, EventStepperMixin):
         self._fsm_owner._rt_event_delay_timer.pause()
         self.update_anim_mode()
 
-    def sim_update(self):
+    def sim_update(self) -> bool:
         """This gets called at high-frequency, but there is nothing to do while paused."""
-        pass
+        return False
 
     def sim_run(self):
         """
@@ -598,10 +610,11 @@ class SimStateRunning(BaseFsmState, EventStepperMixin):
         sim_con._rt_event_delay_timer.resume()
         self.__stop_when_queue_empty = settings.sim_steps.end.stop_when_queue_empty
 
-    def sim_update(self):
+    def sim_update(self) -> bool:
         """
         Should be called at high-frequency. It calls the step() at the correct times. It could raise
         an exception if an event raises, or a Finish function raises.
+        :return: True if an event was processed, False otherwise
         """
         sim_con = self._fsm_owner
         if sim_con._check_need_stop():
@@ -610,22 +623,26 @@ class SimStateRunning(BaseFsmState, EventStepperMixin):
                 sim_con.signals.sig_completion_percentage.emit(sim_con._get_percent_complete(none_allowed=False))
 
             self.do_end_steps()
-            return
+            return False
 
-        if sim_con._check_do_step():
-            self._step_one_event()
+        if not sim_con._check_do_step():
+            return False
 
-            # maybe it's time to pause now:
-            should_pause = (sim_con.num_events <= 0 and self.__stop_when_queue_empty)
-            # might have already been paused by the script, or by aborting debugging:
-            is_paused = (sim_con.state_id == SimStatesEnum.paused)
-            if should_pause:
-                if is_paused:
-                    log.info('Update step done: paused during step')
-                else:
-                    log.info('Update step done, no more events and STOP-on-EMPTY=True so going to PAUSED state from {}',
-                             sim_con.state_name)
-                    self.do_end_steps()
+        self._step_one_event()
+
+        # maybe it's time to pause now:
+        should_pause = (sim_con.num_events <= 0 and self.__stop_when_queue_empty)
+        # might have already been paused by the script, or by aborting debugging:
+        is_paused = (sim_con.state_id == SimStatesEnum.paused)
+        if should_pause:
+            if is_paused:
+                log.info('Update step done: paused during step')
+            else:
+                log.info('Update step done, no more events and STOP-on-EMPTY=True so going to PAUSED state from {}',
+                         sim_con.state_name)
+                self.do_end_steps()
+
+        return True
 
     def sim_pause(self):
         """Pause the simulation; just transition to paused"""
@@ -677,9 +694,9 @@ class SimStateDebugging(BaseFsmState):
         self.update_anim_mode()
         # self._fsm_owner.stop_auto_loop()
 
-    def sim_update(self):
+    def sim_update(self) -> bool:
         """While debugging, nothing to do"""
-        pass
+        return False
 
     def do_reset_steps(self):
         """Pause then execute the Reset steps"""
@@ -767,13 +784,16 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
         sig_anim_while_run_dyn_setting_changed = BridgeSignal(bool)  # new value of setting
         sig_debug_mode_changed = BridgeSignal(bool)  # new value of debug mode
         sig_sim_time_days_changed = BridgeSignal(float, float)  # absolute time (days), delta time (days)
-        sig_wall_clock_time_sec_changed = BridgeSignal(float)  # wall clock value in seconds, since last event popped
-        sig_event_user_time_sec = BridgeSignal(float)  # wall clock seconds between start and end of part execution
+        # wall clock value in seconds, since last event popped
+        sig_wall_clock_time_sec_changed = BridgeSignal(float, coalesce=True)
+        # wall clock seconds between start and end of part execution
+        sig_event_user_time_sec = BridgeSignal(float, coalesce=True)
         sig_step_settings_changed = BridgeSignal(str)  # string dump of a JSON structure for settings
         sig_has_role_parts = BridgeSignal(int, bool)  # (run role enum, True if has at least one part with role
         sig_max_sim_time_days_changed = BridgeSignal(float)
         sig_max_wall_clock_time_sec_changed = BridgeSignal(float)
-        sig_completion_percentage = BridgeSignal(int)  # 0-100, or < 0 if no % available (no max times set)
+        # 0-100, or < 0 if no % available (no max times set)
+        sig_completion_percentage = BridgeSignal(int, coalesce=True)
         sig_settings_changed = BridgeSignal()
 
     # --------------------------- class-wide methods --------------------------------------------
@@ -811,9 +831,11 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
         # private attributes
         self.__replic_folder = None
         self.__master_clock = MasterClock()
+        self.__sim_time_advance_days = 0.0  # total of forward changes of sim time, see get_sim_time_advance_days()
         self.__animation_mode = anim_mode
         self.__anim_mode_dyn = not isinstance(anim_mode, bool)
         self.__pulse_parts = []
+        self._metrics = SimMetrics()
 
         # animation mode can be static or dynamic: if dynamic, it has the set_state; if static, need different config
         assert self._settings.anim_while_run_dyn is True
@@ -897,6 +919,20 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
         """
         return self._event_queue.add_event(time, priority, iexec_part, args)
 
+    def add_events(self, iexec_parts: Sequence[IExecutablePart], args: Tuple = None, time: float = None,
+                   priority: float = 0) -> List[CallInfo]:
+        """
+        Add several executable parts to the simulation event queue, all at given time and priority level, and
+        with the given call arguments. This is equivalent to calling add_event() for each part, in order, but
+        much faster for many parts since the event queue does its bookkeeping and signaling once for all.
+        :param iexec_parts: executable parts to add to event queue, in the order in which to add them
+        :param args: arguments that will be passed to each executable part when its event gets processed
+        :param time: simulation time at which events should be processed
+        :param priority: priority, within given time bin, of events
+        :return: the created CallInfo objects, in same order as iexec_parts
+        """
+        return self._event_queue.add_events(time, priority, iexec_parts, args)
+
     def remove_event(self, time: float, priority: float, call_info: CallInfo, restorable: bool = False):
         """
         Remove an event from the queue.
@@ -1231,6 +1267,14 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
         """Current sim time according to the master clock."""
         return self.__master_clock.time_days
 
+    def get_sim_time_advance_days(self) -> float:
+        """
+        Get the total of the forward changes of sim time since this controller was created. Unlike the sim time,
+        this never decreases (for example when sim time is reset), so parts whose state progresses with sim time
+        can compute their state on demand from it (see SimTimeAnchor), rather than be notified of every change.
+        """
+        return self.__sim_time_advance_days
+
     def get_realtime_sec(self) -> float:
         """Get number of seconds since the start of the sim of scenario"""
         return self._run_timer_wall_clock.total_time_sec
@@ -1318,6 +1362,7 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
     max_wall_clock_elapsed = property(is_max_wall_clock_elapsed)
     max_sim_time_elapsed = property(is_max_sim_time_elapsed)
     sim_time_days = property(get_sim_time_days)
+    sim_time_advance_days = property(get_sim_time_advance_days)
     realtime_sec = property(get_realtime_sec)
 
     # ------------ everything else but TIME -----------------------------
@@ -1332,12 +1377,43 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
             self._on_state_changed(prev_state)
             raise
 
-    def sim_update(self):
+    def sim_update(self) -> bool:
         """
         This should be called at high-frequency so the controller has a chance to update itself.
         This just delegates to the current state. All states support this.
+        :return: True if an event was processed, False otherwise
+        """
+        return self._state.sim_update()
+
+    def sim_update_slice(self, max_duration_sec: float) -> int:
         """
-        self._state.sim_update()
+        Call sim_update() repeatedly, for at most max_duration_sec of wall clock time: this avoids the overhead of
+        one call per event when the caller must regularly do something else (like process GUI requests). The
+        slice ends early if the sim is no longer running (paused by a script, stopped, debugging, etc), or if no
+        event is ready to be processed (no more events, or next event not yet due in real-time mode). When
+        animation is on, only one update is done, since every event gets animated anyway.
+
+        When animation is off, the wall clock time and completion percentage are signaled once at the end
+        of the slice (they are otherwise only signaled when animated).
+
+        :param max_duration_sec: maximum duration of the slice; the last event processed can end after this
+        :return: the number of events processed
+        """
+        if self.is_animated:
+            return 1 if self.sim_update() else 0
+
+        end_time = perf_counter() + max_duration_sec
+        num_events = 0
+        while self.sim_update():
+            num_events += 1
+            if self._state.state_id != SimStatesEnum.running or perf_counter() >= end_time:
+                break
+
+        if num_events and not self.is_animated:
+            self.signals.sig_wall_clock_time_sec_changed.emit(self.realtime_sec)
+            self.signals.sig_completion_percentage.emit(self._get_percent_complete(none_allowed=False))
+
+        return num_events
 
     def sim_step(self):
         """Advance simulation of the scenario by one step. Not all states support this."""
@@ -1417,6 +1493,10 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
         return [(setup_part.SESSION_ID, setup_part.get_path(), setup_part.get_signature())
                 for setup_part in parts_with_role]
 
+    def get_metrics(self) -> SimMetrics:
+        """Get the metrics of the simulation since the last reset (events processed, part execution times, etc)"""
+        return self._metrics
+
     def check_last_step_was_error(self) -> bool:
         """
         Return True if last sim step (via sim_update or sim_step) failed. Further attempts to sim_update(),
@@ -1427,6 +1507,7 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
     # --------------------------- instance PUBLIC properties and safe_slots ---------------------
 
     last_step_was_error = property(check_last_step_was_error)
+    metrics = property(get_metrics)
 
     # --------------------------- instance _PROTECTED and _INTERNAL methods ---------------------
 
@@ -1597,6 +1678,8 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
         if time_days != self.__master_clock.time_days:
             delta = time_days - self.__master_clock.time_days
             self.__master_clock.time_days = time_days
+            if delta > 0:
+                self.__sim_time_advance_days += delta
             if signal:
                 self.signals.sig_sim_time_days_changed.emit(time_days, delta)
 
@@ -1619,6 +1702,7 @@ class SimController(IOriSerializable, IPyDebuggingListener, IScenAlertSource, IF
 
         self._clear_own_alerts(ScenAlertLevelEnum.error, ErrorCatEnum.sim_step)
         self.__last_sim_step_was_error = False
+        self._metrics.reset()
         reset_settings = self._settings.sim_steps.reset
 
         if reset_settings.clear_event_queue:
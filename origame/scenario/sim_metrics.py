@@ -0,0 +1,390 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Simulation metrics
+
+The SimController of a scenario records metrics about the simulation as it runs: number of events processed
+(ASAP and timed), event processing rate, event queue depth over time, and wall time per executable part
+execution. Recording is always on (unless disabled via sim.metrics.enabled), so it is designed to cost little:
+every event is counted, but only one event out of SimMetrics.EVENT_SAMPLING_PERIOD is timed, along with the part
+executions it causes. Times are measured with time.perf_counter_ns() and accumulated in histograms of fixed size,
+whose buckets are powers of 2.
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import json
+import logging
+from collections import deque
+from pathlib import Path
+from time import perf_counter_ns
+from weakref import WeakKeyDictionary
+
+# [2. third-party]
+
+# [3. local]
+from ..core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from ..core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from ..core.typing import AnnotationDeclarations
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'Histogram',
+    'SimMetrics',
+    'SIM_METRICS_FILE_NAME',
+]
+
+log = logging.getLogger('system')
+
+# Name of the file in which a batch replication saves its metrics, when requested:
+SIM_METRICS_FILE_NAME = 'sim_metrics.json'
+
+NS_PER_SEC = 1e9
+
+
+class Decl(AnnotationDeclarations):
+    Histogram = 'Histogram'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class Histogram:
+    """
+    Histogram of non-negative integer values (such as durations in nanoseconds) with a fixed number of buckets:
+    bucket i counts the values v such that 2**(i-1) <= v < 2**i (bucket 0 counts the zeros), and the last bucket
+    counts all larger values. Recording a value is O(1) and the memory used does not depend on the number of
+    values recorded.
+    """
+
+    NUM_BUCKETS = 48  # 2**47 ns is about 39 hours
+
+    def __init__(self):
+        self.__counts = [0] * self.NUM_BUCKETS
+        self.__last_bucket = self.NUM_BUCKETS - 1
+        self.__total = 0
+        self.__max = 0
+
+    def record(self, value: int):
+        """Record a value (an int >= 0)"""
+        bucket = value.bit_length()
+        if bucket > self.__last_bucket:
+            bucket = self.__last_bucket
+        self.__counts[bucket] += 1
+        self.__total += value
+        if value > self.__max:
+            self.__max = value
+
+    def merge(self, other: Decl.Histogram):
+        """Add the values recorded by another histogram to this one"""
+        for bucket, count in enumerate(other.__counts):
+            self.__counts[bucket] += count
+        self.__total += other.__total
+        self.__max = max(self.__max, other.__max)
+
+    def get_count(self) -> int:
+        """Get the number of values recorded"""
+        return sum(self.__counts)
+
+    def get_total(self) -> int:
+        """Get the sum of the values recorded"""
+        return self.__total
+
+    def get_max(self) -> int:
+        """Get the largest value recorded (0 if none)"""
+        return self.__max
+
+    def get_mean(self) -> float:
+        """Get the mean of the values recorded (0 if none)"""
+        count = self.get_count()
+        return self.__total / count if count else 0.0
+
+    def get_percentile(self, percent: float) -> int:
+        """
+        Get an upper bound of the given percentile of the values recorded: the upper bound of the bucket that
+        contains it, capped by the largest value recorded.
+        :param percent: the percentile, between 0 and 100
+        :return: the upper bound (0 if no values recorded)
+        """
+        count = self.get_count()
+        if not count:
+            return 0
+
+        rank = percent / 100 * count
+        cumul = 0
+        for bucket, bucket_count in enumerate(self.__counts):
+            cumul += bucket_count
+            if cumul >= rank and bucket_count:
+                return min(2 ** bucket - 1 if bucket else 0, self.__max)
+
+        return self.__max
+
+    def get_buckets(self) -> Dict[int, int]:
+        """Get the non-empty buckets, as a map of the upper bound of each bucket (exclusive) to its count"""
+        return {2 ** bucket: count for bucket, count in enumerate(self.__counts) if count}
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a JSON-compatible summary of the histogram"""
+        return dict(count=self.get_count(),
+                    total=self.__total,
+                    mean=self.get_mean(),
+                    max=self.__max,
+                    p50=self.get_percentile(50),
+                    p90=self.get_percentile(90),
+                    p99=self.get_percentile(99),
+                    buckets={str(upper): count for upper, count in self.get_buckets().items()})
+
+    count = property(get_count)
+    total = property(get_total)
+    max = property(get_max)
+    mean = property(get_mean)
+
+
+class SimMetrics:
+    """
+    Registry of the metrics of a simulation run. reset() is called when the simulation is reset. All times are
+    wall clock, in nanoseconds unless stated otherwise. The execution times of a part are discarded when the part
+    is deleted.
+
+    The metrics cost little to the simulation because only one event out of EVENT_SAMPLING_PERIOD is sampled:
+    for each event it processes, the SimController only decrements the countdown _events_until_sampled, and calls
+    _start_sampled_event() when it reaches 0, then _end_sampled_event() once that event is done. While a sampled
+    event is processed, the sampling attribute is True, and executable parts then call record_part_exec() for
+    each execution. The number of events is exact, but the numbers of ASAP and timed events are estimated from
+    the sampled events, and the histograms of event processing times and of part execution times only contain
+    the sampled events and the part executions that occur in them: multiply their counts and totals by
+    EVENT_SAMPLING_PERIOD to estimate those of the whole run. Part executions outside of events (such as those
+    triggered from the GUI) are not recorded.
+
+    The depth of the event queue is sampled at most once per QUEUE_DEPTH_SAMPLE_PERIOD_SEC (at sampled events), and
+    the most recent MAX_QUEUE_DEPTH_SAMPLES samples are kept, each with the event rate since the previous sample.
+    The samples are also accumulated in a histogram of queue depths.
+
+    Scripts access the metrics of their scenario via sim.metrics.
+    """
+
+    # One event out of this many is sampled:
+    EVENT_SAMPLING_PERIOD = 64
+    QUEUE_DEPTH_SAMPLE_PERIOD_SEC = 0.1
+    MAX_QUEUE_DEPTH_SAMPLES = 3600
+    # Number of parts listed by to_json(), those with largest total execution time:
+    MAX_PARTS_IN_JSON = 100
+
+    # Value of the countdown while disabled: decrementing it never reaches 0
+    __NEVER_SAMPLED = -1
+
+    def __init__(self, enabled: bool = True):
+        """
+        :param enabled: whether to record the metrics; can be changed later via set_enabled()
+        """
+        self.__enabled = enabled
+        self.__sample_period_ns = int(self.QUEUE_DEPTH_SAMPLE_PERIOD_SEC * NS_PER_SEC)
+        self.__queue_depth_samples = deque(maxlen=self.MAX_QUEUE_DEPTH_SAMPLES)
+        self.reset()
+
+    def reset(self):
+        """Discard all metrics recorded"""
+        self.__start_ns = perf_counter_ns()
+        self.__num_events = 0  # events counted up to the last sampled event, or until disabled
+        self.__num_sampled_events = 0
+        self.__num_sampled_asap_events = 0
+        self.__restart_countdown(1)  # the first event is sampled
+        self.sampling = False
+        self.__asap_event_times = Histogram()
+        self.__timed_event_times = Histogram()
+        self.__queue_depths = Histogram()
+        self.__queue_depth_samples.clear()
+        self.__next_sample_ns = self.__start_ns + self.__sample_period_ns
+        self.__last_sample_ns = self.__start_ns
+        self.__last_sample_num_events = 0
+        self.__part_exec_times = WeakKeyDictionary()  # part -> Histogram
+
+    def get_enabled(self) -> bool:
+        """Return True if the metrics are being recorded"""
+        return self.__enabled
+
+    def set_enabled(self, enabled: bool = True):
+        """
+        Start or stop recording the metrics. The metrics already recorded are kept (see reset()), but the
+        events and part executions that happen while disabled are not counted.
+        """
+        if enabled == self.__enabled:
+            return
+
+        self.__num_events = self.get_num_events()
+        self.__enabled = enabled
+        self.__restart_countdown(1)
+
+    def record_part_exec(self, part: Any, elapsed_ns: int):
+        """
+        Record the execution of an executable part. Nested executions (a part that calls another) are each
+        recorded, so the time of the inner execution is also included in the time of the outer one. The caller
+        must check that a sampled event is being processed (see the sampling attribute).
+        :param part: the part executed
+        :param elapsed_ns: how long the execution took
+        """
+        times = self.__part_exec_times.get(part)
+        if times is None:
+            times = self.__part_exec_times[part] = Histogram()
+        times.record(elapsed_ns)
+
+    def get_num_events(self) -> int:
+        """Get the number of events processed since last reset"""
+        if self.__enabled:
+            return self.__num_events + self.__countdown_start - self._events_until_sampled
+        return self.__num_events
+
+    def get_num_asap_events(self) -> int:
+        """Get an estimate of the number of ASAP events processed since last reset (see class docs)"""
+        if not self.__num_sampled_events:
+            return 0
+        return round(self.get_num_events() * self.__num_sampled_asap_events / self.__num_sampled_events)
+
+    def get_num_timed_events(self) -> int:
+        """Get an estimate of the number of timed events processed since last reset (see class docs)"""
+        return self.get_num_events() - self.get_num_asap_events()
+
+    def get_elapsed_sec(self) -> float:
+        """Get the wall clock time since the last reset, in seconds (includes the time the sim was paused)"""
+        return (perf_counter_ns() - self.__start_ns) / NS_PER_SEC
+
+    def get_events_per_sec(self) -> float:
+        """Get the mean number of events processed per second of wall clock time, since last reset"""
+        elapsed_sec = self.get_elapsed_sec()
+        return self.get_num_events() / elapsed_sec if elapsed_sec > 0 else 0.0
+
+    def get_asap_event_times(self) -> Histogram:
+        """Get the histogram of processing times of ASAP events"""
+        return self.__asap_event_times
+
+    def get_timed_event_times(self) -> Histogram:
+        """Get the histogram of processing times of timed events"""
+        return self.__timed_event_times
+
+    def get_queue_depths(self) -> Histogram:
+        """Get the histogram of event queue depths, one value per sample"""
+        return self.__queue_depths
+
+    def get_queue_depth_samples(self) -> List[Tuple[float, int, float]]:
+        """
+        Get the samples of event queue depth over time: a list of (seconds since reset, queue depth, events per
+        second since previous sample), oldest first.
+        """
+        return list(self.__queue_depth_samples)
+
+    def get_part_exec_times(self, part: Any) -> Optional[Histogram]:
+        """Get the histogram of execution times of the given part, or None if it has not executed since reset"""
+        return self.__part_exec_times.get(part)
+
+    def get_part_exec_totals(self) -> List[Tuple[Any, int, int]]:
+        """
+        Get the execution totals per part: a list of (part, number of executions, total time), by decreasing
+        total time.
+        """
+        totals = [(part, times.count, times.total) for part, times in list(self.__part_exec_times.items())]
+        totals.sort(key=lambda item: item[2], reverse=True)
+        return totals
+
+    def to_json(self) -> Dict[str, Any]:
+        """
+        Get the metrics as a JSON-compatible structure. The parts are identified by their path; only the
+        MAX_PARTS_IN_JSON parts with the largest total execution time are included.
+        """
+        parts = []
+        for part, _, _ in self.get_part_exec_totals()[:self.MAX_PARTS_IN_JSON]:
+            part_json = self.__part_exec_times[part].to_json()
+            part_json['path'] = part.get_path() if hasattr(part, 'get_path') else str(part)
+            parts.append(part_json)
+
+        return dict(elapsed_sec=self.get_elapsed_sec(),
+                    event_sampling_period=self.EVENT_SAMPLING_PERIOD,
+                    num_events=self.get_num_events(),
+                    num_asap_events=self.get_num_asap_events(),
+                    num_timed_events=self.get_num_timed_events(),
+                    events_per_sec=self.get_events_per_sec(),
+                    asap_event_times_ns=self.__asap_event_times.to_json(),
+                    timed_event_times_ns=self.__timed_event_times.to_json(),
+                    queue_depths=self.__queue_depths.to_json(),
+                    queue_depth_samples=self.get_queue_depth_samples(),
+                    part_exec_times_ns=parts)
+
+    def save(self, path: PathType):
+        """Save the metrics to a JSON file at given path"""
+        with Path(path).open('w') as metrics_file:
+            json.dump(self.to_json(), metrics_file, indent=4)
+        log.info('Sim metrics saved to {}', path)
+
+    def _start_sampled_event(self) -> int:
+        """
+        Start sampling an event: called by the SimController when _events_until_sampled reaches 0, just before it
+        processes the event. It must then call _end_sampled_event() once the event has been processed.
+        :return: perf_counter_ns() at the start of the event
+        """
+        self.__num_events += self.__countdown_start
+        self.__restart_countdown(self.EVENT_SAMPLING_PERIOD)
+        self.sampling = True
+        return perf_counter_ns()
+
+    def _end_sampled_event(self, is_asap: bool, start_ns: int, queue_depth: int):
+        """
+        Record the processing time of a sampled event.
+        :param is_asap: True if the event was an ASAP event, False if timed
+        :param start_ns: the value returned by _start_sampled_event()
+        :param queue_depth: number of events on the queue when the event was popped (including it)
+        """
+        end_ns = perf_counter_ns()
+        self.sampling = False
+        self.__num_sampled_events += 1
+        if is_asap:
+            self.__num_sampled_asap_events += 1
+            self.__asap_event_times.record(end_ns - start_ns)
+        else:
+            self.__timed_event_times.record(end_ns - start_ns)
+
+        if end_ns >= self.__next_sample_ns:
+            self.__sample_queue_depth(end_ns, queue_depth)
+
+    enabled = property(get_enabled, set_enabled)
+    num_events = property(get_num_events)
+    num_asap_events = property(get_num_asap_events)
+    num_timed_events = property(get_num_timed_events)
+    elapsed_sec = property(get_elapsed_sec)
+    events_per_sec = property(get_events_per_sec)
+    asap_event_times = property(get_asap_event_times)
+    timed_event_times = property(get_timed_event_times)
+    queue_depths = property(get_queue_depths)
+    queue_depth_samples = property(get_queue_depth_samples)
+
+    def __restart_countdown(self, num_events: int):
+        """Restart the countdown of events until the next sampled one, which is never while disabled"""
+        self.__countdown_start = num_events if self.__enabled else 0
+        self._events_until_sampled = num_events if self.__enabled else self.__NEVER_SAMPLED
+
+    def __sample_queue_depth(self, now_ns: int, queue_depth: int):
+        """Add a sample of the queue depth, with the event rate since the previous sample"""
+        interval_sec = (now_ns - self.__last_sample_ns) / NS_PER_SEC
+        rate = (self.__num_events - self.__last_sample_num_events) / interval_sec
+        self.__queue_depth_samples.append(((now_ns - self.__start_ns) / NS_PER_SEC, queue_depth, rate))
+        self.__queue_depths.record(queue_depth)
+        self.__last_sample_ns = now_ns
+        self.__next_sample_ns = now_ns + self.__sample_period_ns
+        self.__last_sample_num_events = self.__num_events
@@ -78,6 +78,7 @@ class ConsoleMain:
         self._scen_manager = ScenarioManager()
         self._scen_manager.load(settings.scenario_path)
         self._batch_sim_mgr = BatchSimManager(self._scen_manager, settings)
+        self._metrics_out = settings.metrics_out
 
         # setup for trapping ctrl-c etc to cleanly exit
         self.exit_console = False
@@ -104,6 +105,8 @@ class ConsoleMain:
                  bsm.num_variants, bsm.num_variants_done, bsm.num_variants_failed)
         log.info('Status for replications: {} planned, {} completed, {} failed',
                  bsm.num_replics_per_variant * bsm.num_variants, bsm.num_replics_done, bsm.num_replics_failed)
+        if self._metrics_out is not None:
+            bsm.save_replic_metrics(self._metrics_out)
         log.info('Exiting console variant of Origame')
 
         return bsm.batch_folder
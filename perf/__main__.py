@@ -0,0 +1,154 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Command line of the performance benchmarks
+
+Examples, from the project folder:
+
+    python -m perf run --size small --out baseline.json
+    python -m perf run --size small --out current.json --baseline baseline.json --threshold 15
+    python -m perf compare baseline.json current.json
+
+The exit code is 1 if any metric regressed by more than the threshold against the baseline, or if the
+overhead measured by the sim_metrics benchmark exceeds its bound; 0 otherwise.
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import sys
+import logging
+from argparse import ArgumentParser, Namespace
+from copy import deepcopy
+
+# [2. third-party]
+
+# [3. local]
+from origame.core import LogManager
+from origame.core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from origame.core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+
+from .scen_gen import SIZE_PRESETS
+from .results import BenchResults, compare_results, DEFAULT_THRESHOLD_PERCENT
+from .benchmarks import BENCHMARKS, run_benchmarks, check_sim_metrics_overhead
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+log = logging.getLogger('system')
+
+# Command line options that override the parameters of the size preset (option dest -> ScenGenParams attribute):
+PARAM_OPTIONS = dict(
+    actor_depth=int,
+    actor_fan_out=int,
+    parts_per_actor=int,
+    link_density=float,
+    table_rows=int,
+    sheet_rows=int,
+    sheet_cols=int,
+    num_events=int,
+    events_per_day=float,
+    seed=int,
+)
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def get_cmd_line_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog='python -m perf', description='Run the Origame performance benchmarks')
+    parser.add_argument('-v', '--verbose', action='store_true', help='Log to stderr')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    run_parser = commands.add_parser('run', help='Generate a scenario and run benchmarks on it')
+    run_parser.add_argument('--size', choices=sorted(SIZE_PRESETS), default='small',
+                            help='Preset scenario parameters (default: small)')
+    for param_name, param_type in PARAM_OPTIONS.items():
+        run_parser.add_argument('--' + param_name.replace('_', '-'), type=param_type, dest=param_name,
+                                help='Override the {} of the size preset'.format(param_name))
+    run_parser.add_argument('--bench', choices=list(BENCHMARKS), action='append', dest='bench_names',
+                            help='Benchmark to run (can be given more than once; default: all)')
+    run_parser.add_argument('--repeat', type=int, default=3, help='Repetitions of each benchmark (default: 3)')
+    run_parser.add_argument('--work-dir', help='Folder for the files created (default: a temporary folder)')
+    run_parser.add_argument('--out', help='JSON file in which to save the results')
+    run_parser.add_argument('--baseline', help='JSON file of results to compare against')
+    run_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD_PERCENT,
+                            help='Regression threshold, in percent (default: %(default)s)')
+
+    compare_parser = commands.add_parser('compare', help='Compare two saved results')
+    compare_parser.add_argument('baseline', help='JSON file of the baseline results')
+    compare_parser.add_argument('current', help='JSON file of the current results')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD_PERCENT,
+                                help='Regression threshold, in percent (default: %(default)s)')
+
+    return parser
+
+
+def run(args: Namespace) -> int:
+    """Run the benchmarks, then compare against baseline if requested; returns the exit code"""
+    params = deepcopy(SIZE_PRESETS[args.size])
+    for param_name in PARAM_OPTIONS:
+        value = getattr(args, param_name)
+        if value is not None:
+            setattr(params, param_name, value)
+
+    results = run_benchmarks(params, bench_names=args.bench_names, repeat=args.repeat, work_dir=args.work_dir,
+                             size_name=args.size)
+    print(results.get_summary())
+    if args.out:
+        results.save(args.out)
+
+    exit_code = 0
+    overhead_problem = check_sim_metrics_overhead(results)
+    if overhead_problem:
+        print(overhead_problem)
+        exit_code = 1
+
+    if args.baseline:
+        exit_code = max(exit_code, compare(BenchResults.load(args.baseline), results, args.threshold))
+    return exit_code
+
+
+def compare(baseline: BenchResults, current: BenchResults, threshold_percent: float) -> int:
+    """Print the comparison of current results against baseline; returns the exit code"""
+    changes = compare_results(baseline, current, threshold_percent)
+    print()
+    print('{:<40} {:>14} {:>14} {:>10}'.format('Metric', 'Baseline', 'Current', 'Worse by'))
+    for change in changes:
+        print(change)
+
+    regressions = [change for change in changes if change.is_regression]
+    if regressions:
+        print('{} metric(s) regressed by more than {}%'.format(len(regressions), threshold_percent))
+        return 1
+
+    print('No regression beyond {}%'.format(threshold_percent))
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    args = get_cmd_line_parser().parse_args(argv)
+    LogManager(stream=sys.stderr if args.verbose else None,
+               log_level=logging.INFO if args.verbose else logging.WARNING)
+
+    if args.command == 'run':
+        return run(args)
+    return compare(BenchResults.load(args.baseline), BenchResults.load(args.current), args.threshold)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,396 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: The performance benchmarks
+
+Each benchmark is a function that takes a BenchContext and returns the metrics of one repetition, as a dict of
+metric name to value. Metric names ending with "_per_sec" are rates (higher is better), those ending with
+"_percent" are overheads in percent, and all others are durations in seconds (both lower is better). The
+benchmarks only use the backend (no GUI), so they run headless.
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import gc
+import logging
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from random import Random
+from statistics import median
+from time import perf_counter
+from timeit import timeit
+
+# [2. third-party]
+
+# [3. local]
+from origame.core import ConsoleCmdLineArgs
+from origame.core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from origame.core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from origame.core.typing import AnnotationDeclarations
+from origame.batch_sim import BatchSimManager
+from origame.scenario import ScenarioManager, SimStatesEnum
+
+from .scen_gen import ScenGenParams, generate_scenario, get_table_records, get_sheet_data
+from .scen_gen import TABLE_PART_NAME, SHEET_PART_NAME
+from .results import BenchResults
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'BenchContext',
+    'BENCHMARKS',
+    'run_benchmarks',
+    'check_sim_metrics_overhead',
+]
+
+log = logging.getLogger('system')
+
+SCEN_FILE_NAME = 'bench_scen.ori'
+
+# A batch that takes longer than this is assumed hung, and is stopped:
+BATCH_TIMEOUT_SEC = 300
+BATCH_NUM_REPLICS = 2
+
+# Pattern used by the search benchmark; it matches the script of every worker function:
+SEARCH_PATTERN = 'total'
+
+# The sim metrics being always on, they must not reduce the event throughput by more than this:
+MAX_SIM_METRICS_OVERHEAD_PERCENT = 2
+# Events run by the sim metrics benchmark, in chunks of alternately disabled and enabled metrics:
+SIM_METRICS_NUM_EVENTS = 1000000
+SIM_METRICS_CHUNK_EVENTS = 25000
+SIM_METRICS_OVERHEAD_METRIC = 'sim_metrics.overhead_percent'
+
+
+class Decl(AnnotationDeclarations):
+    BenchContext = 'BenchContext'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def run_benchmarks(params: ScenGenParams,
+                   bench_names: List[str] = None,
+                   repeat: int = 3,
+                   work_dir: PathType = None,
+                   size_name: str = None) -> BenchResults:
+    """
+    Generate a scenario and run benchmarks on it.
+    :param params: the parameters of the scenario to generate
+    :param bench_names: the names of the benchmarks to run (keys of BENCHMARKS); if None, all are run
+    :param repeat: how many times to run each benchmark; each metric keeps all its samples
+    :param work_dir: the folder in which to put the scenario and the files created by the benchmarks; if None,
+        a temporary folder is used and removed at the end
+    :param size_name: the name of the size preset that params come from, if any (only recorded in the results)
+    :return: the results
+    """
+    if bench_names is None:
+        bench_names = list(BENCHMARKS)
+    unknown_names = set(bench_names) - set(BENCHMARKS)
+    if unknown_names:
+        raise ValueError('Unknown benchmarks: {}'.format(', '.join(sorted(unknown_names))))
+
+    temp_dir = None
+    if work_dir is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix='origame_perf_')
+        work_dir = temp_dir.name
+
+    try:
+        context = BenchContext(params, Path(work_dir))
+        results = BenchResults(params, size_name=size_name)
+        for bench_name in bench_names:
+            log.warning('Running benchmark {} ({} times)', bench_name, repeat)
+            for _ in range(repeat):
+                for metric_name, value in BENCHMARKS[bench_name](context).items():
+                    results.add_sample('{}.{}'.format(bench_name, metric_name), value)
+
+        return results
+
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+
+def check_sim_metrics_overhead(results: BenchResults) -> Optional[str]:
+    """
+    Check that the median overhead measured by the sim_metrics benchmark is within
+    MAX_SIM_METRICS_OVERHEAD_PERCENT.
+    :return: a description of the problem if the overhead exceeds the bound, else None (also if the benchmark
+        was not run)
+    """
+    if SIM_METRICS_OVERHEAD_METRIC not in results.get_metric_names():
+        return None
+
+    overhead_percent = median(results.get_samples(SIM_METRICS_OVERHEAD_METRIC))
+    if overhead_percent < MAX_SIM_METRICS_OVERHEAD_PERCENT:
+        return None
+    return 'Sim metrics overhead is {:.2f}%, more than the {}% allowed'.format(
+        overhead_percent, MAX_SIM_METRICS_OVERHEAD_PERCENT)
+
+
+@contextmanager
+def _loaded_scenario(context: Decl.BenchContext, anim_mode: bool = True) -> ScenarioManager:
+    """
+    Load the benchmark scenario in a new scenario manager, and shut it down on exit.
+    :param anim_mode: the constant animation mode of the scenario; the sim benchmarks turn it off, as batch
+        replications do, so that they don't measure the emission of the signals for the GUI
+    """
+    scen_manager = ScenarioManager()
+    scen_manager.set_future_anim_mode_constness(anim_mode)
+    scen_manager.load(context.scen_path)
+    try:
+        yield scen_manager
+    finally:
+        scen_manager.shutdown()
+
+
+def bench_load(context: Decl.BenchContext) -> Dict[str, float]:
+    """Load the scenario from file"""
+    scen_manager = ScenarioManager()
+    start_sec = perf_counter()
+    scen_manager.load(context.scen_path)
+    load_sec = perf_counter() - start_sec
+    scen_manager.shutdown()
+    return dict(load_sec=load_sec)
+
+
+def bench_save(context: Decl.BenchContext) -> Dict[str, float]:
+    """Save the whole scenario, then save it again incrementally after changing one part"""
+    save_path = context.work_dir / 'bench_save.ori'
+    with _loaded_scenario(context) as scen_manager:
+        start_sec = perf_counter()
+        scen_manager.save(save_path)
+        full_sec = perf_counter() - start_sec
+
+        root_actor = scen_manager.scenario.scenario_def.root_actor
+        root_actor.get_child_by_name('function_0').script += '\n'
+        start_sec = perf_counter()
+        scen_manager.save(save_path, incremental=True)
+        incremental_sec = perf_counter() - start_sec
+
+    return dict(full_sec=full_sec, incremental_sec=incremental_sec)
+
+
+def bench_sim_update(context: Decl.BenchContext) -> Dict[str, float]:
+    """
+    Run the simulation until the event queue is empty, with animation off. The run time includes the startup
+    functions, which put the events on the queue. The sim metrics are enabled for the run since they count the
+    events processed.
+    """
+    with _loaded_scenario(context, anim_mode=False) as scen_manager:
+        assert not scen_manager.scenario.sim_controller.is_animated
+        sim_controller = scen_manager.scenario.sim_controller
+        sim_controller.metrics.set_enabled(True)
+        start_sec = perf_counter()
+        sim_controller.sim_run()
+        while sim_controller.is_state(SimStatesEnum.running):
+            sim_controller.sim_update()
+        run_sec = perf_counter() - start_sec
+        num_events = sim_controller.metrics.num_events
+
+    if num_events != context.params.num_events:
+        log.warning('Sim processed {} events instead of {}', num_events, context.params.num_events)
+    return dict(run_sec=run_sec, events_per_sec=num_events / run_sec)
+
+
+def bench_sim_metrics(context: Decl.BenchContext) -> Dict[str, float]:
+    """
+    Get the overhead of the sim metrics on the event throughput, for SIM_METRICS_NUM_EVENTS trivial events
+    (whatever the scenario size, since the overhead is per event). The events are run in chunks with the metrics
+    disabled and enabled, in pairs that alternate which goes first, and the median of the ratios of their times
+    is used, to reduce the effect of the noise of the machine. Since the countdown to the next sampled event
+    and the check of the sampling flag are done even when the metrics are disabled, their cost is measured
+    separately and added to the overhead.
+    """
+    scen_manager = ScenarioManager()
+    scen_manager.set_future_anim_mode_constness(False)
+    scen_manager.new_scenario()
+    part = scen_manager.scenario.scenario_def.root_actor.create_child_part('function', name='noop')
+    part.script = 'pass'
+    sim_controller = scen_manager.scenario.sim_controller
+    metrics = sim_controller.metrics
+
+    def run_chunk() -> float:
+        sim_time_days = sim_controller.sim_time_days
+        for index in range(SIM_METRICS_CHUNK_EVENTS):
+            sim_controller.add_event(part, time=sim_time_days + (index + 1) * 0.001)
+        start_sec = perf_counter()
+        for _ in range(SIM_METRICS_CHUNK_EVENTS):
+            sim_controller.sim_step()
+        return perf_counter() - start_sec
+
+    run_chunk()  # warm up
+    ratios = []
+    disabled_secs = []
+    num_pairs = SIM_METRICS_NUM_EVENTS // (2 * SIM_METRICS_CHUNK_EVENTS)
+    for pair in range(num_pairs):
+        run_secs = {}
+        # as done by timeit, garbage collections are prevented from adding to the times:
+        gc.collect()
+        gc.disable()
+        try:
+            for enabled in ((True, False) if pair % 2 else (False, True)):
+                metrics.set_enabled(enabled)
+                run_secs[enabled] = run_chunk()
+        finally:
+            gc.enable()
+        ratios.append(run_secs[True] / run_secs[False])
+        disabled_secs.append(run_secs[False])
+
+    metrics.set_enabled(False)
+    num_checks = 100000
+    check_sec = timeit('metrics._events_until_sampled -= 1; 0 if metrics._events_until_sampled else 1; '
+                       'metrics.sampling', globals=dict(metrics=metrics), number=num_checks)
+    scen_manager.shutdown()
+
+    disabled_event_sec = median(disabled_secs) / SIM_METRICS_CHUNK_EVENTS
+    return dict(overhead_percent=100 * (median(ratios) - 1 + (check_sec / num_checks) / disabled_event_sec),
+                events_per_sec=1 / disabled_event_sec)
+
+
+def bench_batch_startup(context: Decl.BenchContext) -> Dict[str, float]:
+    """
+    Run a small batch (one core): time to start it, time until its first replication is done (which includes
+    the creation of the replication process), and total time.
+    """
+    with _loaded_scenario(context) as scen_manager:
+        settings = ConsoleCmdLineArgs().parse_args([
+            str(context.scen_path), '--num-variants', '1', '--num-replics-per-variant', str(BATCH_NUM_REPLICS),
+            '--num-cores', '1'])
+        batch_sim_mgr = BatchSimManager(scen_manager, settings)
+
+        start_sec = perf_counter()
+        batch_sim_mgr.start_sim()
+        start_call_sec = perf_counter() - start_sec
+        first_replic_sec = None
+        while batch_sim_mgr.is_running():
+            batch_sim_mgr.update_sim()
+            elapsed_sec = perf_counter() - start_sec
+            if first_replic_sec is None and batch_sim_mgr.num_replics_done + batch_sim_mgr.num_replics_failed > 0:
+                first_replic_sec = elapsed_sec
+            if elapsed_sec > BATCH_TIMEOUT_SEC:
+                batch_sim_mgr.stop_sim()
+                raise RuntimeError('Batch did not complete within {} sec'.format(BATCH_TIMEOUT_SEC))
+        total_sec = perf_counter() - start_sec
+
+        if batch_sim_mgr.num_replics_failed:
+            log.warning('{} batch replications failed', batch_sim_mgr.num_replics_failed)
+        if batch_sim_mgr.batch_folder is not None:
+            shutil.rmtree(str(batch_sim_mgr.batch_folder), ignore_errors=True)
+
+    return dict(start_sec=start_call_sec, first_replic_sec=first_replic_sec, total_sec=total_sec)
+
+
+def bench_search(context: Decl.BenchContext) -> Dict[str, float]:
+    """
+    Search the scenario's parts, once on the freshly loaded scenario, once more without changes, and once after
+    a sim step (which should only cost the re-indexing of the parts changed by the step, not a rebuild).
+    """
+    with _loaded_scenario(context) as scen_manager:
+        start_sec = perf_counter()
+        scen_manager.search_scenario_parts(SEARCH_PATTERN)
+        first_sec = perf_counter() - start_sec
+
+        start_sec = perf_counter()
+        scen_manager.search_scenario_parts(SEARCH_PATTERN)
+        repeat_sec = perf_counter() - start_sec
+
+        # run the startup parts, which queue the events, then process one event:
+        sim_controller = scen_manager.scenario.sim_controller
+        sim_controller.sim_run()
+        sim_controller.sim_pause()
+        scen_manager.search_scenario_parts(SEARCH_PATTERN)
+        sim_controller.sim_step()
+        start_sec = perf_counter()
+        scen_manager.search_scenario_parts(SEARCH_PATTERN)
+        after_step_sec = perf_counter() - start_sec
+
+    return dict(first_sec=first_sec, repeat_sec=repeat_sec, after_step_sec=after_step_sec)
+
+
+def bench_table_io(context: Decl.BenchContext) -> Dict[str, float]:
+    """Write and read the data of the bulk table and sheet parts"""
+    params = context.params
+    rng = Random(params.seed)
+    records = get_table_records(params.table_rows, rng)
+    sheet_data = get_sheet_data(params.sheet_rows, params.sheet_cols, rng)
+
+    with _loaded_scenario(context) as scen_manager:
+        root_actor = scen_manager.scenario.scenario_def.root_actor
+        table = root_actor.get_child_by_name(TABLE_PART_NAME)
+        sheet = root_actor.get_child_by_name(SHEET_PART_NAME)
+
+        table.remove_all_data()
+        start_sec = perf_counter()
+        table.insert_many(records)
+        insert_sec = perf_counter() - start_sec
+
+        start_sec = perf_counter()
+        table.get_all_data()
+        read_sec = perf_counter() - start_sec
+
+        start_sec = perf_counter()
+        table.select(where='category = 3')
+        select_sec = perf_counter() - start_sec
+
+        start_sec = perf_counter()
+        sheet.set_data(sheet_data)
+        sheet_write_sec = perf_counter() - start_sec
+
+        start_sec = perf_counter()
+        sheet.get_cell_block(0, 0, params.sheet_rows, params.sheet_cols)
+        sheet_read_sec = perf_counter() - start_sec
+
+    return dict(insert_rows_per_sec=len(records) / insert_sec,
+                read_sec=read_sec,
+                select_sec=select_sec,
+                sheet_write_sec=sheet_write_sec,
+                sheet_read_sec=sheet_read_sec)
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class BenchContext:
+    """
+    The data shared by the benchmarks of a run: the scenario parameters, the work folder, and the scenario file,
+    which is generated when the context is created.
+    """
+
+    def __init__(self, params: ScenGenParams, work_dir: Path):
+        self.params = params
+        self.work_dir = work_dir
+        self.scen_path = work_dir / SCEN_FILE_NAME
+
+        scen_manager = generate_scenario(params)
+        scen_manager.save(self.scen_path)
+        scen_manager.shutdown()
+
+
+# The benchmarks, in the order in which they are run by default:
+BENCHMARKS = dict(
+    load=bench_load,
+    save=bench_save,
+    sim_update=bench_sim_update,
+    sim_metrics=bench_sim_metrics,
+    batch_startup=bench_batch_startup,
+    search=bench_search,
+    table_io=bench_table_io,
+)
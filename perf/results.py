@@ -0,0 +1,243 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Results of the performance benchmarks, and their comparison against a baseline
+
+The results are saved as JSON, so they can be stored (as baseline) and processed by other tools.
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import json
+import logging
+import os
+import platform
+from datetime import datetime
+from pathlib import Path
+from statistics import median
+
+# [2. third-party]
+
+# [3. local]
+from origame.core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from origame.core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from origame.core.typing import AnnotationDeclarations
+
+from .scen_gen import ScenGenParams
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'BenchResults',
+    'MetricChange',
+    'compare_results',
+    'is_higher_better',
+]
+
+log = logging.getLogger('system')
+
+DEFAULT_THRESHOLD_PERCENT = 10.0
+
+# Durations shorter than this are too noisy to be reported as regressions, whatever their change:
+MIN_COMPARED_DURATION_SEC = 0.001
+
+
+class Decl(AnnotationDeclarations):
+    BenchResults = 'BenchResults'
+    MetricChange = 'MetricChange'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def is_higher_better(metric_name: str) -> bool:
+    """Rates (metric names ending with _per_sec) are better when higher, durations are better when lower"""
+    return metric_name.endswith('_per_sec')
+
+
+def get_environment() -> Dict[str, Any]:
+    """Get a description of the machine and Python that ran the benchmarks"""
+    return dict(
+        python=platform.python_version(),
+        platform=platform.platform(),
+        machine=platform.machine(),
+        processor=platform.processor(),
+        num_cpus=os.cpu_count(),
+    )
+
+
+def compare_results(baseline: Decl.BenchResults, current: Decl.BenchResults,
+                    threshold_percent: float = DEFAULT_THRESHOLD_PERCENT) -> List[Decl.MetricChange]:
+    """
+    Compare the metrics of current results against those of baseline. Only the metrics present in both are
+    compared.
+    :param threshold_percent: a metric is a regression if it is worse than baseline by more than this percentage
+    :return: the change of each metric compared, in metric name order
+    """
+    if baseline.params.to_json() != current.params.to_json():
+        log.warning('Baseline scenario parameters ({}) differ from current ones ({})',
+                    baseline.params, current.params)
+    if baseline.environment != current.environment:
+        log.warning('Baseline was run in a different environment: {}', baseline.environment)
+
+    changes = []
+    for metric_name in sorted(set(baseline.get_metric_names()) & set(current.get_metric_names())):
+        changes.append(MetricChange(metric_name, baseline.get_value(metric_name), current.get_value(metric_name),
+                                    threshold_percent))
+
+    missing_names = set(baseline.get_metric_names()) - set(current.get_metric_names())
+    if missing_names:
+        log.warning('Metrics of baseline not in current results: {}', ', '.join(sorted(missing_names)))
+
+    return changes
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class BenchResults:
+    """
+    The samples of each metric of a benchmark run, with the scenario parameters and the environment of the run.
+    The value of a metric is its best sample (the lowest duration, or the highest rate), the one least affected
+    by other activity on the machine.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, params: ScenGenParams, size_name: str = None, environment: Dict[str, Any] = None,
+                 created: str = None):
+        """
+        :param params: the parameters of the benchmark scenario
+        :param size_name: the name of the size preset that params come from, if any
+        :param environment: the environment of the run; if None, the current environment
+        :param created: the date and time of the run, in ISO format; if None, now
+        """
+        self.__params = params
+        self.__size_name = size_name
+        self.__environment = get_environment() if environment is None else environment
+        self.__created = datetime.now().isoformat(timespec='seconds') if created is None else created
+        self.__samples = {}  # metric name -> list of values
+
+    def add_sample(self, metric_name: str, value: float):
+        """Add a sample (the value obtained by one repetition of a benchmark) of a metric"""
+        self.__samples.setdefault(metric_name, []).append(value)
+
+    def get_params(self) -> ScenGenParams:
+        return self.__params
+
+    def get_size_name(self) -> Optional[str]:
+        return self.__size_name
+
+    def get_environment(self) -> Dict[str, Any]:
+        return self.__environment
+
+    def get_metric_names(self) -> List[str]:
+        """Get the names of the metrics, in the order in which they were first sampled"""
+        return list(self.__samples)
+
+    def get_samples(self, metric_name: str) -> List[float]:
+        return self.__samples[metric_name]
+
+    def get_value(self, metric_name: str) -> float:
+        """Get the value of a metric: its best sample"""
+        samples = self.__samples[metric_name]
+        return max(samples) if is_higher_better(metric_name) else min(samples)
+
+    def get_summary(self) -> str:
+        """Get a table of the value and median of each metric"""
+        lines = ['{:<40} {:>14} {:>14}'.format('Metric', 'Best', 'Median')]
+        for metric_name, samples in self.__samples.items():
+            lines.append('{:<40} {:>14.4f} {:>14.4f}'.format(metric_name, self.get_value(metric_name),
+                                                             median(samples)))
+        return '\n'.join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the results as a dict, suitable for JSON"""
+        metrics = {}
+        for metric_name, samples in self.__samples.items():
+            metrics[metric_name] = dict(value=self.get_value(metric_name),
+                                        higher_is_better=is_higher_better(metric_name),
+                                        samples=samples)
+
+        return dict(
+            format_version=self.FORMAT_VERSION,
+            created=self.__created,
+            size_name=self.__size_name,
+            params=self.__params.to_json(),
+            environment=self.__environment,
+            metrics=metrics,
+        )
+
+    @staticmethod
+    def from_json(results_json: Dict[str, Any]) -> Decl.BenchResults:
+        """Get a BenchResults from the dict returned by to_json()"""
+        if results_json.get('format_version') != BenchResults.FORMAT_VERSION:
+            raise ValueError('Unsupported benchmark results format: {}'.format(results_json.get('format_version')))
+
+        results = BenchResults(ScenGenParams.from_json(results_json['params']),
+                               size_name=results_json['size_name'],
+                               environment=results_json['environment'],
+                               created=results_json['created'])
+        for metric_name, metric in results_json['metrics'].items():
+            for value in metric['samples']:
+                results.add_sample(metric_name, value)
+
+        return results
+
+    def save(self, path: PathType):
+        """Save the results to a JSON file"""
+        with Path(path).open('w') as results_file:
+            json.dump(self.to_json(), results_file, indent=4)
+        log.info('Benchmark results saved to {}', path)
+
+    @staticmethod
+    def load(path: PathType) -> Decl.BenchResults:
+        """Load results from a JSON file created by save()"""
+        with Path(path).open() as results_file:
+            return BenchResults.from_json(json.load(results_file))
+
+    params = property(get_params)
+    size_name = property(get_size_name)
+    environment = property(get_environment)
+
+
+class MetricChange:
+    """
+    POD structure with the change of one metric between baseline and current results. The change is expressed
+    so that a positive percentage is always worse: slower for a duration, lower for a rate. Durations shorter than
+    MIN_COMPARED_DURATION_SEC are never regressions.
+    """
+
+    def __init__(self, metric_name: str, baseline_value: float, current_value: float, threshold_percent: float):
+        self.metric_name = metric_name
+        self.baseline_value = baseline_value
+        self.current_value = current_value
+        if baseline_value == 0:
+            self.worse_percent = 0.0
+        elif is_higher_better(metric_name):
+            self.worse_percent = 100 * (baseline_value - current_value) / baseline_value
+        else:
+            self.worse_percent = 100 * (current_value - baseline_value) / baseline_value
+        is_too_short = (not is_higher_better(metric_name) and
+                        max(baseline_value, current_value) < MIN_COMPARED_DURATION_SEC)
+        self.is_regression = self.worse_percent > threshold_percent and not is_too_short
+
+    def __str__(self):
+        return '{:<40} {:>14.4f} {:>14.4f} {:>+9.1f}%{}'.format(
+            self.metric_name, self.baseline_value, self.current_value, self.worse_percent,
+            '  REGRESSION' if self.is_regression else '')
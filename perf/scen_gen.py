@@ -0,0 +1,244 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Generation of synthetic scenarios for the performance benchmarks
+
+The scenarios are built through the same API as scripts and the GUI use (ActorPart.create_child_part(),
+PartFrame.create_link(), etc), from a ScenGenParams. The generation is deterministic: the same parameters always
+give the same scenario, so that benchmark results of different builds can be compared.
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import logging
+from random import Random
+
+# [2. third-party]
+
+# [3. local]
+from origame.core.typing import Any, Either, Optional, Callable, PathType, TextIO, BinaryIO
+from origame.core.typing import List, Tuple, Sequence, Set, Dict, Iterable, Stream
+from origame.core.typing import AnnotationDeclarations
+from origame.scenario import ScenarioManager
+from origame.scenario.defn_parts import ActorPart, FunctionPart, VariablePart, RunRolesEnum
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+__all__ = [
+    # public API of module: one line per string
+    'ScenGenParams',
+    'SIZE_PRESETS',
+    'generate_scenario',
+    'get_table_records',
+    'get_sheet_data',
+]
+
+log = logging.getLogger('system')
+
+# Parts created in each actor, in rotation (the first one must be executable, see _populate_actor()):
+WORKER_PART_TYPES = ('function', 'variable', 'data')
+
+# Names of the parts of the root actor that hold the bulk data:
+TABLE_PART_NAME = 'bench_table'
+SHEET_PART_NAME = 'bench_sheet'
+TABLE_COLUMNS = 'name TEXT, category INTEGER, value REAL'
+
+# Name of the function part, in each actor, that puts the actor's events on the queue at sim start:
+DRIVER_PART_NAME = 'driver'
+
+
+class Decl(AnnotationDeclarations):
+    ScenGenParams = 'ScenGenParams'
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def generate_scenario(params: Decl.ScenGenParams, scen_manager: ScenarioManager = None) -> ScenarioManager:
+    """
+    Generate a synthetic scenario in a new scenario of a scenario manager.
+    :param params: the generation parameters
+    :param scen_manager: the scenario manager in which to create the scenario; if None, one is created
+    :return: the scenario manager
+    """
+    if scen_manager is None:
+        scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    root_actor = scen_manager.scenario.scenario_def.root_actor
+    rng = Random(params.seed)
+
+    actors = [root_actor]
+    _create_actors(root_actor, params, 1, actors)
+    for actor_index, actor in enumerate(actors):
+        _populate_actor(actor, actor_index, len(actors), params, rng)
+
+    _create_table(root_actor, params, rng)
+    _create_sheet(root_actor, params, rng)
+
+    log.info('Generated scenario with {} actors: {}', len(actors), params)
+    return scen_manager
+
+
+def _create_actors(parent: ActorPart, params: Decl.ScenGenParams, depth: int, actors: List[ActorPart]):
+    """Create params.actor_fan_out child actors in parent, recursively until params.actor_depth reached"""
+    if depth > params.actor_depth:
+        return
+
+    for index in range(params.actor_fan_out):
+        actor = parent.create_child_part('actor', name='actor_{}'.format(index))
+        actors.append(actor)
+        _create_actors(actor, params, depth + 1, actors)
+
+
+def _populate_actor(actor: ActorPart, actor_index: int, num_actors: int, params: Decl.ScenGenParams, rng: Random):
+    """
+    Create the worker parts of an actor, link them, and create the actor's driver function. Links only go from a
+    function to a part created after it, so calls between functions never recurse.
+    """
+    parts = []
+    for index in range(params.parts_per_actor):
+        part_type = WORKER_PART_TYPES[index % len(WORKER_PART_TYPES)]
+        parts.append(actor.create_child_part(part_type, name='{}_{}'.format(part_type, index)))
+
+    functions = [part for part in parts if isinstance(part, FunctionPart)]
+    for index, part in enumerate(parts):
+        if not isinstance(part, FunctionPart):
+            continue
+
+        script_lines = ['total = sum(range(10))']
+        for target in parts[index + 1:]:
+            if rng.random() >= params.link_density:
+                continue
+            part.part_frame.create_link(target.part_frame)
+            link_name = target.part_frame.name
+            if isinstance(target, FunctionPart):
+                script_lines.append('link.{}()'.format(link_name))
+            elif isinstance(target, VariablePart):
+                script_lines.append('link.{} = total'.format(link_name))
+            else:
+                script_lines.append("link.{}['total'] = total".format(link_name))
+        part.script = '\n'.join(script_lines)
+
+    # the driver spreads the scenario's events evenly over actors, interleaving them in time so the scenario
+    # as a whole processes params.events_per_day events per simulated day
+    num_events = params.num_events // num_actors + (1 if actor_index < params.num_events % num_actors else 0)
+    driver = actor.create_child_part('function', name=DRIVER_PART_NAME)
+    for function in functions:
+        driver.part_frame.create_link(function.part_frame)
+    driver.script = '\n'.join([
+        'workers = [{}]'.format(', '.join('link.{}'.format(func.part_frame.name) for func in functions)),
+        'for i in range({}):'.format(num_events),
+        '    signal(workers[i % len(workers)], time=(i * {} + {}) / {})'.format(
+            num_actors, actor_index, params.events_per_day),
+    ])
+    driver.set_run_roles({RunRolesEnum.startup})
+
+
+def _create_table(root_actor: ActorPart, params: Decl.ScenGenParams, rng: Random):
+    """Create the bulk data table part, with params.table_rows records"""
+    table = root_actor.create_child_part('table', name=TABLE_PART_NAME)
+    table.set_columns(TABLE_COLUMNS)
+    table.insert_many(get_table_records(params.table_rows, rng))
+
+
+def get_table_records(num_records: int, rng: Random) -> List[Tuple[str, int, float]]:
+    """Get num_records random records for the bulk data table part (columns TABLE_COLUMNS)"""
+    return [('item_{}'.format(index), rng.randrange(10), rng.random()) for index in range(num_records)]
+
+
+def _create_sheet(root_actor: ActorPart, params: Decl.ScenGenParams, rng: Random):
+    """Create the bulk data sheet part, of params.sheet_rows by params.sheet_cols cells"""
+    sheet = root_actor.create_child_part('sheet', name=SHEET_PART_NAME)
+    sheet.set_data(get_sheet_data(params.sheet_rows, params.sheet_cols, rng))
+
+
+def get_sheet_data(num_rows: int, num_cols: int, rng: Random) -> List[List[float]]:
+    """Get random data for the bulk data sheet part"""
+    return [[round(rng.random(), 6) for _ in range(num_cols)] for _ in range(num_rows)]
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class ScenGenParams:
+    """
+    POD structure with the parameters of a synthetic scenario: actor hierarchy, parts in each actor, link density,
+    bulk data sizes, and events. The root actor counts as depth 0, so a depth of 2 with a fan-out of 3 gives
+    1 + 3 + 9 actors.
+    """
+
+    def __init__(self,
+                 actor_depth: int = 2,
+                 actor_fan_out: int = 3,
+                 parts_per_actor: int = 10,
+                 link_density: float = 0.3,
+                 table_rows: int = 1000,
+                 sheet_rows: int = 100,
+                 sheet_cols: int = 20,
+                 num_events: int = 5000,
+                 events_per_day: float = 1000.0,
+                 seed: int = 0):
+        """
+        :param actor_depth: depth of the actor hierarchy below the root actor
+        :param actor_fan_out: number of child actors of each actor above the max depth
+        :param parts_per_actor: number of worker parts (functions, variables and data parts) in each actor
+        :param link_density: probability that a worker function links to each worker part created after it
+        :param table_rows: number of records in the bulk data table part
+        :param sheet_rows: number of rows of the bulk data sheet part
+        :param sheet_cols: number of columns of the bulk data sheet part
+        :param num_events: number of events put on the queue when the sim starts
+        :param events_per_day: event rate, in events per simulated day
+        :param seed: seed of the random generator used for links and bulk data
+        """
+        if parts_per_actor < 1:
+            raise ValueError('Need at least one part per actor (got {})'.format(parts_per_actor))
+        if events_per_day <= 0:
+            raise ValueError('Event rate must be > 0 (got {})'.format(events_per_day))
+
+        self.actor_depth = actor_depth
+        self.actor_fan_out = actor_fan_out
+        self.parts_per_actor = parts_per_actor
+        self.link_density = link_density
+        self.table_rows = table_rows
+        self.sheet_rows = sheet_rows
+        self.sheet_cols = sheet_cols
+        self.num_events = num_events
+        self.events_per_day = events_per_day
+        self.seed = seed
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get the parameters as a dict, suitable for JSON"""
+        return dict(vars(self))
+
+    @staticmethod
+    def from_json(params: Dict[str, Any]) -> Decl.ScenGenParams:
+        """Get a ScenGenParams from the dict returned by to_json()"""
+        return ScenGenParams(**params)
+
+    def __str__(self):
+        return ', '.join('{}={}'.format(name, value) for name, value in vars(self).items())
+
+
+# Named sets of parameters; "small" runs in seconds and is meant for quick checks, "large" approaches the size
+# of the biggest scenarios seen in practice:
+SIZE_PRESETS = dict(
+    small=ScenGenParams(actor_depth=1, actor_fan_out=3, parts_per_actor=6, table_rows=500,
+                        sheet_rows=50, sheet_cols=10, num_events=2000),
+    medium=ScenGenParams(),
+    large=ScenGenParams(actor_depth=3, actor_fan_out=4, parts_per_actor=20, table_rows=20000,
+                        sheet_rows=1000, sheet_cols=50, num_events=50000),
+)
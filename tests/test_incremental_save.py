@@ -0,0 +1,198 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the incremental save of scenarios
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Event
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.defn_parts import ButtonStateEnum, DetailLevelEnum, DisplayOrderEnum, Position
+from origame.scenario.defn_parts import PulsePartState, RunRolesEnum
+from origame.scenario.file_util_json import OriJsonSegmentCache
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+IMAGE_PATH = str(Path(__file__).parent.parent / 'origame' / 'gui' / 'icons' / 'sort.png')
+
+
+def set_roll(part):
+    part.rotation_3d.roll = 12.5
+
+
+def set_data_list(part):
+    part['values'] = [1]
+
+
+def link_to_new_info(part):
+    target = part.parent_actor_part.create_child_part('info')
+    part.part_frame.create_link(target.part_frame)
+
+
+def get_link(part):
+    return list(part.part_frame.outgoing_links)[0]
+
+
+# Each case: (part type, setup called before the first save, call that changes what gets saved for the part)
+SETTER_CASES = [
+    ('actor', None, lambda part: part.set_rotation_2d(45.0)),
+    ('actor', None, set_roll),
+    ('actor', None, lambda part: part.set_proxy_pos(3.0, 4.0)),
+    ('actor', None, lambda part: part.set_image_path(IMAGE_PATH)),
+    ('actor', None, lambda part: part.create_child_part('info')),
+
+    ('button', None, lambda part: part.set_state(ButtonStateEnum.pressed)),
+    ('button', None, lambda part: part.set_rotation_2d_pressed(30.0)),
+
+    ('data', None, lambda part: part.__setitem__('key', 'value')),
+    ('data', set_data_list, lambda part: part['values'].append(2)),
+    ('data', None, lambda part: part.set_display_order(DisplayOrderEnum.reverse_alphabetical)),
+
+    ('datetime', None, lambda part: part.set_date_time(datetime(2099, 1, 2))),
+
+    ('file', None, lambda part: part.set_filepath('some_file.txt')),
+    ('file', None, lambda part: part.set_is_relative_to_scen_folder(True)),
+
+    ('function', None, lambda part: part.set_script('x = 1')),
+    ('function', None, lambda part: part.set_parameters('a, b')),
+    ('function', None, lambda part: part.set_run_roles({RunRolesEnum.startup})),
+    ('function', None, lambda part: part.set_all_imports({'mm': 'math'})),
+    ('function', None, lambda part: part.add_imports('os')),
+
+    ('hub', None, link_to_new_info),
+    ('hub', link_to_new_info, lambda part: get_link(part).add_waypoint(Position(1.0, 2.0))),
+    ('hub', link_to_new_info, lambda part: get_link(part).set_name('renamed_link')),
+
+    ('info', None, lambda part: part.set_text('some info')),
+    ('info', None, lambda part: part.part_frame.set_name('renamed')),
+    ('info', None, lambda part: part.part_frame.set_comment('a comment')),
+    ('info', None, lambda part: part.part_frame.set_position(5.0, 6.0)),
+    ('info', None, lambda part: part.part_frame.set_size(20.0, 30.0)),
+    ('info', None, lambda part: part.part_frame.set_detail_level(DetailLevelEnum.minimal)),
+
+    ('library', None, lambda part: part.set_script('y = 2')),
+    ('library', None, lambda part: part.set_all_imports({'oo': 'os'})),
+
+    ('node', None, link_to_new_info),
+
+    ('plot', None, lambda part: part.set_dpi(200)),
+    ('plot', None, lambda part: part.set_script('def configure():\n    pass')),
+
+    ('pulse', None, lambda part: part.set_pulse_period_days(12.5)),
+    ('pulse', None, lambda part: part.set_state(PulsePartState.inactive)),
+    ('pulse', None, lambda part: part.set_priority(3.0)),
+
+    ('sheet', None, lambda part: part.set_cell_data(0, 0, 42)),
+    ('sheet', None, lambda part: part.set_col_name(0, 'named')),
+    ('sheet', None, lambda part: part.add_col(0)),
+
+    ('sql', None, lambda part: part.set_sql_script('SELECT 1')),
+
+    ('table', None, lambda part: part.set_column_names_and_types(['a INTEGER'])),
+
+    ('time', None, lambda part: part.set_elapsed_time(timedelta(days=12))),
+
+    ('variable', None, lambda part: part.set_obj([1, 2, 3])),
+]
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def scen_manager():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    yield scen_manager
+    scen_manager.shutdown()
+
+
+@pytest.fixture
+def num_encoded(monkeypatch):
+    """The number of parts encoded by each save that uses the segment cache, in order of saves"""
+    nums_encoded = []
+    commit = OriJsonSegmentCache.commit
+
+    def record_commit(cache: OriJsonSegmentCache):
+        nums_encoded.append(cache.num_encoded)
+        commit(cache)
+
+    monkeypatch.setattr(OriJsonSegmentCache, 'commit', record_commit)
+    return nums_encoded
+
+
+@pytest.mark.parametrize('part_type, setup, setter', SETTER_CASES)
+def test_incremental_same_as_full(scen_manager, num_encoded, tmp_path, part_type, setup, setter):
+    root = scen_manager.scenario.scenario_def.root_actor
+    part = root.create_child_part(part_type)
+    # parts that don't change, so the incremental save has text to re-use:
+    for _ in range(3):
+        root.create_child_part('function')
+    if setup is not None:
+        setup(part)
+    path = tmp_path / 'scen.ori'
+    scen_manager.save(path)
+
+    setter(part)
+    scen_manager.save(path, incremental=True)
+    incremental_text = path.read_text()
+    assert num_encoded[-1] < num_encoded[0]
+
+    scen_manager.save(path)
+    assert incremental_text == path.read_text()
+
+
+def test_incremental_baselines_changed_parts_only(scen_manager, tmp_path):
+    scenario = scen_manager.scenario
+    root = scenario.scenario_def.root_actor
+    changed = root.create_child_part('function')
+    unchanged = root.create_child_part('function')
+    path = tmp_path / 'scen.ori'
+    scen_manager.save(path)
+    changed_baseline = changed._ori_snapshot_locals_baseline
+    unchanged_baseline = unchanged._ori_snapshot_locals_baseline
+
+    changed.set_script('x = 1')
+    assert scenario.has_ori_changes()
+    scen_manager.save(path, incremental=True)
+    assert not scenario.has_ori_changes()
+    assert changed._ori_snapshot_locals_baseline is not changed_baseline
+    assert unchanged._ori_snapshot_locals_baseline is unchanged_baseline
+
+    unchanged.set_script('x = 2')
+    assert scenario.has_ori_changes()
+
+
+def test_save_async_signals_saved_after_write(scen_manager, tmp_path):
+    path = tmp_path / 'scen.ori'
+    saved = Event()
+    file_written = []
+    scen_manager.signals.sig_scenario_saved.connect(lambda: (file_written.append(path.exists()), saved.set()))
+
+    future = scen_manager.save_async(path, incremental=True)
+    assert saved.wait(timeout=10)
+    assert future.result() == []
+    assert file_written == [True]
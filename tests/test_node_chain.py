@@ -0,0 +1,127 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the endpoint resolution of node chains
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+from time import perf_counter
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+NUM_NODES = 1000
+NUM_LOOKUPS = 10000
+MAX_FIRST_LOOKUP_SEC = 0.05
+MAX_CACHED_LOOKUP_SEC = 10e-6
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def root():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    yield scen_manager.scenario.scenario_def.root_actor
+    scen_manager.shutdown()
+
+
+@pytest.fixture
+def chain(root):
+    """A function part linked to a data part through NUM_NODES nodes; returns (function, nodes, data)"""
+    source = root.create_child_part('function', name='source')
+    nodes = [root.create_child_part('node') for _ in range(NUM_NODES)]
+    target = root.create_child_part('data', name='target')
+    source.part_frame.create_link(nodes[0].part_frame)
+    for node, next_node in zip(nodes, nodes[1:]):
+        node.part_frame.create_link(next_node.part_frame)
+    nodes[-1].part_frame.create_link(target.part_frame)
+    return source, nodes, target
+
+
+def get_out_link(part):
+    links = list(part.part_frame.outgoing_links)
+    assert len(links) == 1
+    return links[0]
+
+
+def check_endpoint(nodes, endpoint):
+    """Check the endpoint found from the first node, then that every node has it cached"""
+    assert nodes[0].get_endpoint_part() is endpoint
+    assert all(node.get_endpoint_part() is endpoint for node in nodes)
+
+
+def test_lookup_time(chain):
+    source, nodes, target = chain
+
+    start_sec = perf_counter()
+    assert nodes[0].get_endpoint_part() is target
+    first_lookup_sec = perf_counter() - start_sec
+
+    start_sec = perf_counter()
+    for _ in range(NUM_LOOKUPS):
+        nodes[0].get_endpoint_part()
+    cached_lookup_sec = (perf_counter() - start_sec) / NUM_LOOKUPS
+
+    assert first_lookup_sec < MAX_FIRST_LOOKUP_SEC
+    assert cached_lookup_sec < MAX_CACHED_LOOKUP_SEC
+    # links to the chain target the endpoint:
+    assert nodes[0].get_as_link_target_part() is target
+
+
+def test_retarget_invalidates(root, chain):
+    source, nodes, target = chain
+    check_endpoint(nodes, target)
+
+    new_target = root.create_child_part('data', name='new_target')
+    restore_info = get_out_link(nodes[-1]).retarget_link(new_target.part_frame)
+    check_endpoint(nodes, new_target)
+
+    get_out_link(nodes[-1]).restore_retargeted_link(restore_info)
+    check_endpoint(nodes, target)
+
+
+def test_remove_restore_endpoint_invalidates(chain):
+    source, nodes, target = chain
+    check_endpoint(nodes, target)
+
+    restore_info = target.remove_self(restorable=True)
+    check_endpoint(nodes, None)
+
+    target.restore_self(restore_info)
+    check_endpoint(nodes, target)
+
+
+def test_remove_restore_intermediate_invalidates(chain):
+    source, nodes, target = chain
+    check_endpoint(nodes, target)
+
+    middle = NUM_NODES // 2
+    restore_info = nodes[middle].remove_self(restorable=True)
+    check_endpoint(nodes[:middle], None)
+    check_endpoint(nodes[middle + 1:], target)
+
+    nodes[middle].restore_self(restore_info)
+    check_endpoint(nodes, target)
@@ -0,0 +1,115 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the tracking of ORI changes by parts
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+from pathlib import Path
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.defn_parts import DetailLevelEnum, FrameStyleEnum, Position, RunRolesEnum
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+IMAGE_PATH = str(Path(__file__).parent.parent / 'origame' / 'gui' / 'icons' / 'sort.png')
+
+
+def set_roll(part):
+    part.rotation_3d.roll = 12.5
+
+
+def link_to_new_info(part):
+    target = part.parent_actor_part.create_child_part('info')
+    part.part_frame.create_link(target.part_frame)
+
+
+def get_link(part):
+    return list(part.part_frame.outgoing_links)[0]
+
+
+# Each case: (part type, setup called before the save, call that changes the ORI state of the part). The part types
+# that track their ORI changes (actor, function, library, sql, info, node, hub) are all covered, along with the part
+# frame and links; plot parts do not track their changes, they are compared by snapshot.
+SETTER_CASES = [
+    ('actor', None, lambda part: part.set_rotation_2d(45.0)),
+    ('actor', None, set_roll),
+    ('actor', None, lambda part: part.set_proxy_pos(3.0, 4.0)),
+    ('actor', None, lambda part: part.set_image_path(IMAGE_PATH)),
+
+    ('function', None, lambda part: part.set_script('x = 1')),
+    ('function', None, lambda part: part.set_parameters('a, b')),
+    ('function', None, lambda part: part.set_run_roles({RunRolesEnum.startup})),
+    ('function', None, lambda part: part.set_all_imports({'mm': 'math'})),
+    ('function', None, lambda part: part.add_imports('os')),
+
+    ('library', None, lambda part: part.set_script('y = 2')),
+    ('library', None, lambda part: part.set_all_imports({'oo': 'os'})),
+    ('library', None, lambda part: part.add_imports(pp=('os', 'path'))),
+
+    ('sql', None, lambda part: part.set_sql_script('SELECT 1')),
+    ('sql', None, lambda part: part.set_parameters('a')),
+
+    ('info', None, lambda part: part.set_text('some info')),
+
+    ('node', None, lambda part: part.part_frame.set_position(5.0, 6.0)),
+    ('node', None, link_to_new_info),
+    ('hub', None, link_to_new_info),
+    ('hub', link_to_new_info, lambda part: get_link(part).add_waypoint(Position(1.0, 2.0))),
+    ('hub', link_to_new_info, lambda part: get_link(part).set_bold(True)),
+    ('hub', link_to_new_info, lambda part: get_link(part).set_name('renamed_link')),
+
+    ('info', None, lambda part: part.part_frame.set_name('renamed')),
+    ('info', None, lambda part: part.part_frame.set_comment('a comment')),
+    ('info', None, lambda part: part.part_frame.set_size(20.0, 30.0)),
+    ('info', None, lambda part: part.part_frame.set_frame_style(FrameStyleEnum.bold)),
+    ('info', None, lambda part: part.part_frame.set_detail_level(DetailLevelEnum.minimal)),
+
+    ('plot', None, lambda part: part.set_dpi(200)),
+    ('plot', None, lambda part: part.set_script('def configure():\n    pass')),
+]
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def scen_manager():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    yield scen_manager
+    scen_manager.shutdown()
+
+
+@pytest.mark.parametrize('part_type, setup, setter', SETTER_CASES)
+def test_setter_flags_changes(scen_manager, tmp_path, part_type, setup, setter):
+    part = scen_manager.scenario.scenario_def.root_actor.create_child_part(part_type)
+    if setup is not None:
+        setup(part)
+    scen_manager.save(tmp_path / 'scen.ori')
+    assert not part.has_ori_changes()
+    assert not scen_manager.check_for_changes()
+
+    setter(part)
+    assert part.has_ori_changes()
+    assert scen_manager.check_for_changes()
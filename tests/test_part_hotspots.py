@@ -0,0 +1,72 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the part hotspot profiler
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+from time import perf_counter
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.part_execs import PartHotspotProfiler
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+BUSY_SEC = 0.5
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def busy_part():
+    """A function part that keeps the GIL for BUSY_SEC, so samples are late, as when profiling a simulation"""
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    root = scen_manager.scenario.scenario_def.root_actor
+    part = root.create_child_part('function', name='busy')
+    part.script = ('from time import perf_counter\n'
+                   'end_sec = perf_counter() + {}\n'
+                   'while perf_counter() < end_sec:\n'
+                   '    pass'.format(BUSY_SEC))
+    yield part
+    scen_manager.shutdown()
+
+
+def test_total_sec_matches_wall_time(busy_part):
+    profiler = PartHotspotProfiler()
+    start_sec = perf_counter()
+    profiler.enable()
+    busy_part.call()
+    hotspots = profiler.disable()
+    wall_sec = perf_counter() - start_sec
+
+    # only the time between the last sample and disable() is not sampled:
+    assert hotspots.total_sec == pytest.approx(wall_sec, rel=0.1)
+    # nominal intervals would underestimate, the samples come later than the interval:
+    assert sum(hotspots.part_stacks.values()) * PartHotspotProfiler.DEFAULT_INTERVAL_SEC < 0.9 * wall_sec
+
+    part_times = hotspots.get_part_times()
+    assert part_times[0].name == busy_part.path
+    assert part_times[0].cumul_sec == pytest.approx(BUSY_SEC, rel=0.1)
+    assert part_times[0].percent == pytest.approx(100 * part_times[0].cumul_sec / hotspots.total_sec)
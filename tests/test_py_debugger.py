@@ -0,0 +1,122 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the Python script debugger
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import sys
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.part_execs import PyDebugger
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def session():
+    session = DebugSession()
+    PyDebugger.set_user_action_callback(session.on_user_action)
+    yield session
+    PyDebugger.set_user_action_callback(None)
+
+
+@pytest.fixture
+def parts(session):
+    """Part a calls part b at its line 3; b is 4 lines long. Once b returns, the next stop in a is at line 4."""
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    root = scen_manager.scenario.scenario_def.root_actor
+    part_b = root.create_child_part('function', name='b')
+    part_b.parameters = 'x'
+    part_b.script = 'y = x * 2\nz = y + 1\nw = z\nreturn w'
+    part_a = root.create_child_part('function', name='a')
+    part_a.part_frame.create_link(part_b.part_frame)
+    part_a.script = 'v = 1\nu = v\nr = link.b(u)\ns = r + 1\nreturn s'
+    yield part_a, part_b
+    scen_manager.shutdown()
+
+
+def test_no_breakpoint(parts, session):
+    part_a, _ = parts
+    assert session.debug_call(part_a, []) == (4, [])
+    assert sys.gettrace() is None
+
+
+def test_breakpoint_in_caller(parts, session):
+    part_a, _ = parts
+    part_a.set_breakpoints({2})
+    assert session.debug_call(part_a, ['step_over', 'step_over']) == (4, [('a', 2), ('a', 3), ('a', 4)])
+
+
+def test_step_out_into_caller(parts, session):
+    part_a, part_b = parts
+    part_b.set_breakpoints({2})
+    assert session.debug_call(part_a, ['step_out']) == (4, [('b', 2), ('a', 4)])
+
+
+def test_step_over_into_caller(parts, session):
+    part_a, part_b = parts
+    part_b.set_breakpoints({2})
+    assert session.debug_call(part_a, ['step_over'] * 4) == (
+        4, [('b', 2), ('b', 3), ('b', 4), ('a', 4), ('a', 5)])
+
+
+def test_step_in_into_caller(parts, session):
+    part_a, part_b = parts
+    part_b.set_breakpoints({3})
+    assert session.debug_call(part_a, ['step_in', 'step_in']) == (4, [('b', 3), ('b', 4), ('a', 4)])
+
+
+def test_stop(parts, session):
+    part_a, _ = parts
+    part_a.set_breakpoints({2})
+    assert session.debug_call(part_a, ['stop']) == (None, [('a', 2)])
+    assert sys.gettrace() is None
+
+
+# -- Class Definitions --------------------------------------------------------------------------
+
+class DebugSession:
+    """
+    Feeds a list of debug commands to the debugger (as the GUI would) and records the (part name, script line)
+    of every stop.
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.stops = []
+
+    def on_user_action(self):
+        debugger = PyDebugger.get_singleton()
+        info = debugger.current_debug_info
+        self.stops.append((info.py_part.name, info.line_no - info.py_part.get_debug_line_offset()))
+        command = self.commands.pop(0) if self.commands else 'continue'
+        getattr(debugger, 'next_command_' + command)()
+
+    def debug_call(self, part, commands):
+        self.commands = list(commands)
+        self.stops = []
+        result = part.call(_debug_mode=True)
+        return result, self.stops
@@ -0,0 +1,65 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the sampling profiler
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+from time import perf_counter
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.core.utils import SamplingProfiler
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+BUSY_SEC = 0.5
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+def busy_wait(duration_sec: float):
+    """Keep the GIL for duration_sec, so the sampling thread gets it late, as when profiling a simulation"""
+    end_sec = perf_counter() + duration_sec
+    while perf_counter() < end_sec:
+        pass
+
+
+def test_times_match_wall_time():
+    profiler = SamplingProfiler(record_stacks=True)
+    start_sec = perf_counter()
+    profiler.enable()
+    busy_wait(BUSY_SEC)
+    profiler.disable()
+    wall_sec = perf_counter() - start_sec
+
+    # only the time between the last sample and disable() is not sampled:
+    assert profiler.sampled_sec == pytest.approx(wall_sec, rel=0.1)
+    assert sum(profiler.get_stack_times().values()) == pytest.approx(profiler.sampled_sec)
+    # the samples come later than the interval, so nominal intervals would underestimate:
+    assert profiler.num_samples * profiler.interval_sec < profiler.sampled_sec
+
+    profiler.create_stats()
+    busy_key = (busy_wait.__code__.co_filename, busy_wait.__code__.co_firstlineno, 'busy_wait')
+    num_calls, _, _, cumul_sec, _ = profiler.stats[busy_key]
+    assert num_calls > 0
+    assert cumul_sec == pytest.approx(profiler.sampled_sec, rel=0.1)
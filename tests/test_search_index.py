@@ -0,0 +1,248 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the scenario search index
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import current_thread, main_thread
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.defn_parts import ButtonActionEnum, ButtonStateEnum, ButtonTriggerStyleEnum
+from origame.scenario.defn_parts import DisplayOrderEnum, PulsePartState, RunRolesEnum
+from origame.scenario.defn_parts.part_types_info import get_part_class_by_name
+from origame.scenario.ori import OriScenData, OriContextEnum
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+IMAGE_PATH = str(Path(__file__).parent.parent / 'origame' / 'gui' / 'icons' / 'sort.png')
+IMAGE_NEEDLE = 'sort.png'
+
+DATE_TIME = datetime(2001, 1, 1, 1, 1, 1)
+
+
+def set_date_time(part):
+    part.set_date_time(DATE_TIME)
+
+
+def add_image_sibling(part):
+    """Create a sibling actor that holds a reference to the test image, so its image ID can be set on part"""
+    sibling = part.parent_actor_part.create_child_part('actor')
+    sibling.set_image_path(IMAGE_PATH)
+    return sibling.image_id
+
+
+def name_col(col_idx):
+    return lambda part: part.set_col_name(col_idx, 'zqxcol')
+
+
+# Each case: (part type, setup called before the index is up to date, setter call, name of the searchable
+# property that the setter changes, text that the property contains either only before or only after the call)
+SETTER_CASES = [
+    ('actor', None, lambda part: part.set_rotation_2d(123.75), 'rotation_2d', '123.75'),
+    ('actor', None, lambda part: part.set_image_path(IMAGE_PATH), 'image_path', IMAGE_NEEDLE),
+    ('actor', add_image_sibling, lambda part, image_id: part.set_image_id(image_id), 'image_path', IMAGE_NEEDLE),
+    ('actor', lambda part: part.set_image_path(IMAGE_PATH), lambda part: part.remove_image(), 'image_path',
+     IMAGE_NEEDLE),
+
+    ('button', None, lambda part: part.set_state(ButtonStateEnum.pressed), 'state', str(ButtonStateEnum.pressed)),
+    ('button', None, lambda part: part.set_button_action(ButtonActionEnum.toggle), 'button_action',
+     str(ButtonActionEnum.toggle)),
+    ('button', None, lambda part: part.set_button_trigger_style(ButtonTriggerStyleEnum.on_press_and_release),
+     'button_trigger_style', str(ButtonTriggerStyleEnum.on_press_and_release)),
+    ('button', None, lambda part: part.set_rotation_2d_pressed(123.75), 'rotation_2d_pressed', '123.75'),
+    ('button', None, lambda part: part.set_rotation_2d_released(321.25), 'rotation_2d_released', '321.25'),
+    ('button', None, lambda part: part.set_image_pressed_path(IMAGE_PATH), 'image_path_pressed', IMAGE_NEEDLE),
+    ('button', None, lambda part: part.set_image_released_path(IMAGE_PATH), 'image_path_released', IMAGE_NEEDLE),
+    ('button', add_image_sibling, lambda part, image_id: part.set_image_id_pressed(image_id),
+     'image_path_pressed', IMAGE_NEEDLE),
+    ('button', add_image_sibling, lambda part, image_id: part.set_image_id_released(image_id),
+     'image_path_released', IMAGE_NEEDLE),
+    ('button', lambda part: part.set_image_pressed_path(IMAGE_PATH), lambda part: part.remove_image_pressed(),
+     'image_path_pressed', IMAGE_NEEDLE),
+    ('button', lambda part: part.set_image_released_path(IMAGE_PATH), lambda part: part.remove_image_released(),
+     'image_path_released', IMAGE_NEEDLE),
+
+    ('clock', None, lambda part: part.set_date_time(datetime(2099, 1, 2)), 'date_time', '2099-01-02'),
+    ('clock', set_date_time, lambda part: part.set_year(2088), 'date_time', '2088-01-01'),
+    ('clock', set_date_time, lambda part: part.set_month(11), 'date_time', '2001-11-01'),
+    ('clock', set_date_time, lambda part: part.set_day(27), 'date_time', '2001-01-27'),
+    ('clock', set_date_time, lambda part: part.set_hour(13), 'date_time', '13:01:01'),
+    ('clock', set_date_time, lambda part: part.set_minute(47), 'date_time', '01:47:01'),
+    ('clock', set_date_time, lambda part: part.set_second(59), 'date_time', '01:01:59'),
+    ('clock', None, lambda part: part.set_tick_period_days(4321.5), 'tick_period_days', '4321.5'),
+    ('clock', None, lambda part: part.set_tick_value(9876.5), 'tick_value', '9876.5'),
+
+    ('data', None, lambda part: part.set_display_order(DisplayOrderEnum.reverse_alphabetical), 'display_order',
+     str(DisplayOrderEnum.reverse_alphabetical)),
+
+    ('datetime', None, lambda part: part.set_date_time(datetime(2099, 1, 2)), 'date_time', '2099-01-02'),
+    ('datetime', set_date_time, lambda part: part.set_year(2088), 'date_time', '2088-01-01'),
+    ('datetime', set_date_time, lambda part: part.set_month(11), 'date_time', '2001-11-01'),
+    ('datetime', set_date_time, lambda part: part.set_day(27), 'date_time', '2001-01-27'),
+    ('datetime', set_date_time, lambda part: part.set_hour(13), 'date_time', '13:01:01'),
+    ('datetime', set_date_time, lambda part: part.set_minute(47), 'date_time', '01:47:01'),
+    ('datetime', set_date_time, lambda part: part.set_second(59), 'date_time', '01:01:59'),
+
+    ('file', None, lambda part: part.set_filepath('zqxfile.txt'), 'filepath', 'zqxfile'),
+    ('file', None, lambda part: part.set_is_relative_to_scen_folder(True), 'is_relative_to_scen_folder', 'true'),
+
+    ('function', None, lambda part: part.set_run_roles({RunRolesEnum.startup}), 'run_roles', 'startup'),
+    ('library', None, lambda part: part.set_all_imports({'zqxmod': 'math'}), 'imports', 'zqxmod'),
+
+    ('pulse', None, lambda part: part.set_pulse_period_days(12345.5), 'pulse_period_days', '12345.5'),
+    ('pulse', None, lambda part: part.set_priority(777.25), 'priority', '777.25'),
+    ('pulse', None, lambda part: part.set_state(PulsePartState.inactive), 'state', str(PulsePartState.inactive)),
+
+    ('sheet', None, name_col(0), 'named_cols', 'zqxcol'),
+    ('sheet', name_col(0), lambda part: part.del_col_name('zqxcol'), 'named_cols', 'zqxcol'),
+    ('sheet', name_col(0), lambda part: part.add_col(0), 'named_cols', "'zqxcol': 1"),
+    ('sheet', name_col(1), lambda part: part.delete_col(0), 'named_cols', "'zqxcol': 0"),
+    ('sheet', name_col(0), lambda part: part.clear(), 'named_cols', 'zqxcol'),
+    ('sheet', None, lambda part: part.set_index_style('array'), 'index_style', 'array'),
+
+    ('time', None, lambda part: part.set_elapsed_time(timedelta(days=4321)), 'elapsed_time', '4321 days'),
+    ('time', lambda part: part.set_elapsed_time(timedelta(days=4321)), lambda part: part.reset(),
+     'elapsed_time', '4321 days'),
+]
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def scen_def():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    yield scen_manager.scenario.scenario_def
+    scen_manager.shutdown()
+
+
+def create_part(parent, part_type):
+    """Create a part of given type in parent; types that are not user-creatable (clock) are copied from ORI"""
+    PartClass = get_part_class_by_name(part_type)
+    if PartClass.USER_CREATABLE:
+        return parent.create_child_part(part_type)
+
+    ori_def = PartClass(parent).get_ori_def(context=OriContextEnum.copy)
+    return parent.create_child_part_from_ori(OriScenData(ori_def), OriContextEnum.copy, {})
+
+
+def get_found_props(parts_found, part):
+    return parts_found.get(part, [])
+
+
+@pytest.mark.parametrize('part_type, setup, setter, prop_name, needle', SETTER_CASES)
+def test_setter_updates_index(scen_def, part_type, setup, setter, prop_name, needle):
+    root = scen_def.root_actor
+    part = create_part(root, part_type)
+    setup_result = None if setup is None else setup(part)
+
+    found_before = scen_def.search_parts(needle)  # brings the index up to date
+    assert found_before == root.search_parts(needle, new_search=True)
+
+    if setup_result is None:
+        setter(part)
+    else:
+        setter(part, setup_result)
+
+    found_after = scen_def.search_parts(needle)
+    assert found_after == root.search_parts(needle, new_search=True)
+    # the setter changed whether the property contains the needle, so the index had to be updated:
+    assert (prop_name in get_found_props(found_before, part)) != (prop_name in get_found_props(found_after, part))
+
+
+def test_script_execution_updates_changed_parts_only(scen_def):
+    root = scen_def.root_actor
+    func = root.create_child_part('function', name='func')
+    var = root.create_child_part('variable', name='var')
+    func.part_frame.create_link(var.part_frame)
+    func.script = "link.var = 'zqxval'"
+    search_index = root._shared_scenario_state.search_index
+
+    assert var not in scen_def.search_parts('zqxval')
+    func()
+    assert not search_index.is_stale
+    assert search_index.update() == 1  # only the variable part is re-indexed
+    assert 'editable_str' in get_found_props(scen_def.search_parts('zqxval'), var)
+
+
+def test_sim_time_values_reindexed(scen_def):
+    root = scen_def.root_actor
+    time_part = root.create_child_part('time')
+    func = root.create_child_part('function')
+    func.script = 'pass'
+    assert time_part not in scen_def.search_parts('1 day')
+
+    sim_controller = scen_def.shared_scenario_state.sim_controller
+    sim_controller.add_event(func, time=1.5)
+    sim_controller.sim_step()
+    found = scen_def.search_parts('1 day')
+    assert found == root.search_parts('1 day', new_search=True)
+    assert 'elapsed_time' in get_found_props(found, time_part)
+
+
+def test_in_place_changes_reindexed(scen_def):
+    root = scen_def.root_actor
+    func = root.create_child_part('function')
+    assert func not in scen_def.search_parts('startup')
+
+    func.run_roles.add(RunRolesEnum.startup)
+    found = scen_def.search_parts('startup')
+    assert found == root.search_parts('startup', new_search=True)
+    assert 'run_roles' in get_found_props(found, func)
+
+
+def test_results_in_tree_order(scen_def):
+    root = scen_def.root_actor
+    actor = root.create_child_part('actor', name='zqx_actor')
+    root.create_child_part('info', name='zqx_info')
+    data = actor.create_child_part('data', name='data')
+    data['zqx_key'] = 1  # content, searched outside of the index
+    actor.create_child_part('function', name='zqx_func')
+    actor.create_child_part('variable', name='zqx_var')
+    expected = list(root.search_parts('zqx', new_search=True))
+    assert expected[1] is data
+
+    hits = []
+    scen_def.shared_scenario_state.signals.sig_search_hit.connect(lambda part, prop_names: hits.append(part))
+    assert list(scen_def.search_parts('zqx')) == expected
+    assert hits == expected
+
+
+def test_search_async(scen_def):
+    root = scen_def.root_actor
+    part = root.create_child_part('info', name='zqx_info')
+    signals = scen_def.shared_scenario_state.signals
+    hit_threads = []
+    signals.sig_search_hit.connect(lambda part, prop_names: hit_threads.append(current_thread()))
+    num_done = []
+    signals.sig_search_done.connect(lambda: num_done.append(1))
+
+    future = scen_def.search_parts_async('zqx')
+    assert future.result() == {part: ['part_frame.name']}
+    assert len(num_done) == 1
+    # the hits are reported by the search worker thread:
+    assert hit_threads and main_thread() not in hit_threads
@@ -0,0 +1,87 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the application of cell diffs to sheet parts
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+
+# [2. third-party]
+import numpy as np
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.defn_parts import ExcelSheetIndexError
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def sheet():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    sheet = scen_manager.scenario.scenario_def.root_actor.create_child_part('sheet')
+    sheet.set_data([[0] * 4 for _ in range(5)])
+    yield sheet
+    scen_manager.shutdown()
+
+
+@pytest.fixture
+def subset_changes(sheet):
+    """The ranges emitted by the sheet's sig_sheet_subset_changed"""
+    changes = []
+    sheet.signals.sig_sheet_subset_changed.connect(lambda *changed_range: changes.append(changed_range))
+    return changes
+
+
+def test_one_signal_for_all_blocks(sheet, subset_changes):
+    assert sheet.apply_cell_diff([(1, 2, [[1, 2], [3, 4]]), (4, 0, [[5]])]) == (1, 4, 0, 3)
+    assert subset_changes == [(1, 4, 0, 3)]
+    assert sheet.get_cell_block(1, 2, 2, 2) == [[1, 2], [3, 4]]
+    assert sheet.get_cell_data(4, 0) == 5
+
+    assert sheet.apply_cell_diff([]) is None
+    assert subset_changes == [(1, 4, 0, 3)]
+
+
+@pytest.mark.parametrize('bad_block, error', [
+    ((4, 3, [[1, 2]]), ExcelSheetIndexError),
+    ((3, 0, [[1], [2], [3]]), ExcelSheetIndexError),
+    ((0, 0, []), ValueError),
+    ((0, 0, [[1], []]), ValueError),
+])
+def test_validated_before_set(sheet, subset_changes, bad_block, error):
+    with pytest.raises(error):
+        sheet.apply_cell_diff([(0, 0, [[1, 2]]), bad_block])
+
+    # the valid block was not set either:
+    assert sheet.get_cell_block(0, 0, 1, 2) == [[0, 0]]
+    assert subset_changes == []
+
+
+def test_values_set_as_is(sheet):
+    array = np.array([1, 2, 3])
+    sheet.apply_cell_diff([(0, 0, [[array, '', None]])])
+    assert sheet.get_cell_block(0, 0, 1, 3) == [[array, '', None]]
+
+    # the diff that reverts an edit has the values replaced, which can also be any object:
+    sheet.apply_cell_diff([(0, 0, [[0, array, 0]])])
+    assert sheet.get_cell_data(0, 1) is array
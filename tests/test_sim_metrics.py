@@ -0,0 +1,135 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the simulation metrics
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import gc
+from time import perf_counter
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.sim_metrics import Histogram, SimMetrics
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+class SmallHistogram(Histogram):
+    NUM_BUCKETS = 4
+
+
+class Part:
+    """Stands in for a part as key of the per-part execution times"""
+    pass
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def scen_manager():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    yield scen_manager
+    scen_manager.shutdown()
+
+
+def run_events(scen_manager, part, num_events: int) -> float:
+    """Run num_events events that call part; returns the mean time per event, in seconds"""
+    sim_controller = scen_manager.scenario.sim_controller
+    for index in range(num_events):
+        sim_controller.add_event(part, time=index * 0.001)
+
+    start_sec = perf_counter()
+    for _ in range(num_events):
+        sim_controller.sim_step()
+    return (perf_counter() - start_sec) / num_events
+
+
+def test_histogram_clamps_to_last_bucket():
+    histogram = SmallHistogram()
+    histogram.record(2 ** 40)
+    assert histogram.get_buckets() == {2 ** (SmallHistogram.NUM_BUCKETS - 1): 1}
+    assert histogram.max == 2 ** 40
+
+
+def test_removed_part_times_dropped():
+    metrics = SimMetrics(enabled=True)
+    part = Part()
+    metrics.record_part_exec(part, 1000)
+    assert metrics.get_part_exec_times(part).count == 1
+
+    del part
+    gc.collect()
+    assert metrics.get_part_exec_totals() == []
+
+
+def step_events(metrics: SimMetrics, num_events: int, is_asap: bool = False):
+    """Count num_events events as the SimController does"""
+    for _ in range(num_events):
+        metrics._events_until_sampled -= 1
+        if not metrics._events_until_sampled:
+            metrics._end_sampled_event(is_asap, metrics._start_sampled_event(), 1)
+
+
+def test_counts_between_samples():
+    metrics = SimMetrics()
+    step_events(metrics, 1)
+    assert metrics.num_events == 1
+    assert metrics.timed_event_times.count == 1
+
+    step_events(metrics, 10, is_asap=True)
+    assert metrics.num_events == 11
+    assert metrics.num_asap_events == 0  # estimated from the only sampled event
+
+    step_events(metrics, SimMetrics.EVENT_SAMPLING_PERIOD - 10, is_asap=True)
+    assert metrics.num_events == 1 + SimMetrics.EVENT_SAMPLING_PERIOD
+    assert metrics.asap_event_times.count == 1
+    assert metrics.num_asap_events == metrics.num_events // 2
+
+    metrics.enabled = False
+    step_events(metrics, 3 * SimMetrics.EVENT_SAMPLING_PERIOD)
+    assert metrics.num_events == 1 + SimMetrics.EVENT_SAMPLING_PERIOD
+    metrics.enabled = True
+    step_events(metrics, 2)
+    assert metrics.num_events == 3 + SimMetrics.EVENT_SAMPLING_PERIOD
+    assert metrics.timed_event_times.count == 2
+
+
+def test_records_when_enabled(scen_manager):
+    root = scen_manager.scenario.scenario_def.root_actor
+    part = root.create_child_part('function', name='noop')
+    part.script = 'pass'
+    metrics = scen_manager.scenario.sim_controller.metrics
+    assert metrics.enabled
+
+    num_sampled = 3
+    run_events(scen_manager, part, num_sampled * SimMetrics.EVENT_SAMPLING_PERIOD)
+    assert metrics.num_events == num_sampled * SimMetrics.EVENT_SAMPLING_PERIOD
+    assert metrics.timed_event_times.count == num_sampled
+    assert metrics.get_part_exec_times(part).count == num_sampled
+
+    metrics.enabled = False
+    run_events(scen_manager, part, SimMetrics.EVENT_SAMPLING_PERIOD)
+    assert metrics.num_events == num_sampled * SimMetrics.EVENT_SAMPLING_PERIOD
+    assert metrics.get_part_exec_times(part).count == num_sampled
+
@@ -0,0 +1,94 @@
+# This file is part of Origame. See the __license__ variable below for licensing information.
+#
+# This file is provided AS IS with NO WARRANTY OF ANY KIND, INCLUDING THE
+# WARRANTY OF DESIGN, MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE.
+#
+# For coding standards that apply to this file, see the project's Coding Standards document,
+# r4_coding_standards.html, in the project's docs/CodingStandards/html folder.
+
+"""
+*Project - R4 HR TDP*: Tests of the sim time anchor of the clock, datetime and time parts
+
+Version History: See SVN log.
+"""
+
+# -- Imports ------------------------------------------------------------------------------------
+
+# [1. standard library]
+import gc
+import weakref
+
+# [2. third-party]
+import pytest
+
+# [3. local]
+from origame.scenario import ScenarioManager
+from origame.scenario.defn_parts.part_types_info import get_part_class_by_name
+from origame.scenario.ori import OriScenData, OriContextEnum
+
+# -- Meta-data ----------------------------------------------------------------------------------
+
+__version__ = "$Revision: 5800$"
+__license__ = """This file can ONLY be copied, used or modified according to the terms and conditions
+                 described in the LICENSE.txt located in the root folder of the Origame package."""
+__copyright__ = "(c) Her Majesty the Queen in Right of Canada"
+
+# -- Module-level objects -----------------------------------------------------------------------
+
+# Each case: (part type, name of the part signal emitted when sim time advances while animated)
+PART_CASES = [
+    ('clock', 'sig_date_time_changed'),
+    ('datetime', 'sig_date_time_changed'),
+    ('time', 'sig_elapsed_time_changed'),
+]
+
+
+# -- Function definitions -----------------------------------------------------------------------
+
+@pytest.fixture
+def scen_manager():
+    scen_manager = ScenarioManager()
+    scen_manager.new_scenario()
+    yield scen_manager
+    scen_manager.shutdown()
+
+
+def create_part(parent, part_type):
+    """Create a part of given type in parent; types that are not user-creatable (clock) are copied from ORI"""
+    PartClass = get_part_class_by_name(part_type)
+    if PartClass.USER_CREATABLE:
+        return parent.create_child_part(part_type)
+
+    ori_def = PartClass(parent).get_ori_def(context=OriContextEnum.copy)
+    return parent.create_child_part_from_ori(OriScenData(ori_def), OriContextEnum.copy, {})
+
+
+@pytest.mark.parametrize('part_type, signal_name', PART_CASES)
+def test_removed_part_not_notified(scen_manager, part_type, signal_name):
+    sim_signals = scen_manager.scenario.sim_controller.signals
+    part = create_part(scen_manager.scenario.scenario_def.root_actor, part_type)
+    num_emitted = []
+    getattr(part.signals, signal_name).connect(lambda *args: num_emitted.append(args))
+
+    sim_signals.sig_animation_mode_changed.emit(True)
+    assert len(num_emitted) == 1
+
+    restore_info = part.remove_self(restorable=True)
+    sim_signals.sig_animation_mode_changed.emit(True)
+    assert len(num_emitted) == 1
+
+    part.restore_self(restore_info)
+    sim_signals.sig_animation_mode_changed.emit(True)
+    assert len(num_emitted) == 2
+
+
+# the clock part is left out: the log record of its deprecation warning, kept by pytest, refers to it
+@pytest.mark.parametrize('part_type', ['datetime', 'time'])
+def test_removed_part_released(scen_manager, part_type):
+    part = create_part(scen_manager.scenario.scenario_def.root_actor, part_type)
+    part_ref = weakref.ref(part)
+
+    part.remove_self()
+    del part
+    gc.collect()
+    assert part_ref() is None